@@ -0,0 +1,584 @@
+# Copyright (c) 2025 Benedat LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+#
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Asyncio versions of the tools in k8s_tools. For each tool in k8s_tools.TOOLS, there is
+an `async def` function here with the same name, signature, and return type.
+
+The requests are made with an httpx.AsyncClient, created on first use from the same
+kube config (or in-cluster config) as k8s_tools. All tools share its connection pool,
+which is sized by k8s_tools.CONNECTION_POOL_MAXSIZE, and requests time out after
+k8s_tools.REQUEST_TIMEOUT seconds. The list responses are paged and parsed like the
+"json" response mode of k8s_tools. If informers have been enabled (see
+k8s_tools.enable_informers()), the summary tools read from them.
+
+The client is bound to the event loop that first used it. Call close() before that loop
+exits if you want to release the connections.
+
+Only the requests themselves run on the event loop. Loading the kube config (which may run
+an exec plugin), refreshing exec plugin tokens, and parsing, converting and validating the
+responses are CPU-bound or blocking, so they run in asyncio's default thread pool (through
+asyncio.to_thread()), so that a large list does not stall the other tasks on the loop.
+"""
+import asyncio
+import datetime
+import logging
+import ssl
+import time
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, Callable, Optional, Union
+
+import certifi
+import httpx
+
+from . import k8s_tools, paging
+# the kubernetes client is imported on first use (see k8s_tools)
+from .k8s_tools import client
+from .k8s_tools import K8sApiError, NamespaceSummary, NodeSummary, PodSummary, ContainerStatus, \
+                       EventSummary, LogMatch, PodLogs, DeploymentSummary, ServiceSummary, ColumnarTable, ListFormat, \
+                       TruncatedList, SummaryPage
+from .tool_metrics import record_api_request
+from .tool_profiler import profile_tools
+
+HTTP_CLIENT:Optional[httpx.AsyncClient] = None
+CONFIGURATION:Optional['client.Configuration'] = None
+# Only used to convert responses to the kubernetes client models, for the tools that need them
+_DESERIALIZER:Optional['client.ApiClient'] = None
+
+
+def _ssl_context(configuration:'client.Configuration') -> ssl.SSLContext:
+    context = ssl.create_default_context(cafile=configuration.ssl_ca_cert or certifi.where())
+    if configuration.cert_file:
+        context.load_cert_chain(configuration.cert_file, configuration.key_file)
+    if not configuration.verify_ssl:
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    return context
+
+
+def _create_http_client() -> tuple[httpx.AsyncClient, 'client.Configuration']:
+    configuration = k8s_tools._load_configuration()
+    timeout = k8s_tools.REQUEST_TIMEOUT if k8s_tools.REQUEST_TIMEOUT > 0 else None
+    http_client = httpx.AsyncClient(
+        base_url=configuration.host,
+        verify=_ssl_context(configuration),
+        proxy=configuration.proxy,
+        limits=httpx.Limits(max_connections=k8s_tools.CONNECTION_POOL_MAXSIZE,
+                            max_keepalive_connections=k8s_tools.CONNECTION_POOL_MAXSIZE),
+        timeout=httpx.Timeout(timeout))
+    return (http_client, configuration)
+
+
+async def _get_http_client() -> httpx.AsyncClient:
+    global HTTP_CLIENT, CONFIGURATION
+    if HTTP_CLIENT is None:
+        # reading the kube config (and running an exec plugin) blocks, so it is done in a thread
+        (http_client, configuration) = await asyncio.to_thread(_create_http_client)
+        if HTTP_CLIENT is None:
+            (HTTP_CLIENT, CONFIGURATION) = (http_client, configuration)
+        else:
+            # another task created the client while this one was waiting
+            await http_client.aclose()
+    return HTTP_CLIENT
+
+
+async def close() -> None:
+    """Close the shared client and its connections. It will be recreated if another
+    tool is called."""
+    global HTTP_CLIENT
+    if HTTP_CLIENT is not None:
+        await HTTP_CLIENT.aclose()
+        HTTP_CLIENT = None
+
+
+async def _get(path:str, params:Optional[dict[str, Any]]=None) -> httpx.Response:
+    """Make a GET request to the API server. Raises httpx.HTTPStatusError for error responses."""
+    http_client = await _get_http_client()
+    record_api_request()
+    response = await http_client.get(path, params=params, headers=await _headers())
+    response.raise_for_status()
+    return response
+
+
+async def _headers() -> dict[str, str]:
+    assert CONFIGURATION is not None
+    headers = {'Accept': 'application/json'}
+    # This is evaluated for each request, so that tokens from exec plugins are refreshed. The
+    # refresh may run the plugin, so it is done in a thread if there is a refresh hook.
+    if getattr(CONFIGURATION, 'refresh_api_key_hook', None) is not None:
+        auth_settings = await asyncio.to_thread(CONFIGURATION.auth_settings)
+    else:
+        auth_settings = CONFIGURATION.auth_settings()
+    bearer_token = auth_settings.get('BearerToken')
+    if bearer_token and bearer_token.get('value'):
+        headers['Authorization'] = bearer_token['value']
+    return headers
+
+
+def _to_model(response:httpx.Response, klass:str) -> Any:
+    """Convert a response to a kubernetes client model, the same way the client does"""
+    global _DESERIALIZER
+    if _DESERIALIZER is None:
+        _DESERIALIZER = client.ApiClient()
+    return _DESERIALIZER.deserialize(SimpleNamespace(data=response.text), klass)
+
+
+def _error_message(e:httpx.HTTPError) -> str:
+    if isinstance(e, httpx.HTTPStatusError):
+        return f"({e.response.status_code}) {e.response.reason_phrase}: {e.response.text}"
+    return str(e)
+
+
+def _list_path(kind:str, namespace:Optional[str]) -> str:
+    all_namespaces_path, namespaced_path = k8s_tools._LIST_RESOURCE_PATHS[kind]
+    return namespaced_path.format(namespace=namespace) if namespace and namespaced_path else all_namespaces_path
+
+
+def _parse_list(content:bytes, convert:Callable[[list[dict[str, Any]]], list[Any]]) -> tuple[list[Any], Optional[str]]:
+    """Parse a LIST response and convert its items. Returns the converted items and the continue token."""
+    result = k8s_tools._json_loads(content)
+    return (convert(result.get('items') or []), (result.get('metadata') or {}).get('continue'))
+
+
+async def _list_json_in_pages(kind:str, namespace:Optional[str], params:dict[str, Any],
+                              convert:Callable[[list[dict[str, Any]]], list[Any]]) -> AsyncIterator[Any]:
+    """Async equivalent of k8s_tools._list_json_in_pages(): yield the objects of a kind, parsed
+    from paged LIST responses and converted by convert, which is called with the parsed items
+    of each page. Each page is parsed and converted in a worker thread. httpx errors are passed
+    through to the caller.
+    """
+    path = _list_path(kind, namespace)
+    params = dict(params)
+    while True:
+        if k8s_tools.LIST_PAGE_SIZE > 0:
+            params['limit'] = k8s_tools.LIST_PAGE_SIZE
+        response = await _get(path, params)
+        (items, continue_token) = await asyncio.to_thread(_parse_list, response.content, convert)
+        for item in items:
+            yield item
+        if not continue_token:
+            return
+        params['continue'] = continue_token
+
+
+async def _get_summary_fields(kind:str, namespace:Optional[str], params:dict[str, Any],
+                              to_summary:Callable[[Any, datetime.datetime], dict[str, Any]],
+                              json_to_summary:Callable[[dict[str, Any], datetime.datetime], dict[str, Any]],
+                              use_informer:bool=True) -> list[dict[str, Any]]:
+    """Async equivalent of k8s_tools._get_summary_fields(), always using the "json" response mode.
+    The objects are converted in worker threads. httpx errors are passed through to the caller.
+    """
+    objects = k8s_tools._get_informer_items(kind, namespace) if use_informer else None
+    current_time_utc = datetime.datetime.now(datetime.timezone.utc)
+    if objects is not None:
+        return await asyncio.to_thread(lambda: [to_summary(obj, current_time_utc) for obj in objects])
+    return [fields async for fields in
+            _list_json_in_pages(kind, namespace, params,
+                                lambda items: [json_to_summary(obj, current_time_utc) for obj in items])]
+
+
+async def _get_summary_page(kind:str, model:type[k8s_tools._Summary], namespace:Optional[str], params:dict[str, Any],
+                            to_summary:Callable[[Any, datetime.datetime], dict[str, Any]],
+                            json_to_summary:Callable[[dict[str, Any], datetime.datetime], dict[str, Any]],
+                            format:ListFormat, page_size:Optional[int], cursor:Optional[str],
+                            use_informer:bool=True) -> Union[SummaryPage[k8s_tools._Summary], ColumnarTable]:
+    """Async equivalent of k8s_tools._get_summary_page(), always using the "json" response mode.
+    A ValueError is raised if the cursor has expired, other httpx errors are passed through to the caller.
+    """
+    query = paging.list_query(kind, namespace, params.get('labelSelector'), params.get('fieldSelector'))
+    position = paging.decode_cursor(cursor, query) if cursor else None
+    page_size = page_size or paging.DEFAULT_PAGE_SIZE
+    current_time_utc = datetime.datetime.now(datetime.timezone.utc)
+    objects = k8s_tools._get_informer_items(kind, namespace) if use_informer and position is None else None
+    if objects is not None or (position is not None and 's' in position):
+        (page, next_cursor) = k8s_tools._snapshot_page(query, objects, position, page_size)
+        fields = await asyncio.to_thread(lambda: [to_summary(obj, current_time_utc) for obj in page])
+    else:
+        page_params = dict(params, limit=page_size)
+        if position is not None:
+            page_params['continue'] = position['c']
+        try:
+            response = await _get(_list_path(kind, namespace), page_params)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == paging.HTTP_STATUS_GONE and position is not None:
+                raise ValueError(paging.EXPIRED_CURSOR_MESSAGE) from e
+            raise
+        (fields, continue_token) = await asyncio.to_thread(
+            _parse_list, response.content, lambda items: [json_to_summary(obj, current_time_utc) for obj in items])
+        next_cursor = paging.encode_cursor(query, continue_token=continue_token) if continue_token else None
+    return await asyncio.to_thread(lambda: k8s_tools._page_result(model, k8s_tools._to_summaries(model, fields),
+                                                                  format, next_cursor))
+
+
+def _selector_params(label_selector:Optional[str], field_selector:Optional[str]) -> dict[str, str]:
+    params:dict[str, str] = {}
+    if label_selector:
+        params['labelSelector'] = label_selector
+    if field_selector:
+        params['fieldSelector'] = field_selector
+    return params
+
+
+async def get_namespaces(format: ListFormat = 'objects', max_items: Optional[int] = None,
+                         max_bytes: Optional[int] = None) -> Union[list[NamespaceSummary],
+                                                                   TruncatedList[NamespaceSummary], ColumnarTable]:
+    k8s_tools._check_list_args(format, max_items, max_bytes)
+    logging.info(f"get_namespaces(format={format}, max_items={max_items}, max_bytes={max_bytes})")
+    try:
+        fields = await _get_summary_fields('namespaces', None, {}, k8s_tools._namespace_to_summary,
+                                           k8s_tools._namespace_json_to_summary)
+    except httpx.HTTPError as e:
+        raise K8sApiError(f"Error fetching namespaces: {_error_message(e)}") from e
+    return await asyncio.to_thread(k8s_tools._list_result, NamespaceSummary, fields, format, max_items, max_bytes)
+
+get_namespaces.__doc__ = k8s_tools.get_namespaces.__doc__
+
+
+async def get_node_summaries(format: ListFormat = 'objects', max_items: Optional[int] = None,
+                             max_bytes: Optional[int] = None, page_size: Optional[int] = None,
+                             cursor: Optional[str] = None) -> Union[list[NodeSummary], TruncatedList[NodeSummary],
+                                                                    SummaryPage[NodeSummary], ColumnarTable]:
+    k8s_tools._check_list_args(format, max_items, max_bytes, page_size, cursor)
+    logging.info(f"get_node_summaries(format={format}, max_items={max_items}, max_bytes={max_bytes}, "
+                 f"page_size={page_size}, cursor={cursor})")
+    try:
+        if page_size is not None or cursor is not None:
+            return await _get_summary_page('nodes', NodeSummary, None, {}, k8s_tools._node_to_summary,
+                                           k8s_tools._node_json_to_summary, format, page_size, cursor)
+        fields = await _get_summary_fields('nodes', None, {}, k8s_tools._node_to_summary,
+                                           k8s_tools._node_json_to_summary)
+    except httpx.HTTPError as e:
+        raise K8sApiError(f"Error fetching nodes: {_error_message(e)}") from e
+    return await asyncio.to_thread(k8s_tools._list_result, NodeSummary, fields, format, max_items, max_bytes)
+
+get_node_summaries.__doc__ = k8s_tools.get_node_summaries.__doc__
+
+
+async def get_pod_summaries(namespace: Optional[str] = None, label_selector: Optional[str] = None,
+                            field_selector: Optional[str] = None,
+                            format: ListFormat = 'objects', max_items: Optional[int] = None,
+                            max_bytes: Optional[int] = None, page_size: Optional[int] = None,
+                            cursor: Optional[str] = None) -> Union[list[PodSummary], TruncatedList[PodSummary],
+                                                                   SummaryPage[PodSummary], ColumnarTable]:
+    k8s_tools._check_list_args(format, max_items, max_bytes, page_size, cursor)
+    logging.info(f"get_pod_summaries(namespace={namespace}, label_selector={label_selector}, field_selector={field_selector}, "
+                 f"format={format}, max_items={max_items}, max_bytes={max_bytes}, "
+                 f"page_size={page_size}, cursor={cursor})")
+    selectors = _selector_params(label_selector, field_selector)
+    try:
+        if page_size is not None or cursor is not None:
+            return await _get_summary_page('pods', PodSummary, namespace, selectors, k8s_tools._pod_to_summary,
+                                           k8s_tools._pod_json_to_summary, format, page_size, cursor,
+                                           use_informer=not selectors)
+        fields = await _get_summary_fields('pods', namespace, selectors, k8s_tools._pod_to_summary,
+                                           k8s_tools._pod_json_to_summary, use_informer=not selectors)
+    except httpx.HTTPError as e:
+        raise K8sApiError(f"Error fetching pods: {_error_message(e)}") from e
+    return await asyncio.to_thread(k8s_tools._list_result, PodSummary, fields, format, max_items, max_bytes)
+
+get_pod_summaries.__doc__ = k8s_tools.get_pod_summaries.__doc__
+
+
+async def get_pod_container_statuses(pod_name: str, namespace: str = "default") -> list[ContainerStatus]:
+    logging.info(f"get_pod_container_statuses(pod_name={pod_name}, namespace={namespace})")
+    try:
+        response = await _get(f"/api/v1/namespaces/{namespace}/pods/{pod_name}")
+    except httpx.HTTPError as e:
+        raise K8sApiError(f"Error reading pod '{pod_name}' in namespace '{namespace}': {_error_message(e)}") from e
+    return await asyncio.to_thread(
+        lambda: k8s_tools._to_summaries(ContainerStatus,
+                                        k8s_tools._pod_to_container_statuses(_to_model(response, 'V1Pod'),
+                                                                             pod_name, namespace)))
+
+get_pod_container_statuses.__doc__ = k8s_tools.get_pod_container_statuses.__doc__
+
+
+async def get_namespace_container_statuses(namespace: Optional[str] = None, label_selector: Optional[str] = None,
+                                           only_not_ready: bool = False, min_restarts: int = 0,
+                                           format: ListFormat = 'objects', max_items: Optional[int] = None,
+                                           max_bytes: Optional[int] = None) -> Union[list[ContainerStatus],
+                                                                                     TruncatedList[ContainerStatus],
+                                                                                     ColumnarTable]:
+    k8s_tools._check_list_args(format, max_items, max_bytes)
+    logging.info(f"get_namespace_container_statuses(namespace={namespace}, label_selector={label_selector}, "
+                 f"only_not_ready={only_not_ready}, min_restarts={min_restarts}, format={format}, "
+                 f"max_items={max_items}, max_bytes={max_bytes})")
+    pods = k8s_tools._get_informer_items('pods', namespace) if not label_selector else None
+    if pods is not None:
+        statuses = await asyncio.to_thread(lambda: k8s_tools._filter_container_statuses(
+            (status for pod in pods
+             for status in k8s_tools._pod_to_container_statuses(pod, pod.metadata.name, pod.metadata.namespace)),
+            only_not_ready, min_restarts))
+    else:
+        def to_statuses(items:list[dict[str, Any]]) -> list[dict[str, Any]]:
+            return k8s_tools._filter_container_statuses(
+                (status for pod in items for status in k8s_tools._pod_json_to_container_statuses(pod)),
+                only_not_ready, min_restarts)
+        try:
+            statuses = [status async for status in
+                        _list_json_in_pages('pods', namespace, _selector_params(label_selector, None), to_statuses)]
+        except httpx.HTTPError as e:
+            raise K8sApiError(f"Error fetching pods: {_error_message(e)}") from e
+    return await asyncio.to_thread(k8s_tools._list_result, ContainerStatus, statuses, format, max_items, max_bytes)
+
+get_namespace_container_statuses.__doc__ = k8s_tools.get_namespace_container_statuses.__doc__
+
+
+async def _list_object_events(namespace:str, kind:str, name:str) -> list[Any]:
+    """Async equivalent of k8s_tools._list_object_events(). The event index is synchronous,
+    so it is called in a worker thread. httpx errors are passed through to the caller.
+    """
+    event_index = k8s_tools.EVENT_INDEX
+    if event_index is not None:
+        return await asyncio.to_thread(event_index.get, namespace, kind, name)
+    response = await _get(f"/api/v1/namespaces/{namespace}/events",
+                          {'fieldSelector': f"involvedObject.name={name},involvedObject.kind={kind}"})
+    return (await asyncio.to_thread(_to_model, response, 'CoreV1EventList')).items
+
+
+async def get_pod_events(pod_name: str, namespace: str = "default") -> list[EventSummary]:
+    logging.info(f"get_pod_events(pod_name={pod_name}, namespace={namespace})")
+    try:
+        events = await _list_object_events(namespace, 'Pod', pod_name)
+    except httpx.HTTPError as e:
+        raise K8sApiError(f"Error fetching events for pod '{pod_name}': {_error_message(e)}") from e
+    except client.ApiException as e:
+        raise K8sApiError(f"Error fetching events for pod '{pod_name}': {e}") from e
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return await asyncio.to_thread(lambda: k8s_tools._to_summaries(
+        EventSummary, (k8s_tools._event_to_summary(event, pod_name, now) for event in events)))
+
+get_pod_events.__doc__ = k8s_tools.get_pod_events.__doc__
+
+
+async def get_object_events(kind: str, name: str, namespace: str = "default") -> list[EventSummary]:
+    logging.info(f"get_object_events(kind={kind}, name={name}, namespace={namespace})")
+    try:
+        events = await _list_object_events(namespace, kind, name)
+    except httpx.HTTPError as e:
+        raise K8sApiError(f"Error fetching events for {kind} '{name}': {_error_message(e)}") from e
+    except client.ApiException as e:
+        raise K8sApiError(f"Error fetching events for {kind} '{name}': {e}") from e
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return await asyncio.to_thread(lambda: k8s_tools._to_summaries(
+        EventSummary, (k8s_tools._event_to_summary(event, name, now) for event in events)))
+
+get_object_events.__doc__ = k8s_tools.get_object_events.__doc__
+
+
+async def get_pod_spec(pod_name: str, namespace: str = "default") -> dict[str,Any]:
+    logging.info(f"get_pod_spec(pod_name={pod_name}, namespace={namespace})")
+    try:
+        response = await _get(f"/api/v1/namespaces/{namespace}/pods/{pod_name}")
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 404:
+            raise K8sApiError(f"Pod '{pod_name}' not found in namespace '{namespace}'.") from e
+        raise K8sApiError(f"Error getting pod '{pod_name}' in namespace '{namespace}': {_error_message(e)}") from e
+    except httpx.HTTPError as e:
+        raise K8sApiError(f"Error getting pod '{pod_name}' in namespace '{namespace}': {_error_message(e)}") from e
+    pod = _to_model(response, 'V1Pod')
+    if pod.spec is None:
+        raise K8sApiError(f"Pod '{pod_name}' in namespace '{namespace}' did not return a valid spec.")
+    return pod.spec.to_dict()
+
+get_pod_spec.__doc__ = k8s_tools.get_pod_spec.__doc__
+
+
+_LOG_QUERY_PARAMS = {'container': 'container', 'since_seconds': 'sinceSeconds', 'tail_lines': 'tailLines',
+                     'limit_bytes': 'limitBytes'}
+
+def _log_params(container_name:Optional[str], since_seconds:Optional[int], since_time:Optional[datetime.datetime],
+                tail_lines:Optional[int], limit_bytes:Optional[int]) -> dict[str, Any]:
+    log_args = k8s_tools._log_query_args(container_name, since_seconds, since_time, tail_lines, limit_bytes)
+    params:dict[str, Any] = {'timestamps': 'true'}
+    for (arg, param) in _LOG_QUERY_PARAMS.items():
+        if log_args.get(arg) is not None:
+            params[param] = log_args[arg]
+    return params
+
+
+async def get_logs_for_pod_and_container(pod_name:str, namespace:str = "default",
+                                         container_name:Optional[str]=None,
+                                         since_seconds:Optional[int]=None,
+                                         since_time:Optional[datetime.datetime]=None,
+                                         tail_lines:Optional[int]=k8s_tools.DEFAULT_LOG_TAIL_LINES,
+                                         limit_bytes:Optional[int]=k8s_tools.DEFAULT_LOG_LIMIT_BYTES) -> Optional[str]:
+    params = _log_params(container_name, since_seconds, since_time, tail_lines, limit_bytes)
+    try:
+        response = await _get(f"/api/v1/namespaces/{namespace}/pods/{pod_name}/log", params)
+    except httpx.HTTPError as e:
+        raise K8sApiError(f"Error fetching logs: {_error_message(e)}") from e
+    return response.text
+
+get_logs_for_pod_and_container.__doc__ = k8s_tools.get_logs_for_pod_and_container.__doc__
+
+
+async def stream_logs_for_pod_and_container(pod_name:str, namespace:str = "default",
+                                            container_name:Optional[str]=None,
+                                            since_seconds:Optional[int]=None,
+                                            since_time:Optional[datetime.datetime]=None,
+                                            tail_lines:Optional[int]=None,
+                                            limit_bytes:Optional[int]=None,
+                                            follow:bool=False,
+                                            follow_timeout_seconds:float=60.0) -> AsyncIterator[str]:
+    params = _log_params(container_name, since_seconds, since_time, tail_lines, limit_bytes)
+    if follow:
+        params['follow'] = 'true'
+    http_client = await _get_http_client()
+    record_api_request()
+    try:
+        async with http_client.stream('GET', f"/api/v1/namespaces/{namespace}/pods/{pod_name}/log",
+                                      params=params, headers=await _headers(),
+                                      timeout=httpx.Timeout(http_client.timeout.connect,
+                                                            read=follow_timeout_seconds) if follow else None) as response:
+            if response.is_error:
+                await response.aread()
+                response.raise_for_status()
+            deadline = time.monotonic() + follow_timeout_seconds
+            try:
+                async for line in response.aiter_lines():
+                    yield line.rstrip('\r\n')
+                    if follow and time.monotonic() > deadline:
+                        return
+            except httpx.ReadTimeout:
+                if not follow:
+                    raise
+    except httpx.HTTPError as e:
+        raise K8sApiError(f"Error fetching logs: {_error_message(e)}") from e
+
+stream_logs_for_pod_and_container.__doc__ = k8s_tools.stream_logs_for_pod_and_container.__doc__
+
+
+async def search_pod_logs(pod_name:str, pattern:str, namespace:str = "default",
+                          container_name:Optional[str]=None, before:int=0, after:int=0,
+                          max_matches:int=100, ignore_case:bool=False,
+                          since_seconds:Optional[int]=None) -> list[LogMatch]:
+    logging.info(f"search_pod_logs(pod_name={pod_name}, pattern={pattern}, namespace={namespace}, "
+                 f"container_name={container_name}, since_seconds={since_seconds})")
+    searcher = k8s_tools._LogSearcher(k8s_tools._compile_log_pattern(pattern, ignore_case), before, after, max_matches)
+    lines = stream_logs_for_pod_and_container(pod_name, namespace, container_name, since_seconds=since_seconds)
+    try:
+        async for line in lines:
+            if searcher.add(line):
+                break
+    finally:
+        await lines.aclose()
+    return searcher.matches
+
+search_pod_logs.__doc__ = k8s_tools.search_pod_logs.__doc__
+
+
+async def get_logs_for_workload(namespace:str = "default", deployment_name:Optional[str]=None,
+                                label_selector:Optional[str]=None, container_name:Optional[str]=None,
+                                since_seconds:Optional[int]=None, tail_lines:Optional[int]=100,
+                                limit_bytes:Optional[int]=64*1024, max_pods:int=50) -> list[PodLogs]:
+    k8s_tools._check_workload_args(deployment_name, label_selector)
+    logging.info(f"get_logs_for_workload(namespace={namespace}, deployment_name={deployment_name}, "
+                 f"label_selector={label_selector}, container_name={container_name})")
+    try:
+        if deployment_name is not None:
+            response = await _get(f"/apis/apps/v1/namespaces/{namespace}/deployments/{deployment_name}")
+            label_selector = k8s_tools._label_selector_to_string(_to_model(response, 'V1Deployment').spec.selector)
+        pod_names = sorted([name async for name in
+                            _list_json_in_pages('pods', namespace, _selector_params(label_selector, None),
+                                                lambda items: [pod['metadata']['name'] for pod in items])])
+    except httpx.HTTPError as e:
+        raise K8sApiError(f"Error finding pods for workload: {_error_message(e)}") from e
+    if len(pod_names) > max_pods:
+        logging.warning(f"get_logs_for_workload: found {len(pod_names)} pods, only fetching logs for {max_pods}")
+        pod_names = pod_names[:max_pods]
+    semaphore = asyncio.Semaphore(k8s_tools.LOG_FANOUT_CONCURRENCY)
+
+    async def fetch(pod_name:str) -> PodLogs:
+        async with semaphore:
+            try:
+                logs = await get_logs_for_pod_and_container(pod_name, namespace, container_name,
+                                                            since_seconds=since_seconds, tail_lines=tail_lines,
+                                                            limit_bytes=limit_bytes)
+                return PodLogs(pod_name=pod_name, container_name=container_name, logs=logs)
+            except K8sApiError as e:
+                return PodLogs(pod_name=pod_name, container_name=container_name, error=str(e))
+
+    return list(await asyncio.gather(*[fetch(pod_name) for pod_name in pod_names]))
+
+get_logs_for_workload.__doc__ = k8s_tools.get_logs_for_workload.__doc__
+
+
+async def get_deployment_summaries(namespace: Optional[str] = None, label_selector: Optional[str] = None,
+                                   field_selector: Optional[str] = None,
+                                   format: ListFormat = 'objects', max_items: Optional[int] = None,
+                                   max_bytes: Optional[int] = None, page_size: Optional[int] = None,
+                                   cursor: Optional[str] = None) -> Union[list[DeploymentSummary],
+                                                                          TruncatedList[DeploymentSummary],
+                                                                          SummaryPage[DeploymentSummary], ColumnarTable]:
+    k8s_tools._check_list_args(format, max_items, max_bytes, page_size, cursor)
+    logging.info(f"get_deployment_summaries(namespace={namespace}, label_selector={label_selector}, field_selector={field_selector}, "
+                 f"format={format}, max_items={max_items}, max_bytes={max_bytes}, "
+                 f"page_size={page_size}, cursor={cursor})")
+    selectors = _selector_params(label_selector, field_selector)
+    try:
+        if page_size is not None or cursor is not None:
+            return await _get_summary_page('deployments', DeploymentSummary, namespace, selectors,
+                                           k8s_tools._deployment_to_summary, k8s_tools._deployment_json_to_summary,
+                                           format, page_size, cursor, use_informer=not selectors)
+        fields = await _get_summary_fields('deployments', namespace, selectors,
+                                           k8s_tools._deployment_to_summary, k8s_tools._deployment_json_to_summary,
+                                           use_informer=not selectors)
+    except httpx.HTTPError as e:
+        raise K8sApiError(f"Error fetching deployments: {_error_message(e)}") from e
+    return await asyncio.to_thread(k8s_tools._list_result, DeploymentSummary, fields, format, max_items, max_bytes)
+
+get_deployment_summaries.__doc__ = k8s_tools.get_deployment_summaries.__doc__
+
+
+async def get_service_summaries(namespace: Optional[str] = None, label_selector: Optional[str] = None,
+                                field_selector: Optional[str] = None,
+                                format: ListFormat = 'objects', max_items: Optional[int] = None,
+                                max_bytes: Optional[int] = None, page_size: Optional[int] = None,
+                                cursor: Optional[str] = None) -> Union[list[ServiceSummary],
+                                                                       TruncatedList[ServiceSummary],
+                                                                       SummaryPage[ServiceSummary], ColumnarTable]:
+    k8s_tools._check_list_args(format, max_items, max_bytes, page_size, cursor)
+    logging.info(f"get_service_summaries(namespace={namespace}, label_selector={label_selector}, field_selector={field_selector}, "
+                 f"format={format}, max_items={max_items}, max_bytes={max_bytes}, "
+                 f"page_size={page_size}, cursor={cursor})")
+    selectors = _selector_params(label_selector, field_selector)
+    try:
+        if page_size is not None or cursor is not None:
+            return await _get_summary_page('services', ServiceSummary, namespace, selectors,
+                                           k8s_tools._service_to_summary, k8s_tools._service_json_to_summary,
+                                           format, page_size, cursor, use_informer=not selectors)
+        fields = await _get_summary_fields('services', namespace, selectors, k8s_tools._service_to_summary,
+                                           k8s_tools._service_json_to_summary, use_informer=not selectors)
+    except httpx.HTTPError as e:
+        raise K8sApiError(f"Error fetching services: {_error_message(e)}") from e
+    return await asyncio.to_thread(k8s_tools._list_result, ServiceSummary, fields, format, max_items, max_bytes)
+
+get_service_summaries.__doc__ = k8s_tools.get_service_summaries.__doc__
+
+
+TOOLS = [
+    get_namespaces,
+    get_node_summaries,
+    get_pod_summaries,
+    get_pod_container_statuses,
+    get_namespace_container_statuses,
+    get_pod_events,
+    get_object_events,
+    get_pod_spec,
+    get_logs_for_pod_and_container,
+    search_pod_logs,
+    get_logs_for_workload,
+    get_deployment_summaries,
+    get_service_summaries
+]
+
+# Profile the calls of the tools if that was enabled through the environment (see tool_profiler)
+TOOLS = profile_tools(TOOLS, globals())
@@ -0,0 +1,90 @@
+# Copyright (c) 2025 Benedat LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+#
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""An index of the events in each namespace, keyed by the object they are about.
+
+Without the index, each call to get_pod_events() (or get_object_events()) does a LIST of
+the namespace's events with a field selector. With the index, the events of a namespace
+are listed once, grouped by involvedObject kind and name, and reused until they are
+older than the index's TTL. Looking up the events of another pod, deployment or node in
+the same namespace is then a dictionary lookup.
+
+The index is opt-in. See k8s_tools.enable_event_index().
+"""
+import logging
+import threading
+import time
+from typing import Any, Callable, Iterable, Optional
+
+
+class _NamespaceEvents:
+    """The events of one namespace, as of one list"""
+    def __init__(self, events:Iterable[Any]):
+        self.loaded_at = time.monotonic()
+        self.by_object:dict[tuple[str, str], list[Any]] = {}
+        self.count = 0
+        for event in events:
+            involved_object = event.involved_object
+            self.by_object.setdefault((involved_object.kind or "", involved_object.name or ""), []).append(event)
+            self.count += 1
+
+
+class EventIndex:
+    """Caches the events of each namespace, indexed by the object they involve.
+
+    Parameters
+    ----------
+    list_fn : Callable
+        Called with a namespace, returns all of that namespace's events
+        (e.g. a paged CoreV1Api.list_namespaced_event).
+    ttl_seconds : float, default=30.0
+        The events of a namespace are listed again on the first lookup after
+        they are older than this.
+    """
+    def __init__(self, list_fn:Callable[[str], Iterable[Any]], ttl_seconds:float=30.0):
+        self._list_fn = list_fn
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._namespaces:dict[str, _NamespaceEvents] = {}
+        # Held while a namespace is being listed, so concurrent lookups wait for one list
+        self._load_locks:dict[str, threading.Lock] = {}
+
+    def _get_namespace(self, namespace:str) -> _NamespaceEvents:
+        with self._lock:
+            entry = self._namespaces.get(namespace)
+            if entry is not None and time.monotonic() - entry.loaded_at <= self.ttl_seconds:
+                return entry
+            load_lock = self._load_locks.setdefault(namespace, threading.Lock())
+        with load_lock:
+            # Another thread may have refreshed the namespace while we waited
+            with self._lock:
+                entry = self._namespaces.get(namespace)
+                if entry is not None and time.monotonic() - entry.loaded_at <= self.ttl_seconds:
+                    return entry
+            entry = _NamespaceEvents(self._list_fn(namespace))
+            logging.info(f"Event index listed {entry.count} events in namespace {namespace}")
+            with self._lock:
+                self._namespaces[namespace] = entry
+            return entry
+
+    def get(self, namespace:str, kind:str, name:str) -> list[Any]:
+        """Return the events in the namespace about the object with the specified kind and name"""
+        return list(self._get_namespace(namespace).by_object.get((kind, name), []))
+
+    def invalidate(self, namespace:Optional[str]=None) -> None:
+        """Drop the cached events of a namespace (or of all namespaces), so that
+        the next lookup lists them again.
+        """
+        with self._lock:
+            if namespace is None:
+                self._namespaces.clear()
+            else:
+                self._namespaces.pop(namespace, None)
@@ -0,0 +1,527 @@
+# Copyright (c) 2025 Benedat LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+#
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""A lightweight stand-in for the Kubernetes API server, for end-to-end benchmarks.
+
+It serves the list, read, watch, and log endpoints used by the tools, for namespaces,
+nodes, pods, events, deployments, and services. The objects are generated from a synthetic
+cluster (see mock_tools.generate_cluster_data()), converted to the JSON returned by a real API
+server, so the tools' full HTTP and deserialization costs are measured. Label and field
+selectors and limit/continue paging are supported. Latency can be added to each request, and
+the page size can be capped to exercise paging.
+
+Limitations: the data does not change, so watches only send bookmarks; Table responses are
+not supported (a regular list is returned, which clients must accept); and there is no
+authentication.
+
+Example (from Python):
+
+    with FakeApiServer(num_pods=10000, num_nodes=100) as server:
+        server.configure_k8s_tools()
+        pods = k8s_tools.get_pod_summaries()
+
+Or run it from the command line and point kubectl or the MCP server at the kubeconfig it writes:
+
+    python -m k8stools.fake_apiserver --pods 10000 --kubeconfig /tmp/fake-kubeconfig
+    KUBECONFIG=/tmp/fake-kubeconfig k8s-mcp-server
+"""
+import argparse
+import datetime
+import json
+import logging
+import os
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterator, Optional
+from urllib.parse import parse_qs, urlparse
+
+import yaml
+
+from . import k8s_tools
+from . import mock_tools
+
+RESOURCE_VERSION = "1000"
+
+# Seconds between bookmark events on a watch
+WATCH_BOOKMARK_INTERVAL = 5.0
+
+
+def _timestamp(value:datetime.datetime) -> str:
+    return value.strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def _uid(kind:str, namespace:str, name:str) -> str:
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, f"{kind}/{namespace}/{name}"))
+
+
+def _metadata(kind:str, namespace:Optional[str], name:str, age:datetime.timedelta, now:datetime.datetime,
+              labels:Optional[dict[str, str]]=None) -> dict[str, Any]:
+    metadata:dict[str, Any] = {'name': name, 'uid': _uid(kind, namespace or "", name),
+                               'resourceVersion': RESOURCE_VERSION, 'creationTimestamp': _timestamp(now - age)}
+    if namespace is not None:
+        metadata['namespace'] = namespace
+    if labels:
+        metadata['labels'] = labels
+    return metadata
+
+
+def _container_state_json(state:Optional[k8s_tools.ContainerState]) -> dict[str, Any]:
+    if isinstance(state, k8s_tools.ContainerStateRunning):
+        return {'running': {'startedAt': _timestamp(state.started_at)}}
+    elif isinstance(state, k8s_tools.ContainerStateWaiting):
+        return {'waiting': {'reason': state.reason, 'message': state.message}}
+    elif isinstance(state, k8s_tools.ContainerStateTerminated):
+        return {'terminated': {'exitCode': state.exit_code or 0, 'reason': state.reason, 'message': state.message,
+                               'startedAt': _timestamp(state.started_at) if state.started_at else None,
+                               'finishedAt': _timestamp(state.finished_at) if state.finished_at else None}}
+    return {}
+
+
+def _pod_json(pod:k8s_tools.PodSummary, details:dict[str, Any], labels:dict[str, str],
+              now:datetime.datetime) -> dict[str, Any]:
+    statuses = mock_tools._synthetic_container_statuses(pod, details)
+    ready = pod.ready_containers == pod.total_containers
+    metadata = _metadata('Pod', pod.namespace, pod.name, pod.age, now, labels)
+    template_hash = labels.get('pod-template-hash')
+    if template_hash:
+        replica_set = f"{labels['app']}-{template_hash}"
+        metadata['ownerReferences'] = [{'apiVersion': 'apps/v1', 'kind': 'ReplicaSet', 'name': replica_set,
+                                        'uid': _uid('ReplicaSet', pod.namespace, replica_set),
+                                        'controller': True, 'blockOwnerDeletion': True}]
+    return {
+        'metadata': metadata,
+        'spec': {
+            'nodeName': pod.node,
+            'restartPolicy': 'Always',
+            'containers': [{'name': container_name, 'image': image,
+                            'ports': [{'containerPort': 8080, 'protocol': 'TCP'}] if i == 0 else [],
+                            'resources': {'limits': {'memory': '256Mi'},
+                                          'requests': {'cpu': '100m', 'memory': '128Mi'}},
+                            'volumeMounts': [{'name': 'kube-api-access',
+                                              'mountPath': '/var/run/secrets/kubernetes.io/serviceaccount',
+                                              'readOnly': True}]}
+                           for (i, (container_name, image)) in enumerate(details['containers'])],
+        },
+        'status': {
+            'phase': 'Pending' if details['mode'] in ('Pending', 'ImagePullBackOff') else 'Running',
+            'podIP': pod.ip,
+            'hostIP': None,
+            'startTime': _timestamp(now - pod.age),
+            'conditions': [{'type': 'PodScheduled', 'status': 'False' if details['mode'] == 'Pending' else 'True'},
+                           {'type': 'Ready', 'status': 'True' if ready else 'False'}],
+            'containerStatuses': [{
+                'name': status.container_name,
+                'image': status.image,
+                'imageID': f"{status.image}@sha256:{_uid('Image', '', status.image).replace('-', '')}",
+                'ready': status.ready,
+                'restartCount': status.restart_count,
+                'started': status.started,
+                'state': _container_state_json(status.state),
+                'lastState': _container_state_json(status.last_state),
+                'volumeMounts': [{'name': m.name, 'mountPath': m.mount_path, 'readOnly': m.read_only,
+                                  'recursiveReadOnly': m.recursive_read_only} for m in status.volume_mounts],
+                'resources': {'requests': status.resource_requests, 'limits': status.resource_limits},
+                'allocatedResources': status.allocated_resources,
+            } for status in statuses] if details['mode'] != 'Pending' else [],
+        },
+    }
+
+
+def _node_json(node:k8s_tools.NodeSummary, now:datetime.datetime) -> dict[str, Any]:
+    labels = {'kubernetes.io/hostname': node.name, 'kubernetes.io/os': 'linux'}
+    for role in node.roles:
+        if role != "<none>":
+            labels[f"node-role.kubernetes.io/{role}"] = ""
+    return {
+        'metadata': _metadata('Node', None, node.name, node.age, now, labels),
+        'status': {
+            'conditions': [{'type': 'Ready', 'status': 'True' if node.status == 'Ready' else 'False'}],
+            'addresses': [{'type': 'InternalIP', 'address': node.internal_ip},
+                          {'type': 'Hostname', 'address': node.name}],
+            'nodeInfo': {'kubeletVersion': node.version, 'kubeProxyVersion': node.version,
+                         'osImage': node.os_image, 'kernelVersion': node.kernel_version,
+                         'containerRuntimeVersion': node.container_runtime, 'architecture': 'amd64',
+                         'operatingSystem': 'linux', 'bootID': _uid('Boot', '', node.name),
+                         'machineID': _uid('Machine', '', node.name), 'systemUUID': _uid('System', '', node.name)},
+        },
+    }
+
+
+def _deployment_json(deployment:k8s_tools.DeploymentSummary, labels:dict[str, str],
+                     now:datetime.datetime) -> dict[str, Any]:
+    return {
+        'metadata': _metadata('Deployment', deployment.namespace, deployment.name, deployment.age, now, labels),
+        'spec': {
+            'replicas': deployment.total_replicas,
+            'selector': {'matchLabels': labels},
+            'template': {'metadata': {'labels': labels},
+                         'spec': {'containers': [{'name': deployment.name}]}},
+        },
+        'status': {'replicas': deployment.total_replicas, 'readyReplicas': deployment.ready_replicas,
+                   'updatedReplicas': deployment.up_to_date_relicas,
+                   'availableReplicas': deployment.available_replicas},
+    }
+
+
+def _service_json(service:k8s_tools.ServiceSummary, labels:dict[str, str], now:datetime.datetime) -> dict[str, Any]:
+    return {
+        'metadata': _metadata('Service', service.namespace, service.name, service.age, now, labels),
+        'spec': {'type': service.type, 'clusterIP': service.cluster_ip, 'selector': labels,
+                 'ports': [{'port': p.port, 'protocol': p.protocol, 'targetPort': 8080} for p in service.ports]},
+        'status': {'loadBalancer': {'ingress': [{'ip': service.external_ip}]} if service.external_ip else {}},
+    }
+
+
+def _event_json(event:k8s_tools.EventSummary, kind:str, namespace:str, index:int,
+                now:datetime.datetime) -> dict[str, Any]:
+    last_seen = now - (event.last_seen or datetime.timedelta(0))
+    return {
+        'metadata': {'name': f"{event.object}.{index:x}", 'namespace': namespace,
+                     'uid': _uid('Event', namespace, f"{event.object}.{index}"),
+                     'resourceVersion': RESOURCE_VERSION, 'creationTimestamp': _timestamp(last_seen)},
+        'involvedObject': {'kind': kind, 'name': event.object, 'namespace': namespace if kind != 'Node' else None,
+                           'uid': _uid(kind, namespace if kind != 'Node' else "", event.object)},
+        'type': event.type,
+        'reason': event.reason,
+        'message': event.message,
+        'count': 1,
+        'firstTimestamp': _timestamp(last_seen),
+        'lastTimestamp': _timestamp(last_seen),
+        'source': {'component': 'kubelet' if kind == 'Pod' else 'controller'},
+    }
+
+
+class _StoredObject:
+    """An object in the store, with its JSON pre-serialized for list and read responses"""
+    __slots__ = ('obj', 'body')
+
+    def __init__(self, obj:dict[str, Any]):
+        self.obj = obj
+        self.body = json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+class _Resource:
+    """The objects of one kind, ordered by namespace and name"""
+    def __init__(self, kind:str, api_version:str, objects:list[dict[str, Any]]):
+        self.kind = kind
+        self.api_version = api_version
+        self.objects = [_StoredObject(obj) for obj in
+                        sorted(objects, key=lambda o: (o['metadata'].get('namespace') or "", o['metadata']['name']))]
+        self.by_key = {(o.obj['metadata'].get('namespace'), o.obj['metadata']['name']): o for o in self.objects}
+        self.by_namespace:dict[str, list[_StoredObject]] = {}
+        for o in self.objects:
+            self.by_namespace.setdefault(o.obj['metadata'].get('namespace') or "", []).append(o)
+
+
+def build_cluster_objects(data:dict[str, Any]) -> dict[str, list[dict[str, Any]]]:
+    """Convert mock data (as returned by mock_tools.generate_cluster_data()) to the JSON
+    objects a real API server would return, keyed by resource name (e.g. 'pods').
+    """
+    now = datetime.datetime.now(datetime.timezone.utc)
+    labels = data['labels']
+    pod_details = data['pod_details']
+    pods = [_pod_json(pod, pod_details[(pod.namespace, pod.name)], labels.get(('pods', pod.namespace, pod.name), {}), now)
+            for pod in data['pods'] if (pod.namespace, pod.name) in pod_details]
+    events:list[dict[str, Any]] = []
+    # Like a real cluster, the events of healthy pods have expired, so there are only events for the others
+    for pod in data['pods']:
+        details = pod_details.get((pod.namespace, pod.name))
+        if details is not None and details['mode'] != 'Running':
+            events.extend(_event_json(event, 'Pod', pod.namespace, len(events), now)
+                          for event in mock_tools._synthetic_pod_events(pod, details))
+    for node in data['nodes']:
+        if node.status != 'Ready':
+            event = k8s_tools.EventSummary(last_seen=datetime.timedelta(minutes=2), type="Normal",
+                                           reason="NodeNotReady", object=node.name,
+                                           message=f"Node {node.name} status is now: NodeNotReady")
+            events.append(_event_json(event, 'Node', 'default', len(events), now))
+    return {
+        'namespaces': [{'metadata': _metadata('Namespace', None, ns.name, ns.age, now),
+                        'status': {'phase': ns.status}} for ns in data['namespaces']],
+        'nodes': [_node_json(node, now) for node in data['nodes']],
+        'pods': pods,
+        'events': events,
+        'deployments': [_deployment_json(d, labels.get(('deployments', d.namespace, d.name), {}), now)
+                        for d in data['deployments']],
+        'services': [_service_json(s, labels.get(('services', s.namespace, s.name), {}), now)
+                     for s in data['services']],
+    }
+
+
+_RESOURCE_KINDS = {
+    'namespaces': ('Namespace', 'v1'),
+    'nodes': ('Node', 'v1'),
+    'pods': ('Pod', 'v1'),
+    'events': ('Event', 'v1'),
+    'deployments': ('Deployment', 'apps/v1'),
+    'services': ('Service', 'v1'),
+}
+
+# /api/v1/{resource}, /api/v1/namespaces/{namespace}/{resource}[/{name}[/log]], and the same under /apis/apps/v1
+_PATH_RE = re.compile(r"^/(?:api/v1|apis/apps/v1)(?:/namespaces/(?P<namespace>[^/]+)(?=/))?"
+                      r"/(?P<resource>[a-z]+)(?:/(?P<name>[^/]+)(?:/(?P<subresource>log))?)?$")
+
+
+def _is_true(value:Optional[str]) -> bool:
+    # the kubernetes client sends booleans as "True"
+    return value is not None and value.lower() in ('true', '1')
+
+
+def _field_value(obj:dict[str, Any], path:str) -> str:
+    value:Any = obj
+    for part in path.split('.'):
+        value = value.get(part) if isinstance(value, dict) else None
+    return "" if value is None else str(value)
+
+
+def _matches_field_selector(obj:dict[str, Any], field_selector:str) -> bool:
+    for requirement in mock_tools._split_selector(field_selector):
+        m = re.match(r"^\s*([\w.]+)\s*(==|!=|=)\s*(.*?)\s*$", requirement)
+        if m is None:
+            raise ValueError(f"invalid field selector '{field_selector}'")
+        if (_field_value(obj, m.group(1)) == m.group(3)) != (m.group(2) != '!='):
+            return False
+    return True
+
+
+class FakeApiServer:
+    """Serves a synthetic cluster over HTTP, like the Kubernetes API server.
+
+    Parameters
+    ----------
+    data : Optional[dict[str, Any]], default=None
+        Mock data from mock_tools.generate_cluster_data(). If None, it is generated
+        from generate_kwargs.
+    latency : float, default=0.0
+        Seconds to wait before answering each request.
+    max_page_size : Optional[int], default=None
+        If specified, list responses contain at most this many items, with a continue
+        token for the rest (even if the client did not ask for paging).
+    host : str, default="127.0.0.1"
+    port : int, default=0
+        Port to listen on. 0 picks a free port.
+    generate_kwargs
+        Passed to mock_tools.generate_cluster_data() if data is None
+        (e.g. num_pods=10000, num_nodes=100).
+    """
+    def __init__(self, data:Optional[dict[str, Any]]=None, latency:float=0.0, max_page_size:Optional[int]=None,
+                 host:str="127.0.0.1", port:int=0, **generate_kwargs:Any):
+        if data is None:
+            data = mock_tools.generate_cluster_data(**generate_kwargs)
+        self.data = mock_tools._index_mock_data(data)
+        self.resources = {name: _Resource(_RESOURCE_KINDS[name][0], _RESOURCE_KINDS[name][1], objects)
+                          for (name, objects) in build_cluster_objects(data).items()}
+        self.latency = latency
+        self.max_page_size = max_page_size
+        self.request_count = 0
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread:Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        (host, port) = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'FakeApiServer':
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="fake-apiserver", daemon=True)
+        self._thread.start()
+        logging.info(f"Fake API server listening on {self.url}")
+        return self
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> 'FakeApiServer':
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def write_kubeconfig(self, path:str) -> str:
+        """Write a kubeconfig file for this server to path, and return path"""
+        kubeconfig = {
+            'apiVersion': 'v1',
+            'kind': 'Config',
+            'clusters': [{'name': 'fake', 'cluster': {'server': self.url}}],
+            'users': [{'name': 'fake', 'user': {'token': 'fake-token'}}],
+            'contexts': [{'name': 'fake', 'context': {'cluster': 'fake', 'user': 'fake'}}],
+            'current-context': 'fake',
+        }
+        with open(path, 'w') as f:
+            yaml.safe_dump(kubeconfig, f)
+        return path
+
+    def configure_k8s_tools(self, kubeconfig_path:Optional[str]=None) -> str:
+        """Point k8s_tools (and async_tools) at this server: write a kubeconfig, set $KUBECONFIG
+        to it, and drop any existing API clients so they are recreated. Returns the kubeconfig path.
+        """
+        from . import async_tools
+        if kubeconfig_path is None:
+            kubeconfig_path = os.path.join(os.environ.get('TMPDIR', '/tmp'),
+                                           f"k8stools-fake-kubeconfig-{self._httpd.server_address[1]}")
+        self.write_kubeconfig(kubeconfig_path)
+        os.environ['KUBECONFIG'] = kubeconfig_path
+        k8s_tools.API_CLIENT = None
+        k8s_tools.K8S = None
+        k8s_tools.APPS_V1_API = None
+        async_tools.HTTP_CLIENT = None
+        return kubeconfig_path
+
+    def _list(self, resource:_Resource, namespace:Optional[str], query:dict[str, str]) -> bytes:
+        objects = resource.by_namespace.get(namespace, []) if namespace else resource.objects
+        if query.get('labelSelector'):
+            objects = [o for o in objects
+                       if mock_tools._matches_label_selector(o.obj['metadata'].get('labels') or {},
+                                                             query['labelSelector'])]
+        if query.get('fieldSelector'):
+            objects = [o for o in objects if _matches_field_selector(o.obj, query['fieldSelector'])]
+        start = int(query.get('continue') or 0)
+        limits = [int(query['limit'])] if int(query.get('limit') or 0) > 0 else []
+        if self.max_page_size:
+            limits.append(self.max_page_size)
+        end = min([start + limit for limit in limits] + [len(objects)])
+        metadata:dict[str, Any] = {'resourceVersion': RESOURCE_VERSION}
+        if end < len(objects):
+            metadata['continue'] = str(end)
+            metadata['remainingItemCount'] = len(objects) - end
+        return b''.join([
+            json.dumps({'kind': f"{resource.kind}List", 'apiVersion': resource.api_version,
+                        'metadata': metadata}, separators=(',', ':'))[:-1].encode('utf-8'),
+            b',"items":[', b','.join(o.body for o in objects[start:end]), b']}'])
+
+    def _logs(self, pod:dict[str, Any], query:dict[str, str]) -> bytes:
+        namespace = pod['metadata']['namespace']
+        name = pod['metadata']['name']
+        summary = self.data['pod_index'][(namespace, name)]
+        logs = mock_tools._synthetic_logs(summary, self.data['pod_details'][(namespace, name)], query.get('container'))
+        lines = logs.splitlines()
+        if not _is_true(query.get('timestamps')):
+            lines = [line.split(' ', 1)[1] if ' ' in line else line for line in lines]
+        if query.get('tailLines'):
+            lines = lines[-int(query['tailLines']):] if int(query['tailLines']) > 0 else []
+        body = ''.join(line + '\n' for line in lines).encode('utf-8')
+        if query.get('limitBytes'):
+            body = body[:int(query['limitBytes'])]
+        return body
+
+    def _watch_events(self, resource:_Resource, query:dict[str, str]) -> Iterator[bytes]:
+        """The data never changes, so a watch only sends bookmarks until it times out"""
+        deadline = time.monotonic() + float(query.get('timeoutSeconds') or 1800)
+        while not self._stop_event.wait(min(WATCH_BOOKMARK_INTERVAL, max(deadline - time.monotonic(), 0))):
+            if time.monotonic() >= deadline:
+                return
+            if _is_true(query.get('allowWatchBookmarks')):
+                yield json.dumps({'type': 'BOOKMARK',
+                                  'object': {'kind': resource.kind, 'apiVersion': resource.api_version,
+                                             'metadata': {'resourceVersion': RESOURCE_VERSION}}}).encode('utf-8') + b'\n'
+
+    def _make_handler(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                logging.debug(f"fake_apiserver: {format % args}")
+
+            def _send(self, status:int, body:bytes, content_type:str='application/json') -> None:
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _send_status(self, code:int, reason:str, message:str) -> None:
+                self._send(code, json.dumps({'kind': 'Status', 'apiVersion': 'v1', 'status': 'Failure',
+                                             'message': message, 'reason': reason, 'code': code}).encode('utf-8'))
+
+            def do_GET(self):
+                with server._lock:
+                    server.request_count += 1
+                if server.latency > 0:
+                    time.sleep(server.latency)
+                url = urlparse(self.path)
+                query = {key: values[-1] for (key, values) in parse_qs(url.query).items()}
+                m = _PATH_RE.match(url.path)
+                resource = server.resources.get(m.group('resource')) if m else None
+                if m is None or resource is None:
+                    self._send_status(404, 'NotFound', f"the server could not find the requested resource")
+                    return
+                (namespace, name) = (m.group('namespace'), m.group('name'))
+                try:
+                    if name is None and _is_true(query.get('watch')):
+                        self.send_response(200)
+                        self.send_header('Content-Type', 'application/json')
+                        self.send_header('Connection', 'close')
+                        self.end_headers()
+                        self.close_connection = True
+                        for event in server._watch_events(resource, query):
+                            self.wfile.write(event)
+                            self.wfile.flush()
+                    elif name is None:
+                        self._send(200, server._list(resource, namespace, query))
+                    else:
+                        key = (namespace if resource.kind not in ('Namespace', 'Node') else None, name)
+                        obj = resource.by_key.get(key)
+                        if obj is None:
+                            self._send_status(404, 'NotFound', f'{m.group("resource")} "{name}" not found')
+                        elif m.group('subresource') == 'log':
+                            self._send(200, server._logs(obj.obj, query), 'text/plain')
+                        else:
+                            self._send(200, obj.body)
+                except ValueError as e:
+                    self._send_status(400, 'BadRequest', str(e))
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a fake Kubernetes API server that serves a synthetic cluster.")
+    parser.add_argument('--pods', type=int, default=1000, help="Number of pods [default: 1000]")
+    parser.add_argument('--nodes', type=int, default=20, help="Number of nodes [default: 20]")
+    parser.add_argument('--namespaces', type=int, default=10, help="Number of namespaces [default: 10]")
+    parser.add_argument('--seed', type=int, default=0, help="Random seed for the cluster [default: 0]")
+    parser.add_argument('--latency', type=float, default=0.0,
+                        help="Seconds to wait before answering each request [default: 0]")
+    parser.add_argument('--max-page-size', type=int, default=None,
+                        help="Maximum number of items in each list response [default: no limit]")
+    parser.add_argument('--host', default='127.0.0.1', help="Address to listen on [default: 127.0.0.1]")
+    parser.add_argument('--port', type=int, default=8001, help="Port to listen on [default: 8001]")
+    parser.add_argument('--kubeconfig', default=None,
+                        help="If specified, write a kubeconfig for the server to this file")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    server = FakeApiServer(latency=args.latency, max_page_size=args.max_page_size, host=args.host, port=args.port,
+                           num_pods=args.pods, num_nodes=args.nodes, num_namespaces=args.namespaces, seed=args.seed)
+    if args.kubeconfig:
+        server.write_kubeconfig(args.kubeconfig)
+        logging.info(f"Wrote kubeconfig to {args.kubeconfig}")
+    server.start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
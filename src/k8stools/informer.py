@@ -0,0 +1,221 @@
+# Copyright (c) 2025 Benedat LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+#
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Watch-backed informers that keep an in-process copy of cluster objects.
+
+An informer does one initial LIST of a kind of object, and then runs a WATCH
+starting from the resourceVersion returned by that list. Events from the watch
+are applied to an in-memory store, which the tools in k8s_tools can read instead of
+going to the API server. If the watch falls too far behind (the server returns
+410 Gone), the informer relists and starts a new watch.
+
+Informers are opt-in. See k8s_tools.enable_informers().
+"""
+import logging
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from pydantic import BaseModel
+from kubernetes import watch
+from kubernetes.client import ApiException
+
+HTTP_STATUS_GONE = 410
+# Added to the server-side watch timeout to get the client-side read timeout
+WATCH_TIMEOUT_MARGIN = 30
+
+
+class InformerStatus(BaseModel):
+    """Status of an informer, used to judge how fresh its data is."""
+    kind: str
+    synced: bool
+    object_count: int
+    resource_version: Optional[str] = None
+    staleness_seconds: Optional[float] = None
+    relists: int
+
+
+def _object_key(obj:Any) -> tuple[str, str]:
+    return (obj.metadata.namespace or "", obj.metadata.name)
+
+
+class Informer:
+    """Maintains a store of one kind of object, kept current by a watch.
+
+    Parameters
+    ----------
+    kind : str
+        Name of the kind of object, used in log messages and status (e.g. "pods").
+    list_fn : Callable
+        A kubernetes client list function covering all namespaces
+        (e.g. CoreV1Api.list_pod_for_all_namespaces). It is called without arguments
+        for the initial list and with watch=True for the watch.
+    watch_timeout_seconds : int, default=300
+        Server-side timeout for each watch request. When it expires, the watch is
+        restarted from the last seen resourceVersion.
+    page_size : int, default=0
+        If greater than zero, the initial list (and any relist) is done in pages of
+        this size using the continue token.
+    """
+    def __init__(self, kind:str, list_fn:Callable[..., Any], watch_timeout_seconds:int=300,
+                 page_size:int=0):
+        self.kind = kind
+        self._list_fn = list_fn
+        self.watch_timeout_seconds = watch_timeout_seconds
+        self.page_size = page_size
+        self._lock = threading.Lock()
+        self._store:dict[tuple[str, str], Any] = {}
+        self._sorted_items:Optional[list[Any]] = None
+        self.resource_version:Optional[str] = None
+        self.relists = 0
+        self._last_sync:Optional[float] = None
+        # True while a watch request is open, during which the store is kept current
+        self._watching = False
+        self._stop_event = threading.Event()
+        self._watch:Optional[watch.Watch] = None
+        self._thread:Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Do the initial list and start the watch in a daemon thread."""
+        self.relist()
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name=f"informer-{self.kind}", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the watch thread. The store keeps its last contents."""
+        self._stop_event.set()
+        if self._watch is not None:
+            self._watch.stop()
+
+    def relist(self) -> None:
+        """Replace the store with the result of a full list."""
+        store:dict[tuple[str, str], Any] = {}
+        kwargs:dict[str, Any] = {'limit': self.page_size} if self.page_size > 0 else {}
+        while True:
+            result = self._list_fn(**kwargs)
+            for obj in result.items:
+                store[_object_key(obj)] = obj
+            continue_token = getattr(result.metadata, '_continue', None)
+            if not continue_token:
+                break
+            kwargs['_continue'] = continue_token
+        with self._lock:
+            self._store = store
+            self._sorted_items = None
+            # All pages of a list come from the same snapshot, so they share a resourceVersion
+            self.resource_version = result.metadata.resource_version
+            self.relists += 1
+            self._last_sync = time.monotonic()
+        logging.info(f"Informer for {self.kind} listed {len(store)} objects at resourceVersion {self.resource_version}")
+
+    def apply_event(self, event:dict[str, Any]) -> None:
+        """Apply a single watch event to the store."""
+        event_type = event['type']
+        with self._lock:
+            if event_type == 'BOOKMARK':
+                self.resource_version = event['raw_object']['metadata']['resourceVersion']
+            else:
+                obj = event['object']
+                key = _object_key(obj)
+                if event_type == 'DELETED':
+                    self._store.pop(key, None)
+                else: # ADDED or MODIFIED
+                    self._store[key] = obj
+                self._sorted_items = None
+                self.resource_version = obj.metadata.resource_version
+            self._last_sync = time.monotonic()
+
+    def watch_once(self) -> None:
+        """Run one watch request until it times out or is stopped. On a 410 Gone
+        response, relist so that the next watch starts from a valid resourceVersion.
+        """
+        self._watch = watch.Watch()
+        with self._lock:
+            self._watching = True
+        ended_normally = False
+        try:
+            for event in self._watch.stream(self._list_fn,
+                                            resource_version=self.resource_version,
+                                            timeout_seconds=self.watch_timeout_seconds,
+                                            allow_watch_bookmarks=True,
+                                            # A watch can be idle for a long time, so don't use
+                                            # the default client-side timeout for requests
+                                            _request_timeout=self.watch_timeout_seconds + WATCH_TIMEOUT_MARGIN):
+                self.apply_event(event)
+            ended_normally = True
+        except ApiException as e:
+            if e.status != HTTP_STATUS_GONE:
+                raise
+            logging.info(f"Informer for {self.kind}: resourceVersion {self.resource_version} is gone, relisting")
+            self.relist()
+        finally:
+            with self._lock:
+                self._watching = False
+                # The watch ended normally, so the data was current as of now, even if
+                # there were no events (e.g. a quiet namespace and no bookmarks)
+                if ended_normally and not self._stop_event.is_set():
+                    self._last_sync = time.monotonic()
+
+    def _run(self) -> None:
+        backoff = 1.0
+        while not self._stop_event.is_set():
+            try:
+                self.watch_once()
+                backoff = 1.0
+            except Exception as e:
+                logging.warning(f"Informer for {self.kind}: watch failed ({e}), retrying in {backoff} seconds")
+                self._stop_event.wait(backoff)
+                backoff = min(backoff * 2, 60.0)
+
+    @property
+    def synced(self) -> bool:
+        return self._last_sync is not None
+
+    def staleness(self) -> Optional[float]:
+        """Seconds since the store was last known to be current, or None if it
+        has never been synced. While a watch is open, the store is current, even if
+        no events have been received. (A watch whose connection has silently died
+        times out WATCH_TIMEOUT_MARGIN seconds after the server-side timeout.)
+        """
+        with self._lock:
+            return self._staleness()
+
+    def _staleness(self) -> Optional[float]:
+        # the caller holds self._lock
+        if self._last_sync is None:
+            return None
+        if self._watching:
+            return 0.0
+        return time.monotonic() - self._last_sync
+
+    def list(self, namespace:Optional[str]=None) -> list[Any]:
+        """Return the objects in the store, ordered by namespace and name like
+        a LIST from the API server. If namespace is specified, only return objects
+        in that namespace.
+        """
+        with self._lock:
+            if self._sorted_items is None:
+                self._sorted_items = [self._store[key] for key in sorted(self._store)]
+            items = self._sorted_items
+        if namespace:
+            return [obj for obj in items if obj.metadata.namespace == namespace]
+        return items
+
+    def status(self) -> InformerStatus:
+        with self._lock:
+            staleness = self._staleness()
+            return InformerStatus(kind=self.kind,
+                                  synced=self.synced,
+                                  object_count=len(self._store),
+                                  resource_version=self.resource_version,
+                                  staleness_seconds=round(staleness, 3) if staleness is not None else None,
+                                  relists=self.relists)
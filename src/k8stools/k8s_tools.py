@@ -14,19 +14,109 @@
 
 import sys
 import os
+import json
+import re
+import collections
+import concurrent.futures
+import contextvars
+import math
+import time
+import socket
 import logging
 import datetime
-from typing import Optional, Union, Literal, Any
-
-from pydantic import BaseModel, Field
-import yaml
-
-from kubernetes import client, config
-from kubernetes.client import V1PodSpec, ApiException
-from kubernetes.client.models.v1_container_status import V1ContainerStatus
-
-K8S:Optional[client.CoreV1Api] = None
-APPS_V1_API:Optional[client.AppsV1Api] = None
+import functools
+import importlib
+import threading
+import typing
+from typing import Optional, Union, Literal, Any, Callable, Generic, Iterable, Iterator, TypeVar, TYPE_CHECKING
+
+import pydantic_core
+from pydantic import BaseModel, Field, TypeAdapter
+
+try:
+    # orjson is optional (pip install k8stools[fast]), but parses large list responses much faster
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+from .tool_metrics import record_api_request
+from .tool_profiler import profile_tools
+from . import paging
+
+
+class _LazyModule:
+    """Stands in for a module that is imported when one of its attributes is first used."""
+    def __init__(self, name:str):
+        self._name = name
+        self._module:Any = None
+
+    def __getattr__(self, attr:str) -> Any:
+        if attr.startswith('__'):
+            raise AttributeError(attr)
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+
+if TYPE_CHECKING:
+    import urllib3
+    import yaml
+    from kubernetes import client, config
+    from .informer import Informer, InformerStatus
+    from .event_index import EventIndex
+else:
+    # The kubernetes client has hundreds of model modules and takes about half a second to
+    # import. It is only imported when first used, so that processes which never call the API
+    # server (e.g. k8s-mcp-server --mock, or one that has not received a tool call yet) start quickly.
+    client = _LazyModule('kubernetes.client')
+    config = _LazyModule('kubernetes.config')
+    urllib3 = _LazyModule('urllib3')
+    yaml = _LazyModule('yaml')
+
+
+def __getattr__(name:str) -> Any:
+    # These were imported from the kubernetes client into this module, keep them available
+    if name in ('ApiException', 'V1PodSpec', 'V1ContainerStatus'):
+        return getattr(client, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+K8S:Optional['client.CoreV1Api'] = None
+APPS_V1_API:Optional['client.AppsV1Api'] = None
+
+# A single ApiClient (and thus a single connection pool) is shared by all the API groups.
+# It is created on first use, from the settings below.
+API_CLIENT:Optional['client.ApiClient'] = None
+_API_CLIENT_LOCK = threading.Lock()
+# Maximum number of connections to the API server kept in the pool. This bounds the
+# number of requests that can be in flight at once (the kubernetes client default is 4).
+CONNECTION_POOL_MAXSIZE:int = int(os.environ.get('K8STOOLS_CONNECTION_POOL_MAXSIZE', '32'))
+# Timeout in seconds (for both connecting and reading) for requests that do not specify
+# their own _request_timeout. Set to 0 for no timeout.
+REQUEST_TIMEOUT:float = float(os.environ.get('K8STOOLS_REQUEST_TIMEOUT', '60'))
+
+# Maximum number of objects requested by each LIST call. Larger result sets are fetched
+# in chunks using the continue token, so memory use is bounded by the page size rather
+# than the size of the cluster. Set to 0 to fetch everything in one call.
+LIST_PAGE_SIZE:int = int(os.environ.get('K8STOOLS_LIST_PAGE_SIZE', '500'))
+
+# How LIST responses are decoded. "model" deserializes them into the kubernetes client
+# models (V1Pod, etc.). "json" skips the models: the response body is parsed as JSON and only
+# the fields needed by the summaries are read, which is much faster for large lists. "table"
+# asks the API server for a Table (the format used by `kubectl get`), so that only the printed
+# columns and the object metadata are sent. If the server cannot return a Table for a resource,
+# it sends a regular list, which is handled like the "json" mode.
+LIST_RESPONSE_MODE:Literal['model', 'json', 'table'] = os.environ.get('K8STOOLS_LIST_RESPONSE_MODE', 'model') # type: ignore
+
+# Informers keyed by kind. This is empty unless enable_informers() has been called.
+INFORMERS:dict[str, 'Informer'] = {}
+INFORMER_KINDS = ('namespaces', 'nodes', 'pods', 'deployments', 'services')
+# If an informer has not been synced within this many seconds, the tools go
+# directly to the API server instead.
+INFORMER_MAX_STALENESS:float = 120.0
+
+# Index of events by involved object. This is None unless enable_event_index() has been called.
+EVENT_INDEX:Optional['EventIndex'] = None
 
 class K8sConfigError(Exception):
     """This is thrown when atempting to load the config or initializing the API fails."""
@@ -36,38 +126,684 @@ class K8sApiError(Exception):
     """This is thrown when one of the kubernetes calls (other than initial API load) fails."""
     pass
 
-def _get_api_client() -> client.CoreV1Api:
+def _new_api_client(configuration:'client.Configuration') -> 'client.ApiClient':
+    """Return an ApiClient that applies REQUEST_TIMEOUT to requests made without a timeout.
+    The class is defined here since it subclasses the lazily imported client.ApiClient."""
+    class _ApiClient(client.ApiClient):
+        def request(self, method, url, query_params=None, headers=None, post_params=None, body=None,
+                    _preload_content=True, _request_timeout=None):
+            if _request_timeout is None and REQUEST_TIMEOUT > 0:
+                # the client only accepts integers or (connect, read) tuples
+                _request_timeout = (REQUEST_TIMEOUT, REQUEST_TIMEOUT)
+            record_api_request()
+            return super().request(method, url, query_params=query_params, headers=headers,
+                                   post_params=post_params, body=body, _preload_content=_preload_content,
+                                   _request_timeout=_request_timeout)
+    return _ApiClient(configuration)
+
+
+def _load_configuration() -> 'client.Configuration':
+    configuration = client.Configuration()
     try:
-        config.load_kube_config()
-        return client.CoreV1Api()
+        # The kubernetes package reads $KUBECONFIG when it is imported, so check it again here
+        # in case it was set afterwards (e.g. to point at fake_apiserver)
+        if os.environ.get('KUBECONFIG'):
+            config.load_kube_config(config_file=os.environ['KUBECONFIG'], client_configuration=configuration)
+        else:
+            config.load_kube_config(client_configuration=configuration)
+        return configuration
     except config.ConfigException:
         logging.warning("Could not load kube config. Ensure you have a valid Kubernetes configuration.")
         logging.warning("Attempting to load in-cluster config...")
         try:
-            config.load_incluster_config()
-            return client.CoreV1Api()
+            config.load_incluster_config(client_configuration=configuration)
+            return configuration
         except config.ConfigException as e:
             raise K8sConfigError("Could not load in-cluster config. No Kubernetes config found.") from e
         except Exception as e:
             raise K8sConfigError(f"Unexpected error: {e}") from e
 
 
-def _get_apps_v1_api_client() -> client.AppsV1Api:
+def _get_shared_api_client() -> 'client.ApiClient':
+    """Return the ApiClient shared by all the API groups, creating it on the first call."""
+    global API_CLIENT
+    with _API_CLIENT_LOCK:
+        if API_CLIENT is None:
+            configuration = _load_configuration()
+            configuration.connection_pool_maxsize = CONNECTION_POOL_MAXSIZE
+            api_client = _new_api_client(configuration)
+            # Enable TCP keepalive, so that idle connections in the pool are not silently
+            # dropped by NAT gateways or load balancers in front of the API server
+            from urllib3.connection import HTTPConnection
+            api_client.rest_client.pool_manager.connection_pool_kw['socket_options'] = \
+                HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+            API_CLIENT = api_client
+        return API_CLIENT
+
+
+def _get_api_client() -> 'client.CoreV1Api':
+    return client.CoreV1Api(_get_shared_api_client())
+
+
+def _get_apps_v1_api_client() -> 'client.AppsV1Api':
+    return client.AppsV1Api(_get_shared_api_client())
+
+
+def _list_in_pages(list_fn:Callable[..., Any], **kwargs) -> Iterator[Any]:
+    """Call a kubernetes list function with limit/continue until all pages have been
+    retrieved, yielding the items one at a time. Only one page is held in memory.
+    Any ApiException is passed through to the caller.
+    """
+    continue_token:Optional[str] = None
+    while True:
+        if LIST_PAGE_SIZE > 0:
+            kwargs['limit'] = LIST_PAGE_SIZE
+        if continue_token:
+            kwargs['_continue'] = continue_token
+        result = list_fn(**kwargs)
+        yield from result.items
+        metadata = getattr(result, 'metadata', None)
+        continue_token = getattr(metadata, '_continue', None) if metadata is not None else None
+        if not continue_token:
+            return
+
+
+def _list_json_in_pages(list_fn:Callable[..., Any], **kwargs) -> Iterator[dict[str, Any]]:
+    """Like _list_in_pages(), but the responses are not deserialized into the client
+    models. Instead, each item is yielded as a dict parsed directly from the response JSON
+    (with the API's camelCase field names).
+    """
+    continue_token:Optional[str] = None
+    while True:
+        if LIST_PAGE_SIZE > 0:
+            kwargs['limit'] = LIST_PAGE_SIZE
+        if continue_token:
+            kwargs['_continue'] = continue_token
+        response = list_fn(_preload_content=False, **kwargs)
+        try:
+            result = _json_loads(response.data)
+        finally:
+            response.release_conn()
+        yield from result.get('items') or []
+        continue_token = (result.get('metadata') or {}).get('continue')
+        if not continue_token:
+            return
+
+
+# Prefer a Table, but accept a regular list from servers (e.g. aggregated APIs) that can't produce one
+TABLE_ACCEPT_HEADER = 'application/json;as=Table;v=v1;g=meta.k8s.io,application/json'
+
+# Paths for listing each kind, for all namespaces and for a single namespace. These are
+# used for Table requests (the generated list functions do not allow the Accept header
+# to be overridden, so those requests are made through ApiClient.call_api()) and by async_tools.
+_LIST_RESOURCE_PATHS:dict[str, tuple[str, Optional[str]]] = {
+    'namespaces': ('/api/v1/namespaces', None),
+    'nodes': ('/api/v1/nodes', None),
+    'pods': ('/api/v1/pods', '/api/v1/namespaces/{namespace}/pods'),
+    'deployments': ('/apis/apps/v1/deployments', '/apis/apps/v1/namespaces/{namespace}/deployments'),
+    'services': ('/api/v1/services', '/api/v1/namespaces/{namespace}/services'),
+}
+
+HTTP_STATUS_NOT_ACCEPTABLE = 406
+
+
+def _list_table_summaries(kind:str, list_fn:Callable[..., Any], list_kwargs:dict[str, Any],
+                          table_row_to_summary:Callable[[dict[str, Any], datetime.datetime], dict[str, Any]],
+                          json_to_summary:Callable[[dict[str, Any], datetime.datetime], dict[str, Any]],
+                          current_time_utc:datetime.datetime) -> list[dict[str, Any]]:
+    """Build the fields of the summaries from Table responses, in pages. Each row includes the object's
+    metadata (includeObject=Metadata), since the columns do not include the namespace
+    or the exact creation time. Pages that come back as regular lists are passed to
+    json_to_summary. ApiExceptions other than 406 Not Acceptable are passed through.
+    """
+    summaries:list[dict[str, Any]] = []
+    continue_token:Optional[str] = None
+    while True:
+        try:
+            result = _request_table(kind, list_fn, list_kwargs, LIST_PAGE_SIZE, continue_token)
+        except client.ApiException as e:
+            if e.status != HTTP_STATUS_NOT_ACCEPTABLE:
+                raise
+            logging.warning(f"API server did not accept a Table request for {kind}, using a regular list")
+            return [json_to_summary(obj, current_time_utc) for obj in _list_json_in_pages(list_fn, **list_kwargs)]
+        summaries.extend(_table_result_to_summaries(result, table_row_to_summary, json_to_summary, current_time_utc))
+        continue_token = (result.get('metadata') or {}).get('continue')
+        if not continue_token:
+            return summaries
+
+
+def _request_table(kind:str, list_fn:Callable[..., Any], list_kwargs:dict[str, Any], limit:int,
+                   continue_token:Optional[str]) -> dict[str, Any]:
+    """Request one page of objects as a Table and return the parsed response. If limit is 0,
+    all of the objects are requested. ApiExceptions are passed through.
+    """
+    api_client = list_fn.__self__.api_client
+    all_namespaces_path, namespaced_path = _LIST_RESOURCE_PATHS[kind]
+    namespace = list_kwargs.get('namespace')
+    path_params = {'namespace': namespace} if namespace else {}
+    query:list[tuple[str, Any]] = [('includeObject', 'Metadata')]
+    if list_kwargs.get('label_selector'):
+        query.append(('labelSelector', list_kwargs['label_selector']))
+    if list_kwargs.get('field_selector'):
+        query.append(('fieldSelector', list_kwargs['field_selector']))
+    if limit > 0:
+        query.append(('limit', limit))
+    if continue_token:
+        query.append(('continue', continue_token))
+    response = api_client.call_api(namespaced_path if namespace else all_namespaces_path, 'GET',
+                                   path_params, query, {'Accept': TABLE_ACCEPT_HEADER},
+                                   auth_settings=['BearerToken'], _return_http_data_only=True,
+                                   _preload_content=False)
     try:
-        config.load_kube_config()
-        return client.AppsV1Api()
-    except config.ConfigException:
-        logging.warning("Could not load kube config. Ensure you have a valid Kubernetes configuration.")
-        logging.warning("Attempting to load in-cluster config...")
+        return _json_loads(response.data)
+    finally:
+        response.release_conn()
+
+
+def _table_result_to_summaries(result:dict[str, Any],
+                               table_row_to_summary:Callable[[dict[str, Any], datetime.datetime], dict[str, Any]],
+                               json_to_summary:Callable[[dict[str, Any], datetime.datetime], dict[str, Any]],
+                               current_time_utc:datetime.datetime) -> list[dict[str, Any]]:
+    """Build the fields of the summaries from the response to a Table request, which may
+    be a regular list"""
+    if result.get('kind') == 'Table':
+        return [table_row_to_summary(row, current_time_utc) for row in _table_rows(result)]
+    else:
+        return [json_to_summary(obj, current_time_utc) for obj in result.get('items') or []]
+
+
+def _table_rows(table:dict[str, Any]) -> Iterator[dict[str, Any]]:
+    """Yield each row of a Table as a dict with 'cells' (keyed by lowercase column name)
+    and 'metadata' (from the row's PartialObjectMetadata, empty if not included).
+    """
+    column_names = [column['name'].lower() for column in table.get('columnDefinitions') or []]
+    for row in table.get('rows') or []:
+        yield {'cells': dict(zip(column_names, row.get('cells') or [])),
+               'metadata': (row.get('object') or {}).get('metadata') or {}}
+
+
+def _table_cell(row:dict[str, Any], column:str) -> Any:
+    """Return a cell from a table row, mapping the placeholders kubectl prints for
+    missing values to None.
+    """
+    value = row['cells'].get(column)
+    return None if value in (None, '', '<none>', '<unknown>') else value
+
+
+_HUMAN_DURATION_RE = re.compile(r'(\d+)([ydhms])')
+_HUMAN_DURATION_UNITS = {'y': 365*86400, 'd': 86400, 'h': 3600, 'm': 60, 's': 1}
+
+def _parse_human_duration(value:Optional[str]) -> Optional[datetime.timedelta]:
+    """Parse a duration as printed by kubectl (e.g. "5m10s", "3d4h", "2y10d")"""
+    parts = _HUMAN_DURATION_RE.findall(value or '')
+    if not parts:
+        return None
+    return datetime.timedelta(seconds=sum(int(n)*_HUMAN_DURATION_UNITS[unit] for (n, unit) in parts))
+
+
+def _table_age(row:dict[str, Any], now:datetime.datetime) -> datetime.timedelta:
+    """Age of a table row's object, from its metadata if present, otherwise from the Age column"""
+    creation_timestamp = _parse_timestamp(row['metadata'].get('creationTimestamp'))
+    if creation_timestamp:
+        return now - creation_timestamp
+    return _parse_human_duration(row['cells'].get('age')) or datetime.timedelta(0)
+
+
+def _parse_timestamp(value:Optional[str]) -> Optional[datetime.datetime]:
+    """Parse an RFC 3339 timestamp from a raw API response"""
+    return datetime.datetime.fromisoformat(value) if value else None
+
+
+_Summary = TypeVar('_Summary', bound=BaseModel)
+
+
+@functools.cache
+def _summary_list_adapter(model:type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(list[model]) # type: ignore
+
+
+def _to_summaries(model:type[_Summary], fields:Iterable[dict[str, Any]]) -> list[_Summary]:
+    """Create a model for each dict of fields. The *_to_summary() functions return the fields
+    of the summaries rather than the models, so that a whole list can be validated in one call to
+    pydantic, which is about a third faster for large lists than creating the models one at a time.
+    (model_construct() skips the validation, but is slower still, as it runs in Python.)
+    """
+    return _summary_list_adapter(model).validate_python(fields)
+
+
+class OmittedItems(BaseModel):
+    """Describes the items that were left out of the result of a list tool because
+    of its max_items or max_bytes limits, so that the query can be narrowed.
+
+    Attributes
+    ----------
+    count : int
+        Number of items that were left out.
+    by_namespace : dict[str, int]
+        Number of items left out in each namespace, for the (at most 20) namespaces with
+        the most omitted items. Empty for cluster-scoped objects (namespaces and nodes).
+    by_status : dict[str, int]
+        Number of items left out by status: 'Ready' or 'NotReady' for pods, 'Available'
+        or 'Unavailable' for deployments, the type for services, the state for containers
+        and the status for namespaces and nodes.
+    """
+    count: int
+    by_namespace: dict[str, int]
+    by_status: dict[str, int]
+
+
+class ColumnarTable(BaseModel):
+    """A compact form of a list of summaries, returned by the list tools when called with
+    format='columnar'. The field names are given once, in columns, and each row has the
+    values of one summary, in the same order. Durations (e.g. age) are integer seconds.
+    If items were left out because of the max_items or max_bytes limits, omitted
+    summarizes them. When paging, next_cursor is the cursor for the next page.
+    """
+    columns: list[str]
+    rows: list[list[Any]]
+    omitted: Optional[OmittedItems] = None
+    next_cursor: Optional[str] = None
+
+
+class TruncatedList(BaseModel, Generic[_Summary]):
+    """The result of a list tool (with format='objects') when some of the items were left
+    out because of its max_items or max_bytes limits.
+    """
+    items: list[_Summary]
+    omitted: OmittedItems
+
+
+class SummaryPage(BaseModel, Generic[_Summary]):
+    """A page of the result of a list tool (with format='objects'), returned when it is
+    called with page_size or cursor. next_cursor is None on the last page.
+    """
+    items: list[_Summary]
+    next_cursor: Optional[str] = None
+
+
+# The format of the results of the list tools: a list of summary objects, or a ColumnarTable
+ListFormat = Literal['objects', 'columnar']
+
+
+def _check_list_args(format:str, max_items:Optional[int], max_bytes:Optional[int],
+                     page_size:Optional[int]=None, cursor:Optional[str]=None) -> None:
+    if format not in ('objects', 'columnar'):
+        raise ValueError(f"Invalid format '{format}', must be 'objects' or 'columnar'")
+    if max_items is not None and max_items < 0:
+        raise ValueError(f"max_items must not be negative, got {max_items}")
+    if max_bytes is not None and max_bytes < 0:
+        raise ValueError(f"max_bytes must not be negative, got {max_bytes}")
+    if page_size is not None and page_size <= 0:
+        raise ValueError(f"page_size must be positive, got {page_size}")
+    if (page_size is not None or cursor is not None) and (max_items is not None or max_bytes is not None):
+        raise ValueError("page_size and cursor cannot be combined with max_items or max_bytes")
+
+
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+def _seconds(values:list[Optional[datetime.timedelta]]) -> list[Optional[int]]:
+    return [int(value.total_seconds()) if value is not None else None for value in values]
+
+
+@functools.cache
+def _column_converters(model:type[BaseModel]) -> list[tuple[str, Optional[Callable[[list[Any]], list[Any]]]]]:
+    """For each field of model, return its name and a function that converts a column of its
+    values to plain (JSON-compatible) values, or None if they need no conversion"""
+    converters:list[tuple[str, Optional[Callable[[list[Any]], list[Any]]]]] = []
+    for (name, field) in model.model_fields.items():
+        types = typing.get_args(field.annotation) if typing.get_origin(field.annotation) is Union \
+                else (field.annotation,)
+        if all(t in _SCALAR_TYPES for t in types):
+            converters.append((name, None))
+        elif all(t in (datetime.timedelta, type(None)) for t in types):
+            converters.append((name, _seconds))
+        else:
+            # nested models, lists and dicts
+            converters.append((name, TypeAdapter(list[field.annotation]).dump_python)) # type: ignore
+    return converters
+
+
+def _columnar_rows(model:type[_Summary], summaries:list[_Summary]) -> list[list[Any]]:
+    # The values are converted a column at a time, which is much faster than a value at a time
+    columns:list[list[Any]] = []
+    for (name, convert) in _column_converters(model):
+        values = [getattr(summary, name) for summary in summaries]
+        columns.append(convert(values) if convert is not None else values)
+    return [list(row) for row in zip(*columns)]
+
+
+def _omitted_status(model:type[BaseModel], fields:dict[str, Any]) -> str:
+    if model is PodSummary:
+        return 'Ready' if fields['ready_containers'] == fields['total_containers'] else 'NotReady'
+    elif model is DeploymentSummary:
+        return 'Available' if fields['available_replicas'] >= fields['total_replicas'] else 'Unavailable'
+    elif model is ServiceSummary:
+        return fields['type']
+    elif model is ContainerStatus:
+        state = fields['state']
+        if state is None:
+            return 'Unknown'
+        return state['state_name'] if isinstance(state, dict) else state.state_name
+    else:
+        return fields['status']
+
+
+# The maximum number of namespaces in OmittedItems.by_namespace
+OMITTED_MAX_NAMESPACES = 20
+
+
+def _omitted_items(model:type[BaseModel], items:list[Any]) -> OmittedItems:
+    """Count the items (models or dicts of their fields) by namespace and status"""
+    by_namespace:collections.Counter[str] = collections.Counter()
+    by_status:collections.Counter[str] = collections.Counter()
+    for item in items:
+        fields = item if isinstance(item, dict) else item.__dict__
+        if 'namespace' in fields:
+            by_namespace[fields['namespace']] += 1
+        by_status[_omitted_status(model, fields)] += 1
+    return OmittedItems(count=len(items), by_namespace=dict(by_namespace.most_common(OMITTED_MAX_NAMESPACES)),
+                        by_status=dict(by_status.most_common()))
+
+
+# When max_bytes is specified, the summaries are created and measured in chunks of this many,
+# so that no more of them are created than fit in the budget
+BUDGET_CHUNK_SIZE = 256
+
+
+def _list_result(model:type[_Summary], items:list[Any], format:ListFormat, max_items:Optional[int]=None,
+                 max_bytes:Optional[int]=None) -> Union[list[_Summary], TruncatedList[_Summary], ColumnarTable]:
+    """Return the result of a list tool for items, which are either instances of model or dicts
+    of their fields (as returned by the *_to_summary() functions), in the requested format.
+
+    At most max_items items are included, and the items are only included while the total size
+    of their JSON (the objects or the rows, depending on format) is at most max_bytes. Models are
+    only created for the items that are included. If any items are left out, a summary of them
+    is included in the result.
+    """
+    candidates = items[:max_items] if max_items is not None else items
+    to_models = (lambda chunk: _to_summaries(model, chunk)) if candidates and isinstance(candidates[0], dict) \
+                else (lambda chunk: chunk)
+    to_values = (lambda summaries: summaries) if format == 'objects' \
+                else (lambda summaries: _columnar_rows(model, summaries))
+    if max_bytes is None:
+        values = to_values(to_models(candidates))
+    else:
+        values = []
+        size = 2 # the brackets around the list
+        full = False
+        for start in range(0, len(candidates), BUDGET_CHUNK_SIZE):
+            for value in to_values(to_models(candidates[start:start+BUDGET_CHUNK_SIZE])):
+                size += len(pydantic_core.to_json(value)) + 1
+                if size > max_bytes:
+                    full = True
+                    break
+                values.append(value)
+            if full:
+                break
+    omitted = _omitted_items(model, items[len(values):]) if len(values) < len(items) else None
+    if format == 'columnar':
+        return ColumnarTable.model_construct(columns=[name for (name, _) in _column_converters(model)],
+                                             rows=values, omitted=omitted)
+    elif omitted is not None:
+        return TruncatedList[model](items=values, omitted=omitted) # type: ignore
+    else:
+        return values
+
+
+def _page_result(model:type[_Summary], summaries:list[_Summary], format:ListFormat,
+                 next_cursor:Optional[str]) -> Union[SummaryPage[_Summary], ColumnarTable]:
+    """Return a page of summaries (instances of model) in the requested format"""
+    if format == 'columnar':
+        return ColumnarTable.model_construct(columns=[name for (name, _) in _column_converters(model)],
+                                             rows=_columnar_rows(model, summaries), next_cursor=next_cursor)
+    return SummaryPage[model](items=summaries, next_cursor=next_cursor) # type: ignore
+
+
+def _snapshot_page(query:str, items:Optional[list[Any]], position:Optional[dict[str, Any]],
+                   page_size:int) -> tuple[list[Any], Optional[str]]:
+    """Return a page of in-memory items and the cursor for the next page. For the first page
+    (position is None), the items are stored in paging.SNAPSHOTS if there is more than one page.
+    Otherwise, they are read from the snapshot at position.
+    """
+    if position is None:
+        assert items is not None
+        if len(items) <= page_size:
+            return (items, None)
+        (snapshot_id, offset) = (paging.SNAPSHOTS.add(items), 0)
+    else:
+        (snapshot_id, offset) = (position['s'], position['o'])
+        items = paging.SNAPSHOTS.get(snapshot_id)
+    end = offset + page_size
+    next_cursor = paging.encode_cursor(query, snapshot_id=snapshot_id, offset=end) if end < len(items) else None
+    return (items[offset:end], next_cursor)
+
+
+def _list_summary_page(kind:str, list_fn:Callable[..., Any], list_kwargs:dict[str, Any],
+                       to_summary:Callable[[Any, datetime.datetime], dict[str, Any]],
+                       json_to_summary:Callable[[dict[str, Any], datetime.datetime], dict[str, Any]],
+                       table_row_to_summary:Callable[[dict[str, Any], datetime.datetime], dict[str, Any]],
+                       limit:int, continue_token:Optional[str],
+                       current_time_utc:datetime.datetime) -> tuple[list[dict[str, Any]], Optional[str]]:
+    """Make a single LIST request for at most limit objects, starting at continue_token, decoded
+    according to LIST_RESPONSE_MODE. Returns the fields of the summaries and the continue token
+    for the next page (None on the last page). ApiExceptions are passed through to the caller.
+    """
+    if LIST_RESPONSE_MODE == 'table':
         try:
-            config.load_incluster_config()
-            return client.AppsV1Api()
-        except config.ConfigException as e:
-            raise K8sConfigError("Could not load in-cluster config. No Kubernetes config found.") from e
-        except Exception as e:
-            raise K8sConfigError(f"Unexpected error: {e}") from e
+            result = _request_table(kind, list_fn, list_kwargs, limit, continue_token)
+            return (_table_result_to_summaries(result, table_row_to_summary, json_to_summary, current_time_utc),
+                    (result.get('metadata') or {}).get('continue'))
+        except client.ApiException as e:
+            if e.status != HTTP_STATUS_NOT_ACCEPTABLE:
+                raise
+            logging.warning(f"API server did not accept a Table request for {kind}, using a regular list")
+    kwargs = dict(list_kwargs, limit=limit)
+    if continue_token:
+        kwargs['_continue'] = continue_token
+    if LIST_RESPONSE_MODE in ('json', 'table'):
+        response = list_fn(_preload_content=False, **kwargs)
+        try:
+            result = _json_loads(response.data)
+        finally:
+            response.release_conn()
+        return ([json_to_summary(obj, current_time_utc) for obj in result.get('items') or []],
+                (result.get('metadata') or {}).get('continue'))
+    result = list_fn(**kwargs)
+    metadata = getattr(result, 'metadata', None)
+    return ([to_summary(obj, current_time_utc) for obj in result.items],
+            getattr(metadata, '_continue', None) if metadata is not None else None)
+
+
+def _get_summary_page(kind:str, model:type[_Summary], list_fn:Callable[..., Any], list_kwargs:dict[str, Any],
+                      to_summary:Callable[[Any, datetime.datetime], dict[str, Any]],
+                      json_to_summary:Callable[[dict[str, Any], datetime.datetime], dict[str, Any]],
+                      table_row_to_summary:Callable[[dict[str, Any], datetime.datetime], dict[str, Any]],
+                      format:ListFormat, page_size:Optional[int], cursor:Optional[str],
+                      namespace:Optional[str]=None,
+                      use_informer:bool=True) -> Union[SummaryPage[_Summary], ColumnarTable]:
+    """Return one page of the summaries of the objects of the specified kind, starting at cursor
+    (see the paging module). If the informer cache is enabled, the first page takes a snapshot of
+    its objects and the later pages are read from the snapshot. Otherwise, each page is one LIST
+    call. Either way, only the objects in the page are converted. A ValueError is raised if the
+    cursor has expired, other ApiExceptions are passed through to the caller.
+    """
+    query = paging.list_query(kind, namespace, list_kwargs.get('label_selector'), list_kwargs.get('field_selector'))
+    position = paging.decode_cursor(cursor, query) if cursor else None
+    page_size = page_size or paging.DEFAULT_PAGE_SIZE
+    current_time_utc = datetime.datetime.now(datetime.timezone.utc)
+    objects = _get_informer_items(kind, namespace) if use_informer and position is None else None
+    if objects is not None or (position is not None and 's' in position):
+        (page, next_cursor) = _snapshot_page(query, objects, position, page_size)
+        fields = [to_summary(obj, current_time_utc) for obj in page]
+    else:
+        try:
+            (fields, continue_token) = _list_summary_page(kind, list_fn, list_kwargs, to_summary, json_to_summary,
+                                                          table_row_to_summary, page_size,
+                                                          position['c'] if position else None, current_time_utc)
+        except client.ApiException as e:
+            if e.status == paging.HTTP_STATUS_GONE and position is not None:
+                raise ValueError(paging.EXPIRED_CURSOR_MESSAGE) from e
+            raise
+        next_cursor = paging.encode_cursor(query, continue_token=continue_token) if continue_token else None
+    return _page_result(model, _to_summaries(model, fields), format, next_cursor)
+
+
+def _get_summary_fields(kind:str, list_fn:Callable[..., Any], list_kwargs:dict[str, Any],
+                        to_summary:Callable[[Any, datetime.datetime], dict[str, Any]],
+                        json_to_summary:Callable[[dict[str, Any], datetime.datetime], dict[str, Any]],
+                        table_row_to_summary:Callable[[dict[str, Any], datetime.datetime], dict[str, Any]],
+                        namespace:Optional[str]=None, use_informer:bool=True) -> list[dict[str, Any]]:
+    """Return the fields of a summary for each object of the specified kind, to be passed to
+    _list_result() or _to_summaries(). The objects come from the informer cache if it is enabled,
+    otherwise from paged LIST calls decoded according to LIST_RESPONSE_MODE. ApiExceptions are
+    passed through to the caller.
+    """
+    objects = _get_informer_items(kind, namespace) if use_informer else None
+    current_time_utc = datetime.datetime.now(datetime.timezone.utc)
+    if objects is not None:
+        fields = [to_summary(obj, current_time_utc) for obj in objects]
+    elif LIST_RESPONSE_MODE == 'table':
+        fields = _list_table_summaries(kind, list_fn, list_kwargs, table_row_to_summary, json_to_summary,
+                                       current_time_utc)
+    elif LIST_RESPONSE_MODE == 'json':
+        fields = [json_to_summary(obj, current_time_utc) for obj in _list_json_in_pages(list_fn, **list_kwargs)]
+    else:
+        fields = [to_summary(obj, current_time_utc) for obj in _list_in_pages(list_fn, **list_kwargs)]
+    return fields
+
+
+def _selector_args(label_selector:Optional[str], field_selector:Optional[str]) -> dict[str, str]:
+    """Return the keyword arguments for the selectors that were specified, to be passed
+    to a kubernetes list call.
+    """
+    selectors:dict[str, str] = {}
+    if label_selector:
+        selectors['label_selector'] = label_selector
+    if field_selector:
+        selectors['field_selector'] = field_selector
+    return selectors
+
+
+def enable_informers(kinds:Optional[list[str]]=None, max_staleness:float=120.0,
+                     watch_timeout_seconds:int=300) -> None:
+    """Start watch-backed informers, so that the summary tools read from an in-process
+    store rather than doing a full LIST against the API server on each call.
+
+    Parameters
+    ----------
+    kinds : Optional[list[str]], default=None
+        The kinds to cache, from INFORMER_KINDS. If None, all of them are cached.
+    max_staleness : float, default=120.0
+        If an informer has not been synced within this many seconds (e.g. because its
+        watch keeps failing), the tools fall back to listing from the API server.
+    watch_timeout_seconds : int, default=300
+        Server-side timeout for each watch request.
+
+    Raises
+    ------
+    K8sConfigError
+        If unable to initialize the K8S API.
+    K8sApiError
+        If the initial list for an informer fails.
+    """
+    from .informer import Informer
+    global K8S, APPS_V1_API, INFORMER_MAX_STALENESS
+    if K8S is None:
+        K8S = _get_api_client()
+    if APPS_V1_API is None:
+        APPS_V1_API = _get_apps_v1_api_client()
+    list_fns = {
+        'namespaces': K8S.list_namespace,
+        'nodes': K8S.list_node,
+        'pods': K8S.list_pod_for_all_namespaces,
+        'deployments': APPS_V1_API.list_deployment_for_all_namespaces,
+        'services': K8S.list_service_for_all_namespaces,
+    }
+    INFORMER_MAX_STALENESS = max_staleness
+    for kind in (kinds if kinds is not None else INFORMER_KINDS):
+        if kind not in list_fns:
+            raise ValueError(f"Unknown informer kind '{kind}', must be one of {', '.join(INFORMER_KINDS)}")
+        if kind in INFORMERS:
+            continue
+        informer = Informer(kind, list_fns[kind], watch_timeout_seconds=watch_timeout_seconds,
+                            page_size=LIST_PAGE_SIZE)
+        try:
+            informer.start()
+        except client.ApiException as e:
+            raise K8sApiError(f"Error listing {kind} for informer: {e}") from e
+        INFORMERS[kind] = informer
+
+
+def disable_informers() -> None:
+    """Stop all informers. The tools go back to listing from the API server."""
+    for informer in INFORMERS.values():
+        informer.stop()
+    INFORMERS.clear()
+
+
+def get_informer_status() -> list['InformerStatus']:
+    """Return the status of each running informer, including how many seconds
+    it has been since its data was known to be current.
+    """
+    return [informer.status() for informer in INFORMERS.values()]
+
+
+def _get_informer_items(kind:str, namespace:Optional[str]=None) -> Optional[list[Any]]:
+    """Return the cached objects of the specified kind, or None if there is
+    no informer for that kind or its data is too stale to use.
+    """
+    informer = INFORMERS.get(kind)
+    if informer is None:
+        return None
+    staleness = informer.staleness()
+    if staleness is None or staleness > INFORMER_MAX_STALENESS:
+        logging.warning(f"Informer for {kind} is stale (last synced {staleness} seconds ago), "
+                        "listing from the API server")
+        return None
+    return informer.list(namespace)
+
+
+def enable_event_index(ttl_seconds:float=30.0) -> None:
+    """Index the events of each namespace by the object they involve, so that
+    get_pod_events() and get_object_events() do one LIST per namespace (refreshed
+    after ttl_seconds) rather than one LIST per call.
+
+    Parameters
+    ----------
+    ttl_seconds : float, default=30.0
+        How long the events of a namespace are reused before they are listed again.
+
+    Raises
+    ------
+    K8sConfigError
+        If unable to initialize the K8S API.
+    """
+    from .event_index import EventIndex
+    global K8S, EVENT_INDEX
+    if K8S is None:
+        K8S = _get_api_client()
+    list_namespaced_event = K8S.list_namespaced_event
+    EVENT_INDEX = EventIndex(lambda namespace: _list_in_pages(list_namespaced_event, namespace=namespace),
+                             ttl_seconds=ttl_seconds)
+
+
+def disable_event_index() -> None:
+    """Stop using the event index. Each event lookup goes back to the API server."""
+    global EVENT_INDEX
+    EVENT_INDEX = None
 
 
+def _list_object_events(namespace:str, kind:str, name:str) -> list[Any]:
+    """Return the events about an object, from the event index if it is enabled,
+    otherwise from a LIST with a field selector. ApiExceptions are passed through.
+    """
+    if EVENT_INDEX is not None:
+        return EVENT_INDEX.get(namespace, kind, name)
+    assert K8S is not None
+    field_selector = f"involvedObject.name={name},involvedObject.kind={kind}"
+    return K8S.list_namespaced_event(namespace, field_selector=field_selector).items
+
 
 class NamespaceSummary(BaseModel):
     """Summary information about a namespace, like returned by `kubectl get namespace`"""
@@ -76,19 +812,33 @@ class NamespaceSummary(BaseModel):
     age: datetime.timedelta
 
 
-def get_namespaces() -> list[NamespaceSummary]:
+def get_namespaces(format: ListFormat = 'objects', max_items: Optional[int] = None,
+                   max_bytes: Optional[int] = None) -> Union[list[NamespaceSummary], TruncatedList[NamespaceSummary],
+                                                             ColumnarTable]:
     """Return a summary of the namespaces for this Kubernetes cluster, similar to that
     returned by `kubectl get namespace`.
 
     Parameters
     ----------
-    None
-        This function does not take any parameters.
+    format : Literal['objects', 'columnar'], default='objects'
+        'objects' returns a list of NamespaceSummary objects. 'columnar' returns a ColumnarTable
+        instead, with the field names below given once, in columns, and one row of values per
+        namespace. Durations are integer seconds. This is about half the size for long lists.
+    max_items : Optional[int], default=None
+        If specified, at most this many namespaces are returned.
+    max_bytes : Optional[int], default=None
+        If specified, namespaces are only returned while the total size of their JSON (as
+        objects or rows, depending on format) is at most this many bytes.
+        If any namespaces are left out because of max_items or max_bytes, the result is a
+        TruncatedList (or a ColumnarTable) that also has a summary of the omitted
+        namespaces, with their counts by status, so that the query can be
+        narrowed. Use these limits to get a quick, bounded answer on large clusters.
 
     Returns
     -------
-    list of NamespaceSummary
-        List of namespace summary objects. Each NamespaceSummary has the following fields:
+    list of NamespaceSummary, TruncatedList of NamespaceSummary or ColumnarTable
+        A ColumnarTable if format is 'columnar', with the same fields as columns. Otherwise,
+        list of namespace summary objects. Each NamespaceSummary has the following fields:
 
         name : str
             Name of the namespace.
@@ -106,15 +856,35 @@ def get_namespaces() -> list[NamespaceSummary]:
     global K8S
     if K8S is None:
         K8S = _get_api_client()
-    logging.info(f"get_namespaces()")
-    namespaces = K8S.list_namespace().items
-    now = datetime.datetime.now(datetime.timezone.utc)
-    return [
-        NamespaceSummary(name=namespace.metadata.name,
-                        status=namespace.status.phase,
-                        age=now-namespace.metadata.creation_timestamp)
-        for namespace in namespaces
-    ]
+    _check_list_args(format, max_items, max_bytes)
+    logging.info(f"get_namespaces(format={format}, max_items={max_items}, max_bytes={max_bytes})")
+    try:
+        fields = _get_summary_fields('namespaces', K8S.list_namespace, {},
+                                     _namespace_to_summary, _namespace_json_to_summary,
+                                     _namespace_table_row_to_summary)
+    except client.ApiException as e:
+        raise K8sApiError(f"Error fetching namespaces: {e}") from e
+    return _list_result(NamespaceSummary, fields, format, max_items, max_bytes)
+
+
+def _namespace_to_summary(namespace:'client.V1Namespace', now:datetime.datetime) -> dict[str, Any]:
+    return dict(name=namespace.metadata.name,
+                status=namespace.status.phase,
+                age=now-namespace.metadata.creation_timestamp)
+
+
+def _namespace_json_to_summary(namespace:dict[str, Any], now:datetime.datetime) -> dict[str, Any]:
+    metadata = namespace['metadata']
+    return dict(name=metadata['name'],
+                status=(namespace.get('status') or {}).get('phase'),
+                age=now-_parse_timestamp(metadata.get('creationTimestamp')))
+
+
+def _namespace_table_row_to_summary(row:dict[str, Any], now:datetime.datetime) -> dict[str, Any]:
+    """Equivalent to _namespace_to_summary(), for a row of a Table response"""
+    return dict(name=row['cells']['name'],
+                status=row['cells'].get('status'),
+                age=_table_age(row, now))
 
 
 class NodeSummary(BaseModel):
@@ -130,19 +900,43 @@ class NodeSummary(BaseModel):
     kernel_version: Optional[str] = None
     container_runtime: Optional[str] = None
 
-def get_node_summaries() -> list[NodeSummary]:
+def get_node_summaries(format: ListFormat = 'objects', max_items: Optional[int] = None,
+                       max_bytes: Optional[int] = None, page_size: Optional[int] = None,
+                       cursor: Optional[str] = None) -> Union[list[NodeSummary], TruncatedList[NodeSummary],
+                                                              SummaryPage[NodeSummary], ColumnarTable]:
     """Return a summary of the nodes for this Kubernetes cluster, similar to that
     returned by `kubectl get nodes -o wide`.
 
     Parameters
     ----------
-    None
-        This function does not take any parameters.
+    format : Literal['objects', 'columnar'], default='objects'
+        'objects' returns a list of NodeSummary objects. 'columnar' returns a ColumnarTable
+        instead, with the field names below given once, in columns, and one row of values per
+        node. Durations are integer seconds. This is about half the size for long lists.
+    max_items : Optional[int], default=None
+        If specified, at most this many nodes are returned.
+    max_bytes : Optional[int], default=None
+        If specified, nodes are only returned while the total size of their JSON (as
+        objects or rows, depending on format) is at most this many bytes.
+        If any nodes are left out because of max_items or max_bytes, the result is a
+        TruncatedList (or a ColumnarTable) that also has a summary of the omitted
+        nodes, with their counts by status, so that the query can be
+        narrowed. Use these limits to get a quick, bounded answer on large clusters.
+    page_size : Optional[int], default=None
+        If specified, the nodes are returned a page at a time, as a SummaryPage (or a
+        ColumnarTable) with at most page_size nodes and a next_cursor for the next page.
+        Each page only costs the work for its own nodes. Defaults to 100 if only cursor
+        is specified. Cannot be combined with max_items or max_bytes.
+    cursor : Optional[str], default=None
+        The next_cursor returned by the previous page, to get the next page. The other
+        arguments must be the same as for the previous page. next_cursor is None on the
+        last page. Cursors expire after a few minutes of not being used.
 
     Returns
     -------
-    list of NodeSummary
-        List of node summary objects. Each NodeSummary has the following fields:
+    list of NodeSummary, TruncatedList of NodeSummary, SummaryPage of NodeSummary or ColumnarTable
+        A ColumnarTable if format is 'columnar', with the same fields as columns. Otherwise,
+        list of node summary objects. Each NodeSummary has the following fields:
 
         name : str
             Name of the node.
@@ -175,78 +969,143 @@ def get_node_summaries() -> list[NodeSummary]:
     global K8S
     if K8S is None:
         K8S = _get_api_client()
-    logging.info(f"get_node_summaries()")
+    _check_list_args(format, max_items, max_bytes, page_size, cursor)
+    logging.info(f"get_node_summaries(format={format}, max_items={max_items}, max_bytes={max_bytes}, "
+                 f"page_size={page_size}, cursor={cursor})")
     
     try:
-        nodes = K8S.list_node().items
+        if page_size is not None or cursor is not None:
+            return _get_summary_page('nodes', NodeSummary, K8S.list_node, {}, _node_to_summary,
+                                     _node_json_to_summary, _node_table_row_to_summary, format, page_size, cursor)
+        fields = _get_summary_fields('nodes', K8S.list_node, {}, _node_to_summary,
+                                     _node_json_to_summary, _node_table_row_to_summary)
     except client.ApiException as e:
         raise K8sApiError(f"Error fetching nodes: {e}") from e
+    return _list_result(NodeSummary, fields, format, max_items, max_bytes)
+
+
+def _node_to_summary(node:'client.V1Node', current_time_utc:datetime.datetime) -> dict[str, Any]:
+    node_name = node.metadata.name
     
-    current_time_utc = datetime.datetime.now(datetime.timezone.utc)
-    node_summaries: list[NodeSummary] = []
+    # Determine node status
+    status = "Unknown"
+    if node.status and node.status.conditions:
+        for condition in node.status.conditions:
+            if condition.type == "Ready":
+                status = "Ready" if condition.status == "True" else "NotReady"
+                break
     
-    for node in nodes:
-        node_name = node.metadata.name
-        
-        # Determine node status
-        status = "Unknown"
-        if node.status and node.status.conditions:
-            for condition in node.status.conditions:
-                if condition.type == "Ready":
-                    status = "Ready" if condition.status == "True" else "NotReady"
-                    break
-        
-        # Extract roles from labels
-        roles = []
-        if node.metadata.labels:
-            for label_key in node.metadata.labels:
-                if label_key.startswith("node-role.kubernetes.io/"):
-                    role = label_key.replace("node-role.kubernetes.io/", "")
-                    if role:  # Skip empty roles
-                        roles.append(role)
-                # Also check for older master label
-                elif label_key == "kubernetes.io/role" and node.metadata.labels[label_key]:
-                    roles.append(node.metadata.labels[label_key])
-        
-        if not roles:
-            roles = ["<none>"]
-        
-        # Calculate age
-        age = datetime.timedelta(0)
-        if node.metadata.creation_timestamp:
-            age = current_time_utc - node.metadata.creation_timestamp
-        
-        # Extract version and system info
-        version = node.status.node_info.kubelet_version if node.status and node.status.node_info else "Unknown"
-        os_image = node.status.node_info.os_image if node.status and node.status.node_info else None
-        kernel_version = node.status.node_info.kernel_version if node.status and node.status.node_info else None
-        container_runtime = node.status.node_info.container_runtime_version if node.status and node.status.node_info else None
-        
-        # Extract IP addresses
-        internal_ip = None
-        external_ip = None
-        if node.status and node.status.addresses:
-            for address in node.status.addresses:
-                if address.type == "InternalIP":
-                    internal_ip = address.address
-                elif address.type == "ExternalIP":
-                    external_ip = address.address
-        
-        node_summary = NodeSummary(
-            name=node_name,
-            status=status,
-            roles=roles,
-            age=age,
-            version=version,
-            internal_ip=internal_ip,
-            external_ip=external_ip,
-            os_image=os_image,
-            kernel_version=kernel_version,
-            container_runtime=container_runtime
-        )
-        node_summaries.append(node_summary)
+    # Extract roles from labels
+    roles = []
+    if node.metadata.labels:
+        for label_key in node.metadata.labels:
+            if label_key.startswith("node-role.kubernetes.io/"):
+                role = label_key.replace("node-role.kubernetes.io/", "")
+                if role:  # Skip empty roles
+                    roles.append(role)
+            # Also check for older master label
+            elif label_key == "kubernetes.io/role" and node.metadata.labels[label_key]:
+                roles.append(node.metadata.labels[label_key])
+    
+    if not roles:
+        roles = ["<none>"]
+    
+    # Calculate age
+    age = datetime.timedelta(0)
+    if node.metadata.creation_timestamp:
+        age = current_time_utc - node.metadata.creation_timestamp
+    
+    # Extract version and system info
+    version = node.status.node_info.kubelet_version if node.status and node.status.node_info else "Unknown"
+    os_image = node.status.node_info.os_image if node.status and node.status.node_info else None
+    kernel_version = node.status.node_info.kernel_version if node.status and node.status.node_info else None
+    container_runtime = node.status.node_info.container_runtime_version if node.status and node.status.node_info else None
+    
+    # Extract IP addresses
+    internal_ip = None
+    external_ip = None
+    if node.status and node.status.addresses:
+        for address in node.status.addresses:
+            if address.type == "InternalIP":
+                internal_ip = address.address
+            elif address.type == "ExternalIP":
+                external_ip = address.address
     
-    return node_summaries
+    return dict(
+        name=node_name,
+        status=status,
+        roles=roles,
+        age=age,
+        version=version,
+        internal_ip=internal_ip,
+        external_ip=external_ip,
+        os_image=os_image,
+        kernel_version=kernel_version,
+        container_runtime=container_runtime
+    )
+
+def _node_json_to_summary(node:dict[str, Any], current_time_utc:datetime.datetime) -> dict[str, Any]:
+    """Equivalent to _node_to_summary(), for a node parsed from the raw API response"""
+    metadata = node['metadata']
+    node_status = node.get('status') or {}
+    status = "Unknown"
+    for condition in node_status.get('conditions') or []:
+        if condition.get('type') == "Ready":
+            status = "Ready" if condition.get('status') == "True" else "NotReady"
+            break
+    roles = []
+    labels = metadata.get('labels') or {}
+    for label_key in labels:
+        if label_key.startswith("node-role.kubernetes.io/"):
+            role = label_key.replace("node-role.kubernetes.io/", "")
+            if role:
+                roles.append(role)
+        elif label_key == "kubernetes.io/role" and labels[label_key]:
+            roles.append(labels[label_key])
+    if not roles:
+        roles = ["<none>"]
+    creation_timestamp = _parse_timestamp(metadata.get('creationTimestamp'))
+    age = current_time_utc - creation_timestamp if creation_timestamp else datetime.timedelta(0)
+    node_info = node_status.get('nodeInfo')
+    internal_ip = None
+    external_ip = None
+    for address in node_status.get('addresses') or []:
+        if address.get('type') == "InternalIP":
+            internal_ip = address.get('address')
+        elif address.get('type') == "ExternalIP":
+            external_ip = address.get('address')
+    return dict(
+        name=metadata['name'],
+        status=status,
+        roles=roles,
+        age=age,
+        version=node_info.get('kubeletVersion') if node_info else "Unknown",
+        internal_ip=internal_ip,
+        external_ip=external_ip,
+        os_image=node_info.get('osImage') if node_info else None,
+        kernel_version=node_info.get('kernelVersion') if node_info else None,
+        container_runtime=node_info.get('containerRuntimeVersion') if node_info else None
+    )
+
+
+def _node_table_row_to_summary(row:dict[str, Any], current_time_utc:datetime.datetime) -> dict[str, Any]:
+    """Equivalent to _node_to_summary(), for a row of a Table response. The node Table
+    includes the `kubectl get nodes -o wide` columns.
+    """
+    # The status column may have extra values appended, e.g. "Ready,SchedulingDisabled"
+    status = (_table_cell(row, 'status') or "Unknown").split(',')[0]
+    return dict(
+        name=row['cells']['name'],
+        status=status,
+        roles=(_table_cell(row, 'roles') or "<none>").split(','),
+        age=_table_age(row, current_time_utc),
+        version=_table_cell(row, 'version') or "Unknown",
+        internal_ip=_table_cell(row, 'internal-ip'),
+        external_ip=_table_cell(row, 'external-ip'),
+        os_image=_table_cell(row, 'os-image'),
+        kernel_version=_table_cell(row, 'kernel-version'),
+        container_runtime=_table_cell(row, 'container-runtime')
+    )
 
 def print_node_summaries() -> None:
     """
@@ -293,7 +1152,12 @@ class PodSummary(BaseModel):
 
    
 
-def get_pod_summaries(namespace: Optional[str] = None) -> list[PodSummary]:
+def get_pod_summaries(namespace: Optional[str] = None, label_selector: Optional[str] = None,
+                      field_selector: Optional[str] = None,
+                      format: ListFormat = 'objects', max_items: Optional[int] = None,
+                      max_bytes: Optional[int] = None, page_size: Optional[int] = None,
+                      cursor: Optional[str] = None) -> Union[list[PodSummary], TruncatedList[PodSummary],
+                                                             SummaryPage[PodSummary], ColumnarTable]:
     """
     Retrieves a list of PodSummary objects for pods in a given namespace or all namespaces.
 
@@ -301,11 +1165,43 @@ def get_pod_summaries(namespace: Optional[str] = None) -> list[PodSummary]:
     ----------
     namespace : Optional[str], default=None
         The specific namespace to list pods from. If None, lists pods from all namespaces.
+    label_selector : Optional[str], default=None
+        If specified, only return pods whose labels match this selector, using the
+        same syntax as `kubectl get -l` (e.g. 'app=checkout' or 'tier in (web,api)').
+        The filtering is done by the API server.
+    field_selector : Optional[str], default=None
+        If specified, only return pods whose fields match this selector, using the
+        same syntax as `kubectl get --field-selector` (e.g. 'spec.nodeName=node-1'
+        or 'status.phase!=Running'). The filtering is done by the API server.
+
+    format : Literal['objects', 'columnar'], default='objects'
+        'objects' returns a list of PodSummary objects. 'columnar' returns a ColumnarTable
+        instead, with the field names below given once, in columns, and one row of values per
+        pod. Durations are integer seconds. This is about half the size for long lists.
+    max_items : Optional[int], default=None
+        If specified, at most this many pods are returned.
+    max_bytes : Optional[int], default=None
+        If specified, pods are only returned while the total size of their JSON (as
+        objects or rows, depending on format) is at most this many bytes.
+        If any pods are left out because of max_items or max_bytes, the result is a
+        TruncatedList (or a ColumnarTable) that also has a summary of the omitted
+        pods, with their counts by namespace and status, so that the query can be
+        narrowed. Use these limits to get a quick, bounded answer on large clusters.
+    page_size : Optional[int], default=None
+        If specified, the pods are returned a page at a time, as a SummaryPage (or a
+        ColumnarTable) with at most page_size pods and a next_cursor for the next page.
+        Each page only costs the work for its own pods. Defaults to 100 if only cursor
+        is specified. Cannot be combined with max_items or max_bytes.
+    cursor : Optional[str], default=None
+        The next_cursor returned by the previous page, to get the next page. The other
+        arguments must be the same as for the previous page. next_cursor is None on the
+        last page. Cursors expire after a few minutes of not being used.
 
     Returns
     -------
-    list of PodSummary
-        A list of PodSummary objects, each providing a summary of a pod's status with the following fields:
+    list of PodSummary, TruncatedList of PodSummary, SummaryPage of PodSummary or ColumnarTable
+        A ColumnarTable if format is 'columnar', with the same fields as columns. Otherwise,
+        a list of PodSummary objects, each providing a summary of a pod's status with the following fields:
 
         name : str
             Name of the pod.
@@ -338,79 +1234,139 @@ def get_pod_summaries(namespace: Optional[str] = None) -> list[PodSummary]:
     if K8S is None:
         K8S = _get_api_client()
 
-    logging.info(f"get_pod_summaries(namespace={namespace})")
-    pod_summaries: list[PodSummary] = []
-    
+    _check_list_args(format, max_items, max_bytes, page_size, cursor)
+    logging.info(f"get_pod_summaries(namespace={namespace}, label_selector={label_selector}, field_selector={field_selector}, "
+                 f"format={format}, max_items={max_items}, max_bytes={max_bytes}, "
+                 f"page_size={page_size}, cursor={cursor})")
+    selectors = _selector_args(label_selector, field_selector)
+    if namespace:
+        # List pods in a specific namespace
+        list_fn, list_kwargs = K8S.list_namespaced_pod, dict(namespace=namespace, **selectors)
+    else:
+        # List pods across all namespaces
+        list_fn, list_kwargs = K8S.list_pod_for_all_namespaces, selectors
     try:
-        if namespace:
-            # List pods in a specific namespace
-            pods = K8S.list_namespaced_pod(namespace=namespace).items
-        else:
-            # List pods across all namespaces
-            pods = K8S.list_pod_for_all_namespaces().items
+        # The informer cache does not evaluate selectors, so those queries go to the API server
+        if page_size is not None or cursor is not None:
+            return _get_summary_page('pods', PodSummary, list_fn, list_kwargs, _pod_to_summary,
+                                     _pod_json_to_summary, _pod_table_row_to_summary, format, page_size, cursor,
+                                     namespace=namespace, use_informer=not selectors)
+        fields = _get_summary_fields('pods', list_fn, list_kwargs, _pod_to_summary, _pod_json_to_summary,
+                                     _pod_table_row_to_summary, namespace=namespace, use_informer=not selectors)
     except client.ApiException as e:
         raise K8sApiError(f"Error fetching pods: {e}") from e
+    return _list_result(PodSummary, fields, format, max_items, max_bytes)
 
-    current_time_utc = datetime.datetime.now(datetime.timezone.utc)
 
-    for pod in pods:
-        pod_name = pod.metadata.name
-        pod_namespace = pod.metadata.namespace
-        
-        total_containers = len(pod.spec.containers)
-        ready_containers = 0
-        total_restarts = 0
-        latest_restart_time: Optional[datetime.datetime] = None
-
-        if pod.status and pod.status.container_statuses:
-            for container_status in pod.status.container_statuses:
-                if container_status.ready:
-                    ready_containers += 1
-                
-                total_restarts += container_status.restart_count
-                
-                # Check for last restart time
-                if container_status.last_state and container_status.last_state.terminated:
-                    terminated_at = container_status.last_state.terminated.finished_at
-                    if terminated_at:
-                        if latest_restart_time is None or terminated_at > latest_restart_time:
-                            latest_restart_time = terminated_at
-
-        # Calculate age
-        age = datetime.timedelta(0) # Default to 0 if creation_timestamp is missing
-        if pod.metadata.creation_timestamp:
-            age = current_time_utc - pod.metadata.creation_timestamp
-
-        # Calculate last_restart timedelta if a latest_restart_time was found
-        last_restart_timedelta: Optional[datetime.timedelta] = None
-        if latest_restart_time:
-            last_restart_timedelta = current_time_utc - latest_restart_time
-
-        # Extract IP and node information
-        pod_ip = pod.status.pod_ip if pod.status and pod.status.pod_ip else None
-        node_name = pod.spec.node_name if pod.spec and pod.spec.node_name else None
-
-        pod_summary = PodSummary(
-            name=pod_name,
-            namespace=pod_namespace,
-            total_containers=total_containers,
-            ready_containers=ready_containers,
-            restarts=total_restarts,
-            last_restart=last_restart_timedelta,
-            age=age,
-            ip=pod_ip,
-            node=node_name
-        )
-        pod_summaries.append(pod_summary)
+def _pod_to_summary(pod:'client.V1Pod', current_time_utc:datetime.datetime) -> dict[str, Any]:
+    pod_name = pod.metadata.name
+    pod_namespace = pod.metadata.namespace
     
-    return pod_summaries
-
-def print_pod_summaries(namespace: Optional[str] = None) -> None:
+    total_containers = len(pod.spec.containers)
+    ready_containers = 0
+    total_restarts = 0
+    latest_restart_time: Optional[datetime.datetime] = None
+
+    if pod.status and pod.status.container_statuses:
+        for container_status in pod.status.container_statuses:
+            if container_status.ready:
+                ready_containers += 1
+            
+            total_restarts += container_status.restart_count
+            
+            # Check for last restart time
+            if container_status.last_state and container_status.last_state.terminated:
+                terminated_at = container_status.last_state.terminated.finished_at
+                if terminated_at:
+                    if latest_restart_time is None or terminated_at > latest_restart_time:
+                        latest_restart_time = terminated_at
+
+    # Calculate age
+    age = datetime.timedelta(0) # Default to 0 if creation_timestamp is missing
+    if pod.metadata.creation_timestamp:
+        age = current_time_utc - pod.metadata.creation_timestamp
+
+    # Calculate last_restart timedelta if a latest_restart_time was found
+    last_restart_timedelta: Optional[datetime.timedelta] = None
+    if latest_restart_time:
+        last_restart_timedelta = current_time_utc - latest_restart_time
+
+    # Extract IP and node information
+    pod_ip = pod.status.pod_ip if pod.status and pod.status.pod_ip else None
+    node_name = pod.spec.node_name if pod.spec and pod.spec.node_name else None
+
+    return dict(
+        name=pod_name,
+        namespace=pod_namespace,
+        total_containers=total_containers,
+        ready_containers=ready_containers,
+        restarts=total_restarts,
+        last_restart=last_restart_timedelta,
+        age=age,
+        ip=pod_ip,
+        node=node_name
+    )
+
+def _pod_json_to_summary(pod:dict[str, Any], current_time_utc:datetime.datetime) -> dict[str, Any]:
+    """Equivalent to _pod_to_summary(), for a pod parsed from the raw API response"""
+    metadata = pod['metadata']
+    spec = pod.get('spec') or {}
+    pod_status = pod.get('status') or {}
+    ready_containers = 0
+    total_restarts = 0
+    latest_restart_time: Optional[datetime.datetime] = None
+    for container_status in pod_status.get('containerStatuses') or []:
+        if container_status.get('ready'):
+            ready_containers += 1
+        total_restarts += container_status.get('restartCount', 0)
+        terminated = (container_status.get('lastState') or {}).get('terminated')
+        if terminated:
+            terminated_at = _parse_timestamp(terminated.get('finishedAt'))
+            if terminated_at:
+                if latest_restart_time is None or terminated_at > latest_restart_time:
+                    latest_restart_time = terminated_at
+    creation_timestamp = _parse_timestamp(metadata.get('creationTimestamp'))
+    return dict(
+        name=metadata['name'],
+        namespace=metadata['namespace'],
+        total_containers=len(spec.get('containers') or []),
+        ready_containers=ready_containers,
+        restarts=total_restarts,
+        last_restart=current_time_utc - latest_restart_time if latest_restart_time else None,
+        age=current_time_utc - creation_timestamp if creation_timestamp else datetime.timedelta(0),
+        ip=pod_status.get('podIP') or None,
+        node=spec.get('nodeName') or None
+    )
+
+
+_POD_RESTARTS_RE = re.compile(r'(\d+)(?: \((\S+) ago\))?')
+
+def _pod_table_row_to_summary(row:dict[str, Any], current_time_utc:datetime.datetime) -> dict[str, Any]:
+    """Equivalent to _pod_to_summary(), for a row of a Table response. The time since
+    the last restart is only available to the precision that kubectl prints it.
+    """
+    ready_containers, _, total_containers = str(row['cells'].get('ready') or "0/0").partition('/')
+    # Newer API servers print restarts as "3 (5m ago)", older ones as an integer
+    restarts_match = _POD_RESTARTS_RE.match(str(row['cells'].get('restarts') or 0))
+    return dict(
+        name=row['cells']['name'],
+        namespace=row['metadata'].get('namespace'),
+        total_containers=int(total_containers or 0),
+        ready_containers=int(ready_containers or 0),
+        restarts=int(restarts_match.group(1)) if restarts_match else 0,
+        last_restart=_parse_human_duration(restarts_match.group(2)) if restarts_match else None,
+        age=_table_age(row, current_time_utc),
+        ip=_table_cell(row, 'ip'),
+        node=_table_cell(row, 'node')
+    )
+
+def print_pod_summaries(namespace: Optional[str] = None, label_selector: Optional[str] = None,
+                        field_selector: Optional[str] = None) -> None:
     """
     Calls get_pod_summaries and prints the output to stdout, using
     the same format as `kubectl get pods -o wide`.
     """
-    pod_summaries = get_pod_summaries(namespace)
+    pod_summaries = get_pod_summaries(namespace, label_selector, field_selector)
     # Print header
     print(f"{'NAME':<32} {'NAMESPACE':<20} {'READY':<10} {'RESTARTS':<10} {'AGE':<12} {'IP':<16} {'NODE':<24}")
     for pod in pod_summaries:
@@ -485,19 +1441,60 @@ def get_pod_events(pod_name: str, namespace: str = "default") -> list[EventSumma
     if K8S is None:
         K8S = _get_api_client()
     logging.info(f"get_pod_events(pod_name={pod_name}, namespace={namespace})")
-    field_selector = f"involvedObject.name={pod_name}"
-    events = K8S.list_namespaced_event(namespace, field_selector=field_selector)
+    events = _list_object_events(namespace, 'Pod', pod_name)
     now = datetime.datetime.now(datetime.timezone.utc)
-    return [
-        EventSummary(
-            last_seen=(now - event.last_timestamp) if event.last_timestamp else None,
-            type=event.type,
-            reason=event.reason,
-            object=getattr(event.involved_object, 'name', pod_name),
-            message=event.message,
-        )
-        for event in events.items
-    ]
+    return _to_summaries(EventSummary, (_event_to_summary(event, pod_name, now) for event in events))
+
+
+def get_object_events(kind: str, name: str, namespace: str = "default") -> list[EventSummary]:
+    """
+    Get events for any Kubernetes object, such as a Deployment, ReplicaSet, Service or Node.
+    This is equivalent to the kubectl command:
+    `kubectl get events -n NAMESPACE --field-selector involvedObject.name=NAME,involvedObject.kind=KIND`
+
+    Parameters
+    ----------
+    kind : str
+        Kind of the object, as it appears in the event's involvedObject (e.g. "Deployment",
+        "ReplicaSet", "Node"). This is case sensitive.
+    name : str
+        Name of the object.
+    namespace : str, optional
+        Namespace of the object (default is "default"). The events of cluster-scoped
+        objects, like nodes, are recorded in the "default" namespace.
+
+    Returns
+    -------
+    list of EventSummary
+        List of events associated with the specified object, with the same fields as
+        those returned by get_pod_events().
+    Raises
+    ------
+    K8sConfigError
+        If unable to initialize the K8S API.
+    K8sApiError
+        If the API call to list events fails.
+    """
+    global K8S
+    if K8S is None:
+        K8S = _get_api_client()
+    logging.info(f"get_object_events(kind={kind}, name={name}, namespace={namespace})")
+    try:
+        events = _list_object_events(namespace, kind, name)
+    except client.ApiException as e:
+        raise K8sApiError(f"Error fetching events for {kind} '{name}': {e}") from e
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return _to_summaries(EventSummary, (_event_to_summary(event, name, now) for event in events))
+
+
+def _event_to_summary(event:'client.CoreV1Event', pod_name:str, now:datetime.datetime) -> dict[str, Any]:
+    return dict(
+        last_seen=(now - event.last_timestamp) if event.last_timestamp else None,
+        type=event.type,
+        reason=event.reason,
+        object=getattr(event.involved_object, 'name', pod_name),
+        message=event.message,
+    )
 
 
 def print_pod_events(pod_name: str, namespace: str = "default") -> None:
@@ -534,19 +1531,22 @@ class ContainerStateTerminated(BaseModel):
 # see kubernetes.client.models.v1_container_state.V1ContainerState
 ContainerState = Union[ContainerStateRunning, ContainerStateWaiting, ContainerStateTerminated]
 
-def _v1_container_state_to_container_state(container_state:client.V1ContainerState) -> Optional[ContainerState]:
+def _v1_container_state_to_container_state(container_state:'client.V1ContainerState') -> Optional[dict[str, Any]]:
+    # state_name selects the member of the ContainerState union when the fields are validated
     if container_state.running:
-        return ContainerStateRunning(started_at=container_state.running.started_at)
+        return dict(state_name='Running', started_at=container_state.running.started_at)
     elif container_state.waiting:
-        return ContainerStateWaiting(reason=container_state.waiting.reason,
-                                     message=container_state.waiting.message)
+        return dict(state_name='Waiting',
+                    reason=container_state.waiting.reason,
+                    message=container_state.waiting.message)
     elif container_state.terminated:
         cst = container_state.terminated
-        return ContainerStateTerminated(exit_code=cst.exit_code,
-                                        reason=cst.reason,
-                                        finished_at=cst.finished_at,
-                                        message=cst.message,
-                                        started_at=cst.started_at)
+        return dict(state_name='Terminated',
+                    exit_code=cst.exit_code,
+                    reason=cst.reason,
+                    finished_at=cst.finished_at,
+                    message=cst.message,
+                    started_at=cst.started_at)
     else:
         # All states are None - this is valid (e.g., for last_state when container has never been in a previous state)
         return None
@@ -558,11 +1558,11 @@ class VolumeMountStatus(BaseModel):
     read_only: Optional[bool]
     recursive_read_only: Optional[str]
 
-def _v1_volume_mount_status_to_mount_statis(mount_status:client.V1VolumeMountStatus) -> VolumeMountStatus:
-    return VolumeMountStatus(mount_path=mount_status.mount_path,
-                             name=mount_status.name,
-                             read_only=mount_status.read_only,
-                             recursive_read_only=mount_status.recursive_read_only)
+def _v1_volume_mount_status_to_mount_statis(mount_status:'client.V1VolumeMountStatus') -> dict[str, Any]:
+    return dict(mount_path=mount_status.mount_path,
+                name=mount_status.name,
+                read_only=mount_status.read_only,
+                recursive_read_only=mount_status.recursive_read_only)
 
 # and https://github.com/kubernetes-client/python/blob/master/kubernetes/docs/V1ContainerStatus.md
 class ContainerStatus(BaseModel):
@@ -646,10 +1646,15 @@ def get_pod_container_statuses(pod_name: str, namespace: str = "default") -> lis
         K8S = _get_api_client()
     logging.info(f"get_pod_container_statuses(pod_name={pod_name}, namespace={namespace})")
     pod = K8S.read_namespaced_pod(name=pod_name, namespace=namespace)
+    return _to_summaries(ContainerStatus, _pod_to_container_statuses(pod, pod_name, namespace))
+
+
+def _pod_to_container_statuses(pod:'client.V1Pod', pod_name:str, namespace:str) -> list[dict[str, Any]]:
+    """Return the fields of a ContainerStatus for each container of a pod"""
     # Only proceed if pod is a V1Pod instance
     if not isinstance(pod, client.V1Pod):
         raise K8sApiError(f"Unexpected type for pod: {type(pod)}")
-    result:list[ContainerStatus] = []
+    result:list[dict[str, Any]] = []
     if not pod.status or not pod.status.container_statuses:
         return result
     for container_status in pod.status.container_statuses:
@@ -677,7 +1682,7 @@ def get_pod_container_statuses(pod_name: str, namespace: str = "default") -> lis
         allocated_resources = container_status.allocated_resources \
                               if container_status.allocated_resources is not None else {}
 
-        result.append(ContainerStatus(
+        result.append(dict(
             pod_name=pod_name,
             namespace=namespace,
             container_name=container_name,
@@ -696,6 +1701,150 @@ def get_pod_container_statuses(pod_name: str, namespace: str = "default") -> lis
     return result
 
 
+def _json_container_state_to_container_state(container_state:dict[str, Any]) -> Optional[dict[str, Any]]:
+    """Equivalent to _v1_container_state_to_container_state(), for a state parsed from the raw API response"""
+    if container_state.get('running'):
+        return dict(state_name='Running', started_at=_parse_timestamp(container_state['running'].get('startedAt')))
+    elif container_state.get('waiting'):
+        waiting = container_state['waiting']
+        return dict(state_name='Waiting', reason=waiting.get('reason'), message=waiting.get('message'))
+    elif container_state.get('terminated'):
+        cst = container_state['terminated']
+        return dict(state_name='Terminated',
+                    exit_code=cst.get('exitCode'),
+                    reason=cst.get('reason'),
+                    finished_at=_parse_timestamp(cst.get('finishedAt')),
+                    message=cst.get('message'),
+                    started_at=_parse_timestamp(cst.get('startedAt')))
+    else:
+        return None
+
+
+def _pod_json_to_container_statuses(pod:dict[str, Any]) -> list[dict[str, Any]]:
+    """Equivalent to _pod_to_container_statuses(), for a pod parsed from the raw API response"""
+    metadata = pod['metadata']
+    result:list[dict[str, Any]] = []
+    for container_status in (pod.get('status') or {}).get('containerStatuses') or []:
+        state = container_status.get('state')
+        last_state = container_status.get('lastState')
+        resources = container_status.get('resources') or {}
+        result.append(dict(
+            pod_name=metadata['name'],
+            namespace=metadata['namespace'],
+            container_name=container_status['name'],
+            image=container_status['image'],
+            ready=container_status.get('ready', False),
+            restart_count=container_status.get('restartCount', 0),
+            started=container_status.get('started'),
+            stop_signal=container_status.get('stopSignal'),
+            state=_json_container_state_to_container_state(state) if state is not None else None,
+            last_state=_json_container_state_to_container_state(last_state) if last_state is not None else None,
+            volume_mounts=[dict(mount_path=volume_mount['mountPath'],
+                                name=volume_mount['name'],
+                                read_only=volume_mount.get('readOnly'),
+                                recursive_read_only=volume_mount.get('recursiveReadOnly'))
+                           for volume_mount in container_status.get('volumeMounts') or []],
+            resource_requests=resources.get('requests') or {},
+            resource_limits=resources.get('limits') or {},
+            allocated_resources=container_status.get('allocatedResources') or {}
+        ))
+    return result
+
+
+def get_namespace_container_statuses(namespace: Optional[str] = None, label_selector: Optional[str] = None,
+                                     only_not_ready: bool = False, min_restarts: int = 0,
+                                     format: ListFormat = 'objects', max_items: Optional[int] = None,
+                                     max_bytes: Optional[int] = None) -> Union[list[ContainerStatus],
+                                                                               TruncatedList[ContainerStatus],
+                                                                               ColumnarTable]:
+    """
+    Get the status of the containers of every pod in a namespace (or all namespaces), using
+    a single list of the pods rather than one request per pod. This is useful for finding
+    problem containers, e.g. those that are not ready or have restarted repeatedly.
+
+    Parameters
+    ----------
+    namespace : Optional[str], default=None
+        The namespace of the pods. If None, the pods of all namespaces are included.
+    label_selector : Optional[str], default=None
+        If specified, only include pods whose labels match this selector, using the
+        same syntax as `kubectl get -l` (e.g. 'app=checkout' or 'tier in (web,api)').
+    only_not_ready : bool, default=False
+        If True, only return containers that are not ready.
+    min_restarts : int, default=0
+        Only return containers that have restarted at least this many times.
+    format : Literal['objects', 'columnar'], default='objects'
+        'objects' returns a list of ContainerStatus objects. 'columnar' returns a ColumnarTable
+        instead, with the field names given once, in columns, and one row of values per
+        container. The states and volume mounts are included as objects. This is about
+        half the size for long lists.
+    max_items : Optional[int], default=None
+        If specified, at most this many containers are returned.
+    max_bytes : Optional[int], default=None
+        If specified, containers are only returned while the total size of their JSON (as
+        objects or rows, depending on format) is at most this many bytes.
+        If any containers are left out because of max_items or max_bytes, the result is a
+        TruncatedList (or a ColumnarTable) that also has a summary of the omitted
+        containers, with their counts by namespace and status, so that the query can be
+        narrowed. Use these limits to get a quick, bounded answer on large clusters.
+
+    Returns
+    -------
+    list of ContainerStatus, TruncatedList of ContainerStatus or ColumnarTable
+        List of container status objects, ordered by pod, or a ColumnarTable with a row per
+        container if format is 'columnar'. The fields are the same as those returned by
+        get_pod_container_statuses().
+
+    Raises
+    ------
+    K8sConfigError
+        If unable to initialize the K8S API.
+    K8sApiError
+        If the API call to list the pods fails.
+    """
+    global K8S
+    if K8S is None:
+        K8S = _get_api_client()
+    _check_list_args(format, max_items, max_bytes)
+    logging.info(f"get_namespace_container_statuses(namespace={namespace}, label_selector={label_selector}, "
+                 f"only_not_ready={only_not_ready}, min_restarts={min_restarts}, format={format}, "
+                 f"max_items={max_items}, max_bytes={max_bytes})")
+    # The informer cache does not evaluate selectors, so those queries go to the API server
+    pods = _get_informer_items('pods', namespace) if not label_selector else None
+    try:
+        if pods is not None:
+            fields = (status for pod in pods
+                      for status in _pod_to_container_statuses(pod, pod.metadata.name, pod.metadata.namespace))
+        else:
+            selectors = _selector_args(label_selector, None)
+            list_fn = K8S.list_namespaced_pod if namespace else K8S.list_pod_for_all_namespaces
+            if namespace:
+                selectors['namespace'] = namespace
+            # A Table has no container statuses, so the 'table' mode reads the pods as JSON too
+            if LIST_RESPONSE_MODE in ('json', 'table'):
+                fields = (status for pod in _list_json_in_pages(list_fn, **selectors)
+                          for status in _pod_json_to_container_statuses(pod))
+            else:
+                fields = (status for pod in _list_in_pages(list_fn, **selectors)
+                          for status in _pod_to_container_statuses(pod, pod.metadata.name, pod.metadata.namespace))
+        # _list_result() only creates models for the statuses that pass the filters and fit in the budget
+        statuses = _filter_container_statuses(fields, only_not_ready, min_restarts)
+    except client.ApiException as e:
+        raise K8sApiError(f"Error fetching pods: {e}") from e
+    return _list_result(ContainerStatus, statuses, format, max_items, max_bytes)
+
+
+def _container_status_matches(ready:bool, restart_count:int, only_not_ready:bool, min_restarts:int) -> bool:
+    return not (only_not_ready and ready) and restart_count >= min_restarts
+
+
+def _filter_container_statuses(fields:Iterable[dict[str, Any]], only_not_ready:bool,
+                               min_restarts:int) -> list[dict[str, Any]]:
+    """Return the fields of the container statuses that pass the filters of get_namespace_container_statuses()"""
+    return [status for status in fields
+            if _container_status_matches(status['ready'], status['restart_count'], only_not_ready, min_restarts)]
+
+
 def print_pod_container_statuses(pod_name: str, namespace: str = "default") -> None:
     """
     Pretty-print the status for all containers in a specified Kubernetes pod. 
@@ -782,7 +1931,7 @@ def get_pod_spec(pod_name: str, namespace: str = "default") -> dict[str,Any]:
         if not isinstance(pod, client.V1Pod) or not hasattr(pod, "spec") or pod.spec is None:
             raise K8sApiError(f"Pod '{pod_name}' in namespace '{namespace}' did not return a valid spec.")
         return pod.spec.to_dict()
-    except ApiException as e:
+    except client.ApiException as e:
         if hasattr(e, "status") and e.status == 404:
             raise K8sApiError(
                 f"Pod '{pod_name}' not found in namespace '{namespace}'."
@@ -803,8 +1952,41 @@ def print_pod_spec(pod_name: str, namespace: str = "default") -> None:
         print(f"Error printing pod spec: {e}")
 
 
+# Defaults for the amount of log data returned by get_logs_for_pod_and_container()
+DEFAULT_LOG_TAIL_LINES = 1000
+DEFAULT_LOG_LIMIT_BYTES = 1024*1024
+# Size of the reads done by stream_logs_for_pod_and_container()
+LOG_STREAM_CHUNK_SIZE = 16*1024
+
+
+def _log_query_args(container_name:Optional[str], since_seconds:Optional[int],
+                    since_time:Optional[datetime.datetime], tail_lines:Optional[int],
+                    limit_bytes:Optional[int]) -> dict[str, Any]:
+    """Return the keyword arguments for read_namespaced_pod_log() for the specified options.
+    The client does not support sinceTime, so since_time is converted to since_seconds.
+    """
+    if since_seconds is not None and since_time is not None:
+        raise K8sApiError("At most one of since_seconds or since_time may be specified")
+    args:dict[str, Any] = {'container': container_name, 'timestamps': True}
+    if since_time is not None:
+        if since_time.tzinfo is None:
+            since_time = since_time.replace(tzinfo=datetime.timezone.utc)
+        since_seconds = max(1, math.ceil((datetime.datetime.now(datetime.timezone.utc) - since_time).total_seconds()))
+    if since_seconds is not None:
+        args['since_seconds'] = since_seconds
+    if tail_lines is not None:
+        args['tail_lines'] = tail_lines
+    if limit_bytes is not None:
+        args['limit_bytes'] = limit_bytes
+    return args
+
+
 def get_logs_for_pod_and_container(pod_name:str, namespace:str = "default",
-                                    container_name:Optional[str]=None) -> Optional[str]:
+                                   container_name:Optional[str]=None,
+                                   since_seconds:Optional[int]=None,
+                                   since_time:Optional[datetime.datetime]=None,
+                                   tail_lines:Optional[int]=DEFAULT_LOG_TAIL_LINES,
+                                   limit_bytes:Optional[int]=DEFAULT_LOG_LIMIT_BYTES) -> Optional[str]:
     """
     Retrieves logs from a Kubernetes pod and container.
 
@@ -813,6 +1995,13 @@ def get_logs_for_pod_and_container(pod_name:str, namespace:str = "default",
         pod_name (str): The name of the pod.
         container_name (str, optional): The name of the container within the pod.
                                         If None, defaults to the first container.
+        since_seconds (int, optional): Only return logs newer than this many seconds.
+        since_time (datetime, optional): Only return logs after this time. At most one of
+                                         since_seconds and since_time may be specified.
+        tail_lines (int, optional): Maximum number of lines to return, counting back from
+                                    the end of the log. Defaults to 1000. If None, there is no limit.
+        limit_bytes (int, optional): Maximum number of bytes to return. Defaults to 1MB.
+                                     If None, there is no limit.
 
     Returns:
         str, optional: Log content if any found for this pod/container, or None otherwise
@@ -827,18 +2016,17 @@ def get_logs_for_pod_and_container(pod_name:str, namespace:str = "default",
     global K8S
     if K8S is None:
         K8S = _get_api_client()
- 
+    logging.info(f"get_logs_for_pod_and_container(pod_name={pod_name}, namespace={namespace}, "
+                 f"container_name={container_name}, since_seconds={since_seconds}, since_time={since_time}, "
+                 f"tail_lines={tail_lines}, limit_bytes={limit_bytes})")
+    log_args = _log_query_args(container_name, since_seconds, since_time, tail_lines, limit_bytes)
     try:
-        # read_namespaced_pod_log with reasonable limits to avoid memory issues
         resp = K8S.read_namespaced_pod_log(
             name=pod_name,
             namespace=namespace,
-            container=container_name,  # Pass container_name if specified
-            follow=False,              # Set to False to get all current logs
-            _preload_content=True,     # Important: This loads all content into memory
-            timestamps=True,           # Optional: Include timestamps
-            tail_lines=1000,          # Limit to last 1000 lines to avoid memory issues
-            limit_bytes=1024*1024     # Limit to 1MB to avoid memory issues
+            follow=False,
+            _preload_content=True,
+            **log_args
         )
 
         # The response is a single string containing all logs
@@ -852,6 +2040,317 @@ def get_logs_for_pod_and_container(pod_name:str, namespace:str = "default",
         raise K8sApiError(f"An unexpected error occurred: {e}") from e
 
 
+def _iter_lines(chunks:Iterator[bytes]) -> Iterator[str]:
+    """Split a stream of byte chunks into lines (without the line endings)"""
+    buffer = b''
+    for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b'\n')
+        for line in lines:
+            yield line.decode('utf-8', errors='replace')
+    if buffer:
+        yield buffer.decode('utf-8', errors='replace')
+
+
+def stream_logs_for_pod_and_container(pod_name:str, namespace:str = "default",
+                                      container_name:Optional[str]=None,
+                                      since_seconds:Optional[int]=None,
+                                      since_time:Optional[datetime.datetime]=None,
+                                      tail_lines:Optional[int]=None,
+                                      limit_bytes:Optional[int]=None,
+                                      follow:bool=False,
+                                      follow_timeout_seconds:float=60.0) -> Iterator[str]:
+    """
+    Like get_logs_for_pod_and_container(), but yields the log lines as they are received
+    rather than returning them as one string. Only one chunk of the response is held in
+    memory at a time. There are no default limits on the amount of log data.
+
+    If follow is True, new lines continue to be yielded as the container writes them.
+    Following stops after about follow_timeout_seconds, when no new lines have arrived
+    for follow_timeout_seconds, or when the caller closes the generator.
+
+    Raises
+    ------
+    K8sConfigError
+        If unable to initialize the K8S API.
+    K8sApiError
+        If the API call to fetch logs fails.
+    """
+    global K8S
+    if K8S is None:
+        K8S = _get_api_client()
+    logging.info(f"stream_logs_for_pod_and_container(pod_name={pod_name}, namespace={namespace}, "
+                 f"container_name={container_name}, follow={follow})")
+    log_args = _log_query_args(container_name, since_seconds, since_time, tail_lines, limit_bytes)
+    if follow:
+        # the read timeout bounds how long we wait for the next line
+        log_args['_request_timeout'] = (REQUEST_TIMEOUT or None, follow_timeout_seconds)
+    try:
+        response = K8S.read_namespaced_pod_log(name=pod_name, namespace=namespace, follow=follow,
+                                               _preload_content=False, **log_args)
+    except client.ApiException as e:
+        raise K8sApiError(f"Error fetching logs: {e}") from e
+    deadline = time.monotonic() + follow_timeout_seconds
+    try:
+        for line in _iter_lines(response.stream(LOG_STREAM_CHUNK_SIZE)):
+            yield line
+            if follow and time.monotonic() > deadline:
+                return
+    except (urllib3.exceptions.ReadTimeoutError, urllib3.exceptions.ProtocolError) as e:
+        if not follow:
+            raise K8sApiError(f"Error reading logs: {e}") from e
+        # no new lines within the timeout, so we are done following
+    finally:
+        response.close()
+        response.release_conn()
+
+
+class LogMatch(BaseModel):
+    """A log line that matched a search, with the lines around it"""
+    line_number: int
+    timestamp: Optional[datetime.datetime]
+    line: str
+    before: list[str] = Field(default_factory=list)
+    after: list[str] = Field(default_factory=list)
+
+
+def _split_log_timestamp(line:str) -> tuple[Optional[datetime.datetime], str]:
+    """Split a log line requested with timestamps=True into its timestamp and message"""
+    timestamp, sep, message = line.partition(' ')
+    if sep:
+        try:
+            return (datetime.datetime.fromisoformat(timestamp), message)
+        except ValueError:
+            pass
+    return (None, line)
+
+
+class _LogSearcher:
+    """Matches log lines one at a time, keeping only the context lines that may still be
+    needed. Call add() for each line until it returns True (no more matches are wanted).
+    """
+    def __init__(self, regex:re.Pattern, before:int, after:int, max_matches:int):
+        self.regex = regex
+        self.after = after
+        self.max_matches = max_matches
+        self.matches:list[LogMatch] = []
+        self.line_number = 0
+        self._before:collections.deque[str] = collections.deque(maxlen=max(before, 0))
+        self._pending:list[LogMatch] = [] # matches still collecting their after lines
+
+    def add(self, line:str) -> bool:
+        self.line_number += 1
+        (timestamp, message) = _split_log_timestamp(line)
+        for match in self._pending:
+            match.after.append(message)
+        self._pending = [match for match in self._pending if len(match.after) < self.after]
+        if len(self.matches) < self.max_matches and self.regex.search(message):
+            match = LogMatch(line_number=self.line_number, timestamp=timestamp, line=message,
+                             before=list(self._before))
+            self.matches.append(match)
+            if self.after > 0:
+                self._pending.append(match)
+        self._before.append(message)
+        return len(self.matches) >= self.max_matches and not self._pending
+
+
+def _compile_log_pattern(pattern:str, ignore_case:bool) -> re.Pattern:
+    try:
+        return re.compile(pattern, re.IGNORECASE if ignore_case else 0)
+    except re.error as e:
+        raise ValueError(f"Invalid regular expression '{pattern}': {e}") from e
+
+
+def search_pod_logs(pod_name:str, pattern:str, namespace:str = "default",
+                    container_name:Optional[str]=None, before:int=0, after:int=0,
+                    max_matches:int=100, ignore_case:bool=False,
+                    since_seconds:Optional[int]=None) -> list[LogMatch]:
+    """
+    Search the logs of a pod's container for lines matching a regular expression, like
+    `kubectl logs POD | grep -B BEFORE -A AFTER PATTERN`. The logs are read as a stream
+    and matched line by line, so only the matching lines and their context are returned.
+
+    Parameters
+    ----------
+    pod_name : str
+        Name of the pod.
+    pattern : str
+        Python regular expression to search for (e.g. "ERROR|Exception"). It is matched
+        against each line's message, without the timestamp.
+    namespace : str, optional
+        Namespace of the pod (default is "default").
+    container_name : Optional[str], optional
+        Name of the container. If None, defaults to the pod's only container.
+    before : int, optional
+        Number of lines to include before each match (default is 0).
+    after : int, optional
+        Number of lines to include after each match (default is 0).
+    max_matches : int, optional
+        Maximum number of matches to return (default is 100). The search stops reading the
+        logs once this many matches have been found.
+    ignore_case : bool, optional
+        If True, the match is case-insensitive (default is False).
+    since_seconds : Optional[int], optional
+        Only search logs newer than this many seconds. If None, the entire log is searched.
+
+    Returns
+    -------
+    list of LogMatch
+        The matching lines, in order. Each LogMatch has the following fields:
+
+        line_number : int
+            Position of the line in the log that was read, starting at 1.
+        timestamp : Optional[datetime.datetime]
+            Time the line was written.
+        line : str
+            The matching line, without the timestamp.
+        before : list[str]
+            The lines before the match, without their timestamps.
+        after : list[str]
+            The lines after the match, without their timestamps.
+
+    Raises
+    ------
+    ValueError
+        If the pattern is not a valid regular expression.
+    K8sConfigError
+        If unable to initialize the K8S API.
+    K8sApiError
+        If the API call to fetch logs fails.
+    """
+    logging.info(f"search_pod_logs(pod_name={pod_name}, pattern={pattern}, namespace={namespace}, "
+                 f"container_name={container_name}, since_seconds={since_seconds})")
+    searcher = _LogSearcher(_compile_log_pattern(pattern, ignore_case), before, after, max_matches)
+    lines = stream_logs_for_pod_and_container(pod_name, namespace, container_name, since_seconds=since_seconds)
+    try:
+        for line in lines:
+            if searcher.add(line):
+                break
+    finally:
+        lines.close()
+    return searcher.matches
+
+
+# Maximum number of pods whose logs are fetched at once by get_logs_for_workload()
+LOG_FANOUT_CONCURRENCY:int = int(os.environ.get('K8STOOLS_LOG_FANOUT_CONCURRENCY', '10'))
+
+
+class PodLogs(BaseModel):
+    """The logs from one pod of a workload, or the error encountered fetching them"""
+    pod_name: str
+    container_name: Optional[str] = None
+    logs: Optional[str] = None
+    error: Optional[str] = None
+
+
+def _label_selector_to_string(selector:'client.V1LabelSelector') -> str:
+    """Convert a deployment's spec.selector to the string form used by list calls"""
+    requirements = [f"{key}={value}" for (key, value) in (selector.match_labels or {}).items()]
+    for expression in selector.match_expressions or []:
+        if expression.operator == 'In':
+            requirements.append(f"{expression.key} in ({','.join(expression.values)})")
+        elif expression.operator == 'NotIn':
+            requirements.append(f"{expression.key} notin ({','.join(expression.values)})")
+        elif expression.operator == 'Exists':
+            requirements.append(expression.key)
+        elif expression.operator == 'DoesNotExist':
+            requirements.append(f"!{expression.key}")
+    return ','.join(requirements)
+
+
+def _check_workload_args(deployment_name:Optional[str], label_selector:Optional[str]) -> None:
+    if (deployment_name is None) == (label_selector is None):
+        raise ValueError("Exactly one of deployment_name or label_selector must be specified")
+
+
+def get_logs_for_workload(namespace:str = "default", deployment_name:Optional[str]=None,
+                          label_selector:Optional[str]=None, container_name:Optional[str]=None,
+                          since_seconds:Optional[int]=None, tail_lines:Optional[int]=100,
+                          limit_bytes:Optional[int]=64*1024, max_pods:int=50) -> list[PodLogs]:
+    """
+    Retrieve the logs from all the pods of a deployment, or all the pods matching a label
+    selector. The logs of the pods are fetched in parallel.
+
+    Parameters
+    ----------
+    namespace : str, optional
+        Namespace of the workload (default is "default").
+    deployment_name : Optional[str], optional
+        Name of a deployment. Its pods are found using the deployment's selector.
+    label_selector : Optional[str], optional
+        Label selector for the pods (e.g. "app=checkout"). Exactly one of deployment_name
+        and label_selector must be specified.
+    container_name : Optional[str], optional
+        Name of the container. If None, defaults to each pod's only container.
+    since_seconds : Optional[int], optional
+        Only return logs newer than this many seconds.
+    tail_lines : Optional[int], optional
+        Maximum number of lines to return for each pod (default is 100). If None, there is no limit.
+    limit_bytes : Optional[int], optional
+        Maximum number of bytes to return for each pod (default is 64KB). If None, there is no limit.
+    max_pods : int, optional
+        Maximum number of pods to fetch logs for (default is 50). Pods are taken in order by name.
+
+    Returns
+    -------
+    list of PodLogs
+        One entry per pod, ordered by pod name. Each PodLogs has the following fields:
+
+        pod_name : str
+            Name of the pod.
+        container_name : Optional[str]
+            Name of the container, if one was specified.
+        logs : Optional[str]
+            The log content, or None if there was an error.
+        error : Optional[str]
+            If the logs for this pod could not be retrieved, a description of the error.
+
+    Raises
+    ------
+    ValueError
+        If not exactly one of deployment_name and label_selector is specified.
+    K8sConfigError
+        If unable to initialize the K8S API.
+    K8sApiError
+        If the deployment could not be read or the pods could not be listed.
+    """
+    global K8S, APPS_V1_API
+    _check_workload_args(deployment_name, label_selector)
+    if K8S is None:
+        K8S = _get_api_client()
+    logging.info(f"get_logs_for_workload(namespace={namespace}, deployment_name={deployment_name}, "
+                 f"label_selector={label_selector}, container_name={container_name})")
+    try:
+        if deployment_name is not None:
+            if APPS_V1_API is None:
+                APPS_V1_API = _get_apps_v1_api_client()
+            deployment = APPS_V1_API.read_namespaced_deployment(name=deployment_name, namespace=namespace)
+            label_selector = _label_selector_to_string(deployment.spec.selector)
+        pod_names = sorted(pod.metadata.name for pod in
+                           _list_in_pages(K8S.list_namespaced_pod, namespace=namespace, label_selector=label_selector))
+    except client.ApiException as e:
+        raise K8sApiError(f"Error finding pods for workload: {e}") from e
+    if len(pod_names) > max_pods:
+        logging.warning(f"get_logs_for_workload: found {len(pod_names)} pods, only fetching logs for {max_pods}")
+        pod_names = pod_names[:max_pods]
+
+    def fetch(pod_name:str) -> PodLogs:
+        try:
+            logs = get_logs_for_pod_and_container(pod_name, namespace, container_name, since_seconds=since_seconds,
+                                                  tail_lines=tail_lines, limit_bytes=limit_bytes)
+            return PodLogs(pod_name=pod_name, container_name=container_name, logs=logs)
+        except K8sApiError as e:
+            return PodLogs(pod_name=pod_name, container_name=container_name, error=str(e))
+
+    if not pod_names:
+        return []
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(LOG_FANOUT_CONCURRENCY, len(pod_names)),
+                                               thread_name_prefix="k8stools-logs") as executor:
+        # each fetch runs in a copy of our context, so that its requests are counted for this call (see tool_metrics)
+        futures = [executor.submit(contextvars.copy_context().run, fetch, pod_name) for pod_name in pod_names]
+        return [future.result() for future in futures]
+
+
 class DeploymentSummary(BaseModel):
     """A summary of a deployment's status like returned by `kubectl get deployments`"""
     name: str
@@ -862,7 +2361,13 @@ class DeploymentSummary(BaseModel):
     available_replicas: int
     age: datetime.timedelta
 
-def get_deployment_summaries(namespace: Optional[str] = None) -> list[DeploymentSummary]:
+def get_deployment_summaries(namespace: Optional[str] = None, label_selector: Optional[str] = None,
+                             field_selector: Optional[str] = None,
+                             format: ListFormat = 'objects', max_items: Optional[int] = None,
+                             max_bytes: Optional[int] = None, page_size: Optional[int] = None,
+                             cursor: Optional[str] = None) -> Union[list[DeploymentSummary],
+                                                                    TruncatedList[DeploymentSummary],
+                                                                    SummaryPage[DeploymentSummary], ColumnarTable]:
     """
     Retrieves a list of DeploymentSummary objects for deployments in a given namespace or all namespaces.
     Similar to `kubectl get deployements`.
@@ -871,11 +2376,43 @@ def get_deployment_summaries(namespace: Optional[str] = None) -> list[Deployment
     ----------
     namespace : Optional[str], default=None
         The specific namespace to list deployments from. If None, lists deployments from all namespaces.
+    label_selector : Optional[str], default=None
+        If specified, only return deployments whose labels match this selector, using the
+        same syntax as `kubectl get -l` (e.g. 'app=checkout'). The filtering is done
+        by the API server.
+    field_selector : Optional[str], default=None
+        If specified, only return deployments whose fields match this selector, using the
+        same syntax as `kubectl get --field-selector` (e.g. 'metadata.name=checkout').
+        The filtering is done by the API server.
+
+    format : Literal['objects', 'columnar'], default='objects'
+        'objects' returns a list of DeploymentSummary objects. 'columnar' returns a ColumnarTable
+        instead, with the field names below given once, in columns, and one row of values per
+        deployment. Durations are integer seconds. This is about half the size for long lists.
+    max_items : Optional[int], default=None
+        If specified, at most this many deployments are returned.
+    max_bytes : Optional[int], default=None
+        If specified, deployments are only returned while the total size of their JSON (as
+        objects or rows, depending on format) is at most this many bytes.
+        If any deployments are left out because of max_items or max_bytes, the result is a
+        TruncatedList (or a ColumnarTable) that also has a summary of the omitted
+        deployments, with their counts by namespace and status, so that the query can be
+        narrowed. Use these limits to get a quick, bounded answer on large clusters.
+    page_size : Optional[int], default=None
+        If specified, the deployments are returned a page at a time, as a SummaryPage (or a
+        ColumnarTable) with at most page_size deployments and a next_cursor for the next page.
+        Each page only costs the work for its own deployments. Defaults to 100 if only cursor
+        is specified. Cannot be combined with max_items or max_bytes.
+    cursor : Optional[str], default=None
+        The next_cursor returned by the previous page, to get the next page. The other
+        arguments must be the same as for the previous page. next_cursor is None on the
+        last page. Cursors expire after a few minutes of not being used.
 
     Returns
     -------
-    list of DeploymentSummary
-        A list of DeploymentSummary objects, each providing a summary of a deployment's status with the following fields:
+    list of DeploymentSummary, TruncatedList of DeploymentSummary, SummaryPage of DeploymentSummary or ColumnarTable
+        A ColumnarTable if format is 'columnar', with the same fields as columns. Otherwise,
+        a list of DeploymentSummary objects, each providing a summary of a deployment's status with the following fields:
 
         name : str
             Name of the deployment.
@@ -905,54 +2442,92 @@ def get_deployment_summaries(namespace: Optional[str] = None) -> list[Deployment
     if APPS_V1_API is None:
         APPS_V1_API = _get_apps_v1_api_client()
 
-    logging.info(f"get_deployment_summaries(namespace={namespace})")
-    deployment_summaries: list[DeploymentSummary] = []
-    
+    _check_list_args(format, max_items, max_bytes, page_size, cursor)
+    logging.info(f"get_deployment_summaries(namespace={namespace}, label_selector={label_selector}, field_selector={field_selector}, "
+                 f"format={format}, max_items={max_items}, max_bytes={max_bytes}, "
+                 f"page_size={page_size}, cursor={cursor})")
+    selectors = _selector_args(label_selector, field_selector)
+    if namespace:
+        list_fn, list_kwargs = APPS_V1_API.list_namespaced_deployment, dict(namespace=namespace, **selectors)
+    else:
+        list_fn, list_kwargs = APPS_V1_API.list_deployment_for_all_namespaces, selectors
     try:
-        if namespace:
-            deployments = APPS_V1_API.list_namespaced_deployment(namespace=namespace)
-        else:
-            deployments = APPS_V1_API.list_deployment_for_all_namespaces()
+        if page_size is not None or cursor is not None:
+            return _get_summary_page('deployments', DeploymentSummary, list_fn, list_kwargs, _deployment_to_summary,
+                                     _deployment_json_to_summary, _deployment_table_row_to_summary, format,
+                                     page_size, cursor, namespace=namespace, use_informer=not selectors)
+        fields = _get_summary_fields('deployments', list_fn, list_kwargs, _deployment_to_summary,
+                                     _deployment_json_to_summary, _deployment_table_row_to_summary,
+                                     namespace=namespace, use_informer=not selectors)
     except client.ApiException as e:
         raise K8sApiError(f"Error fetching deployments: {e}") from e
+    return _list_result(DeploymentSummary, fields, format, max_items, max_bytes)
+
+
+def _deployment_to_summary(deployment:'client.V1Deployment', current_time_utc:datetime.datetime) -> dict[str, Any]:
+    deployment_name = deployment.metadata.name
+    deployment_namespace = deployment.metadata.namespace
     
-    current_time_utc = datetime.datetime.now(datetime.timezone.utc)
+    # Extract replica counts from deployment status
+    total_replicas = deployment.spec.replicas if deployment.spec.replicas is not None else 0
+    ready_replicas = deployment.status.ready_replicas if deployment.status.ready_replicas is not None else 0
+    up_to_date_replicas = deployment.status.updated_replicas if deployment.status.updated_replicas is not None else 0
+    available_replicas = deployment.status.available_replicas if deployment.status.available_replicas is not None else 0
     
-    for deployment in deployments.items:
-        deployment_name = deployment.metadata.name
-        deployment_namespace = deployment.metadata.namespace
-        
-        # Extract replica counts from deployment status
-        total_replicas = deployment.spec.replicas if deployment.spec.replicas is not None else 0
-        ready_replicas = deployment.status.ready_replicas if deployment.status.ready_replicas is not None else 0
-        up_to_date_replicas = deployment.status.updated_replicas if deployment.status.updated_replicas is not None else 0
-        available_replicas = deployment.status.available_replicas if deployment.status.available_replicas is not None else 0
-        
-        # Calculate age
-        age = datetime.timedelta(0)  # Default to 0 if creation_timestamp is missing
-        if deployment.metadata.creation_timestamp:
-            age = current_time_utc - deployment.metadata.creation_timestamp
-        
-        deployment_summary = DeploymentSummary(
-            name=deployment_name,
-            namespace=deployment_namespace,
-            total_replicas=total_replicas,
-            ready_replicas=ready_replicas,
-            up_to_date_relicas=up_to_date_replicas,
-            available_replicas=available_replicas,
-            age=age
-        )
-        deployment_summaries.append(deployment_summary)
+    # Calculate age
+    age = datetime.timedelta(0)  # Default to 0 if creation_timestamp is missing
+    if deployment.metadata.creation_timestamp:
+        age = current_time_utc - deployment.metadata.creation_timestamp
     
-    return deployment_summaries
-
-
-def print_deployment_summaries(namespace: Optional[str] = None) -> None:
+    return dict(
+        name=deployment_name,
+        namespace=deployment_namespace,
+        total_replicas=total_replicas,
+        ready_replicas=ready_replicas,
+        up_to_date_relicas=up_to_date_replicas,
+        available_replicas=available_replicas,
+        age=age
+    )
+
+
+def _deployment_json_to_summary(deployment:dict[str, Any], current_time_utc:datetime.datetime) -> dict[str, Any]:
+    """Equivalent to _deployment_to_summary(), for a deployment parsed from the raw API response"""
+    metadata = deployment['metadata']
+    spec = deployment.get('spec') or {}
+    status = deployment.get('status') or {}
+    creation_timestamp = _parse_timestamp(metadata.get('creationTimestamp'))
+    return dict(
+        name=metadata['name'],
+        namespace=metadata['namespace'],
+        total_replicas=spec.get('replicas') or 0,
+        ready_replicas=status.get('readyReplicas') or 0,
+        up_to_date_relicas=status.get('updatedReplicas') or 0,
+        available_replicas=status.get('availableReplicas') or 0,
+        age=current_time_utc - creation_timestamp if creation_timestamp else datetime.timedelta(0)
+    )
+
+
+def _deployment_table_row_to_summary(row:dict[str, Any], current_time_utc:datetime.datetime) -> dict[str, Any]:
+    """Equivalent to _deployment_to_summary(), for a row of a Table response"""
+    ready_replicas, _, total_replicas = str(row['cells'].get('ready') or "0/0").partition('/')
+    return dict(
+        name=row['cells']['name'],
+        namespace=row['metadata'].get('namespace'),
+        total_replicas=int(total_replicas or 0),
+        ready_replicas=int(ready_replicas or 0),
+        up_to_date_relicas=int(row['cells'].get('up-to-date') or 0),
+        available_replicas=int(row['cells'].get('available') or 0),
+        age=_table_age(row, current_time_utc)
+    )
+
+
+def print_deployment_summaries(namespace: Optional[str] = None, label_selector: Optional[str] = None,
+                               field_selector: Optional[str] = None) -> None:
     """
     Calls get_deployment_summaries and prints the output to stdout, using
     the same format as `kubectl get deployments`.
     """
-    deployment_summaries = get_deployment_summaries(namespace)
+    deployment_summaries = get_deployment_summaries(namespace, label_selector, field_selector)
     print(f"{'NAME':<32} {'NAMESPACE':<20} {'READY':<10} {'UP-TO-DATE':<12} {'AVAILABLE':<12} {'AGE':<12}")
     for deployment in deployment_summaries:
         ready = f"{deployment.ready_replicas}/{deployment.total_replicas}"
@@ -977,7 +2552,12 @@ class ServiceSummary(BaseModel):
     ports: list[PortInfo]
     age: datetime.timedelta
 
-def get_service_summaries(namespace: Optional[str] = None) -> list[ServiceSummary]:
+def get_service_summaries(namespace: Optional[str] = None, label_selector: Optional[str] = None,
+                          field_selector: Optional[str] = None,
+                          format: ListFormat = 'objects', max_items: Optional[int] = None,
+                          max_bytes: Optional[int] = None, page_size: Optional[int] = None,
+                          cursor: Optional[str] = None) -> Union[list[ServiceSummary], TruncatedList[ServiceSummary],
+                                                                 SummaryPage[ServiceSummary], ColumnarTable]:
     """Retrieves a list of ServiceSummary objects for services in a given namespace or all namespaces.
     Similar to `kubectl get services`.
 
@@ -985,11 +2565,43 @@ def get_service_summaries(namespace: Optional[str] = None) -> list[ServiceSummar
     ----------
     namespace : Optional[str], default=None
         The specific namespace to list services from. If None, lists services from all namespaces.
+    label_selector : Optional[str], default=None
+        If specified, only return services whose labels match this selector, using the
+        same syntax as `kubectl get -l` (e.g. 'app=checkout'). The filtering is done
+        by the API server.
+    field_selector : Optional[str], default=None
+        If specified, only return services whose fields match this selector, using the
+        same syntax as `kubectl get --field-selector` (e.g. 'spec.type=LoadBalancer').
+        The filtering is done by the API server.
+
+    format : Literal['objects', 'columnar'], default='objects'
+        'objects' returns a list of ServiceSummary objects. 'columnar' returns a ColumnarTable
+        instead, with the field names below given once, in columns, and one row of values per
+        service. Durations are integer seconds. This is about half the size for long lists.
+    max_items : Optional[int], default=None
+        If specified, at most this many services are returned.
+    max_bytes : Optional[int], default=None
+        If specified, services are only returned while the total size of their JSON (as
+        objects or rows, depending on format) is at most this many bytes.
+        If any services are left out because of max_items or max_bytes, the result is a
+        TruncatedList (or a ColumnarTable) that also has a summary of the omitted
+        services, with their counts by namespace and status, so that the query can be
+        narrowed. Use these limits to get a quick, bounded answer on large clusters.
+    page_size : Optional[int], default=None
+        If specified, the services are returned a page at a time, as a SummaryPage (or a
+        ColumnarTable) with at most page_size services and a next_cursor for the next page.
+        Each page only costs the work for its own services. Defaults to 100 if only cursor
+        is specified. Cannot be combined with max_items or max_bytes.
+    cursor : Optional[str], default=None
+        The next_cursor returned by the previous page, to get the next page. The other
+        arguments must be the same as for the previous page. next_cursor is None on the
+        last page. Cursors expire after a few minutes of not being used.
 
     Returns
     -------
-    list of ServiceSummary
-        A list of ServiceSummary objects, each providing a summary of a service's status with the following fields:
+    list of ServiceSummary, TruncatedList of ServiceSummary, SummaryPage of ServiceSummary or ColumnarTable
+        A ColumnarTable if format is 'columnar', with the same fields as columns. Otherwise,
+        a list of ServiceSummary objects, each providing a summary of a service's status with the following fields:
 
         name : str
             Name of the service.
@@ -1019,70 +2631,125 @@ def get_service_summaries(namespace: Optional[str] = None) -> list[ServiceSummar
     if K8S is None:
         K8S = _get_api_client()
 
-    logging.info(f"get_service_summaries(namespace={namespace})")
-    service_summaries: list[ServiceSummary] = []
-    
+    _check_list_args(format, max_items, max_bytes, page_size, cursor)
+    logging.info(f"get_service_summaries(namespace={namespace}, label_selector={label_selector}, field_selector={field_selector}, "
+                 f"format={format}, max_items={max_items}, max_bytes={max_bytes}, "
+                 f"page_size={page_size}, cursor={cursor})")
+    selectors = _selector_args(label_selector, field_selector)
+    if namespace:
+        # List services in a specific namespace
+        list_fn, list_kwargs = K8S.list_namespaced_service, dict(namespace=namespace, **selectors)
+    else:
+        # List services across all namespaces
+        list_fn, list_kwargs = K8S.list_service_for_all_namespaces, selectors
     try:
-        if namespace:
-            # List services in a specific namespace
-            services = K8S.list_namespaced_service(namespace=namespace).items
-        else:
-            # List services across all namespaces
-            services = K8S.list_service_for_all_namespaces().items
+        if page_size is not None or cursor is not None:
+            return _get_summary_page('services', ServiceSummary, list_fn, list_kwargs, _service_to_summary,
+                                     _service_json_to_summary, _service_table_row_to_summary, format, page_size, cursor,
+                                     namespace=namespace, use_informer=not selectors)
+        fields = _get_summary_fields('services', list_fn, list_kwargs, _service_to_summary,
+                                     _service_json_to_summary, _service_table_row_to_summary,
+                                     namespace=namespace, use_informer=not selectors)
     except client.ApiException as e:
         raise K8sApiError(f"Error fetching services: {e}") from e
+    return _list_result(ServiceSummary, fields, format, max_items, max_bytes)
 
-    current_time_utc = datetime.datetime.now(datetime.timezone.utc)
 
-    for service in services:
-        service_name = service.metadata.name
-        service_namespace = service.metadata.namespace
-        service_type = service.spec.type if service.spec.type else "ClusterIP"
-        
-        # Get cluster IP (None for ExternalName services)
-        cluster_ip = service.spec.cluster_ip if service.spec.cluster_ip != "None" else None
-        
-        # Get external IP for LoadBalancer services
-        external_ip = None
-        if service.status and service.status.load_balancer and service.status.load_balancer.ingress:
-            # Take the first ingress IP or hostname
-            ingress = service.status.load_balancer.ingress[0]
-            external_ip = ingress.ip or ingress.hostname
-        
-        # Extract port information
-        ports = []
-        if service.spec.ports:
-            for port in service.spec.ports:
-                ports.append(PortInfo(
-                    port=port.port,
-                    protocol=port.protocol if port.protocol else "TCP"
-                ))
-        
-        # Calculate age
-        age = datetime.timedelta(0)  # Default to 0 if creation_timestamp is missing
-        if service.metadata.creation_timestamp:
-            age = current_time_utc - service.metadata.creation_timestamp
-
-        service_summary = ServiceSummary(
-            name=service_name,
-            namespace=service_namespace,
-            type=service_type,
-            cluster_ip=cluster_ip,
-            external_ip=external_ip,
-            ports=ports,
-            age=age
-        )
-        service_summaries.append(service_summary)
+def _service_to_summary(service:'client.V1Service', current_time_utc:datetime.datetime) -> dict[str, Any]:
+    service_name = service.metadata.name
+    service_namespace = service.metadata.namespace
+    service_type = service.spec.type if service.spec.type else "ClusterIP"
     
-    return service_summaries
-
-
-def print_service_summaries(namespace: Optional[str] = None) -> None:
+    # Get cluster IP (None for ExternalName services)
+    cluster_ip = service.spec.cluster_ip if service.spec.cluster_ip != "None" else None
+    
+    # Get external IP for LoadBalancer services
+    external_ip = None
+    if service.status and service.status.load_balancer and service.status.load_balancer.ingress:
+        # Take the first ingress IP or hostname
+        ingress = service.status.load_balancer.ingress[0]
+        external_ip = ingress.ip or ingress.hostname
+    
+    # Extract port information
+    ports = []
+    if service.spec.ports:
+        for port in service.spec.ports:
+            ports.append(dict(
+                port=port.port,
+                protocol=port.protocol if port.protocol else "TCP"
+            ))
+    
+    # Calculate age
+    age = datetime.timedelta(0)  # Default to 0 if creation_timestamp is missing
+    if service.metadata.creation_timestamp:
+        age = current_time_utc - service.metadata.creation_timestamp
+
+    return dict(
+        name=service_name,
+        namespace=service_namespace,
+        type=service_type,
+        cluster_ip=cluster_ip,
+        external_ip=external_ip,
+        ports=ports,
+        age=age
+    )
+
+
+def _service_json_to_summary(service:dict[str, Any], current_time_utc:datetime.datetime) -> dict[str, Any]:
+    """Equivalent to _service_to_summary(), for a service parsed from the raw API response"""
+    metadata = service['metadata']
+    spec = service.get('spec') or {}
+    external_ip = None
+    ingresses = ((service.get('status') or {}).get('loadBalancer') or {}).get('ingress')
+    if ingresses:
+        external_ip = ingresses[0].get('ip') or ingresses[0].get('hostname')
+    cluster_ip = spec.get('clusterIP')
+    creation_timestamp = _parse_timestamp(metadata.get('creationTimestamp'))
+    return dict(
+        name=metadata['name'],
+        namespace=metadata['namespace'],
+        type=spec.get('type') or "ClusterIP",
+        cluster_ip=cluster_ip if cluster_ip != "None" else None,
+        external_ip=external_ip,
+        ports=[dict(port=port['port'], protocol=port.get('protocol') or "TCP")
+               for port in spec.get('ports') or []],
+        age=current_time_utc - creation_timestamp if creation_timestamp else datetime.timedelta(0)
+    )
+
+
+def _service_table_row_to_summary(row:dict[str, Any], current_time_utc:datetime.datetime) -> dict[str, Any]:
+    """Equivalent to _service_to_summary(), for a row of a Table response"""
+    service_type = _table_cell(row, 'type') or "ClusterIP"
+    cluster_ip = _table_cell(row, 'cluster-ip')
+    # The external IP column also shows spec.externalIPs and ExternalName targets, but the
+    # summary only reports load balancer ingress addresses
+    external_ip = None
+    if service_type == "LoadBalancer" and _table_cell(row, 'external-ip') not in (None, '<pending>'):
+        external_ip = _table_cell(row, 'external-ip').split(',')[0]
+    ports = []
+    # Ports are printed as "80/TCP,443:30443/TCP" (port:nodePort/protocol)
+    for port in (_table_cell(row, 'port(s)') or '').split(','):
+        if port:
+            number, _, protocol = port.partition('/')
+            ports.append(dict(port=int(number.split(':')[0]), protocol=protocol or "TCP"))
+    return dict(
+        name=row['cells']['name'],
+        namespace=row['metadata'].get('namespace'),
+        type=service_type,
+        cluster_ip=cluster_ip if cluster_ip != "None" else None,
+        external_ip=external_ip,
+        ports=ports,
+        age=_table_age(row, current_time_utc)
+    )
+
+
+def print_service_summaries(namespace: Optional[str] = None, label_selector: Optional[str] = None,
+                            field_selector: Optional[str] = None) -> None:
     """
     Calls get_service_summaries and prints the output to stdout, using
     the same format as `kubectl get services`.
     """
-    service_summaries = get_service_summaries(namespace)
+    service_summaries = get_service_summaries(namespace, label_selector, field_selector)
     print(f"{'NAME':<32} {'NAMESPACE':<20} {'TYPE':<15} {'CLUSTER-IP':<16} {'EXTERNAL-IP':<16} {'PORT(S)':<20} {'AGE':<12}")
     for service in service_summaries:
         service_type = service.type
@@ -1103,9 +2770,16 @@ TOOLS = [
     get_node_summaries,
     get_pod_summaries,
     get_pod_container_statuses,
+    get_namespace_container_statuses,
     get_pod_events,
+    get_object_events,
     get_pod_spec,
     get_logs_for_pod_and_container,
+    search_pod_logs,
+    get_logs_for_workload,
     get_deployment_summaries,
     get_service_summaries
-]
\ No newline at end of file
+]
+
+# If profiling was enabled through the environment (see tool_profiler), profile the calls of the tools
+TOOLS = profile_tools(TOOLS, globals())
\ No newline at end of file
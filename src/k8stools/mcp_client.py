@@ -21,7 +21,6 @@ from mcp.types import ListToolsResult, Tool
 
 from rich import print
 from rich.console import Console
-from rich.markdown import Markdown
 
 print(f"sys.argv[0] = {sys.argv[0]}") # XXX
 if sys.argv[0].endswith('ks8-mcp-client'):
@@ -73,6 +72,8 @@ def print_tools(tools:ListToolsResult, filter_names=None, short=False):
             first_line = tool.description.strip().split('\n')[0]
             console.print(f"{tool.name} - {tool.title if tool.title else first_line}")
         else:
+            # rich.markdown (and its markdown parser) is only needed for the full output
+            from rich.markdown import Markdown
             md = tool_to_markdown(tool)
             console.print(Markdown(md))
 
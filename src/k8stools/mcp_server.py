@@ -13,18 +13,107 @@
 
 This will run with either the stdio transport or the streamable http transport.
 """
+from typing import Any, Callable, Optional
 from pydantic import BaseModel
 from mcp.server.fastmcp import FastMCP
 from mcp.server.fastmcp.tools import Tool
+import anyio
+import anyio.to_thread
 import argparse
+import atexit
+import functools
 import logging
+import signal
+import threading
 
+from .tool_cache import ResponseCache, cached
+from .singleflight import SingleFlight, coalesced
+from .tool_metrics import ToolMetrics, instrumented
+from . import tool_profiler
+from .tool_profiler import ToolProfiler, profiled
 
-def get_tool_for_function(fn) -> Tool:
+# Defaults for the number of tool calls that can run at once, in total and for each tool
+DEFAULT_MAX_CONCURRENCY = 16
+DEFAULT_MAX_TOOL_CONCURRENCY = 8
+
+# The response cache, if enabled with --cache. Its stats() method returns the hit and miss counts.
+RESPONSE_CACHE:Optional[ResponseCache] = None
+# Shares the results of concurrent identical calls, unless disabled with --no-coalesce
+SINGLE_FLIGHT:Optional[SingleFlight] = None
+# Per-tool call, latency and API request metrics (and response sizes with --metrics-response-bytes),
+# unless disabled with --no-metrics
+TOOL_METRICS:Optional[ToolMetrics] = None
+
+
+def run_in_worker_thread(fn:Callable[..., Any], limiter:anyio.CapacityLimiter,
+                         tool_limiter:anyio.CapacityLimiter) -> Callable[..., Any]:
+    """Wrap a blocking tool function in a coroutine that runs it in a worker thread, so
+    that it does not block the event loop (and thus other clients) while waiting on the
+    API server. At most tool_limiter's tokens calls of this tool, and limiter's tokens
+    calls in total, run at once. Other calls wait for a slot.
+    """
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        async with tool_limiter:
+            return await anyio.to_thread.run_sync(functools.partial(fn, *args, **kwargs), limiter=limiter)
+    return wrapper
+
+
+def get_tool_for_function(fn, limiter:Optional[anyio.CapacityLimiter]=None,
+                          tool_limiter:Optional[anyio.CapacityLimiter]=None,
+                          cache:Optional[ResponseCache]=None,
+                          single_flight:Optional[SingleFlight]=None,
+                          metrics:Optional[ToolMetrics]=None,
+                          profiler:Optional[ToolProfiler]=None) -> Tool:
+    if profiler is not None:
+        # innermost, so that a blocking tool is profiled in the worker thread that runs it
+        fn = profiled(fn, profiler)
+    if limiter is not None:
+        fn = run_in_worker_thread(fn, limiter, tool_limiter or anyio.CapacityLimiter(limiter.total_tokens))
+    if single_flight is not None:
+        # calls waiting on an identical call don't hold a worker thread or a concurrency slot
+        fn = coalesced(fn, single_flight)
+    if cache is not None:
+        # outside of the worker thread, so that cache hits don't wait for a thread
+        fn = cached(fn, cache)
+    if metrics is not None:
+        # outermost, so that the latency is what the client sees, including cache hits
+        fn = instrumented(fn, metrics)
     tool = Tool.from_function(fn, structured_output=True)
     #return_type = fn.__annotations__['return']
     return tool
 
+def add_metrics_route(mcp:FastMCP, metrics:ToolMetrics) -> None:
+    """Serve the metrics in the Prometheus text format at /metrics"""
+    from starlette.requests import Request
+    from starlette.responses import PlainTextResponse
+
+    @mcp.custom_route("/metrics", methods=["GET"])
+    async def metrics_endpoint(request:Request) -> PlainTextResponse:
+        return PlainTextResponse(metrics.render(RESPONSE_CACHE, SINGLE_FLIGHT),
+                                 media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+def dump_metrics_on_signal(metrics:ToolMetrics, path:str) -> None:
+    """Write the metrics to path when the process receives SIGUSR1, and when it exits"""
+    def write_metrics() -> None:
+        try:
+            metrics.write(path, RESPONSE_CACHE, SINGLE_FLIGHT)
+            logging.info(f"Wrote metrics to {path}")
+        except OSError as e:
+            logging.error(f"Could not write metrics to {path}: {e}")
+
+    def handler(signum, frame) -> None:
+        # The signal may arrive while this (the main) thread holds the metrics lock, so write from another thread
+        threading.Thread(target=write_metrics, name="k8stools-metrics", daemon=True).start()
+
+    if hasattr(signal, 'SIGUSR1'):
+        signal.signal(signal.SIGUSR1, handler)
+    else:
+        logging.warning("SIGUSR1 is not available on this platform, metrics will only be written on exit")
+    atexit.register(write_metrics)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Run the MCP server.")
     parser.add_argument('--transport', choices=['streamable-http', 'stdio'],
@@ -41,14 +130,149 @@ def main():
                         help="Enable debug mode [default: False]")
     parser.add_argument('--mock', action='store_true', default=False,
                         help="If specified, just run mock versions of the tools that don't need a cluster")
+    parser.add_argument('--mock-pods', type=int, default=None,
+                        help="With --mock, serve a generated cluster with this many pods rather than the static "+
+                             "mock data, e.g. for load testing")
+    parser.add_argument('--mock-nodes', type=int, default=20,
+                        help="Number of nodes in the generated cluster [default: 20]")
+    parser.add_argument('--mock-namespaces', type=int, default=10,
+                        help="Number of namespaces in the generated cluster [default: 10]")
+    parser.add_argument('--mock-seed', type=int, default=0,
+                        help="Random seed for the generated cluster [default: 0]")
+    parser.add_argument('--list-page-size', type=int, default=None,
+                        help="Maximum number of objects to request per LIST call, 0 for no limit "+
+                             "[default: $K8STOOLS_LIST_PAGE_SIZE or 500]")
+    parser.add_argument('--list-response-mode', choices=['model', 'json', 'table'], default=None,
+                        help="How LIST responses are decoded: 'model' uses the kubernetes client models, "+
+                             "'json' parses only the needed fields from the raw response, which is faster, "+
+                             "'table' asks the API server for only the columns printed by kubectl "+
+                             "[default: $K8STOOLS_LIST_RESPONSE_MODE or model]")
+    parser.add_argument('--connection-pool-maxsize', type=int, default=None,
+                        help="Maximum number of connections to the API server, which bounds the number of "+
+                             "concurrent requests [default: $K8STOOLS_CONNECTION_POOL_MAXSIZE or 32]")
+    parser.add_argument('--request-timeout', type=float, default=None,
+                        help="Timeout in seconds for requests to the API server, 0 for no timeout "+
+                             "[default: $K8STOOLS_REQUEST_TIMEOUT or 60]")
+    parser.add_argument('--max-concurrency', type=int, default=DEFAULT_MAX_CONCURRENCY,
+                        help="Maximum number of tool calls that run at once, each in a worker thread "+
+                             f"[default: {DEFAULT_MAX_CONCURRENCY}]")
+    parser.add_argument('--max-tool-concurrency', type=int, default=DEFAULT_MAX_TOOL_CONCURRENCY,
+                        help="Maximum number of calls of any one tool that run at once "+
+                             f"[default: {DEFAULT_MAX_TOOL_CONCURRENCY}]")
+    parser.add_argument('--async-tools', action='store_true', default=False,
+                        help="If specified, use the asyncio versions of the tools (from async_tools), which run "+
+                             "on the event loop rather than in worker threads. Not available with --mock")
+    parser.add_argument('--informers', action='store_true', default=False,
+                        help="If specified, keep a watch-backed cache of namespaces, nodes, pods, deployments "+
+                             "and services rather than listing them from the API server on each call")
+    parser.add_argument('--informer-max-staleness', type=float, default=120.0,
+                        help="Seconds after which informer data is considered stale and the tools fall back "+
+                             "to listing from the API server [default: 120]")
+    parser.add_argument('--event-index-ttl', type=float, default=None,
+                        help="If specified, index the events of each namespace by object, relisting them after "+
+                             "this many seconds, rather than listing events on each call")
+    parser.add_argument('--coalesce', action=argparse.BooleanOptionalAction, default=True,
+                        help="Concurrent calls of a tool with the same arguments share a single call "+
+                             "[default: enabled]")
+    parser.add_argument('--cache', action='store_true', default=False,
+                        help="If specified, cache tool results for a few seconds, so that repeated identical "+
+                             "calls don't go to the API server")
+    parser.add_argument('--cache-ttl', action='append', default=[], metavar='TOOL=SECONDS',
+                        help="Cache TTL for a tool, may be repeated. 0 disables caching for the tool. The log "+
+                             "tools are never cached for more than 5 seconds")
+    parser.add_argument('--cache-default-ttl', type=float, default=5.0,
+                        help="Cache TTL for tools without a specific TTL [default: 5]")
+    parser.add_argument('--cache-max-entries', type=int, default=1000,
+                        help="Maximum number of cached results [default: 1000]")
+    parser.add_argument('--cache-max-bytes', type=int, default=64*1024*1024,
+                        help="Maximum approximate size of the cached results in bytes [default: 64MB]")
+    parser.add_argument('--metrics', action=argparse.BooleanOptionalAction, default=True,
+                        help="Record per-tool call counts, latencies and API requests. With the "
+                             "streamable-http transport, they are served at /metrics [default: enabled]")
+    parser.add_argument('--metrics-response-bytes', action='store_true', default=False,
+                        help="Also record the size of the tool results. This serializes each result an "
+                             "extra time, in a worker thread [default: False]")
+    parser.add_argument('--metrics-file', default=None,
+                        help="Write the metrics to this file when the server receives SIGUSR1 and on exit, "
+                             "e.g. for the stdio transport [default: none]")
+    parser.add_argument('--profile', action='store_true', default=False,
+                        help="Profile tool calls and write the profiles of slow calls to --profile-dir [default: False]")
+    parser.add_argument('--profile-dir', default='k8stools-profiles',
+                        help="Directory for the profiles [default: k8stools-profiles]")
+    parser.add_argument('--profile-threshold', type=float, default=1.0,
+                        help="Only write the profiles of calls that take at least this many seconds [default: 1.0]")
+    parser.add_argument('--profile-sample-rate', type=float, default=1.0,
+                        help="Fraction of the calls to profile [default: 1.0]")
+    parser.add_argument('--profile-mode', choices=['sample', 'cprofile'], default='sample',
+                        help="Sample the call's stack periodically (low overhead), or use cProfile [default: sample]")
 
     args = parser.parse_args()
+    if args.mock and args.async_tools:
+        parser.error("--async-tools cannot be used with --mock, there are no async versions of the mock tools")
+    tool_ttls:dict[str, float] = {}
+    for tool_ttl in args.cache_ttl:
+        (tool, _, ttl) = tool_ttl.partition('=')
+        try:
+            tool_ttls[tool] = float(ttl)
+        except ValueError:
+            parser.error(f"--cache-ttl must be TOOL=SECONDS, got '{tool_ttl}'")
     if not args.mock:
-        from .k8s_tools import TOOLS
+        from . import k8s_tools
+        from .k8s_tools import TOOLS, enable_informers, enable_event_index
+        if args.async_tools:
+            from .async_tools import TOOLS
+        if args.list_page_size is not None:
+            k8s_tools.LIST_PAGE_SIZE = args.list_page_size
+        if args.list_response_mode is not None:
+            k8s_tools.LIST_RESPONSE_MODE = args.list_response_mode
+        if args.connection_pool_maxsize is not None:
+            k8s_tools.CONNECTION_POOL_MAXSIZE = args.connection_pool_maxsize
+        if args.request_timeout is not None:
+            k8s_tools.REQUEST_TIMEOUT = args.request_timeout
+        if args.informers:
+            enable_informers(max_staleness=args.informer_max_staleness)
+        if args.event_index_ttl is not None:
+            enable_event_index(ttl_seconds=args.event_index_ttl)
     else:
-        from .mock_tools import TOOLS
+        from .mock_tools import TOOLS, use_synthetic_cluster
         logging.warning(f"Using mock versions of the tools")
-    wrapped_tools = [get_tool_for_function(fn) for fn in TOOLS]
+        if args.mock_pods is not None:
+            use_synthetic_cluster(num_pods=args.mock_pods, num_nodes=args.mock_nodes,
+                                  num_namespaces=args.mock_namespaces, seed=args.mock_seed)
+            logging.info(f"Generated a cluster with {args.mock_pods} pods, {args.mock_nodes} nodes "
+                         f"and {args.mock_namespaces} namespaces")
+    global RESPONSE_CACHE, SINGLE_FLIGHT, TOOL_METRICS
+    profiler:Optional[ToolProfiler] = None
+    if args.profile:
+        profiler = ToolProfiler(args.profile_dir, threshold_seconds=args.profile_threshold,
+                                sample_rate=args.profile_sample_rate, mode=args.profile_mode)
+        logging.info(f"Writing the profiles of tool calls slower than {args.profile_threshold}s to {args.profile_dir}")
+        if tool_profiler.PROFILER is not None:
+            logging.info("--profile takes precedence over the profiling configured by K8STOOLS_PROFILE_DIR")
+    elif tool_profiler.PROFILER is not None and not args.mock:
+        logging.info(f"Profiling tool calls as configured by K8STOOLS_PROFILE_DIR={tool_profiler.PROFILER.directory}")
+    if args.metrics:
+        TOOL_METRICS = ToolMetrics(measure_response_bytes=args.metrics_response_bytes)
+    if args.coalesce:
+        SINGLE_FLIGHT = SingleFlight()
+    if args.cache:
+        unknown_tools = set(tool_ttls) - set(fn.__name__ for fn in TOOLS)
+        if unknown_tools:
+            parser.error(f"--cache-ttl given for unknown tools: {', '.join(sorted(unknown_tools))}")
+        RESPONSE_CACHE = ResponseCache(tool_ttls, default_ttl=args.cache_default_ttl,
+                                       max_entries=args.cache_max_entries, max_bytes=args.cache_max_bytes)
+    if args.async_tools:
+        # the requests run on the event loop, bounded by the connection pool, and the tools do their
+        # blocking and CPU-bound work (config loading, parsing, validation) in asyncio's default thread pool
+        wrapped_tools = [get_tool_for_function(fn, cache=RESPONSE_CACHE, single_flight=SINGLE_FLIGHT,
+                                               metrics=TOOL_METRICS, profiler=profiler)
+                         for fn in TOOLS]
+    else:
+        limiter = anyio.CapacityLimiter(args.max_concurrency)
+        wrapped_tools = [get_tool_for_function(fn, limiter, anyio.CapacityLimiter(args.max_tool_concurrency),
+                                               cache=RESPONSE_CACHE, single_flight=SINGLE_FLIGHT,
+                                               metrics=TOOL_METRICS, profiler=profiler)
+                         for fn in TOOLS]
 
     mcp = FastMCP(
         name="k8stools-"+args.transport,
@@ -60,6 +284,11 @@ def main():
         log_level=args.log_level,
         debug=args.debug
     )
+    if TOOL_METRICS is not None:
+        if args.transport == 'streamable-http':
+            add_metrics_route(mcp, TOOL_METRICS)
+        if args.metrics_file:
+            dump_metrics_on_signal(TOOL_METRICS, args.metrics_file)
     logging.debug(f"Settings are: {mcp.settings}")
     logging.info(f"Starting with {len(wrapped_tools)} tools on transport {args.transport}")
     # this starts the uvicorn server
@@ -1,10 +1,15 @@
 """This module provides mocks for the tool functions. For each tool in k8s_tools.TOOLS, it provides
 an equivalent mock that has the same function signature and returns mock data of the same type.
 This is useful in writing tests for clients of this package (e.g. your agent).
+
+By default, the mocks return a small amount of static data. For load testing, call
+use_synthetic_cluster() to have them return a generated cluster of any size instead.
 """
 import datetime
-from typing import Optional, Any
-from . import k8s_tools
+import random
+import re
+from typing import Optional, Any, Union
+from . import k8s_tools, paging
 
 def _get_static_mock_data():
     """Static mock data for testing"""
@@ -177,34 +182,431 @@ def _get_static_mock_data():
             "restart_policy": "Always",
             "node_name": "minikube"
         },
-        'ad_pod_logs': "2025-07-28T01:50:52.678740495Z Picked up JAVA_TOOL_OPTIONS: -javaagent:/usr/src/app/opentelemetry-javaagent.jar\n2025-07-28T01:50:52.758344990Z OpenJDK 64-Bit Server VM warning: Sharing is only supported for boot loader classes"
+        'ad_pod_logs': "2025-07-28T01:50:52.678740495Z Picked up JAVA_TOOL_OPTIONS: -javaagent:/usr/src/app/opentelemetry-javaagent.jar\n2025-07-28T01:50:52.758344990Z OpenJDK 64-Bit Server VM warning: Sharing is only supported for boot loader classes",
+        # labels of the pods, deployments, and services, keyed by (kind, namespace, name)
+        'labels': {
+            ('pods', 'default', 'ad-647b4947cc-s5mpm'): {'app': 'ad', 'pod-template-hash': '647b4947cc'},
+            ('pods', 'default', 'test-pod-123'): {'app': 'test'},
+            ('pods', 'kube-system', 'kube-system-pod'): {'component': 'kube-system'},
+            ('deployments', 'default', 'ad'): {'app': 'ad'},
+            ('deployments', 'default', 'test-deployment'): {'app': 'test'},
+            ('services', 'default', 'ad'): {'app': 'ad'},
+            ('services', 'default', 'test-service'): {'app': 'test'},
+        },
     }
 
+_APP_NAMES = ["frontend", "cart", "checkout", "payment", "shipping", "email", "ad", "recommendation",
+              "currency", "quote", "inventory", "auth", "search", "catalog", "reviews", "notification",
+              "gateway", "worker", "scheduler", "analytics"]
+_SIDECAR_IMAGES = [("istio-proxy", "docker.io/istio/proxyv2:1.22.1"),
+                   ("fluent-bit", "cr.fluentbit.io/fluent/fluent-bit:3.0.7")]
+_HEX_CHARS = "0123456789abcdef"
+_POD_SUFFIX_CHARS = "bcdfghjklmnpqrstvwxz2456789"
+
+
+def generate_cluster_data(num_pods: int = 1000, num_nodes: int = 20, num_namespaces: int = 10,
+                          seed: int = 0, pods_per_deployment: int = 4,
+                          failure_rate: float = 0.05) -> dict[str, Any]:
+    """Generate the data for a synthetic cluster, in the form used by the mock tools.
+
+    The same parameters always produce the same cluster. Pods are grouped into deployments
+    (with a service for most deployments) and spread across the namespaces and nodes.
+    A fraction of the pods are failing: crash looping, stuck pulling their image, or pending.
+    Container statuses, events, pod specs, and logs are derived from each pod when requested,
+    so large clusters (e.g. 100,000 pods across 500 nodes) can be generated in a few seconds.
+
+    Parameters
+    ----------
+    num_pods : int, default=1000
+        Number of pods.
+    num_nodes : int, default=20
+        Number of nodes. The first three (or fewer) are control-plane nodes.
+    num_namespaces : int, default=10
+        Number of namespaces, including "default" and "kube-system".
+    seed : int, default=0
+        Seed for the random number generator.
+    pods_per_deployment : int, default=4
+        Average number of replicas of each deployment.
+    failure_rate : float, default=0.05
+        Fraction of the pods that are not healthy.
+
+    Returns
+    -------
+    dict[str, Any]
+        The mock data. Pass the same parameters to use_synthetic_cluster() to have the
+        mock tools return it.
+    """
+    rng = random.Random(seed)
+    now = datetime.datetime.now(datetime.timezone.utc)
+    day = datetime.timedelta(days=1)
+    namespace_names = ["default", "kube-system"] + \
+                      [f"{_APP_NAMES[i % len(_APP_NAMES)]}-{i // len(_APP_NAMES)}" for i in range(max(num_namespaces - 2, 0))]
+    namespace_names = namespace_names[:max(num_namespaces, 1)]
+    cluster_age = datetime.timedelta(days=rng.randint(60, 365))
+    data: dict[str, Any] = {
+        'namespaces': [k8s_tools.NamespaceSummary(name=name, status="Active",
+                                                  age=cluster_age if i < 2 else cluster_age * rng.uniform(0.1, 0.9))
+                       for (i, name) in enumerate(namespace_names)],
+        'nodes': [],
+        'pods': [],
+        'deployments': [],
+        'services': [],
+        'labels': {},
+        # (namespace, pod name) -> how the pod's details are generated
+        'pod_details': {},
+    }
+
+    for i in range(num_nodes):
+        control_plane = i < min(3, max(num_nodes - 1, 1))
+        data['nodes'].append(k8s_tools.NodeSummary(
+            name=f"control-plane-{i}" if control_plane else f"node-{i:04d}",
+            status="NotReady" if rng.random() < failure_rate / 5 else "Ready",
+            # like kubectl and k8s_tools, nodes without a role label have the role "<none>"
+            roles=["control-plane"] if control_plane else ["<none>"],
+            age=cluster_age - datetime.timedelta(hours=rng.randint(0, 48)),
+            version="v1.30." + str(rng.choice([2, 2, 2, 3])),
+            internal_ip=f"10.0.{i // 250}.{i % 250 + 2}",
+            os_image="Ubuntu 22.04.4 LTS",
+            kernel_version="5.15.0-112-generic",
+            container_runtime="containerd://1.7.18"))
+    worker_nodes = [node.name for node in data['nodes'] if "control-plane" not in node.roles] or \
+                   [node.name for node in data['nodes']]
+
+    pod_count = 0
+    deployment_count = 0
+    while pod_count < num_pods:
+        namespace = namespace_names[deployment_count % len(namespace_names)]
+        app = f"{_APP_NAMES[deployment_count % len(_APP_NAMES)]}-{deployment_count // len(_APP_NAMES)}"
+        deployment_count += 1
+        replicas = min(max(1, round(rng.expovariate(1 / pods_per_deployment))), num_pods - pod_count)
+        template_hash = ''.join(rng.choice(_HEX_CHARS) for _ in range(10))
+        image = f"registry.example.com/{namespace}/{app}:1.{rng.randint(0, 20)}.{rng.randint(0, 9)}"
+        containers = [(app, image)] + rng.sample(_SIDECAR_IMAGES, rng.choice([0, 0, 0, 1, 1, 2]))
+        deployment_age = cluster_age * rng.uniform(0.01, 0.5)
+        labels = {'app': app}
+        ready_replicas = 0
+        for _ in range(replicas):
+            name = f"{app}-{template_hash}-{''.join(rng.choice(_POD_SUFFIX_CHARS) for _ in range(5))}"
+            roll = rng.random()
+            if roll < failure_rate * 0.6:
+                mode = 'CrashLoopBackOff'
+            elif roll < failure_rate * 0.8:
+                mode = 'ImagePullBackOff'
+            elif roll < failure_rate:
+                mode = 'Pending'
+            else:
+                mode = 'Running'
+            restarts = [0] * len(containers)
+            if mode == 'CrashLoopBackOff':
+                restarts[0] = rng.randint(3, 300)
+            elif mode == 'Running' and rng.random() < 0.1:
+                restarts[0] = rng.randint(1, 5)
+            age = min(deployment_age, day * rng.uniform(0.01, 30))
+            pod_ip = None if mode == 'Pending' else f"10.{128 + pod_count // 65536 % 128}.{pod_count // 256 % 256}.{pod_count % 256}"
+            ready = len(containers) - 1 if mode == 'CrashLoopBackOff' else \
+                    0 if mode in ('ImagePullBackOff', 'Pending') else len(containers)
+            data['pods'].append(k8s_tools.PodSummary(
+                name=name,
+                namespace=namespace,
+                total_containers=len(containers),
+                ready_containers=ready,
+                restarts=sum(restarts),
+                last_restart=datetime.timedelta(minutes=rng.uniform(0.5, 5 if mode == 'CrashLoopBackOff' else 600))
+                             if sum(restarts) else None,
+                age=age,
+                ip=pod_ip,
+                node=None if mode == 'Pending' else rng.choice(worker_nodes)))
+            data['labels'][('pods', namespace, name)] = {**labels, 'pod-template-hash': template_hash}
+            data['pod_details'][(namespace, name)] = {'containers': containers, 'mode': mode, 'restarts': restarts,
+                                                      'started_at': now - age}
+            if ready == len(containers):
+                ready_replicas += 1
+            pod_count += 1
+        data['deployments'].append(k8s_tools.DeploymentSummary(
+            name=app, namespace=namespace, total_replicas=replicas, ready_replicas=ready_replicas,
+            up_to_date_relicas=replicas, available_replicas=ready_replicas, age=deployment_age))
+        data['labels'][('deployments', namespace, app)] = labels
+        if rng.random() < 0.8:
+            service_type = rng.choices(["ClusterIP", "NodePort", "LoadBalancer"], weights=[90, 5, 5])[0]
+            data['services'].append(k8s_tools.ServiceSummary(
+                name=app, namespace=namespace, type=service_type,
+                cluster_ip=f"10.96.{deployment_count // 256 % 256}.{deployment_count % 256}",
+                external_ip=f"203.0.113.{deployment_count % 254 + 1}" if service_type == "LoadBalancer" else None,
+                ports=[k8s_tools.PortInfo(port=rng.choice([80, 8080, 9090, 50051]), protocol="TCP")],
+                age=deployment_age))
+            data['labels'][('services', namespace, app)] = labels
+    return data
+
+
+def use_synthetic_cluster(**kwargs: Any) -> None:
+    """Have the mock tools return the data of a synthetic cluster. The keyword
+    arguments are passed to generate_cluster_data().
+    """
+    global _MOCK_DATA
+    _MOCK_DATA = _index_mock_data(generate_cluster_data(**kwargs))
+
+
+def use_static_data() -> None:
+    """Have the mock tools return the static data (the default)"""
+    global _MOCK_DATA
+    _MOCK_DATA = _index_mock_data(_get_static_mock_data())
+
+
+def _index_mock_data(data: dict[str, Any]) -> dict[str, Any]:
+    data['pod_index'] = {(pod.namespace, pod.name): pod for pod in data['pods']}
+    data.setdefault('pod_details', {})
+    return data
+
+
+def _is_static_ad_pod(pod_name: str, namespace: str) -> bool:
+    """The ad pod of the static data has captured details, rather than generated ones"""
+    return pod_name == "ad-647b4947cc-s5mpm" and namespace == "default" and 'ad_pod_spec' in _MOCK_DATA
+
+
+def _synthetic_container_statuses(pod: k8s_tools.PodSummary, details: dict[str, Any]) -> list[k8s_tools.ContainerStatus]:
+    now = datetime.datetime.now(datetime.timezone.utc)
+    mode = details['mode']
+    statuses = []
+    for (i, (container_name, image)) in enumerate(details['containers']):
+        restart_count = details['restarts'][i]
+        last_state = None
+        if mode == 'Running':
+            state = k8s_tools.ContainerStateRunning(
+                started_at=now - pod.last_restart if restart_count and pod.last_restart else details['started_at'])
+            ready = True
+        elif mode == 'CrashLoopBackOff' and i == 0:
+            state = k8s_tools.ContainerStateWaiting(reason="CrashLoopBackOff",
+                                                    message="back-off 5m0s restarting failed container")
+            finished_at = now - (pod.last_restart or datetime.timedelta(minutes=1))
+            last_state = k8s_tools.ContainerStateTerminated(exit_code=1, reason="Error", finished_at=finished_at,
+                                                            started_at=finished_at - datetime.timedelta(seconds=5))
+            ready = False
+        elif mode == 'CrashLoopBackOff':
+            state = k8s_tools.ContainerStateRunning(started_at=details['started_at'])
+            ready = True
+        elif mode == 'ImagePullBackOff':
+            state = k8s_tools.ContainerStateWaiting(reason="ImagePullBackOff",
+                                                    message=f'Back-off pulling image "{image}"')
+            ready = False
+        else: # Pending, so the containers have not been created
+            state = k8s_tools.ContainerStateWaiting(reason="ContainerCreating")
+            ready = False
+        statuses.append(k8s_tools.ContainerStatus(
+            pod_name=pod.name,
+            namespace=pod.namespace,
+            container_name=container_name,
+            image=image,
+            ready=ready,
+            restart_count=restart_count,
+            started=ready,
+            stop_signal=None,
+            state=state,
+            last_state=last_state,
+            volume_mounts=[k8s_tools.VolumeMountStatus(mount_path="/var/run/secrets/kubernetes.io/serviceaccount",
+                                                       name="kube-api-access", read_only=True,
+                                                       recursive_read_only="Disabled")],
+            resource_requests={"cpu": "100m", "memory": "128Mi"},
+            resource_limits={"memory": "256Mi"},
+            allocated_resources={"cpu": "100m", "memory": "128Mi"}))
+    return statuses
+
+
+def _synthetic_pod_events(pod: k8s_tools.PodSummary, details: dict[str, Any]) -> list[k8s_tools.EventSummary]:
+    mode = details['mode']
+    (container_name, image) = details['containers'][0]
+    if mode == 'Pending':
+        return [k8s_tools.EventSummary(last_seen=datetime.timedelta(seconds=30), type="Warning",
+                                       reason="FailedScheduling", object=pod.name,
+                                       message="0/3 nodes are available: 3 Insufficient cpu. "
+                                               "preemption: 0/3 nodes are available.")]
+    events = [k8s_tools.EventSummary(last_seen=pod.age, type="Normal", reason="Scheduled", object=pod.name,
+                                     message=f"Successfully assigned {pod.namespace}/{pod.name} to {pod.node}")]
+    if mode == 'ImagePullBackOff':
+        events.append(k8s_tools.EventSummary(last_seen=datetime.timedelta(minutes=1), type="Warning", reason="Failed",
+                                             object=pod.name,
+                                             message=f'Failed to pull image "{image}": not found'))
+        events.append(k8s_tools.EventSummary(last_seen=datetime.timedelta(seconds=20), type="Normal", reason="BackOff",
+                                             object=pod.name, message=f'Back-off pulling image "{image}"'))
+    elif mode == 'CrashLoopBackOff':
+        events.append(k8s_tools.EventSummary(last_seen=pod.last_restart, type="Normal", reason="Pulled",
+                                             object=pod.name,
+                                             message=f'Container image "{image}" already present on machine'))
+        events.append(k8s_tools.EventSummary(last_seen=datetime.timedelta(seconds=15), type="Warning",
+                                             reason="BackOff", object=pod.name,
+                                             message="Back-off restarting failed container "
+                                                     f"{container_name} in pod {pod.name}"))
+    else:
+        events.append(k8s_tools.EventSummary(last_seen=pod.age, type="Normal", reason="Started", object=pod.name,
+                                             message=f"Started container {container_name}"))
+    return events
+
+
+def _synthetic_logs(pod: k8s_tools.PodSummary, details: dict[str, Any], container_name: Optional[str]) -> str:
+    mode = details['mode']
+    container_ref = container_name or details['containers'][0][0]
+    if mode in ('Pending', 'ImagePullBackOff'):
+        return ""
+    messages = [f"Starting {container_ref}", "Listening on port 8080"]
+    if mode == 'CrashLoopBackOff' and container_ref == details['containers'][0][0]:
+        messages += [f"Connecting to database at db.{pod.namespace}.svc.cluster.local:5432",
+                     "ERROR Failed to connect to database: connection refused",
+                     "Exiting with status 1"]
+    else:
+        messages += ["GET /healthz 200", "Ready to serve traffic"]
+    return "\n".join(f"{(details['started_at'] + datetime.timedelta(seconds=i)).strftime('%Y-%m-%dT%H:%M:%S.000000000Z')} {message}"
+                     for (i, message) in enumerate(messages))
+
+
 # Initialize the mock data
-_MOCK_DATA = _get_static_mock_data()
+_MOCK_DATA = _index_mock_data(_get_static_mock_data())
+
+
+# Selector fields supported by the mocks for each kind, mapped to the summary attribute
+_FIELD_SELECTOR_ATTRIBUTES = {
+    'pods': {'metadata.name': 'name', 'metadata.namespace': 'namespace',
+             'spec.nodeName': 'node', 'status.podIP': 'ip'},
+    'deployments': {'metadata.name': 'name', 'metadata.namespace': 'namespace'},
+    'services': {'metadata.name': 'name', 'metadata.namespace': 'namespace',
+                 'spec.type': 'type', 'spec.clusterIP': 'cluster_ip'},
+}
+
+_LABEL_REQUIREMENT_RE = re.compile(
+    r"^\s*(?:(?P<not_exists>!)\s*(?P<nkey>[\w./-]+)"
+    r"|(?P<key>[\w./-]+)\s*(?:(?P<op>==|!=|=|\s+in\s+|\s+notin\s+)\s*(?P<values>\([^)]*\)|[\w./-]*))?)\s*$"
+)
+
+
+def _split_selector(selector: str) -> list[str]:
+    """Split a selector on the commas that are not inside parentheses"""
+    parts, depth, current = [], 0, ""
+    for ch in selector:
+        if ch == '(':
+            depth += 1
+        elif ch == ')':
+            depth -= 1
+        if ch == ',' and depth == 0:
+            parts.append(current)
+            current = ""
+        else:
+            current += ch
+    if current.strip():
+        parts.append(current)
+    return parts
+
+
+def _matches_label_selector(labels: dict[str, str], label_selector: str) -> bool:
+    for requirement in _split_selector(label_selector):
+        m = _LABEL_REQUIREMENT_RE.match(requirement)
+        if m is None:
+            raise k8s_tools.K8sApiError(f"Error fetching objects: invalid label selector '{label_selector}'")
+        if m.group('not_exists'):
+            if m.group('nkey') in labels:
+                return False
+            continue
+        key, op = m.group('key'), m.group('op')
+        if op is None:
+            if key not in labels:
+                return False
+            continue
+        op = op.strip()
+        values = [v.strip() for v in m.group('values').strip('()').split(',')]
+        if op in ('=', '=='):
+            if labels.get(key) != values[0]:
+                return False
+        elif op == '!=':
+            if labels.get(key) == values[0]:
+                return False
+        elif op == 'in':
+            if labels.get(key) not in values:
+                return False
+        elif op == 'notin':
+            if key in labels and labels[key] in values:
+                return False
+    return True
+
+
+def _matches_field_selector(kind: str, obj: Any, field_selector: str) -> bool:
+    for requirement in _split_selector(field_selector):
+        m = re.match(r"^\s*([\w.]+)\s*(==|!=|=)\s*(.*?)\s*$", requirement)
+        if m is None or m.group(1) not in _FIELD_SELECTOR_ATTRIBUTES[kind]:
+            raise k8s_tools.K8sApiError(f"Error fetching {kind}: field selector '{field_selector}' is not supported")
+        value = getattr(obj, _FIELD_SELECTOR_ATTRIBUTES[kind][m.group(1)]) or ""
+        if (value == m.group(3)) != (m.group(2) != '!='):
+            return False
+    return True
+
+
+def _filter_objects(kind: str, objects: list, namespace: Optional[str],
+                    label_selector: Optional[str], field_selector: Optional[str]) -> list:
+    """Filter mock summaries by namespace and selectors, like the API server would"""
+    result = []
+    for obj in objects:
+        if namespace is not None and obj.namespace != namespace:
+            continue
+        if label_selector and \
+           not _matches_label_selector(_MOCK_DATA['labels'].get((kind, obj.namespace, obj.name), {}), label_selector):
+            continue
+        if field_selector and not _matches_field_selector(kind, obj, field_selector):
+            continue
+        result.append(obj)
+    return result
+
 
+def _page(kind: str, model: type, format: k8s_tools.ListFormat, page_size: Optional[int], cursor: Optional[str],
+          namespace: Optional[str] = None, label_selector: Optional[str] = None,
+          field_selector: Optional[str] = None) -> Any:
+    """Return a page of the mock summaries of a kind, from a snapshot like for an informer"""
+    query = paging.list_query(kind, namespace, label_selector, field_selector)
+    position = paging.decode_cursor(cursor, query) if cursor else None
+    if position is not None and 's' not in position:
+        raise ValueError(f"Invalid cursor '{cursor}'")
+    objects = _filter_objects(kind, _MOCK_DATA[kind], namespace, label_selector, field_selector) \
+              if position is None else None
+    (page, next_cursor) = k8s_tools._snapshot_page(query, objects, position, page_size or paging.DEFAULT_PAGE_SIZE)
+    return k8s_tools._page_result(model, page, format, next_cursor)
 
-def get_namespaces() -> list[k8s_tools.NamespaceSummary]:
+
+def get_namespaces(format: k8s_tools.ListFormat = 'objects', max_items: Optional[int] = None,
+                   max_bytes: Optional[int] = None) -> Union[list[k8s_tools.NamespaceSummary],
+                                                             k8s_tools.TruncatedList[k8s_tools.NamespaceSummary],
+                                                             k8s_tools.ColumnarTable]:
     """Mock implementation that returns static namespace data"""
-    return _MOCK_DATA['namespaces']
+    k8s_tools._check_list_args(format, max_items, max_bytes)
+    return k8s_tools._list_result(k8s_tools.NamespaceSummary, _MOCK_DATA['namespaces'], format, max_items, max_bytes)
 
 get_namespaces.__doc__ = k8s_tools.get_namespaces.__doc__
 
 
-def get_node_summaries() -> list[k8s_tools.NodeSummary]:
+def get_node_summaries(format: k8s_tools.ListFormat = 'objects', max_items: Optional[int] = None,
+                       max_bytes: Optional[int] = None, page_size: Optional[int] = None,
+                       cursor: Optional[str] = None) -> Union[list[k8s_tools.NodeSummary],
+                                                              k8s_tools.TruncatedList[k8s_tools.NodeSummary],
+                                                              k8s_tools.SummaryPage[k8s_tools.NodeSummary],
+                                                              k8s_tools.ColumnarTable]:
     """Mock implementation that returns static node data"""
-    return _MOCK_DATA['nodes']
+    k8s_tools._check_list_args(format, max_items, max_bytes, page_size, cursor)
+    if page_size is not None or cursor is not None:
+        return _page('nodes', k8s_tools.NodeSummary, format, page_size, cursor)
+    return k8s_tools._list_result(k8s_tools.NodeSummary, _MOCK_DATA['nodes'], format, max_items, max_bytes)
 
 get_node_summaries.__doc__ = k8s_tools.get_node_summaries.__doc__
 
 
-def get_pod_summaries(namespace: Optional[str] = None) -> list[k8s_tools.PodSummary]:
-    """Mock implementation that returns static pod data, filtered by namespace if specified"""
-    pods = _MOCK_DATA['pods']
-    
-    if namespace is not None:
-        return [pod for pod in pods if pod.namespace == namespace]
-    return pods
+def get_pod_summaries(namespace: Optional[str] = None, label_selector: Optional[str] = None,
+                      field_selector: Optional[str] = None,
+                      format: k8s_tools.ListFormat = 'objects', max_items: Optional[int] = None,
+                      max_bytes: Optional[int] = None, page_size: Optional[int] = None,
+                      cursor: Optional[str] = None) -> Union[list[k8s_tools.PodSummary],
+                                                             k8s_tools.TruncatedList[k8s_tools.PodSummary],
+                                                             k8s_tools.SummaryPage[k8s_tools.PodSummary],
+                                                             k8s_tools.ColumnarTable]:
+    """Mock implementation that returns static pod data, filtered by namespace and selectors if specified"""
+    k8s_tools._check_list_args(format, max_items, max_bytes, page_size, cursor)
+    if page_size is not None or cursor is not None:
+        return _page('pods', k8s_tools.PodSummary, format, page_size, cursor, namespace, label_selector, field_selector)
+    return k8s_tools._list_result(k8s_tools.PodSummary,
+                                  _filter_objects('pods', _MOCK_DATA['pods'], namespace, label_selector, field_selector),
+                                  format, max_items, max_bytes)
 
 get_pod_summaries.__doc__ = k8s_tools.get_pod_summaries.__doc__
 
@@ -213,17 +615,17 @@ def get_pod_container_statuses(pod_name: str, namespace: str = "default") -> lis
     """Mock implementation that returns static container status data for the specified pod"""
     
     # For the specific ad pod, return cached data
-    if pod_name == "ad-647b4947cc-s5mpm" and namespace == "default":
+    if _is_static_ad_pod(pod_name, namespace):
         return _MOCK_DATA['ad_pod_container_statuses']
     
-    # For other pods, filter from all pods and create mock container statuses
-    pods = _MOCK_DATA['pods']
-    matching_pods = [pod for pod in pods if pod.name == pod_name and pod.namespace == namespace]
-    
-    if not matching_pods:
+    # For other pods, look up the pod and create mock container statuses
+    pod = _MOCK_DATA['pod_index'].get((namespace, pod_name))
+    if pod is None:
         return []
-    
-    pod = matching_pods[0]
+    details = _MOCK_DATA['pod_details'].get((namespace, pod_name))
+    if details is not None:
+        return _synthetic_container_statuses(pod, details)
+
     # Create mock container statuses based on pod summary
     statuses = []
     for i in range(pod.total_containers):
@@ -256,13 +658,37 @@ def get_pod_container_statuses(pod_name: str, namespace: str = "default") -> lis
 get_pod_container_statuses.__doc__ = k8s_tools.get_pod_container_statuses.__doc__
 
 
+def get_namespace_container_statuses(namespace: Optional[str] = None, label_selector: Optional[str] = None,
+                                     only_not_ready: bool = False, min_restarts: int = 0,
+                                     format: k8s_tools.ListFormat = 'objects', max_items: Optional[int] = None,
+                                     max_bytes: Optional[int] = None) -> Union[list[k8s_tools.ContainerStatus],
+                                                                               k8s_tools.TruncatedList[k8s_tools.ContainerStatus],
+                                                                               k8s_tools.ColumnarTable]:
+    """Mock implementation that returns the container statuses of the matching mock pods"""
+    k8s_tools._check_list_args(format, max_items, max_bytes)
+    pods = _filter_objects('pods', _MOCK_DATA['pods'], namespace, label_selector, None)
+    # skip the pods that can't have matching containers, which is much faster for large synthetic clusters
+    pods = [pod for pod in pods if pod.restarts >= min_restarts and
+            not (only_not_ready and pod.ready_containers == pod.total_containers)]
+    statuses = [status for pod in pods for status in get_pod_container_statuses(pod.name, pod.namespace)
+                if k8s_tools._container_status_matches(status.ready, status.restart_count, only_not_ready, min_restarts)]
+    return k8s_tools._list_result(k8s_tools.ContainerStatus, statuses, format, max_items, max_bytes)
+
+get_namespace_container_statuses.__doc__ = k8s_tools.get_namespace_container_statuses.__doc__
+
+
 def get_pod_events(pod_name: str, namespace: str = "default") -> list[k8s_tools.EventSummary]:
     """Mock implementation that returns static event data for the specified pod"""
     
     # For the specific ad pod, return cached data
-    if pod_name == "ad-647b4947cc-s5mpm" and namespace == "default":
+    if _is_static_ad_pod(pod_name, namespace):
         return _MOCK_DATA['ad_pod_events']
-    
+
+    pod = _MOCK_DATA['pod_index'].get((namespace, pod_name))
+    details = _MOCK_DATA['pod_details'].get((namespace, pod_name))
+    if pod is not None and details is not None:
+        return _synthetic_pod_events(pod, details)
+
     # For other pods, return generic mock events
     return [
         k8s_tools.EventSummary(
@@ -284,13 +710,54 @@ def get_pod_events(pod_name: str, namespace: str = "default") -> list[k8s_tools.
 get_pod_events.__doc__ = k8s_tools.get_pod_events.__doc__
 
 
+def get_object_events(kind: str, name: str, namespace: str = "default") -> list[k8s_tools.EventSummary]:
+    """Mock implementation that returns the pod events for pods, and generic events for other kinds"""
+    if kind == "Pod":
+        return get_pod_events(name, namespace)
+    if kind == "Node" and any(node.name == name and node.status == "NotReady" for node in _MOCK_DATA['nodes']):
+        return [
+            k8s_tools.EventSummary(
+                last_seen=datetime.timedelta(minutes=2),
+                type="Normal",
+                reason="NodeNotReady",
+                object=name,
+                message=f"Node {name} status is now: NodeNotReady"
+            )
+        ]
+    return [
+        k8s_tools.EventSummary(
+            last_seen=datetime.timedelta(minutes=10),
+            type="Normal",
+            reason="ScalingReplicaSet" if kind == "Deployment" else "Created",
+            object=name,
+            message=f"{kind} {namespace}/{name} updated"
+        )
+    ]
+
+get_object_events.__doc__ = k8s_tools.get_object_events.__doc__
+
+
 def get_pod_spec(pod_name: str, namespace: str = "default") -> dict[str, Any]:
     """Mock implementation that returns static pod spec data for the specified pod"""
     
     # For the specific ad pod, return cached data
-    if pod_name == "ad-647b4947cc-s5mpm" and namespace == "default":
+    if _is_static_ad_pod(pod_name, namespace):
         return _MOCK_DATA['ad_pod_spec']
-    
+
+    pod = _MOCK_DATA['pod_index'].get((namespace, pod_name))
+    details = _MOCK_DATA['pod_details'].get((namespace, pod_name))
+    if pod is not None and details is not None:
+        return {
+            "containers": [{
+                "name": container_name,
+                "image": image,
+                "ports": [{"containerPort": 8080, "protocol": "TCP"}] if i == 0 else [],
+                "resources": {"limits": {"memory": "256Mi"}, "requests": {"cpu": "100m", "memory": "128Mi"}}
+            } for (i, (container_name, image)) in enumerate(details['containers'])],
+            "restart_policy": "Always",
+            "node_name": pod.node
+        }
+
     # For other pods, return generic mock spec
     return {
         "containers": [{
@@ -306,41 +773,114 @@ def get_pod_spec(pod_name: str, namespace: str = "default") -> dict[str, Any]:
 get_pod_spec.__doc__ = k8s_tools.get_pod_spec.__doc__
 
 
-def get_logs_for_pod_and_container(pod_name: str, namespace: str = "default", container_name: Optional[str] = None) -> Optional[str]:
-    """Mock implementation that returns static log data for the specified pod and container"""
-    
+def _apply_log_limits(logs: str, tail_lines: Optional[int], limit_bytes: Optional[int]) -> str:
+    """Apply tail_lines and limit_bytes the way the API server does"""
+    if tail_lines is not None:
+        logs = "\n".join(logs.splitlines()[-tail_lines:]) if tail_lines > 0 else ""
+    if limit_bytes is not None:
+        logs = logs.encode('utf-8')[:limit_bytes].decode('utf-8', errors='ignore')
+    return logs
+
+
+def get_logs_for_pod_and_container(pod_name: str, namespace: str = "default", container_name: Optional[str] = None,
+                                   since_seconds: Optional[int] = None,
+                                   since_time: Optional[datetime.datetime] = None,
+                                   tail_lines: Optional[int] = k8s_tools.DEFAULT_LOG_TAIL_LINES,
+                                   limit_bytes: Optional[int] = k8s_tools.DEFAULT_LOG_LIMIT_BYTES) -> Optional[str]:
+    """Mock implementation that returns static log data for the specified pod and container.
+    The since_ parameters are ignored, since the mock logs are not current."""
+    if since_seconds is not None and since_time is not None:
+        raise k8s_tools.K8sApiError("At most one of since_seconds or since_time may be specified")
+
     # For the specific ad pod, return cached data
-    if pod_name == "ad-647b4947cc-s5mpm" and namespace == "default":
-        return _MOCK_DATA['ad_pod_logs']
-    
+    if _is_static_ad_pod(pod_name, namespace):
+        return _apply_log_limits(_MOCK_DATA['ad_pod_logs'], tail_lines, limit_bytes)
+
+    pod = _MOCK_DATA['pod_index'].get((namespace, pod_name))
+    details = _MOCK_DATA['pod_details'].get((namespace, pod_name))
+    if pod is not None and details is not None:
+        return _apply_log_limits(_synthetic_logs(pod, details, container_name), tail_lines, limit_bytes)
+
     # For other pods, return generic mock logs
     container_ref = container_name or pod_name.split('-')[0]
-    return f"""2025-07-28T01:30:00.000000000Z Starting {container_ref} container
+    return _apply_log_limits(f"""2025-07-28T01:30:00.000000000Z Starting {container_ref} container
 2025-07-28T01:30:01.000000000Z {container_ref} container started successfully
 2025-07-28T01:30:02.000000000Z Processing requests...
-2025-07-28T01:30:03.000000000Z Ready to serve traffic"""
+2025-07-28T01:30:03.000000000Z Ready to serve traffic""", tail_lines, limit_bytes)
 
 get_logs_for_pod_and_container.__doc__ = k8s_tools.get_logs_for_pod_and_container.__doc__
 
 
-def get_deployment_summaries(namespace: Optional[str] = None) -> list[k8s_tools.DeploymentSummary]:
-    """Mock implementation that returns static deployment data, filtered by namespace if specified"""
-    deployments = _MOCK_DATA['deployments']
-    
-    if namespace is not None:
-        return [deployment for deployment in deployments if deployment.namespace == namespace]
-    return deployments
+def search_pod_logs(pod_name: str, pattern: str, namespace: str = "default",
+                    container_name: Optional[str] = None, before: int = 0, after: int = 0,
+                    max_matches: int = 100, ignore_case: bool = False,
+                    since_seconds: Optional[int] = None) -> list[k8s_tools.LogMatch]:
+    """Mock implementation that searches the mock logs for the specified pod and container"""
+    searcher = k8s_tools._LogSearcher(k8s_tools._compile_log_pattern(pattern, ignore_case), before, after, max_matches)
+    logs = get_logs_for_pod_and_container(pod_name, namespace, container_name, tail_lines=None, limit_bytes=None)
+    for line in (logs or "").splitlines():
+        if searcher.add(line):
+            break
+    return searcher.matches
+
+search_pod_logs.__doc__ = k8s_tools.search_pod_logs.__doc__
+
+
+def get_logs_for_workload(namespace: str = "default", deployment_name: Optional[str] = None,
+                          label_selector: Optional[str] = None, container_name: Optional[str] = None,
+                          since_seconds: Optional[int] = None, tail_lines: Optional[int] = 100,
+                          limit_bytes: Optional[int] = 64*1024, max_pods: int = 50) -> list[k8s_tools.PodLogs]:
+    """Mock implementation that returns the mock logs of each pod matching the deployment or selector.
+    The mock deployments select the pods with the same labels as the deployment."""
+    k8s_tools._check_workload_args(deployment_name, label_selector)
+    if deployment_name is not None:
+        labels = _MOCK_DATA['labels'].get(('deployments', namespace, deployment_name))
+        if labels is None:
+            raise k8s_tools.K8sApiError(f"Error finding pods for workload: deployment '{deployment_name}' not found")
+        label_selector = ','.join(f"{key}={value}" for (key, value) in labels.items())
+    pods = sorted(_filter_objects('pods', _MOCK_DATA['pods'], namespace, label_selector, None), key=lambda pod: pod.name)
+    return [k8s_tools.PodLogs(pod_name=pod.name, container_name=container_name,
+                              logs=get_logs_for_pod_and_container(pod.name, namespace, container_name,
+                                                                  tail_lines=tail_lines, limit_bytes=limit_bytes))
+            for pod in pods[:max_pods]]
+
+get_logs_for_workload.__doc__ = k8s_tools.get_logs_for_workload.__doc__
+
+
+def get_deployment_summaries(namespace: Optional[str] = None, label_selector: Optional[str] = None,
+                             field_selector: Optional[str] = None,
+                             format: k8s_tools.ListFormat = 'objects', max_items: Optional[int] = None,
+                             max_bytes: Optional[int] = None, page_size: Optional[int] = None,
+                             cursor: Optional[str] = None) -> Union[list[k8s_tools.DeploymentSummary],
+                                                                    k8s_tools.TruncatedList[k8s_tools.DeploymentSummary],
+                                                                    k8s_tools.SummaryPage[k8s_tools.DeploymentSummary],
+                                                                    k8s_tools.ColumnarTable]:
+    """Mock implementation that returns static deployment data, filtered by namespace and selectors if specified"""
+    k8s_tools._check_list_args(format, max_items, max_bytes, page_size, cursor)
+    if page_size is not None or cursor is not None:
+        return _page('deployments', k8s_tools.DeploymentSummary, format, page_size, cursor, namespace, label_selector, field_selector)
+    return k8s_tools._list_result(k8s_tools.DeploymentSummary,
+                                  _filter_objects('deployments', _MOCK_DATA['deployments'], namespace, label_selector, field_selector),
+                                  format, max_items, max_bytes)
 
 get_deployment_summaries.__doc__ = k8s_tools.get_deployment_summaries.__doc__
 
 
-def get_service_summaries(namespace: Optional[str] = None) -> list[k8s_tools.ServiceSummary]:
-    """Mock implementation that returns static service data, filtered by namespace if specified"""
-    services = _MOCK_DATA['services']
-    
-    if namespace is not None:
-        return [service for service in services if service.namespace == namespace]
-    return services
+def get_service_summaries(namespace: Optional[str] = None, label_selector: Optional[str] = None,
+                          field_selector: Optional[str] = None,
+                          format: k8s_tools.ListFormat = 'objects', max_items: Optional[int] = None,
+                          max_bytes: Optional[int] = None, page_size: Optional[int] = None,
+                          cursor: Optional[str] = None) -> Union[list[k8s_tools.ServiceSummary],
+                                                                 k8s_tools.TruncatedList[k8s_tools.ServiceSummary],
+                                                                 k8s_tools.SummaryPage[k8s_tools.ServiceSummary],
+                                                                 k8s_tools.ColumnarTable]:
+    """Mock implementation that returns static service data, filtered by namespace and selectors if specified"""
+    k8s_tools._check_list_args(format, max_items, max_bytes, page_size, cursor)
+    if page_size is not None or cursor is not None:
+        return _page('services', k8s_tools.ServiceSummary, format, page_size, cursor, namespace, label_selector, field_selector)
+    return k8s_tools._list_result(k8s_tools.ServiceSummary,
+                                  _filter_objects('services', _MOCK_DATA['services'], namespace, label_selector, field_selector),
+                                  format, max_items, max_bytes)
 
 get_service_summaries.__doc__ = k8s_tools.get_service_summaries.__doc__
 
@@ -350,9 +890,13 @@ TOOLS = [
     get_node_summaries,
     get_pod_summaries,
     get_pod_container_statuses,
+    get_namespace_container_statuses,
     get_pod_events,
+    get_object_events,
     get_pod_spec,
     get_logs_for_pod_and_container,
+    search_pod_logs,
+    get_logs_for_workload,
     get_deployment_summaries,
     get_service_summaries
 ]
\ No newline at end of file
@@ -0,0 +1,149 @@
+# Copyright (c) 2025 Benedat LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+#
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Cursors for paging through the results of the list tools.
+
+A cursor is an opaque string that the tools return as next_cursor, and that the caller
+passes back to get the next page. It records the query it was returned for, so that it
+can't be used with different arguments, and the position in the results, which is either:
+
+* a continue token from the Kubernetes API server, when the objects are listed from the
+  API server. Each page is then a single LIST request with limit=page_size.
+* the id of a snapshot and an offset into it, when the objects come from memory (the
+  informer cache, or the mock data). The first page stores the list of objects in a
+  SnapshotCache, and later pages are read from it, so that each page only converts the
+  objects in that page.
+
+Both kinds of cursor expire: the API server's continue tokens after a few minutes (the
+request then fails with 410 Gone), and the snapshots after ttl_seconds or when they are
+evicted by newer ones. The caller then has to start again without a cursor.
+"""
+import base64
+import binascii
+import collections
+import hashlib
+import json
+import threading
+import time
+import uuid
+from typing import Any, Optional
+
+# The page size used when a cursor is passed without a page_size
+DEFAULT_PAGE_SIZE = 100
+
+# The status of a LIST request whose continue token has expired
+HTTP_STATUS_GONE = 410
+
+EXPIRED_CURSOR_MESSAGE = "The cursor has expired, call the tool again without a cursor"
+
+
+def query_fingerprint(tool:str, **arguments:Any) -> str:
+    """Return a short string that identifies a query (the tool and the arguments that
+    select the objects), to be stored in its cursors."""
+    key = json.dumps([tool, arguments], sort_keys=True, default=str)
+    return hashlib.sha256(key.encode('utf-8')).hexdigest()[:16]
+
+
+def list_query(kind:str, namespace:Optional[str]=None, label_selector:Optional[str]=None,
+                field_selector:Optional[str]=None) -> str:
+    """Return the query_fingerprint() of a list of the objects of a kind. The k8s_tools, async_tools
+    and mock_tools implementations all use this, so that their cursors are interchangeable."""
+    return query_fingerprint(kind, namespace=namespace or None, label_selector=label_selector or None,
+                             field_selector=field_selector or None)
+
+
+def encode_cursor(query:str, continue_token:Optional[str]=None, snapshot_id:Optional[str]=None,
+                  offset:int=0) -> str:
+    """Return a cursor for query, at either an API server continue token or an offset into
+    a snapshot"""
+    position:dict[str, Any] = {'q': query}
+    if snapshot_id is not None:
+        position['s'] = snapshot_id
+        position['o'] = offset
+    else:
+        position['c'] = continue_token
+    return base64.urlsafe_b64encode(json.dumps(position, separators=(',', ':')).encode('utf-8')).decode('ascii')
+
+
+def decode_cursor(cursor:str, query:str) -> dict[str, Any]:
+    """Return the position recorded in a cursor, as a dict with either 'c' (the continue token)
+    or 's' and 'o' (the snapshot id and offset).
+
+    Raises
+    ------
+    ValueError
+        If the cursor is not valid, or was returned for a different query.
+    """
+    try:
+        position = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+    except (ValueError, UnicodeError, binascii.Error) as e:
+        raise ValueError(f"Invalid cursor '{cursor}'") from e
+    if not isinstance(position, dict) or not (isinstance(position.get('c'), str) or
+                                              (isinstance(position.get('s'), str) and
+                                               isinstance(position.get('o'), int))):
+        raise ValueError(f"Invalid cursor '{cursor}'")
+    if position.get('q') != query:
+        raise ValueError("The cursor was returned for a different query, "
+                         "call the tool with the same arguments (other than cursor and page_size)")
+    return position
+
+
+class SnapshotCache:
+    """A thread-safe store of the lists of objects being paged through, by snapshot id.
+
+    Parameters
+    ----------
+    max_snapshots : int, default=32
+        Maximum number of snapshots kept. The least recently used ones are evicted first.
+    ttl_seconds : float, default=300.0
+        Snapshots expire this long after they were last read.
+    """
+    def __init__(self, max_snapshots:int=32, ttl_seconds:float=300.0):
+        self.max_snapshots = max_snapshots
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        # snapshot id -> (expiration time, items)
+        self._snapshots:collections.OrderedDict[str, tuple[float, list[Any]]] = collections.OrderedDict()
+
+    def add(self, items:list[Any]) -> str:
+        """Store items and return the id of the snapshot"""
+        snapshot_id = uuid.uuid4().hex
+        with self._lock:
+            self._snapshots[snapshot_id] = (time.monotonic() + self.ttl_seconds, items)
+            while len(self._snapshots) > self.max_snapshots:
+                self._snapshots.popitem(last=False)
+        return snapshot_id
+
+    def get(self, snapshot_id:str) -> list[Any]:
+        """Return the items of a snapshot, and extend its expiration time.
+
+        Raises
+        ------
+        ValueError
+            If the snapshot has expired or been evicted.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._snapshots.get(snapshot_id)
+            if entry is None or entry[0] < now:
+                self._snapshots.pop(snapshot_id, None)
+                raise ValueError(EXPIRED_CURSOR_MESSAGE)
+            self._snapshots[snapshot_id] = (now + self.ttl_seconds, entry[1])
+            self._snapshots.move_to_end(snapshot_id)
+            return entry[1]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._snapshots)
+
+
+# The snapshots of the list tools
+SNAPSHOTS = SnapshotCache()
@@ -0,0 +1,91 @@
+# Copyright (c) 2025 Benedat LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+#
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Coalescing of concurrent identical tool calls ("single-flight").
+
+If a call is made while an identical call (same tool, same normalized arguments) is
+still running, it waits for the running call and gets its result (or exception) rather
+than making its own requests to the API server. This protects the API server when many
+clients ask the same question at once.
+"""
+import asyncio
+import concurrent.futures
+import functools
+import inspect
+import threading
+from typing import Any, Awaitable, Callable
+
+from .tool_cache import call_key
+
+
+class SingleFlight:
+    """Tracks the calls in flight, by key. It can be used from threads and from asyncio
+    code; the two kinds of calls are tracked separately.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls:dict[str, concurrent.futures.Future] = {}
+        self._tasks:dict[str, asyncio.Future] = {}
+        # Number of calls that were answered by another call's result
+        self.coalesced_calls = 0
+
+    def do(self, key:str, fn:Callable[[], Any]) -> Any:
+        """Call fn, unless a call with the same key is running in another thread,
+        in which case wait for that call's result."""
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = concurrent.futures.Future()
+            else:
+                self.coalesced_calls += 1
+        if not leader:
+            return future.result()
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    async def do_async(self, key:str, fn:Callable[[], Awaitable[Any]]) -> Any:
+        """Await fn(), unless a call with the same key is already running on the event loop,
+        in which case wait for that call's result. The call runs in its own task, so it is not
+        cancelled if the caller that started it is cancelled while others are waiting.
+        """
+        task = self._tasks.get(key)
+        if task is None:
+            task = self._tasks[key] = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda _: self._tasks.pop(key, None))
+        else:
+            self.coalesced_calls += 1
+        return await asyncio.shield(task)
+
+
+def coalesced(fn:Callable[..., Any], single_flight:SingleFlight) -> Callable[..., Any]:
+    """Wrap a tool function (sync or async) so that concurrent calls with the same
+    arguments share one call. The wrapper has the same signature and docstring as fn.
+    """
+    if inspect.iscoroutinefunction(fn):
+        @functools.wraps(fn)
+        async def async_wrapper(*args, **kwargs):
+            return await single_flight.do_async(call_key(fn, args, kwargs), lambda: fn(*args, **kwargs))
+        return async_wrapper
+    else:
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            return single_flight.do(call_key(fn, args, kwargs), lambda: fn(*args, **kwargs))
+        return wrapper
@@ -0,0 +1,221 @@
+# Copyright (c) 2025 Benedat LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+#
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""A response cache for the tools, used by the MCP server so that repeated identical
+calls (e.g. an agent asking for get_namespaces() several times in a row) are answered
+without going back to the API server.
+
+Entries are keyed by the tool name and its normalized arguments (defaults filled in),
+expire after a per-tool TTL, and are evicted least-recently-used first when the cache
+exceeds its maximum number of entries or (approximate) size in bytes. Exceptions are
+not cached.
+"""
+import collections
+import functools
+import inspect
+import json
+import logging
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from pydantic import BaseModel
+
+# Default TTL in seconds for each tool. Tools not listed here use the cache's default_ttl.
+DEFAULT_TOOL_TTLS:dict[str, float] = {
+    'get_namespaces': 30.0,
+    'get_node_summaries': 15.0,
+    'get_pod_spec': 15.0,
+    'get_deployment_summaries': 10.0,
+    'get_service_summaries': 10.0,
+    'get_pod_events': 5.0,
+    'get_object_events': 5.0,
+    'get_logs_for_pod_and_container': 2.0,
+    'search_pod_logs': 2.0,
+    'get_logs_for_workload': 2.0,
+}
+
+# Tools that return pod logs. Logs change continuously, so the TTL of these tools is
+# never more than MAX_LOG_TTL, even if a longer one is configured.
+LOG_TOOLS:frozenset[str] = frozenset({
+    'get_logs_for_pod_and_container',
+    'search_pod_logs',
+    'get_logs_for_workload',
+})
+MAX_LOG_TTL = 5.0
+
+
+class CacheStats(BaseModel):
+    """Counters for a tool's entries in a ResponseCache"""
+    tool: str
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+def call_key(fn:Callable[..., Any], args:tuple, kwargs:dict[str, Any]) -> str:
+    """Return a key for a call of fn that is the same for equivalent calls, e.g.
+    get_pod_summaries("default") and get_pod_summaries(namespace="default", label_selector=None).
+    """
+    bound = inspect.signature(fn).bind(*args, **kwargs)
+    bound.apply_defaults()
+    return fn.__name__ + json.dumps(bound.arguments, sort_keys=True, default=str)
+
+
+# Number of items of a list whose size is measured to estimate the size of the whole list
+_SIZE_SAMPLE = 8
+
+
+def _approximate_size(value:Any) -> int:
+    """Rough size of a tool result in bytes. This only needs to be proportional to the memory used,
+    so it walks the fields of the models without serializing them, and only measures the first few
+    items of a list (the items of a tool's list are all of the same type), so that it stays cheap
+    for large results.
+    """
+    if isinstance(value, str):
+        return len(value)
+    if isinstance(value, (list, tuple)):
+        if not value:
+            return 8
+        sample = value[:_SIZE_SAMPLE]
+        return (sum(_approximate_size(item) for item in sample)*len(value))//len(sample) + 8*len(value)
+    if isinstance(value, dict):
+        return _approximate_size(list(value.values())) + 8*len(value)
+    if isinstance(value, BaseModel):
+        return _approximate_size(list(value.__dict__.values()))
+    if value is None or isinstance(value, (bool, int, float)):
+        return 8
+    return len(repr(value))
+
+
+class ResponseCache:
+    """A thread-safe TTL cache of tool results with LRU eviction.
+
+    Parameters
+    ----------
+    tool_ttls : Optional[dict[str, float]], default=None
+        TTL in seconds for each tool, by name. These are merged over DEFAULT_TOOL_TTLS.
+        A TTL of 0 disables caching for that tool.
+    default_ttl : float, default=5.0
+        TTL for tools that have no entry in tool_ttls or DEFAULT_TOOL_TTLS.
+    max_entries : int, default=1000
+        Maximum number of cached results.
+    max_bytes : int, default=64MB
+        Maximum total approximate size of the cached results.
+    """
+    def __init__(self, tool_ttls:Optional[dict[str, float]]=None, default_ttl:float=5.0,
+                 max_entries:int=1000, max_bytes:int=64*1024*1024):
+        self.tool_ttls = dict(DEFAULT_TOOL_TTLS)
+        self.tool_ttls.update(tool_ttls or {})
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # key -> (tool name, expiration time, size, value), least recently used first
+        self._entries:collections.OrderedDict[str, tuple[str, float, int, Any]] = collections.OrderedDict()
+        self._bytes = 0
+        self._stats:dict[str, CacheStats] = {}
+
+    def ttl(self, tool:str) -> float:
+        ttl = self.tool_ttls.get(tool, self.default_ttl)
+        if tool in LOG_TOOLS:
+            ttl = min(ttl, MAX_LOG_TTL)
+        return ttl
+
+    def _tool_stats(self, tool:str) -> CacheStats:
+        stats = self._stats.get(tool)
+        if stats is None:
+            stats = self._stats[tool] = CacheStats(tool=tool)
+        return stats
+
+    def get(self, tool:str, key:str) -> tuple[bool, Any]:
+        """Return (True, value) if there is an unexpired entry for key, otherwise (False, None)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] > time.monotonic():
+                self._entries.move_to_end(key)
+                self._tool_stats(tool).hits += 1
+                return (True, entry[3])
+            if entry is not None:
+                self._remove(key)
+            self._tool_stats(tool).misses += 1
+            return (False, None)
+
+    def put(self, tool:str, key:str, value:Any) -> None:
+        ttl = self.ttl(tool)
+        if ttl <= 0:
+            return
+        size = _approximate_size(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (tool, time.monotonic() + ttl, size, value)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                evicted_key = next(iter(self._entries))
+                self._tool_stats(self._entries[evicted_key][0]).evictions += 1
+                self._remove(evicted_key)
+
+    def _remove(self, key:str) -> None:
+        (_, _, size, _) = self._entries.pop(key)
+        self._bytes -= size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> list[CacheStats]:
+        """Return a copy of the hit, miss and eviction counters of each tool"""
+        with self._lock:
+            return [stats.model_copy() for stats in self._stats.values()]
+
+
+def cached(fn:Callable[..., Any], cache:ResponseCache) -> Callable[..., Any]:
+    """Wrap a tool function (sync or async) so that its results are stored in and
+    read from cache. The wrapper has the same signature and docstring as fn.
+    """
+    tool = fn.__name__
+    if cache.ttl(tool) <= 0:
+        return fn
+    if inspect.iscoroutinefunction(fn):
+        @functools.wraps(fn)
+        async def async_wrapper(*args, **kwargs):
+            key = call_key(fn, args, kwargs)
+            (hit, value) = cache.get(tool, key)
+            if hit:
+                logging.debug(f"Cache hit for {key}")
+                return value
+            value = await fn(*args, **kwargs)
+            cache.put(tool, key, value)
+            return value
+        return async_wrapper
+    else:
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = call_key(fn, args, kwargs)
+            (hit, value) = cache.get(tool, key)
+            if hit:
+                logging.debug(f"Cache hit for {key}")
+                return value
+            value = fn(*args, **kwargs)
+            cache.put(tool, key, value)
+            return value
+        return wrapper
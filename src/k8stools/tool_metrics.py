@@ -0,0 +1,248 @@
+# Copyright (c) 2025 Benedat LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+#
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Per-tool metrics for the MCP server: call and error counts, a latency histogram,
+the number of Kubernetes API requests made, and optionally the size of the responses.
+
+The API requests are attributed to a tool call through a context variable, which is set
+by the wrapper from instrumented() and incremented by record_api_request() in k8s_tools
+and async_tools. Context variables are copied to the worker threads and tasks that a tool
+call starts, so their requests are counted too. Requests made outside of a tool call (e.g.
+by the informers) are not counted.
+
+Measuring the size of a response means serializing it a second time (FastMCP serializes
+it again to send it), so it is only done when enabled with measure_response_bytes. The
+async wrapper then does it in a worker thread, so that large results don't block the
+event loop.
+
+The metrics can be rendered in the Prometheus text format, which the server serves at
+/metrics with the streamable HTTP transport, or writes to a file with the stdio transport.
+"""
+import contextvars
+import functools
+import inspect
+import os
+import threading
+import time
+from typing import Any, Callable, Optional, TYPE_CHECKING
+
+import anyio.to_thread
+import pydantic_core
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from .tool_cache import ResponseCache
+    from .singleflight import SingleFlight
+
+# Upper bounds of the latency histogram's buckets, in seconds
+LATENCY_BUCKETS:tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class _RequestCounter:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.value = 0
+
+    def increment(self) -> None:
+        with self._lock:
+            self.value += 1
+
+
+_API_REQUESTS:contextvars.ContextVar[Optional[_RequestCounter]] = \
+    contextvars.ContextVar('k8stools_api_requests', default=None)
+
+
+def record_api_request() -> None:
+    """Count a request to the API server against the tool call that is running, if any"""
+    counter = _API_REQUESTS.get()
+    if counter is not None:
+        counter.increment()
+
+
+class ToolStats(BaseModel):
+    """Counters for the calls of one tool"""
+    tool: str
+    calls: int = 0
+    errors: int = 0
+    api_requests: int = 0
+    response_bytes: int = 0
+    duration_seconds: float = 0.0
+
+
+class _ToolCounters:
+    def __init__(self, num_buckets:int):
+        self.calls = 0
+        # exception type name -> count
+        self.errors:dict[str, int] = {}
+        self.bucket_counts = [0]*num_buckets
+        self.duration_sum = 0.0
+        self.api_requests = 0
+        self.response_bytes = 0
+
+
+def _escape_label(value:str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_bound(bound:float) -> str:
+    return f"{bound:g}"
+
+
+class ToolMetrics:
+    """Thread-safe counters of the tool calls, by tool name.
+
+    Parameters
+    ----------
+    buckets : tuple[float, ...], default=LATENCY_BUCKETS
+        Upper bounds of the latency histogram's buckets, in seconds, in increasing order.
+    measure_response_bytes : bool, default=False
+        If True, instrumented() serializes each result to count its size in response_bytes.
+        Otherwise response_bytes stays 0.
+    """
+    def __init__(self, buckets:tuple[float, ...]=LATENCY_BUCKETS, measure_response_bytes:bool=False):
+        self.buckets = buckets
+        self.measure_response_bytes = measure_response_bytes
+        self._lock = threading.Lock()
+        self._tools:dict[str, _ToolCounters] = {}
+
+    def observe(self, tool:str, duration:float, api_requests:int=0, response_bytes:int=0,
+                error:Optional[str]=None) -> None:
+        """Record one call of tool. error is the name of the exception type, if the call failed."""
+        with self._lock:
+            counters = self._tools.get(tool)
+            if counters is None:
+                counters = self._tools[tool] = _ToolCounters(len(self.buckets))
+            counters.calls += 1
+            counters.duration_sum += duration
+            counters.api_requests += api_requests
+            counters.response_bytes += response_bytes
+            for (i, bound) in enumerate(self.buckets):
+                if duration <= bound:
+                    counters.bucket_counts[i] += 1
+                    break
+            if error is not None:
+                counters.errors[error] = counters.errors.get(error, 0) + 1
+
+    def stats(self) -> list[ToolStats]:
+        """Return the totals for each tool that has been called"""
+        with self._lock:
+            return [ToolStats(tool=tool, calls=c.calls, errors=sum(c.errors.values()), api_requests=c.api_requests,
+                              response_bytes=c.response_bytes, duration_seconds=c.duration_sum)
+                    for (tool, c) in self._tools.items()]
+
+    def render(self, cache:Optional['ResponseCache']=None, single_flight:Optional['SingleFlight']=None) -> str:
+        """Return the metrics in the Prometheus text exposition format. If cache or single_flight
+        are provided, their counters are included as well.
+        """
+        lines:list[str] = []
+        def metric(name:str, kind:str, help_text:str, samples:list[tuple[str, Any]]) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.extend(f"{sample_name} {value}" for (sample_name, value) in samples)
+
+        with self._lock:
+            tools = sorted(self._tools.items())
+            metric('k8stools_tool_calls_total', 'counter', "Number of tool calls.",
+                   [(f'k8stools_tool_calls_total{{tool="{_escape_label(t)}"}}', c.calls) for (t, c) in tools])
+            metric('k8stools_tool_errors_total', 'counter', "Number of tool calls that raised an exception, by type.",
+                   [(f'k8stools_tool_errors_total{{tool="{_escape_label(t)}",error="{_escape_label(e)}"}}', n)
+                    for (t, c) in tools for (e, n) in sorted(c.errors.items())])
+            histogram:list[tuple[str, Any]] = []
+            for (t, c) in tools:
+                label = f'tool="{_escape_label(t)}"'
+                cumulative = 0
+                for (bound, count) in zip(self.buckets, c.bucket_counts):
+                    cumulative += count
+                    histogram.append((f'k8stools_tool_duration_seconds_bucket{{{label},le="{_format_bound(bound)}"}}',
+                                      cumulative))
+                histogram.append((f'k8stools_tool_duration_seconds_bucket{{{label},le="+Inf"}}', c.calls))
+                histogram.append((f'k8stools_tool_duration_seconds_sum{{{label}}}', c.duration_sum))
+                histogram.append((f'k8stools_tool_duration_seconds_count{{{label}}}', c.calls))
+            metric('k8stools_tool_duration_seconds', 'histogram', "Duration of the tool calls in seconds.", histogram)
+            metric('k8stools_tool_api_requests_total', 'counter', "Number of Kubernetes API requests made by tool calls.",
+                   [(f'k8stools_tool_api_requests_total{{tool="{_escape_label(t)}"}}', c.api_requests)
+                    for (t, c) in tools])
+            metric('k8stools_tool_response_bytes_total', 'counter', "Total size of the tool results as JSON, in bytes.",
+                   [(f'k8stools_tool_response_bytes_total{{tool="{_escape_label(t)}"}}', c.response_bytes)
+                    for (t, c) in tools])
+        if cache is not None:
+            cache_stats = sorted(cache.stats(), key=lambda s: s.tool)
+            for (field, help_text) in (('hits', "Number of tool calls answered from the response cache."),
+                                       ('misses', "Number of tool calls not found in the response cache."),
+                                       ('evictions', "Number of entries evicted from the response cache.")):
+                metric(f'k8stools_cache_{field}_total', 'counter', help_text,
+                       [(f'k8stools_cache_{field}_total{{tool="{_escape_label(s.tool)}"}}', getattr(s, field))
+                        for s in cache_stats])
+            metric('k8stools_cache_bytes', 'gauge', "Approximate size of the response cache in bytes.",
+                   [('k8stools_cache_bytes', cache.size_bytes)])
+        if single_flight is not None:
+            metric('k8stools_coalesced_calls_total', 'counter',
+                   "Number of tool calls answered with the result of an identical concurrent call.",
+                   [('k8stools_coalesced_calls_total', single_flight.coalesced_calls)])
+        return '\n'.join(lines) + '\n'
+
+    def write(self, path:str, cache:Optional['ResponseCache']=None, single_flight:Optional['SingleFlight']=None) -> None:
+        """Write the metrics to path in the Prometheus text format. The file is replaced
+        atomically, so readers never see a partial file."""
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w') as f:
+            f.write(self.render(cache, single_flight))
+        os.replace(temp_path, path)
+
+
+def _response_bytes(result:Any) -> int:
+    return len(pydantic_core.to_json(result, fallback=str))
+
+
+def instrumented(fn:Callable[..., Any], metrics:ToolMetrics) -> Callable[..., Any]:
+    """Wrap a tool function (sync or async) so that each call is recorded in metrics.
+    The wrapper has the same signature and docstring as fn. The latency does not include
+    measuring the size of the result.
+    """
+    tool = fn.__name__
+    if inspect.iscoroutinefunction(fn):
+        @functools.wraps(fn)
+        async def async_wrapper(*args, **kwargs):
+            counter = _RequestCounter()
+            token = _API_REQUESTS.set(counter)
+            start = time.perf_counter()
+            try:
+                result = await fn(*args, **kwargs)
+            except Exception as e:
+                metrics.observe(tool, time.perf_counter() - start, counter.value, error=type(e).__name__)
+                raise
+            finally:
+                _API_REQUESTS.reset(token)
+            duration = time.perf_counter() - start
+            response_bytes = 0
+            if metrics.measure_response_bytes:
+                response_bytes = await anyio.to_thread.run_sync(_response_bytes, result)
+            metrics.observe(tool, duration, counter.value, response_bytes)
+            return result
+        return async_wrapper
+    else:
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            counter = _RequestCounter()
+            token = _API_REQUESTS.set(counter)
+            start = time.perf_counter()
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as e:
+                metrics.observe(tool, time.perf_counter() - start, counter.value, error=type(e).__name__)
+                raise
+            finally:
+                _API_REQUESTS.reset(token)
+            duration = time.perf_counter() - start
+            metrics.observe(tool, duration, counter.value,
+                            _response_bytes(result) if metrics.measure_response_bytes else 0)
+            return result
+        return wrapper
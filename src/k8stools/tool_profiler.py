@@ -0,0 +1,304 @@
+# Copyright (c) 2025 Benedat LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+#
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Profiling of individual tool calls, to find out where the time goes in slow calls.
+
+A fraction (sample_rate) of the calls are profiled. If a profiled call takes at least
+threshold_seconds, its profile is written to a directory, along with a JSON file with the
+tool name, its arguments and the call's duration. There are two modes:
+
+* sample (the default) - a background thread samples the stack of the thread running the
+  call every interval_seconds. This has little overhead, so it can be left on in production.
+  The profile is written in the "collapsed stacks" format (one line per stack, with its count),
+  which flamegraph.pl and speedscope can display.
+* cprofile - the call is run under cProfile, which records every function call. This is
+  more precise but much slower. Only one call can be profiled this way at a time, and calls
+  running on other threads at the same time may appear in the profile. The profile can be
+  loaded with pstats or snakeviz.
+
+For library use, profiling can be enabled through environment variables. If
+K8STOOLS_PROFILE_DIR is set, the tools of k8s_tools and async_tools are profiled, whether they
+are called through TOOLS or as module attributes (e.g. k8s_tools.get_pod_summaries()), with
+K8STOOLS_PROFILE_THRESHOLD, K8STOOLS_PROFILE_SAMPLE_RATE, K8STOOLS_PROFILE_MODE and
+K8STOOLS_PROFILE_INTERVAL overriding the defaults. The MCP server enables it with --profile,
+which takes precedence over the environment variables.
+
+A tool called from within a profiled call (e.g. get_logs_for_pod_and_container() from
+get_logs_for_workload()) is not profiled separately, as it is part of the outer call's profile.
+"""
+import collections
+import contextvars
+import cProfile
+import datetime
+import functools
+import inspect
+import json
+import logging
+import os
+import random
+import re
+import sys
+import threading
+import time
+from typing import Any, Callable, Literal, Optional
+
+ProfileMode = Literal['sample', 'cprofile']
+
+# Set while a profiled call is running, so that the tools it calls are not profiled separately
+_IN_PROFILED_CALL:contextvars.ContextVar[bool] = contextvars.ContextVar('k8stools_in_profiled_call', default=False)
+
+
+class _StackSampler:
+    """A background thread that samples the stacks of the threads running profiled calls.
+    It only runs while there are calls being profiled.
+    """
+    def __init__(self, interval_seconds:float):
+        self.interval_seconds = interval_seconds
+        self._condition = threading.Condition()
+        # call token -> (thread id, stack counts)
+        self._calls:dict[object, tuple[int, collections.Counter[str]]] = {}
+        self._thread:Optional[threading.Thread] = None
+
+    def start_call(self) -> tuple[object, collections.Counter[str]]:
+        token = object()
+        stacks:collections.Counter[str] = collections.Counter()
+        with self._condition:
+            self._calls[token] = (threading.get_ident(), stacks)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="k8stools-profiler", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+        return (token, stacks)
+
+    def stop_call(self, token:object) -> None:
+        with self._condition:
+            del self._calls[token]
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._calls:
+                    self._condition.wait()
+                calls = list(self._calls.values())
+            frames = sys._current_frames()
+            for (thread_id, stacks) in calls:
+                frame = frames.get(thread_id)
+                if frame is not None:
+                    stacks[_collapsed_stack(frame)] += 1
+            del frames
+            time.sleep(self.interval_seconds)
+
+
+def _collapsed_stack(frame:Any) -> str:
+    """Return a stack as a ';'-separated list of functions, outermost first"""
+    names:list[str] = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(f"{code.co_qualname} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+        frame = frame.f_back
+    return ';'.join(reversed(names))
+
+
+def _call_arguments(fn:Callable[..., Any], args:tuple, kwargs:dict[str, Any]) -> dict[str, Any]:
+    try:
+        bound = inspect.signature(fn).bind(*args, **kwargs)
+    except TypeError:
+        return {'args': list(args), 'kwargs': kwargs}
+    bound.apply_defaults()
+    return dict(bound.arguments)
+
+
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^A-Za-z0-9_.-]')
+
+
+class ToolProfiler:
+    """Profiles tool calls and writes the profiles of slow calls to a directory.
+
+    Parameters
+    ----------
+    directory : str
+        Directory for the profiles. It is created if needed.
+    threshold_seconds : float, default=1.0
+        Only the profiles of calls that take at least this long are written.
+    sample_rate : float, default=1.0
+        Fraction of the calls that are profiled, between 0 and 1.
+    mode : 'sample' or 'cprofile', default='sample'
+        How the calls are profiled (see the module documentation).
+    interval_seconds : float, default=0.005
+        Time between stack samples, in sample mode.
+    max_profiles : int, default=1000
+        Maximum number of profiles written by this profiler, so that the directory
+        cannot grow without bound.
+    """
+    def __init__(self, directory:str, threshold_seconds:float=1.0, sample_rate:float=1.0,
+                 mode:ProfileMode='sample', interval_seconds:float=0.005, max_profiles:int=1000):
+        if mode not in ('sample', 'cprofile'):
+            raise ValueError(f"Profile mode must be 'sample' or 'cprofile', got '{mode}'")
+        self.directory = directory
+        self.threshold_seconds = threshold_seconds
+        self.sample_rate = sample_rate
+        self.mode = mode
+        self.max_profiles = max_profiles
+        self.profiles_written = 0
+        self._sampler = _StackSampler(interval_seconds) if mode == 'sample' else None
+        # cProfile can only profile one call at a time
+        self._cprofile_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._random = random.Random()
+
+    def _should_profile(self) -> bool:
+        return self.profiles_written < self.max_profiles and self._random.random() < self.sample_rate
+
+    def _start(self) -> Optional[tuple[Any, Any]]:
+        """Start profiling a call on this thread. Returns None if it can't be profiled."""
+        if self._sampler is not None:
+            return self._sampler.start_call()
+        if not self._cprofile_lock.acquire(blocking=False):
+            return None
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # another profiler (e.g. a debugger) is active
+            self._cprofile_lock.release()
+            return None
+        return (None, profile)
+
+    def _stop(self, state:tuple[Any, Any]) -> None:
+        if self._sampler is not None:
+            self._sampler.stop_call(state[0])
+        else:
+            state[1].disable()
+            self._cprofile_lock.release()
+
+    def _finish(self, fn:Callable[..., Any], args:tuple, kwargs:dict[str, Any], state:tuple[Any, Any],
+                started_at:datetime.datetime, duration:float, error:Optional[BaseException]) -> None:
+        self._stop(state)
+        if duration < self.threshold_seconds:
+            return
+        try:
+            self._write(fn.__name__, _call_arguments(fn, args, kwargs), state[1], started_at, duration, error)
+        except OSError as e:
+            logging.error(f"Could not write the profile of {fn.__name__} to {self.directory}: {e}")
+
+    def _write(self, tool:str, arguments:dict[str, Any], profile:Any, started_at:datetime.datetime,
+               duration:float, error:Optional[BaseException]) -> None:
+        with self._write_lock:
+            if self.profiles_written >= self.max_profiles:
+                return
+            self.profiles_written += 1
+            if self.profiles_written == self.max_profiles:
+                logging.warning(f"Wrote {self.max_profiles} profiles to {self.directory}, no more will be written")
+        os.makedirs(self.directory, exist_ok=True)
+        base_name = _UNSAFE_FILENAME_CHARS.sub('_', f"{started_at.strftime('%Y%m%d-%H%M%S.%f')}-{tool}-"
+                                                    f"{int(duration*1000)}ms")
+        base_path = os.path.join(self.directory, base_name)
+        if self.mode == 'sample':
+            profile_path = base_path + '.folded'
+            with open(profile_path, 'w') as f:
+                for (stack, count) in profile.most_common():
+                    f.write(f"{stack} {count}\n")
+        else:
+            profile_path = base_path + '.prof'
+            profile.dump_stats(profile_path)
+        with open(base_path + '.json', 'w') as f:
+            json.dump({'tool': tool, 'arguments': arguments, 'started_at': started_at.isoformat(),
+                       'duration_seconds': duration, 'mode': self.mode, 'profile': os.path.basename(profile_path),
+                       'error': repr(error) if error is not None else None}, f, indent=2, default=str)
+        logging.info(f"Call of {tool} took {duration:.3f}s, wrote its profile to {profile_path}")
+
+
+def profiled(fn:Callable[..., Any], profiler:ToolProfiler) -> Callable[..., Any]:
+    """Wrap a tool function (sync or async) so that its calls are profiled by profiler.
+    The wrapper has the same signature and docstring as fn. For async functions, the
+    event loop's thread is profiled, so other tasks that run during the call are included.
+    If fn is already wrapped with another profiler, that wrapper is replaced, so that the
+    last profiler given takes precedence.
+    """
+    current = getattr(fn, '__k8stools_profiler__', None)
+    if current is profiler:
+        return fn
+    if current is not None:
+        fn = fn.__wrapped__
+    if inspect.iscoroutinefunction(fn):
+        @functools.wraps(fn)
+        async def async_wrapper(*args, **kwargs):
+            state = profiler._start() if not _IN_PROFILED_CALL.get() and profiler._should_profile() else None
+            if state is None:
+                return await fn(*args, **kwargs)
+            token = _IN_PROFILED_CALL.set(True)
+            started_at = datetime.datetime.now(datetime.timezone.utc)
+            start = time.perf_counter()
+            error:Optional[BaseException] = None
+            try:
+                return await fn(*args, **kwargs)
+            except BaseException as e:
+                error = e
+                raise
+            finally:
+                _IN_PROFILED_CALL.reset(token)
+                profiler._finish(fn, args, kwargs, state, started_at, time.perf_counter() - start, error)
+        wrapper = async_wrapper
+    else:
+        @functools.wraps(fn)
+        def sync_wrapper(*args, **kwargs):
+            state = profiler._start() if not _IN_PROFILED_CALL.get() and profiler._should_profile() else None
+            if state is None:
+                return fn(*args, **kwargs)
+            token = _IN_PROFILED_CALL.set(True)
+            started_at = datetime.datetime.now(datetime.timezone.utc)
+            start = time.perf_counter()
+            error:Optional[BaseException] = None
+            try:
+                return fn(*args, **kwargs)
+            except BaseException as e:
+                error = e
+                raise
+            finally:
+                _IN_PROFILED_CALL.reset(token)
+                profiler._finish(fn, args, kwargs, state, started_at, time.perf_counter() - start, error)
+        wrapper = sync_wrapper
+    setattr(wrapper, '__k8stools_profiler__', profiler)
+    return wrapper
+
+
+def profiler_from_environment() -> Optional[ToolProfiler]:
+    """Return a ToolProfiler configured from the K8STOOLS_PROFILE_* environment variables,
+    or None if K8STOOLS_PROFILE_DIR is not set."""
+    directory = os.environ.get('K8STOOLS_PROFILE_DIR')
+    if not directory:
+        return None
+    return ToolProfiler(directory,
+                        threshold_seconds=float(os.environ.get('K8STOOLS_PROFILE_THRESHOLD', '1.0')),
+                        sample_rate=float(os.environ.get('K8STOOLS_PROFILE_SAMPLE_RATE', '1.0')),
+                        mode=os.environ.get('K8STOOLS_PROFILE_MODE', 'sample'), # type: ignore
+                        interval_seconds=float(os.environ.get('K8STOOLS_PROFILE_INTERVAL', '0.005')))
+
+
+# The profiler configured through the environment, if any
+PROFILER:Optional[ToolProfiler] = profiler_from_environment()
+
+
+def profile_tools(tools:list[Callable[..., Any]],
+                  module_globals:Optional[dict[str, Any]]=None) -> list[Callable[..., Any]]:
+    """Return the tools wrapped with PROFILER, or the tools unchanged if profiling was not
+    enabled through the environment. If module_globals (the globals() of the module defining
+    the tools) is given, the module's attributes are replaced with the wrapped tools too, so
+    that calls such as k8s_tools.get_pod_summaries() are profiled as well as those through TOOLS.
+    """
+    if PROFILER is None:
+        return tools
+    wrapped_tools = [profiled(fn, PROFILER) for fn in tools]
+    if module_globals is not None:
+        for (fn, wrapped) in zip(tools, wrapped_tools):
+            if module_globals.get(fn.__name__) is fn:
+                module_globals[fn.__name__] = wrapped
+    return wrapped_tools
@@ -0,0 +1,145 @@
+"""Benchmark of the "json" list response mode against the default "model" mode.
+
+For each object count, a realistic LIST response body is generated once. Then we time
+building the summaries from that body in two ways:
+
+* model - deserialize into the kubernetes client models (what the client does by default)
+  and call _pod_to_summary(), etc.
+* json - parse the body directly and call _pod_json_to_summary(), etc.
+
+No cluster is needed. Run with:
+
+    python tests/benchmarks/bench_raw_json.py [--counts 10000 50000] [--repeat 3]
+"""
+import argparse
+import datetime
+import json
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
+
+from kubernetes import client
+from k8stools import k8s_tools
+
+
+def make_pod(i:int) -> dict:
+    namespace = f"ns-{i % 50}"
+    name = f"app-{i % 400}-7d9c8b6f5-{i:05d}"
+    started = "2025-07-27T10:00:00Z"
+    return {
+        "metadata": {
+            "name": name, "namespace": namespace, "uid": f"uid-{i}", "resourceVersion": str(1000 + i),
+            "creationTimestamp": "2025-07-20T10:00:00Z",
+            "labels": {"app": f"app-{i % 400}", "pod-template-hash": "7d9c8b6f5"},
+            "annotations": {"kubectl.kubernetes.io/restartedAt": started},
+            "ownerReferences": [{"apiVersion": "apps/v1", "kind": "ReplicaSet", "name": f"app-{i % 400}-7d9c8b6f5",
+                                 "uid": f"rs-{i % 400}", "controller": True, "blockOwnerDeletion": True}],
+        },
+        "spec": {
+            "nodeName": f"node-{i % 500}",
+            "restartPolicy": "Always",
+            "containers": [{
+                "name": "app", "image": f"registry.example.com/app-{i % 400}:1.2.3",
+                "ports": [{"containerPort": 8080, "protocol": "TCP"}],
+                "env": [{"name": f"VAR_{j}", "value": str(j)} for j in range(5)],
+                "resources": {"requests": {"cpu": "100m", "memory": "128Mi"}, "limits": {"memory": "256Mi"}},
+                "volumeMounts": [{"name": "kube-api-access", "mountPath": "/var/run/secrets/kubernetes.io/serviceaccount",
+                                  "readOnly": True}],
+            }],
+        },
+        "status": {
+            "phase": "Running", "podIP": f"10.{i // 65536 % 256}.{i // 256 % 256}.{i % 256}",
+            "hostIP": f"192.168.{i % 500 // 256}.{i % 256}", "startTime": started,
+            "conditions": [{"type": t, "status": "True", "lastTransitionTime": started}
+                           for t in ("Initialized", "Ready", "ContainersReady", "PodScheduled")],
+            "containerStatuses": [{
+                "name": "app", "image": f"registry.example.com/app-{i % 400}:1.2.3", "imageID": f"sha256:{i:064d}",
+                "containerID": f"containerd://{i:064d}", "ready": i % 10 != 0, "started": True,
+                "restartCount": i % 7,
+                "state": {"running": {"startedAt": started}},
+                "lastState": {"terminated": {"exitCode": 137, "reason": "OOMKilled",
+                                             "startedAt": "2025-07-26T10:00:00Z",
+                                             "finishedAt": "2025-07-27T09:59:00Z"}} if i % 7 else {},
+            }],
+        },
+    }
+
+
+def make_node(i:int) -> dict:
+    return {
+        "metadata": {"name": f"node-{i}", "creationTimestamp": "2025-07-01T10:00:00Z",
+                     "labels": {"kubernetes.io/hostname": f"node-{i}", "node-role.kubernetes.io/worker": ""}},
+        "status": {
+            "conditions": [{"type": "Ready", "status": "True"}],
+            "addresses": [{"type": "InternalIP", "address": f"192.168.{i // 256 % 256}.{i % 256}"}],
+            "nodeInfo": {"kubeletVersion": "v1.30.0", "osImage": "Ubuntu 22.04.4 LTS",
+                         "kernelVersion": "5.15.0-112-generic", "containerRuntimeVersion": "containerd://1.7.2",
+                         "architecture": "amd64", "bootID": "b", "kubeProxyVersion": "v1.30.0",
+                         "machineID": "m", "operatingSystem": "linux", "systemUUID": "s"},
+        },
+    }
+
+
+def make_service(i:int) -> dict:
+    return {
+        "metadata": {"name": f"svc-{i}", "namespace": f"ns-{i % 50}", "creationTimestamp": "2025-07-20T10:00:00Z"},
+        "spec": {"type": "ClusterIP", "clusterIP": f"10.96.{i // 256 % 256}.{i % 256}",
+                 "ports": [{"port": 80, "protocol": "TCP", "targetPort": 8080}]},
+        "status": {"loadBalancer": {}},
+    }
+
+
+KINDS = {
+    'pods': (make_pod, 'V1PodList', k8s_tools._pod_to_summary, k8s_tools._pod_json_to_summary),
+    'nodes': (make_node, 'V1NodeList', k8s_tools._node_to_summary, k8s_tools._node_json_to_summary),
+    'services': (make_service, 'V1ServiceList', k8s_tools._service_to_summary, k8s_tools._service_json_to_summary),
+}
+
+
+def best_of(repeat:int, fn) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def run(counts:list[int], repeat:int) -> None:
+    api_client = client.ApiClient()
+    print(f"JSON parser: {k8s_tools._json_loads.__module__}")
+    print(f"{'KIND':<10} {'OBJECTS':>8} {'MODEL (s)':>10} {'JSON (s)':>10} {'SPEEDUP':>8}")
+    for kind, (make, list_type, to_summary, json_to_summary) in KINDS.items():
+        for count in counts:
+            body = json.dumps({"metadata": {}, "items": [make(i) for i in range(count)]}).encode('utf-8')
+            now = datetime.datetime.now(datetime.timezone.utc)
+
+            def model_path():
+                result = api_client.deserialize(SimpleNamespace(data=body), list_type)
+                return [to_summary(item, now) for item in result.items]
+
+            def json_path():
+                result = k8s_tools._json_loads(body)
+                return [json_to_summary(item, now) for item in result['items']]
+
+            assert model_path() == json_path()
+            model_time = best_of(repeat, model_path)
+            json_time = best_of(repeat, json_path)
+            print(f"{kind:<10} {count:>8} {model_time:>10.3f} {json_time:>10.3f} {model_time/json_time:>7.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the model and json list response modes")
+    parser.add_argument('--counts', type=int, nargs='+', default=[10000, 50000],
+                        help="Object counts to benchmark [default: 10000 50000]")
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="Number of timing runs per case, the best is reported [default: 3]")
+    args = parser.parse_args()
+    run(args.counts, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,216 @@
+"""Benchmark of the cold-start time of k8s-mcp-server and k8s-mcp-client.
+
+Two things are measured, each in fresh subprocesses and repeated --repeat times:
+
+* import_seconds - the time to import each of the k8stools modules that the scripts load
+  (k8s_tools, mock_tools, async_tools, mcp_server and mcp_client)
+* for the server, with the stdio transport, in each of its configurations (--mock, the
+  real tools and the real tools with --async-tools):
+  - initialize_seconds - from starting the process until it answers the MCP initialize request
+  - tools_list_seconds - from starting the process until it answers the tools/list request
+
+The real server does not make any requests to the API server until a tool is called, so
+it does not need a cluster. KUBECONFIG is pointed at a kube config for an address where
+nothing is listening.
+
+The median of the runs is reported. The results are stored as JSON (by default in
+bench-startup-<commit>.json), so that runs can be compared across commits. --max-seconds
+makes the benchmark fail if a server takes longer than that to answer tools/list, which
+can be used to guard against regressions in CI. Run with:
+
+    python tests/benchmarks/bench_startup.py [--repeat 5] [--max-seconds 2.0]
+    python tests/benchmarks/bench_startup.py --compare OLD.json NEW.json [--threshold 1.2]
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Optional
+
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src'))
+
+MODULES = ['k8stools.k8s_tools', 'k8stools.mock_tools', 'k8stools.async_tools', 'k8stools.mcp_server',
+           'k8stools.mcp_client']
+
+SERVER_CONFIGS:dict[str, list[str]] = {
+    'mock': ['--mock'],
+    'real': [],
+    'real-async': ['--async-tools'],
+}
+
+KUBECONFIG = """apiVersion: v1
+kind: Config
+clusters:
+- name: bench
+  cluster:
+    server: http://127.0.0.1:9
+contexts:
+- name: bench
+  context:
+    cluster: bench
+    user: bench
+current-context: bench
+users:
+- name: bench
+  user:
+    token: bench
+"""
+
+
+def _env(kubeconfig:str) -> dict[str, str]:
+    python_path = os.environ.get('PYTHONPATH')
+    return dict(os.environ, KUBECONFIG=kubeconfig,
+                PYTHONPATH=SRC_DIR + (os.pathsep + python_path if python_path else ''))
+
+
+def time_import(module:str, env:dict[str, str]) -> float:
+    """Import module in a fresh interpreter and return the time the import took"""
+    code = (f"import time; start = time.perf_counter(); import {module}; "
+            f"print(time.perf_counter() - start)")
+    completed = subprocess.run([sys.executable, '-c', code], env=env, capture_output=True, text=True, check=True)
+    return float(completed.stdout.splitlines()[-1])
+
+
+def _send(process:subprocess.Popen, message:dict[str, Any]) -> None:
+    assert process.stdin is not None
+    process.stdin.write(json.dumps(message) + '\n')
+    process.stdin.flush()
+
+
+def _receive(process:subprocess.Popen, request_id:int) -> dict[str, Any]:
+    """Read messages from the server until the response to request_id"""
+    assert process.stdout is not None
+    while True:
+        line = process.stdout.readline()
+        if not line:
+            raise Exception(f"Server exited before answering request {request_id}")
+        message = json.loads(line)
+        if message.get('id') == request_id:
+            if 'error' in message:
+                raise Exception(f"Request {request_id} failed: {message['error']}")
+            return message
+
+
+def time_server(server_args:list[str], env:dict[str, str]) -> tuple[float, float, int]:
+    """Start the server with the stdio transport and return the times until it answered the
+    initialize and tools/list requests, and the number of tools"""
+    start = time.perf_counter()
+    process = subprocess.Popen([sys.executable, '-m', 'k8stools.mcp_server', '--transport', 'stdio'] + server_args,
+                               env=env, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                               stderr=subprocess.DEVNULL, text=True)
+    try:
+        _send(process, {'jsonrpc': '2.0', 'id': 1, 'method': 'initialize',
+                        'params': {'protocolVersion': '2025-06-18', 'capabilities': {},
+                                   'clientInfo': {'name': 'bench-startup', 'version': '0'}}})
+        _receive(process, 1)
+        initialize_seconds = time.perf_counter() - start
+        _send(process, {'jsonrpc': '2.0', 'method': 'notifications/initialized'})
+        _send(process, {'jsonrpc': '2.0', 'id': 2, 'method': 'tools/list'})
+        tools = _receive(process, 2)['result']['tools']
+        tools_list_seconds = time.perf_counter() - start
+    finally:
+        process.kill()
+        process.wait()
+    return (initialize_seconds, tools_list_seconds, len(tools))
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(repeat:int, configs:list[str]) -> dict[str, Any]:
+    results:dict[str, Any] = {'imports': {}, 'servers': {}}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        kubeconfig = os.path.join(tmpdir, 'kubeconfig')
+        with open(kubeconfig, 'w') as f:
+            f.write(KUBECONFIG)
+        env = _env(kubeconfig)
+        print(f"{'MODULE':<24} {'IMPORT (s)':>10}")
+        for module in MODULES:
+            seconds = statistics.median(time_import(module, env) for _ in range(repeat))
+            results['imports'][module] = {'import_seconds': seconds}
+            print(f"{module:<24} {seconds:>10.3f}", flush=True)
+        print(f"\n{'SERVER':<24} {'INITIALIZE (s)':>14} {'TOOLS/LIST (s)':>14} {'TOOLS':>6}")
+        for config in configs:
+            runs = [time_server(SERVER_CONFIGS[config], env) for _ in range(repeat)]
+            result = {'initialize_seconds': statistics.median(r[0] for r in runs),
+                      'tools_list_seconds': statistics.median(r[1] for r in runs),
+                      'tools': runs[0][2]}
+            results['servers'][config] = result
+            print(f"{config:<24} {result['initialize_seconds']:>14.3f} {result['tools_list_seconds']:>14.3f} "
+                  f"{result['tools']:>6}", flush=True)
+    return results
+
+
+def compare(old_path:str, new_path:str, threshold:float) -> int:
+    """Print the changes in startup times between two result files.
+    Returns the number of measurements that regressed by more than threshold."""
+    def load(path:str) -> dict[str, float]:
+        with open(path) as f:
+            results = json.load(f)['results']
+        times = {f"import {m}": r['import_seconds'] for (m, r) in results['imports'].items()}
+        times.update({f"server {c}": r['tools_list_seconds'] for (c, r) in results['servers'].items()})
+        return times
+    old = load(old_path)
+    new = load(new_path)
+    regressions = 0
+    print(f"{'MEASUREMENT':<32} {'OLD (s)':>9} {'NEW (s)':>9} {'RATIO':>7}")
+    for key in sorted(old.keys() & new.keys()):
+        ratio = new[key]/max(old[key], 1e-9)
+        regressed = ratio > threshold
+        regressions += regressed
+        print(f"{key:<32} {old[key]:>9.3f} {new[key]:>9.3f} {ratio:>6.2f}x{'  REGRESSION' if regressed else ''}")
+    for key in sorted(old.keys() ^ new.keys()):
+        print(f"{key}: only in {old_path if key in old else new_path}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the cold-start time of the MCP server and client")
+    parser.add_argument('--repeat', type=int, default=5,
+                        help="Number of runs of each measurement, the median is reported [default: 5]")
+    parser.add_argument('--servers', nargs='+', choices=list(SERVER_CONFIGS), default=list(SERVER_CONFIGS),
+                        help=f"Server configurations to start [default: {' '.join(SERVER_CONFIGS)}]")
+    parser.add_argument('--max-seconds', type=float, default=None,
+                        help="Exit with an error if a server takes longer than this to answer tools/list")
+    parser.add_argument('--output', default=None,
+                        help="File for the JSON results [default: bench-startup-<commit>.json]")
+    parser.add_argument('--compare', nargs=2, metavar=('OLD', 'NEW'), default=None,
+                        help="Compare two result files instead of running the benchmarks")
+    parser.add_argument('--threshold', type=float, default=1.2,
+                        help="With --compare, ratio above which a time is reported as a regression [default: 1.2]")
+    args = parser.parse_args()
+
+    if args.compare:
+        sys.exit(1 if compare(args.compare[0], args.compare[1], args.threshold) else 0)
+
+    commit = git_commit()
+    results = run(args.repeat, args.servers)
+    output = args.output or f"bench-startup-{commit or 'unknown'}.json"
+    with open(output, 'w') as f:
+        json.dump({'commit': commit,
+                   'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+                   'python': platform.python_version(),
+                   'platform': platform.platform(),
+                   'args': {'repeat': args.repeat, 'servers': args.servers},
+                   'results': results}, f, indent=2)
+    print(f"Wrote results to {output}")
+    if args.max_seconds is not None:
+        slow = [c for (c, r) in results['servers'].items() if r['tools_list_seconds'] > args.max_seconds]
+        if slow:
+            print(f"Startup took longer than {args.max_seconds}s for: {', '.join(slow)}", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
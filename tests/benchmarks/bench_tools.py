@@ -0,0 +1,333 @@
+"""Benchmark of every tool in k8s_tools.TOOLS and the print_* functions at realistic cluster sizes.
+
+For each cluster size (the number of pods; there are size/50 nodes and size/2000 namespaces,
+with at least 5 of each), a synthetic cluster is served by k8stools.fake_apiserver. Each tool
+is then run against it in its own subprocess, so the peak RSS of one tool does not hide that
+of another. For each tool, list response mode and size we record:
+
+* wall_seconds - the best wall time of --repeat calls
+* phases - that call's time broken down into:
+  - fetch: making the HTTP requests and reading the response bodies
+  - deserialize: decoding the bodies into the client models (model mode) or dicts (json/table modes)
+  - summarize: the rest of the tool call, mostly building our pydantic models
+  - serialize: converting the result to JSON, like the MCP server does (0 for print_* functions)
+  Tools that make requests in parallel (get_logs_for_workload) sum fetch and deserialize
+  across threads, so summarize is clamped at 0.
+* peak_rss_bytes - the peak RSS of the subprocess
+* peak_python_bytes - the peak size of the Python heap during one call (from tracemalloc)
+* objects_allocated - the number of memory blocks (roughly, Python objects) allocated during
+  one call and not freed by its end, which includes the result (from tracemalloc)
+* requests - the number of API requests made by one call
+* result_bytes - the size of the serialized result
+
+The results are stored as JSON (by default in bench-tools-<commit>.json), so that runs can be
+compared across commits. Run with:
+
+    python tests/benchmarks/bench_tools.py [--sizes 1000 10000 100000] [--modes model json] [--repeat 3]
+    python tests/benchmarks/bench_tools.py --compare OLD.json NEW.json [--threshold 1.2]
+"""
+import argparse
+import contextlib
+import datetime
+import gc
+import io
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from collections import defaultdict
+from typing import Any, Callable, Optional
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
+
+import pydantic_core
+from kubernetes import client
+from kubernetes.client import rest
+from urllib3.response import HTTPResponse
+
+from k8stools import k8s_tools, mock_tools
+from k8stools.fake_apiserver import FakeApiServer
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+PHASES = ('fetch', 'deserialize', 'summarize', 'serialize')
+
+
+def tool_names() -> list[str]:
+    return [fn.__name__ for fn in k8s_tools.TOOLS] + \
+           sorted(name for name in dir(k8s_tools) if name.startswith('print_'))
+
+
+def case_kwargs(data:dict[str, Any]) -> dict[str, dict[str, Any]]:
+    """Return the keyword arguments to call each tool with. The per-pod tools are called
+    on a crash looping pod (so that it has events and restarts), and get_logs_for_workload
+    on that pod's deployment. The list tools are called for all namespaces.
+    """
+    failing = [pod for pod in data['pods']
+               if data['pod_details'][(pod.namespace, pod.name)]['mode'] == 'CrashLoopBackOff']
+    pod = failing[0] if failing else data['pods'][0]
+    deployment = next(d for d in data['deployments']
+                      if d.namespace == pod.namespace and pod.name.startswith(d.name + '-'))
+    pod_args = {'pod_name': pod.name, 'namespace': pod.namespace}
+    kwargs:dict[str, dict[str, Any]] = {
+        'get_namespaces': {},
+        'get_node_summaries': {},
+        'get_pod_summaries': {},
+        'get_pod_container_statuses': pod_args,
+        'get_namespace_container_statuses': {},
+        'get_pod_events': pod_args,
+        'get_object_events': {'kind': 'Pod', 'name': pod.name, 'namespace': pod.namespace},
+        'get_pod_spec': pod_args,
+        'get_logs_for_pod_and_container': pod_args,
+        'search_pod_logs': dict(pod_args, pattern='error|fail', ignore_case=True),
+        'get_logs_for_workload': {'namespace': pod.namespace, 'deployment_name': deployment.name},
+        'get_deployment_summaries': {},
+        'get_service_summaries': {},
+    }
+    for name in tool_names():
+        if name.startswith('print_'):
+            kwargs[name] = kwargs['get_' + name[len('print_'):]]
+    missing = [name for name in tool_names() if name not in kwargs]
+    assert not missing, f"No benchmark arguments for {', '.join(missing)}"
+    return kwargs
+
+
+class PhaseTimer:
+    """Accumulates the time spent in each phase. Only the outermost phase of a thread is
+    timed, e.g. reading the body inside a request counts once, as fetch.
+    """
+    def __init__(self):
+        self.totals:dict[str, float] = defaultdict(float)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def wrap(self, phase:str, fn:Callable[..., Any]) -> Callable[..., Any]:
+        def wrapper(*args, **kwargs):
+            if getattr(self._local, 'active', False):
+                return fn(*args, **kwargs)
+            self._local.active = True
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                self._local.active = False
+                with self._lock:
+                    self.totals[phase] += elapsed
+        return wrapper
+
+    def reset(self) -> None:
+        self.totals.clear()
+
+
+def install_phase_timer() -> PhaseTimer:
+    timer = PhaseTimer()
+    rest.RESTClientObject.request = timer.wrap('fetch', rest.RESTClientObject.request)
+    HTTPResponse.read = timer.wrap('fetch', HTTPResponse.read)
+    client.ApiClient.deserialize = timer.wrap('deserialize', client.ApiClient.deserialize)
+    k8s_tools._json_loads = timer.wrap('deserialize', k8s_tools._json_loads)
+    return timer
+
+
+def peak_rss_bytes() -> int:
+    # On Linux, ru_maxrss is inherited across exec, so it would include the parent (with the
+    # fake API server's data). VmHWM is the peak of this process only.
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])*1024
+    except OSError:
+        pass
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxrss if sys.platform == 'darwin' else maxrss*1024
+
+
+def run_case(tool_name:str, kwargs:dict[str, Any], repeat:int) -> dict[str, Any]:
+    """Run one tool (in the subprocess) and return its measurements"""
+    fn = getattr(k8s_tools, tool_name)
+    is_print = tool_name.startswith('print_')
+    timer = install_phase_timer()
+
+    def call() -> tuple[Any, int]:
+        if is_print:
+            with contextlib.redirect_stdout(io.StringIO()) as output:
+                fn(**kwargs)
+            return (None, len(output.getvalue()))
+        result = fn(**kwargs)
+        with _timed(timer, 'serialize'):
+            serialized = pydantic_core.to_json(result, fallback=str, indent=2)
+        return (result, len(serialized))
+
+    best:Optional[tuple[float, dict[str, float]]] = None
+    result_bytes = 0
+    for _ in range(repeat):
+        timer.reset()
+        start = time.perf_counter()
+        (_, result_bytes) = call()
+        wall = time.perf_counter() - start
+        if best is None or wall < best[0]:
+            phases = {phase: timer.totals.get(phase, 0.0) for phase in PHASES}
+            phases['summarize'] = max(0.0, wall - phases['fetch'] - phases['deserialize'] - phases['serialize'])
+            best = (wall, phases)
+    assert best is not None
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        blocks_before = _traced_blocks()
+        (result, _) = call()
+        (_, peak_python_bytes) = tracemalloc.get_traced_memory()
+        objects_allocated = _traced_blocks() - blocks_before
+        del result
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'wall_seconds': best[0],
+        'phases': best[1],
+        'peak_rss_bytes': peak_rss_bytes(),
+        'peak_python_bytes': peak_python_bytes,
+        'objects_allocated': objects_allocated,
+        'result_bytes': result_bytes,
+    }
+
+
+def _traced_blocks() -> int:
+    return sum(stat.count for stat in tracemalloc.take_snapshot().statistics('filename'))
+
+
+@contextlib.contextmanager
+def _timed(timer:PhaseTimer, phase:str):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timer.totals[phase] += time.perf_counter() - start
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def cluster_data(size:int, seed:int) -> dict[str, Any]:
+    return mock_tools.generate_cluster_data(num_pods=size, num_nodes=max(5, size // 50),
+                                            num_namespaces=max(5, size // 2000), seed=seed)
+
+
+def run(sizes:list[int], modes:list[str], repeat:int, latency:float, seed:int,
+        tools:Optional[list[str]]) -> list[dict[str, Any]]:
+    names = tools or tool_names()
+    results:list[dict[str, Any]] = []
+    print(f"{'TOOL':<34} {'MODE':<6} {'SIZE':>7} {'WALL (s)':>9} {'FETCH':>7} {'DESER':>7} {'SUMM':>7} "
+          f"{'SER':>7} {'RSS (MB)':>9} {'OBJECTS':>9} {'REQS':>5}")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for size in sizes:
+            data = cluster_data(size, seed)
+            kwargs = case_kwargs(data)
+            with FakeApiServer(data=data, latency=latency) as server:
+                kubeconfig = server.write_kubeconfig(os.path.join(tmpdir, f"kubeconfig-{size}"))
+                for mode in modes:
+                    env = dict(os.environ, KUBECONFIG=kubeconfig, K8STOOLS_LIST_RESPONSE_MODE=mode)
+                    for name in names:
+                        requests_before = server.request_count
+                        completed = subprocess.run([sys.executable, os.path.abspath(__file__), '--run-case', name,
+                                                    '--kwargs', json.dumps(kwargs[name]), '--repeat', str(repeat)],
+                                                   env=env, capture_output=True, text=True)
+                        if completed.returncode != 0:
+                            print(f"{name} failed for mode={mode}, size={size}:\n{completed.stderr}", file=sys.stderr)
+                            continue
+                        result = json.loads(completed.stdout.splitlines()[-1])
+                        # the tool was called repeat times, plus once for the memory measurements
+                        result['requests'] = (server.request_count - requests_before) // (repeat + 1)
+                        result.update(tool=name, mode=mode, size=size)
+                        results.append(result)
+                        phases = result['phases']
+                        print(f"{name:<34} {mode:<6} {size:>7} {result['wall_seconds']:>9.3f} "
+                              f"{phases['fetch']:>7.3f} {phases['deserialize']:>7.3f} {phases['summarize']:>7.3f} "
+                              f"{phases['serialize']:>7.3f} {result['peak_rss_bytes']/2**20:>9.1f} "
+                              f"{result['objects_allocated']:>9} {result['requests']:>5}", flush=True)
+    return results
+
+
+def compare(old_path:str, new_path:str, threshold:float) -> int:
+    """Print the changes in wall time and peak RSS between two result files.
+    Returns the number of cases that regressed by more than threshold."""
+    def load(path:str) -> dict[tuple[str, str, int], dict[str, Any]]:
+        with open(path) as f:
+            return {(r['tool'], r['mode'], r['size']): r for r in json.load(f)['results']}
+    old = load(old_path)
+    new = load(new_path)
+    regressions = 0
+    print(f"{'TOOL':<34} {'MODE':<6} {'SIZE':>7} {'OLD (s)':>9} {'NEW (s)':>9} {'TIME':>7} {'RSS':>7}")
+    for key in sorted(old.keys() & new.keys()):
+        time_ratio = new[key]['wall_seconds']/max(old[key]['wall_seconds'], 1e-9)
+        rss_ratio = new[key]['peak_rss_bytes']/max(old[key]['peak_rss_bytes'], 1)
+        regressed = time_ratio > threshold or rss_ratio > threshold
+        regressions += regressed
+        (tool, mode, size) = key
+        print(f"{tool:<34} {mode:<6} {size:>7} {old[key]['wall_seconds']:>9.3f} {new[key]['wall_seconds']:>9.3f} "
+              f"{time_ratio:>6.2f}x {rss_ratio:>6.2f}x{'  REGRESSION' if regressed else ''}")
+    for key in sorted(old.keys() ^ new.keys()):
+        print(f"{' '.join(str(k) for k in key)}: only in {old_path if key in old else new_path}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the tools against a fake API server")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help=f"Cluster sizes, in pods [default: {' '.join(str(s) for s in DEFAULT_SIZES)}]")
+    parser.add_argument('--modes', nargs='+', choices=['model', 'json', 'table'], default=['model', 'json'],
+                        help="List response modes (see K8STOOLS_LIST_RESPONSE_MODE) [default: model json]")
+    parser.add_argument('--tools', nargs='+', default=None, help="Only run these tools [default: all]")
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="Number of timing runs per case, the best is reported [default: 3]")
+    parser.add_argument('--latency', type=float, default=0.0,
+                        help="Seconds the fake API server waits before answering each request [default: 0]")
+    parser.add_argument('--seed', type=int, default=0, help="Random seed for the clusters [default: 0]")
+    parser.add_argument('--output', default=None,
+                        help="File for the JSON results [default: bench-tools-<commit>.json]")
+    parser.add_argument('--compare', nargs=2, metavar=('OLD', 'NEW'), default=None,
+                        help="Compare two result files instead of running the benchmarks")
+    parser.add_argument('--threshold', type=float, default=1.2,
+                        help="With --compare, ratio above which a case is reported as a regression [default: 1.2]")
+    parser.add_argument('--run-case', default=None, help=argparse.SUPPRESS)
+    parser.add_argument('--kwargs', default='{}', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_case:
+        print(json.dumps(run_case(args.run_case, json.loads(args.kwargs), args.repeat)))
+        return
+    if args.compare:
+        sys.exit(1 if compare(args.compare[0], args.compare[1], args.threshold) else 0)
+
+    unknown = set(args.tools or []) - set(tool_names())
+    if unknown:
+        parser.error(f"Unknown tools: {', '.join(sorted(unknown))}")
+    commit = git_commit()
+    results = run(args.sizes, args.modes, args.repeat, args.latency, args.seed, args.tools)
+    output = args.output or f"bench-tools-{commit or 'unknown'}.json"
+    with open(output, 'w') as f:
+        json.dump({'commit': commit,
+                   'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+                   'python': platform.python_version(),
+                   'platform': platform.platform(),
+                   'json_parser': k8s_tools._json_loads.__module__,
+                   'args': {'sizes': args.sizes, 'modes': args.modes, 'repeat': args.repeat,
+                            'latency': args.latency, 'seed': args.seed},
+                   'results': results}, f, indent=2)
+    print(f"Wrote results to {output}")
+
+
+if __name__ == '__main__':
+    main()
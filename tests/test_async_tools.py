@@ -0,0 +1,244 @@
+"""Tests for the asyncio versions of the tools. The API server is replaced by an
+httpx.MockTransport.
+"""
+
+import asyncio
+import datetime
+import inspect
+import json
+import threading
+from unittest.mock import patch
+
+import httpx
+import pytest
+from kubernetes import client
+
+from k8stools import async_tools, k8s_tools, paging
+
+
+PODS = [
+    {"metadata": {"name": f"pod-{i}", "namespace": "default" if i % 2 else "test",
+                  "creationTimestamp": "2025-07-27T10:00:00Z"},
+     "spec": {"containers": [{"name": "app", "image": "nginx"}], "nodeName": "node-1"},
+     "status": {"phase": "Running", "podIP": f"10.244.0.{i}",
+                "containerStatuses": [{"name": "app", "image": "nginx", "imageID": "x", "ready": True,
+                                       "restartCount": i, "started": True,
+                                       "state": {"running": {"startedAt": "2025-07-27T10:01:00Z"}}}]}}
+    for i in range(5)
+]
+
+EVENTS = [
+    {"metadata": {"name": "pod-1.1", "namespace": "default"},
+     "involvedObject": {"kind": "Pod", "name": "pod-1", "namespace": "default"},
+     "type": "Warning", "reason": "BackOff", "message": "Back-off restarting failed container",
+     "lastTimestamp": "2025-07-28T01:00:00Z"},
+]
+
+
+class MockApiServer:
+    """Handles requests from the async client, recording each one"""
+    def __init__(self):
+        self.requests = []
+
+    def __call__(self, request:httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        path = request.url.path
+        params = request.url.params
+        if path in ('/api/v1/pods', '/api/v1/namespaces/default/pods'):
+            pods = [pod for pod in PODS if path == '/api/v1/pods' or pod['metadata']['namespace'] == 'default']
+            if not params.get('continue', '0').isdigit():
+                return httpx.Response(410, json={"kind": "Status", "reason": "Expired", "code": 410})
+            start = int(params.get('continue', '0'))
+            end = start + int(params['limit']) if 'limit' in params else len(pods)
+            metadata = {"continue": str(end)} if end < len(pods) else {}
+            return httpx.Response(200, json={"kind": "PodList", "metadata": metadata, "items": pods[start:end]})
+        elif path == '/api/v1/namespaces/default/pods/pod-1':
+            return httpx.Response(200, json=PODS[1])
+        elif path == '/api/v1/namespaces/default/pods/pod-1/log':
+            return httpx.Response(200, text="2025-07-28T01:00:00Z hello\n")
+        elif path == '/api/v1/namespaces/default/events':
+            return httpx.Response(200, json={"kind": "EventList", "metadata": {}, "items": EVENTS})
+        return httpx.Response(404, json={"kind": "Status", "reason": "NotFound"})
+
+
+@pytest.fixture
+def api_server():
+    server = MockApiServer()
+    configuration = client.Configuration(host="https://k8s.example.com")
+    configuration.api_key = {'authorization': 'test-token'}
+    configuration.api_key_prefix = {'authorization': 'Bearer'}
+    with patch.object(async_tools, "HTTP_CLIENT",
+                      httpx.AsyncClient(base_url=configuration.host, transport=httpx.MockTransport(server))), \
+         patch.object(async_tools, "CONFIGURATION", configuration):
+        yield server
+
+
+def test_tools_match_sync_tools():
+    """Each sync tool should have an async version with the same signature and docstring"""
+    assert [fn.__name__ for fn in async_tools.TOOLS] == [fn.__name__ for fn in k8s_tools.TOOLS]
+    for (async_fn, sync_fn) in zip(async_tools.TOOLS, k8s_tools.TOOLS):
+        assert inspect.iscoroutinefunction(async_fn)
+        assert inspect.signature(async_fn) == inspect.signature(sync_fn), async_fn.__name__
+        assert async_fn.__doc__ == sync_fn.__doc__
+
+
+def test_get_pod_summaries(api_server):
+    now = datetime.datetime.now(datetime.timezone.utc)
+    with patch.object(k8s_tools, "LIST_PAGE_SIZE", 2):
+        pods = asyncio.run(async_tools.get_pod_summaries())
+    assert [pod.name for pod in pods] == [pod['metadata']['name'] for pod in PODS]
+    assert pods[3].restarts == 3
+    assert pods[3].model_copy(update={'age': None}) == \
+           k8s_tools.PodSummary(**k8s_tools._pod_json_to_summary(PODS[3], now)).model_copy(update={'age': None})
+    assert len(api_server.requests) == 3
+    assert api_server.requests[0].headers['Authorization'] == 'Bearer test-token'
+    assert api_server.requests[1].url.params['continue'] == '2'
+
+
+def test_get_pod_summaries_with_selectors(api_server):
+    pods = asyncio.run(async_tools.get_pod_summaries("default", label_selector="app=web",
+                                                     field_selector="spec.nodeName=node-1"))
+    assert [pod.name for pod in pods] == ["pod-1", "pod-3"]
+    params = api_server.requests[0].url.params
+    assert params['labelSelector'] == "app=web"
+    assert params['fieldSelector'] == "spec.nodeName=node-1"
+
+
+
+def test_blocking_work_runs_in_threads():
+    """Loading the config and parsing and validating the responses should not run on the event loop"""
+    server = MockApiServer()
+    configuration = client.Configuration(host="https://k8s.example.com")
+    threads = {}
+    def load_configuration():
+        threads['load_configuration'] = threading.get_ident()
+        return configuration
+    json_loads = k8s_tools._json_loads
+    def parse(data):
+        threads['parse'] = threading.get_ident()
+        return json_loads(data)
+    to_summaries = k8s_tools._to_summaries
+    def validate(model, fields):
+        threads['validate'] = threading.get_ident()
+        return to_summaries(model, fields)
+    async def run_test():
+        threads['loop'] = threading.get_ident()
+        pods = await async_tools.get_pod_summaries()
+        await async_tools.close()
+        return pods
+    AsyncClient = httpx.AsyncClient
+    with patch.object(async_tools, "HTTP_CLIENT", None), patch.object(async_tools, "CONFIGURATION", None), \
+         patch.object(k8s_tools, "_load_configuration", load_configuration), \
+         patch.object(k8s_tools, "_json_loads", parse), patch.object(k8s_tools, "_to_summaries", validate), \
+         patch.object(async_tools.httpx, "AsyncClient",
+                      lambda base_url, **kwargs: AsyncClient(base_url=base_url, transport=httpx.MockTransport(server))):
+        pods = asyncio.run(run_test())
+    assert len(pods) == len(PODS)
+    loop_thread = threads.pop('loop')
+    assert set(threads) == {'load_configuration', 'parse', 'validate'}
+    assert loop_thread not in threads.values()
+
+
+def test_get_pod_summaries_columnar(api_server):
+    table = asyncio.run(async_tools.get_pod_summaries("default", label_selector="app=web", format='columnar'))
+    assert table.columns == list(k8s_tools.PodSummary.model_fields)
+    assert [row[0] for row in table.rows] == ["pod-1", "pod-3"]
+    assert all(isinstance(row[table.columns.index('age')], int) for row in table.rows)
+    with pytest.raises(ValueError):
+        asyncio.run(async_tools.get_pod_summaries(format='json')) # type: ignore
+    assert len(api_server.requests) == 1
+
+
+def test_get_pod_summaries_budget(api_server):
+    result = asyncio.run(async_tools.get_pod_summaries(max_items=1))
+    assert [pod.name for pod in result.items] == [PODS[0]['metadata']['name']]
+    assert result.omitted.count == len(PODS) - 1
+    assert sum(result.omitted.by_namespace.values()) == len(PODS) - 1
+
+
+def test_get_pod_summaries_paging(api_server):
+    page = asyncio.run(async_tools.get_pod_summaries(page_size=2))
+    assert [pod.name for pod in page.items] == [pod['metadata']['name'] for pod in PODS[:2]]
+    pages = [page]
+    while pages[-1].next_cursor is not None:
+        pages.append(asyncio.run(async_tools.get_pod_summaries(page_size=2, cursor=pages[-1].next_cursor)))
+    assert [pod.name for page in pages for pod in page.items] == [pod['metadata']['name'] for pod in PODS]
+    assert len(api_server.requests) == len(pages)
+    assert api_server.requests[1].url.params['continue'] == '2'
+    assert api_server.requests[1].url.params['limit'] == '2'
+    # the cursors record the same query as those of the sync tools
+    assert paging.decode_cursor(page.next_cursor, paging.list_query('pods'))['c'] == '2'
+    expired = paging.encode_cursor(paging.list_query('pods'), continue_token="expired")
+    with pytest.raises(ValueError, match="cursor has expired"):
+        asyncio.run(async_tools.get_pod_summaries(page_size=2, cursor=expired))
+
+
+def test_get_pod_details(api_server):
+    statuses = asyncio.run(async_tools.get_pod_container_statuses("pod-1", "default"))
+    assert [(s.container_name, s.restart_count, s.state.state_name) for s in statuses] == [("app", 1, "Running")]
+    spec = asyncio.run(async_tools.get_pod_spec("pod-1", "default"))
+    assert spec['node_name'] == "node-1"
+    assert spec['containers'][0]['image'] == "nginx"
+    events = asyncio.run(async_tools.get_pod_events("pod-1", "default"))
+    assert [(e.type, e.reason, e.object) for e in events] == [("Warning", "BackOff", "pod-1")]
+    assert api_server.requests[-1].url.params['fieldSelector'] == "involvedObject.name=pod-1,involvedObject.kind=Pod"
+    logs = asyncio.run(async_tools.get_logs_for_pod_and_container("pod-1", "default", "app"))
+    assert logs == "2025-07-28T01:00:00Z hello\n"
+    assert api_server.requests[-1].url.params['container'] == "app"
+
+
+def test_errors(api_server):
+    with pytest.raises(k8s_tools.K8sApiError, match="not found"):
+        asyncio.run(async_tools.get_pod_spec("missing", "default"))
+    with pytest.raises(k8s_tools.K8sApiError, match="404"):
+        asyncio.run(async_tools.get_node_summaries())
+
+
+def test_event_index_errors(api_server):
+    class FailingIndex:
+        def get(self, namespace, kind, name):
+            raise client.ApiException(status=403, reason="Forbidden")
+    with patch.object(k8s_tools, 'EVENT_INDEX', FailingIndex()):
+        with pytest.raises(k8s_tools.K8sApiError, match="events for pod 'pod-1'"):
+            asyncio.run(async_tools.get_pod_events("pod-1", "default"))
+        with pytest.raises(k8s_tools.K8sApiError, match="events for Deployment 'web'"):
+            asyncio.run(async_tools.get_object_events("Deployment", "web", "default"))
+
+
+def test_stream_logs(api_server):
+    async def collect():
+        return [line async for line in async_tools.stream_logs_for_pod_and_container(
+                    "pod-1", "default", "app", since_seconds=30, follow=True)]
+    assert asyncio.run(collect()) == ["2025-07-28T01:00:00Z hello"]
+    params = api_server.requests[-1].url.params
+    assert params['follow'] == 'true'
+    assert params['sinceSeconds'] == '30'
+    assert 'tailLines' not in params
+
+
+def test_search_pod_logs(api_server):
+    matches = asyncio.run(async_tools.search_pod_logs("pod-1", "hel+o", namespace="default"))
+    assert [(m.line_number, m.line) for m in matches] == [(1, "hello")]
+
+
+def test_get_logs_for_workload(api_server):
+    logs = asyncio.run(async_tools.get_logs_for_workload("default", label_selector="app=web"))
+    assert [(l.pod_name, l.error) for l in logs] == [("pod-1", None), ("pod-3", "Error fetching logs: (404) Not Found: "
+                                                     '{"kind":"Status","reason":"NotFound"}')]
+    assert logs[0].logs == "2025-07-28T01:00:00Z hello\n"
+
+
+def test_get_namespace_container_statuses(api_server):
+    with patch.object(k8s_tools, "LIST_PAGE_SIZE", 2):
+        statuses = asyncio.run(async_tools.get_namespace_container_statuses(min_restarts=2))
+    assert [(s.pod_name, s.namespace, s.restart_count) for s in statuses] == \
+           [("pod-2", "test", 2), ("pod-3", "default", 3), ("pod-4", "test", 4)]
+    assert len(api_server.requests) == 3
+    statuses = asyncio.run(async_tools.get_namespace_container_statuses("default", only_not_ready=True))
+    assert statuses == []
+    # only the statuses within max_items are turned into models
+    with patch.object(k8s_tools, "_to_summaries", wraps=k8s_tools._to_summaries) as to_summaries:
+        result = asyncio.run(async_tools.get_namespace_container_statuses(max_items=1))
+    assert [s.pod_name for s in result.items] == ["pod-0"]
+    assert result.omitted.count == len(PODS) - 1
+    assert [len(call.args[1]) for call in to_summaries.call_args_list] == [1]
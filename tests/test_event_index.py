@@ -0,0 +1,79 @@
+"""Tests for the event index. The list function is mocked.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+import datetime
+
+from k8stools import k8s_tools
+from k8stools.event_index import EventIndex
+
+
+def _event(kind, name, reason):
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return SimpleNamespace(
+        last_timestamp=now - datetime.timedelta(minutes=5),
+        type="Normal",
+        reason=reason,
+        involved_object=SimpleNamespace(kind=kind, name=name),
+        message=f"{kind} {name}: {reason}",
+    )
+
+
+EVENTS = {
+    "default": [_event("Pod", "web-1", "Started"),
+                _event("Pod", "web-1", "BackOff"),
+                _event("Deployment", "web", "ScalingReplicaSet"),
+                _event("Node", "node-1", "NodeNotReady")],
+    "test": [_event("Pod", "web-1", "Killing")],
+}
+
+
+class MockEventApi:
+    def __init__(self):
+        self.calls = []
+
+    def list_namespaced_event(self, namespace, limit=None, _continue=None, field_selector=None):
+        self.calls.append((namespace, field_selector))
+        return SimpleNamespace(items=list(EVENTS.get(namespace, [])), metadata=SimpleNamespace(_continue=None))
+
+
+def test_lookups_share_one_list():
+    api = MockEventApi()
+    index = EventIndex(lambda namespace: api.list_namespaced_event(namespace).items)
+    assert [e.reason for e in index.get("default", "Pod", "web-1")] == ["Started", "BackOff"]
+    assert [e.reason for e in index.get("default", "Deployment", "web")] == ["ScalingReplicaSet"]
+    assert [e.reason for e in index.get("default", "Node", "node-1")] == ["NodeNotReady"]
+    assert index.get("default", "Pod", "missing") == []
+    assert [e.reason for e in index.get("test", "Pod", "web-1")] == ["Killing"]
+    assert api.calls == [("default", None), ("test", None)]
+
+
+def test_ttl_and_invalidate():
+    api = MockEventApi()
+    index = EventIndex(lambda namespace: api.list_namespaced_event(namespace).items, ttl_seconds=60)
+    index.get("default", "Pod", "web-1")
+    index.invalidate("default")
+    index.get("default", "Pod", "web-1")
+    assert len(api.calls) == 2
+    with patch("k8stools.event_index.time.monotonic", return_value=1e12):
+        index.get("default", "Pod", "web-1")
+    assert len(api.calls) == 3
+
+
+def test_tools_use_event_index():
+    api = MockEventApi()
+    with patch.object(k8s_tools, "K8S", api), patch.object(k8s_tools, "EVENT_INDEX", None):
+        # Without the index, each call does a list with a field selector
+        k8s_tools.get_object_events("Deployment", "web", "default")
+        assert api.calls[-1] == ("default", "involvedObject.name=web,involvedObject.kind=Deployment")
+        k8s_tools.enable_event_index(ttl_seconds=60)
+        try:
+            events = k8s_tools.get_object_events("Deployment", "web", "default")
+            assert [(e.reason, e.object) for e in events] == [("ScalingReplicaSet", "web")]
+            events = k8s_tools.get_pod_events("web-1", "default")
+            assert [e.reason for e in events] == ["Started", "BackOff"]
+            assert api.calls[-1] == ("default", None)
+            assert len(api.calls) == 2
+        finally:
+            k8s_tools.disable_event_index()
@@ -0,0 +1,90 @@
+"""Tests for the fake API server. These run the real kubernetes client (and k8s_tools)
+against the server over HTTP.
+"""
+
+import os
+import time
+import urllib.request
+
+import pytest
+from kubernetes.client.exceptions import ApiException
+
+from k8stools import async_tools, fake_apiserver, k8s_tools, mock_tools
+from k8stools.fake_apiserver import FakeApiServer
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    # configure_k8s_tools() sets $KUBECONFIG; setting it here first makes monkeypatch restore it
+    monkeypatch.setenv('KUBECONFIG', str(tmp_path/'kubeconfig'))
+    monkeypatch.setattr(k8s_tools, 'LIST_PAGE_SIZE', 60)
+    with FakeApiServer(num_pods=200, num_nodes=5, num_namespaces=3, max_page_size=50) as server:
+        server.configure_k8s_tools(str(tmp_path/'kubeconfig'))
+        yield server
+    k8s_tools.API_CLIENT = None
+    k8s_tools.K8S = None
+    k8s_tools.APPS_V1_API = None
+    async_tools.HTTP_CLIENT = None
+
+
+def test_build_cluster_objects():
+    data = mock_tools.generate_cluster_data(num_pods=50, num_nodes=3, num_namespaces=2, seed=1)
+    objects = fake_apiserver.build_cluster_objects(data)
+    assert len(objects['pods']) == 50
+    assert len(objects['nodes']) == 3
+    pod = objects['pods'][0]
+    assert pod['metadata']['uid'] and pod['metadata']['namespace']
+    assert pod['spec']['containers'][0]['image']
+
+
+def test_list_modes_agree(server, monkeypatch):
+    summaries = k8s_tools.get_pod_summaries()
+    assert len(summaries) == 200
+    monkeypatch.setattr(k8s_tools, 'LIST_RESPONSE_MODE', 'json')
+    # ages and restart times are computed from the current time, so compare the other fields
+    def without_age(pods):
+        return [p.model_dump(exclude={'age', 'last_restart'}) for p in pods]
+    assert without_age(k8s_tools.get_pod_summaries()) == without_age(summaries)
+    namespace = summaries[0].namespace
+    assert without_age(k8s_tools.get_pod_summaries(namespace)) == \
+        without_age([s for s in summaries if s.namespace == namespace])
+    # the roles of the nodes round-trip through their labels
+    assert [(n.name, n.roles) for n in k8s_tools.get_node_summaries()] == \
+        [(n.name, n.roles) for n in server.data['nodes']]
+
+
+def test_selectors(server):
+    pod = k8s_tools.get_pod_summaries()[0]
+    labels = server.data['labels']
+    app = labels[('pods', pod.namespace, pod.name)]['app']
+    pods = k8s_tools.get_pod_summaries(pod.namespace, label_selector=f"app={app}")
+    assert pod.name in [p.name for p in pods]
+    assert all(labels[('pods', p.namespace, p.name)]['app'] == app for p in pods)
+
+
+def test_pod_tools(server):
+    pods = k8s_tools.get_pod_summaries()
+    pod = pods[0]
+    statuses = k8s_tools.get_pod_container_statuses(pod.name, pod.namespace)
+    assert len(statuses) == pod.total_containers
+    assert k8s_tools.get_pod_spec(pod.name, pod.namespace)['containers']
+    logs = k8s_tools.get_logs_for_pod_and_container(pod.name, pod.namespace)
+    assert logs and logs.endswith("\n")
+    failing = [p for p in pods if server.data['pod_details'][(p.namespace, p.name)]['mode'] != 'Running']
+    assert failing, "expected the synthetic cluster to have some failing pods"
+    events = k8s_tools.get_pod_events(failing[0].name, failing[0].namespace)
+    assert events and all(e.object == failing[0].name for e in events)
+    with pytest.raises((ApiException, k8s_tools.K8sApiError)):
+        k8s_tools.get_pod_spec("no-such-pod", pod.namespace)
+
+
+def test_latency_and_request_count(tmp_path):
+    with FakeApiServer(num_pods=10, num_nodes=1, num_namespaces=1, latency=0.05) as server:
+        server.write_kubeconfig(str(tmp_path/'kubeconfig'))
+        assert server.request_count == 0
+        start = time.monotonic()
+        with urllib.request.urlopen(server.url + "/api/v1/namespaces") as response:
+            assert response.status == 200
+        assert time.monotonic() - start >= 0.05
+        assert server.request_count == 1
+        assert os.path.exists(tmp_path/'kubeconfig')
@@ -0,0 +1,200 @@
+"""Tests for the watch-backed informers. The list function and the watch are mocked.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+import datetime
+import pytest
+
+from kubernetes.client import ApiException
+from k8stools import informer as informer_module
+from k8stools import k8s_tools
+from k8stools.informer import Informer
+
+
+def _pod(name, namespace, resource_version="1"):
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return SimpleNamespace(
+        metadata=SimpleNamespace(name=name, namespace=namespace, resource_version=resource_version,
+                                 creation_timestamp=now - datetime.timedelta(hours=1)),
+        spec=SimpleNamespace(containers=[SimpleNamespace(name="c")], node_name="node-1"),
+        status=SimpleNamespace(container_statuses=[], pod_ip="10.0.0.1"),
+    )
+
+
+class MockLister:
+    def __init__(self, items, resource_version="10"):
+        self.items = items
+        self.resource_version = resource_version
+        self.calls = 0
+
+    def __call__(self, **kwargs):
+        self.calls += 1
+        return SimpleNamespace(items=list(self.items),
+                               metadata=SimpleNamespace(resource_version=self.resource_version))
+
+
+class MockWatch:
+    """Replaces kubernetes.watch.Watch. Yields the events in EVENTS, or raises
+    RAISE if set."""
+    EVENTS: list = []
+    RAISE = None
+
+    def __init__(self):
+        self.kwargs = None
+
+    def stream(self, func, **kwargs):
+        self.kwargs = kwargs
+        if MockWatch.RAISE is not None:
+            raise MockWatch.RAISE
+        yield from MockWatch.EVENTS
+
+    def stop(self):
+        pass
+
+
+@pytest.fixture
+def mock_watch():
+    MockWatch.EVENTS = []
+    MockWatch.RAISE = None
+    with patch.object(informer_module.watch, "Watch", MockWatch):
+        yield MockWatch
+
+
+def test_relist_populates_store():
+    lister = MockLister([_pod("b", "default"), _pod("a", "default"), _pod("c", "kube-system")])
+    inf = Informer("pods", lister)
+    assert not inf.synced
+    assert inf.staleness() is None
+    inf.relist()
+    assert inf.synced
+    assert inf.resource_version == "10"
+    assert [p.metadata.name for p in inf.list()] == ["a", "b", "c"]
+    assert [p.metadata.name for p in inf.list("kube-system")] == ["c"]
+    assert inf.staleness() < 5
+
+
+def test_relist_in_pages():
+    pods = [_pod(f"pod-{i}", "default") for i in range(5)]
+    calls = []
+    def list_fn(limit=None, _continue=None):
+        calls.append(_continue)
+        start = int(_continue) if _continue else 0
+        end = start + limit
+        return SimpleNamespace(items=pods[start:end],
+                               metadata=SimpleNamespace(_continue=str(end) if end < len(pods) else None,
+                                                        resource_version="7"))
+    inf = Informer("pods", list_fn, page_size=2)
+    inf.relist()
+    assert calls == [None, "2", "4"]
+    assert len(inf.list()) == 5
+    assert inf.resource_version == "7"
+
+
+def test_watch_events_update_store(mock_watch):
+    lister = MockLister([_pod("a", "default"), _pod("b", "default")])
+    inf = Informer("pods", lister)
+    inf.relist()
+    mock_watch.EVENTS = [
+        {'type': 'ADDED', 'object': _pod("c", "default", "11"), 'raw_object': {}},
+        {'type': 'MODIFIED', 'object': _pod("a", "default", "12"), 'raw_object': {}},
+        {'type': 'DELETED', 'object': _pod("b", "default", "13"), 'raw_object': {}},
+        {'type': 'BOOKMARK', 'object': None,
+         'raw_object': {'metadata': {'resourceVersion': '20'}}},
+    ]
+    inf.watch_once()
+    names = [p.metadata.name for p in inf.list()]
+    assert names == ["a", "c"]
+    assert inf.list()[0].metadata.resource_version == "12"
+    assert inf.resource_version == "20"
+    assert lister.calls == 1
+
+
+def test_watch_gone_relists(mock_watch):
+    lister = MockLister([_pod("a", "default")])
+    inf = Informer("pods", lister)
+    inf.relist()
+    lister.items = [_pod("a", "default"), _pod("z", "default")]
+    lister.resource_version = "50"
+    mock_watch.RAISE = ApiException(status=410, reason="Gone")
+    inf.watch_once()
+    assert lister.calls == 2
+    assert inf.relists == 2
+    assert inf.resource_version == "50"
+    assert [p.metadata.name for p in inf.list()] == ["a", "z"]
+
+
+def test_watch_other_errors_propagate(mock_watch):
+    inf = Informer("pods", MockLister([]))
+    inf.relist()
+    mock_watch.RAISE = ApiException(status=500, reason="Internal error")
+    with pytest.raises(ApiException):
+        inf.watch_once()
+
+
+def test_quiet_watch_is_not_stale(mock_watch):
+    inf = Informer("pods", MockLister([_pod("a", "default")]))
+    inf.relist()
+    inf._last_sync -= 1000
+    assert inf.staleness() > 1000
+    staleness_during_watch = []
+    class QuietWatch:
+        def __iter__(self):
+            staleness_during_watch.append(inf.staleness())
+            return iter([])
+    mock_watch.EVENTS = QuietWatch()
+    inf.watch_once()
+    # the store is current while the watch is open, and as of when it ended
+    assert staleness_during_watch == [0.0]
+    assert inf.staleness() < 5
+    # but not if the watch failed
+    inf._last_sync -= 1000
+    mock_watch.RAISE = ApiException(status=500, reason="Internal error")
+    with pytest.raises(ApiException):
+        inf.watch_once()
+    assert inf.staleness() > 1000
+
+
+def test_status():
+    inf = Informer("pods", MockLister([_pod("a", "default")]))
+    status = inf.status()
+    assert status.kind == "pods"
+    assert status.synced is False
+    assert status.staleness_seconds is None
+    inf.relist()
+    status = inf.status()
+    assert status.synced is True
+    assert status.object_count == 1
+    assert status.resource_version == "10"
+    assert status.relists == 1
+
+
+def test_pod_summaries_read_from_informer():
+    inf = Informer("pods", MockLister([_pod("cached-1", "default"), _pod("cached-2", "other")]))
+    inf.relist()
+    def fail(**kwargs):
+        raise AssertionError("Should not call the API when the informer is synced")
+    original_k8s = k8s_tools.K8S
+    k8s_tools.K8S = SimpleNamespace(list_pod_for_all_namespaces=fail, list_namespaced_pod=fail)
+    k8s_tools.INFORMERS['pods'] = inf
+    try:
+        pods = k8s_tools.get_pod_summaries()
+        assert [p.name for p in pods] == ["cached-1", "cached-2"]
+        pods = k8s_tools.get_pod_summaries("other")
+        assert [p.name for p in pods] == ["cached-2"]
+        assert k8s_tools.get_informer_status()[0].object_count == 2
+    finally:
+        k8s_tools.INFORMERS.clear()
+        k8s_tools.K8S = original_k8s
+
+
+def test_stale_informer_is_not_used():
+    inf = Informer("pods", MockLister([_pod("cached-1", "default")]))
+    inf.relist()
+    k8s_tools.INFORMERS['pods'] = inf
+    try:
+        with patch.object(inf, "staleness", return_value=k8s_tools.INFORMER_MAX_STALENESS + 1):
+            assert k8s_tools._get_informer_items('pods') is None
+        assert k8s_tools._get_informer_items('nodes') is None
+    finally:
+        k8s_tools.INFORMERS.clear()
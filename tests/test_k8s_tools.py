@@ -2,13 +2,51 @@
 """
 
 import datetime
+import json
+import subprocess
+import sys
+import time
 from types import SimpleNamespace
-from k8stools import k8s_tools
+from k8stools import k8s_tools, paging
 from unittest.mock import patch
+import pydantic_core
 import pytest
 
+
+def _page(items, limit=None, _continue=None):
+    """Return one page of items, emulating limit/continue on a LIST call. The
+    continue token is just the index of the next item."""
+    start = int(_continue) if _continue else 0
+    end = start + limit if limit else len(items)
+    next_token = str(end) if end < len(items) else None
+    return SimpleNamespace(items=items[start:end],
+                           metadata=SimpleNamespace(_continue=next_token, resource_version="1"))
+
+
+class MockLogResponse:
+    """Stands in for the urllib3 response returned with _preload_content=False"""
+    def __init__(self, chunks, error=None):
+        self.chunks = chunks
+        self.error = error
+        self.closed = False
+
+    def stream(self, amt):
+        yield from self.chunks
+        if self.error is not None:
+            raise self.error
+
+    def close(self):
+        self.closed = True
+
+    def release_conn(self):
+        pass
+
+
 class MockK8S:
-    def list_namespace(self):
+    # keyword arguments of the most recent list call, used to check that selectors are passed through
+    last_list_kwargs = {}
+
+    def list_namespace(self, limit=None, _continue=None):
         now = datetime.datetime.now(datetime.timezone.utc)
         ns1 = SimpleNamespace(
             metadata=SimpleNamespace(name="default", creation_timestamp=now - datetime.timedelta(days=5)),
@@ -18,10 +56,10 @@ class MockK8S:
             metadata=SimpleNamespace(name="test", creation_timestamp=now - datetime.timedelta(days=2)),
             status=SimpleNamespace(phase="Active")
         )
-        return SimpleNamespace(items=[ns1, ns2])
+        return _page([ns1, ns2], limit, _continue)
 
-    def list_node(self):
-        return self._mock_nodes()
+    def list_node(self, limit=None, _continue=None):
+        return _page(self._mock_nodes().items, limit, _continue)
 
     def _mock_nodes(self):
         now = datetime.datetime.now(datetime.timezone.utc)
@@ -104,12 +142,14 @@ class MockK8S:
         
         return SimpleNamespace(items=[node1, node2, node3])
 
-    def list_pod_for_all_namespaces(self):
-        return self._mock_pods()
+    def list_pod_for_all_namespaces(self, limit=None, _continue=None, **kwargs):
+        MockK8S.last_list_kwargs = kwargs
+        return _page(self._mock_pods().items, limit, _continue)
 
-    def list_namespaced_pod(self, namespace):
+    def list_namespaced_pod(self, namespace, limit=None, _continue=None, **kwargs):
+        MockK8S.last_list_kwargs = kwargs
         pods = [pod for pod in self._mock_pods().items if pod.metadata.namespace == namespace]
-        return SimpleNamespace(items=pods)
+        return _page(pods, limit, _continue)
 
     def read_namespaced_pod(self, name, namespace):
         for pod in self._mock_pods().items:
@@ -135,18 +175,29 @@ class MockK8S:
         )
         return SimpleNamespace(items=[event1, event2])
 
-    def read_namespaced_pod_log(self, name, namespace, container=None, follow=False, _preload_content=True, timestamps=True, tail_lines=None, limit_bytes=None):
+    # keyword arguments of the most recent log call
+    last_log_kwargs = {}
+
+    def read_namespaced_pod_log(self, name, namespace, container=None, follow=False, _preload_content=True, timestamps=True, tail_lines=None, limit_bytes=None, **kwargs):
+        MockK8S.last_log_kwargs = dict(container=container, follow=follow, tail_lines=tail_lines,
+                                       limit_bytes=limit_bytes, **kwargs)
         # Return a sample log string for testing
         if name == "pod-1" and namespace == "default" and container == "container-1":
-            return "2025-07-12T00:00:00Z container-1 log line 1\n2025-07-12T00:01:00Z container-1 log line 2"
-        return ""
+            logs = "2025-07-12T00:00:00Z container-1 log line 1\n2025-07-12T00:01:00Z container-1 log line 2"
+        else:
+            logs = ""
+        if not _preload_content:
+            return MockLogResponse([logs.encode('utf-8')[i:i+7] for i in range(0, len(logs), 7)])
+        return logs
 
-    def list_service_for_all_namespaces(self):
-        return self._mock_services()
+    def list_service_for_all_namespaces(self, limit=None, _continue=None, **kwargs):
+        MockK8S.last_list_kwargs = kwargs
+        return _page(self._mock_services().items, limit, _continue)
 
-    def list_namespaced_service(self, namespace):
+    def list_namespaced_service(self, namespace, limit=None, _continue=None, **kwargs):
+        MockK8S.last_list_kwargs = kwargs
         services = [svc for svc in self._mock_services().items if svc.metadata.namespace == namespace]
-        return SimpleNamespace(items=services)
+        return _page(services, limit, _continue)
 
     def _mock_pods(self):
         now = datetime.datetime.now(datetime.timezone.utc)
@@ -251,12 +302,20 @@ class MockK8S:
 
 
 class MockAppsV1Api:
-    def list_namespaced_deployment(self, namespace):
+    def read_namespaced_deployment(self, name, namespace):
+        for deployment in self._mock_deployments().items:
+            if deployment.metadata.name == name and deployment.metadata.namespace == namespace:
+                return deployment
+        raise k8s_tools.ApiException(status=404, reason="Not Found")
+
+    def list_namespaced_deployment(self, namespace, limit=None, _continue=None, **kwargs):
+        MockK8S.last_list_kwargs = kwargs
         deployments = [dep for dep in self._mock_deployments().items if dep.metadata.namespace == namespace]
-        return SimpleNamespace(items=deployments)
+        return _page(deployments, limit, _continue)
     
-    def list_deployment_for_all_namespaces(self):
-        return self._mock_deployments()
+    def list_deployment_for_all_namespaces(self, limit=None, _continue=None, **kwargs):
+        MockK8S.last_list_kwargs = kwargs
+        return _page(self._mock_deployments().items, limit, _continue)
     
     def _mock_deployments(self):
         now = datetime.datetime.now(datetime.timezone.utc)
@@ -268,7 +327,10 @@ class MockAppsV1Api:
                 namespace="default",
                 creation_timestamp=now - datetime.timedelta(days=2)
             ),
-            spec=SimpleNamespace(replicas=3),
+            spec=SimpleNamespace(replicas=3, selector=k8s_tools.client.V1LabelSelector(
+                match_labels={"app": "nginx"},
+                match_expressions=[k8s_tools.client.V1LabelSelectorRequirement(key="tier", operator="In",
+                                                                               values=["web", "edge"])])),
             status=SimpleNamespace(
                 ready_replicas=2,
                 updated_replicas=3,
@@ -399,6 +461,29 @@ def test_get_pod_container_statuses():
         assert cs.restart_count == 1
         assert hasattr(cs, "last_state")
 
+def test_get_namespace_container_statuses():
+    with patch.object(k8s_tools.client, "V1Pod", SimpleNamespace):
+        statuses = k8s_tools.get_namespace_container_statuses()
+        assert [(cs.pod_name, cs.namespace) for cs in statuses] == [("pod-1", "default"), ("pod-2", "test"),
+                                                                    ("pod-2", "test")]
+        statuses = k8s_tools.get_namespace_container_statuses("test", label_selector="app=web")
+        assert [cs.pod_name for cs in statuses] == ["pod-2", "pod-2"]
+        assert MockK8S.last_list_kwargs == {"label_selector": "app=web"}
+        assert k8s_tools.get_namespace_container_statuses(only_not_ready=True) == []
+        assert len(k8s_tools.get_namespace_container_statuses(min_restarts=1)) == 3
+        assert k8s_tools.get_namespace_container_statuses(min_restarts=2) == []
+        with patch.object(k8s_tools, "_to_summaries", wraps=k8s_tools._to_summaries) as to_summaries:
+            result = k8s_tools.get_namespace_container_statuses(max_items=1)
+        assert [cs.pod_name for cs in result.items] == ["pod-1"]
+        assert result.omitted.count == 2
+        assert [len(call.args[1]) for call in to_summaries.call_args_list] == [1]
+        # With an informer, the pods come from its cache rather than a list call
+        pods = MockK8S()._mock_pods().items
+        with patch.object(k8s_tools, "_get_informer_items", return_value=pods[:1]) as get_items:
+            statuses = k8s_tools.get_namespace_container_statuses("default")
+        get_items.assert_called_once_with('pods', "default")
+        assert [cs.pod_name for cs in statuses] == ["pod-1"]
+
 def test_get_pod_events():
     events = k8s_tools.get_pod_events("pod-1", "default")
     assert len(events) == 2
@@ -425,6 +510,46 @@ def test_retrieve_logs_from_pod_and_container():
     assert isinstance(logs, str)
     assert "container-1 log line 1" in logs
     assert "container-1 log line 2" in logs
+    assert MockK8S.last_log_kwargs['tail_lines'] == 1000
+    assert MockK8S.last_log_kwargs['limit_bytes'] == 1024*1024
+    assert 'since_seconds' not in MockK8S.last_log_kwargs
+
+
+def test_logs_since_and_limits():
+    k8s_tools.get_logs_for_pod_and_container("pod-1", "default", "container-1", since_seconds=30,
+                                             tail_lines=None, limit_bytes=4096)
+    assert MockK8S.last_log_kwargs['since_seconds'] == 30
+    assert MockK8S.last_log_kwargs['tail_lines'] is None
+    assert MockK8S.last_log_kwargs['limit_bytes'] == 4096
+    since_time = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(minutes=5)
+    k8s_tools.get_logs_for_pod_and_container("pod-1", "default", "container-1", since_time=since_time)
+    assert 300 <= MockK8S.last_log_kwargs['since_seconds'] <= 302
+    with pytest.raises(k8s_tools.K8sApiError):
+        k8s_tools.get_logs_for_pod_and_container("pod-1", "default", since_seconds=30, since_time=since_time)
+
+
+def test_stream_logs():
+    lines = list(k8s_tools.stream_logs_for_pod_and_container("pod-1", "default", "container-1", tail_lines=10))
+    assert lines == ["2025-07-12T00:00:00Z container-1 log line 1", "2025-07-12T00:01:00Z container-1 log line 2"]
+    assert MockK8S.last_log_kwargs['follow'] is False
+    assert MockK8S.last_log_kwargs['tail_lines'] == 10
+    assert '_request_timeout' not in MockK8S.last_log_kwargs
+
+
+def test_stream_logs_follow():
+    """When following, a read timeout ends the stream, and so does the deadline"""
+    import urllib3
+    response = MockLogResponse([b"line 1\nline", b" 2\n"], error=urllib3.exceptions.ReadTimeoutError(None, None, "timeout"))
+    with patch.object(k8s_tools.K8S, "read_namespaced_pod_log", return_value=response) as read_log:
+        lines = list(k8s_tools.stream_logs_for_pod_and_container("pod-1", follow=True, follow_timeout_seconds=5))
+    assert lines == ["line 1", "line 2"]
+    assert read_log.call_args.kwargs['follow'] is True
+    assert read_log.call_args.kwargs['_request_timeout'][1] == 5
+    assert response.closed
+    response = MockLogResponse([f"line {i}\n".encode('utf-8') for i in range(1000)])
+    with patch.object(k8s_tools.K8S, "read_namespaced_pod_log", return_value=response):
+        lines = list(k8s_tools.stream_logs_for_pod_and_container("pod-1", follow=True, follow_timeout_seconds=0))
+    assert lines == ["line 0"]
 
 def test_deployment_summaries():
     deployments = k8s_tools.get_deployment_summaries()
@@ -512,3 +637,550 @@ def test_service_summaries():
     assert default_services[0].namespace == "default"
     assert default_services[1].name == "external-service" 
     assert default_services[1].namespace == "default"
+
+
+def test_list_in_pages():
+    """With a page size smaller than the number of objects, all pages should be fetched."""
+    calls = []
+    def list_fn(**kwargs):
+        calls.append(kwargs)
+        return _page(list(range(7)), **kwargs)
+    with patch.object(k8s_tools, "LIST_PAGE_SIZE", 3):
+        assert list(k8s_tools._list_in_pages(list_fn)) == list(range(7))
+    assert [call.get('_continue') for call in calls] == [None, '3', '6']
+    assert all(call['limit'] == 3 for call in calls)
+    calls.clear()
+    with patch.object(k8s_tools, "LIST_PAGE_SIZE", 0):
+        assert list(k8s_tools._list_in_pages(list_fn)) == list(range(7))
+    assert calls == [{}]
+
+
+def test_summaries_with_small_pages():
+    """The summaries should not depend on the page size."""
+    with patch.object(k8s_tools, "LIST_PAGE_SIZE", 1):
+        assert [pod.name for pod in k8s_tools.get_pod_summaries()] == ["pod-1", "pod-2"]
+        assert len(k8s_tools.get_node_summaries()) == 3
+        assert len(k8s_tools.get_namespaces()) == 2
+        assert len(k8s_tools.get_service_summaries()) == 3
+        assert len(k8s_tools.get_service_summaries("default")) == 2
+        assert len(k8s_tools.get_deployment_summaries()) == 2
+
+
+def test_cursor_paging():
+    """Each page should be a single LIST call, continuing from the cursor"""
+    page = k8s_tools.get_node_summaries(page_size=2)
+    assert isinstance(page, k8s_tools.SummaryPage)
+    assert [node.name for node in page.items] == ["control-plane-1", "worker-1"]
+    assert page.next_cursor is not None
+    last_page = k8s_tools.get_node_summaries(page_size=2, cursor=page.next_cursor)
+    assert [node.name for node in last_page.items] == ["worker-2"]
+    assert last_page.next_cursor is None
+    table = k8s_tools.get_pod_summaries(page_size=1, format='columnar')
+    assert [row[0] for row in table.rows] == ["pod-1"]
+    # the page size defaults to paging.DEFAULT_PAGE_SIZE
+    assert [pod.name for pod in k8s_tools.get_pod_summaries(cursor=table.next_cursor).items] == ["pod-2"]
+    with pytest.raises(ValueError, match="different query"):
+        k8s_tools.get_pod_summaries("default", cursor=table.next_cursor)
+    with pytest.raises(ValueError):
+        k8s_tools.get_pod_summaries(cursor="not a cursor")
+    with pytest.raises(ValueError):
+        k8s_tools.get_pod_summaries(page_size=10, max_items=5)
+    # the API server rejects continue tokens that have expired with 410 Gone
+    with patch.object(k8s_tools.K8S, "list_node", side_effect=k8s_tools.ApiException(status=410, reason="Gone")):
+        with pytest.raises(ValueError, match="cursor has expired"):
+            k8s_tools.get_node_summaries(page_size=2, cursor=page.next_cursor)
+        with pytest.raises(k8s_tools.K8sApiError):
+            k8s_tools.get_node_summaries(page_size=2)
+
+
+def test_cursors_match_async_and_mock_tools():
+    """The cursors record the same query for the sync, async and mock tools"""
+    page = k8s_tools.get_pod_summaries(label_selector="app=web", page_size=1)
+    assert page.next_cursor is not None
+    assert paging.decode_cursor(page.next_cursor, paging.list_query('pods', None, "app=web"))['c'] == "1"
+
+
+def test_cursor_paging_with_informer():
+    """With an informer, the pages should come from a snapshot of its objects"""
+    nodes = k8s_tools.K8S.list_node().items
+    with patch.object(k8s_tools, "_get_informer_items", return_value=nodes) as get_items:
+        page = k8s_tools.get_node_summaries(page_size=2)
+        get_items.return_value = []
+        last_page = k8s_tools.get_node_summaries(page_size=2, cursor=page.next_cursor)
+    assert [node.name for node in page.items + last_page.items] == ["control-plane-1", "worker-1", "worker-2"]
+    assert last_page.next_cursor is None
+    assert get_items.call_count == 1
+
+
+def test_selectors_passed_to_api():
+    k8s_tools.get_pod_summaries(label_selector="app=checkout", field_selector="spec.nodeName=node-1")
+    assert MockK8S.last_list_kwargs == {"label_selector": "app=checkout", "field_selector": "spec.nodeName=node-1"}
+    k8s_tools.get_pod_summaries("default", label_selector="app=checkout")
+    assert MockK8S.last_list_kwargs == {"label_selector": "app=checkout"}
+    k8s_tools.get_service_summaries(field_selector="spec.type=LoadBalancer")
+    assert MockK8S.last_list_kwargs == {"field_selector": "spec.type=LoadBalancer"}
+    k8s_tools.get_deployment_summaries("default", label_selector="tier in (web)")
+    assert MockK8S.last_list_kwargs == {"label_selector": "tier in (web)"}
+    # no selectors should result in no selector arguments
+    k8s_tools.get_pod_summaries()
+    assert MockK8S.last_list_kwargs == {}
+
+
+# Raw API objects (as returned by the API server) for testing the "json" response mode.
+RAW_NAMESPACES = [
+    {"metadata": {"name": "default", "creationTimestamp": "2025-07-01T10:00:00Z"}, "status": {"phase": "Active"}},
+    {"metadata": {"name": "old", "creationTimestamp": "2025-06-01T10:00:00Z"}, "status": {"phase": "Terminating"}},
+]
+
+RAW_NODES = [
+    {"metadata": {"name": "control-plane-1", "creationTimestamp": "2025-07-01T10:00:00Z",
+                  "labels": {"node-role.kubernetes.io/control-plane": "", "node-role.kubernetes.io/master": "",
+                             "kubernetes.io/hostname": "control-plane-1"}},
+     "status": {"conditions": [{"type": "MemoryPressure", "status": "False"}, {"type": "Ready", "status": "True"}],
+                "addresses": [{"type": "InternalIP", "address": "192.168.1.10"},
+                              {"type": "ExternalIP", "address": "203.0.113.10"}],
+                "nodeInfo": {"kubeletVersion": "v1.28.2", "osImage": "Ubuntu 22.04.3 LTS",
+                             "kernelVersion": "5.15.0-78-generic", "containerRuntimeVersion": "containerd://1.7.2",
+                             "architecture": "amd64", "bootID": "b", "kubeProxyVersion": "v1.28.2",
+                             "machineID": "m", "operatingSystem": "linux", "systemUUID": "s"}}},
+    {"metadata": {"name": "worker-1", "creationTimestamp": "2025-07-02T10:00:00Z",
+                  "labels": {"kubernetes.io/role": "worker"}},
+     "status": {"conditions": [{"type": "Ready", "status": "Unknown"}]}},
+    {"metadata": {"name": "worker-2"}},
+]
+
+RAW_PODS = [
+    {"metadata": {"name": "pod-1", "namespace": "default", "creationTimestamp": "2025-07-27T10:00:00Z"},
+     "spec": {"containers": [{"name": "c1", "image": "nginx"}, {"name": "c2", "image": "busybox"}],
+              "nodeName": "node-1"},
+     "status": {"phase": "Running", "podIP": "10.244.0.6",
+                "containerStatuses": [
+                    {"name": "c1", "image": "nginx", "imageID": "x", "ready": True, "restartCount": 3,
+                     "lastState": {"terminated": {"exitCode": 137, "reason": "OOMKilled",
+                                                  "startedAt": "2025-07-28T01:00:00Z",
+                                                  "finishedAt": "2025-07-28T01:48:52Z"}},
+                     "state": {"running": {"startedAt": "2025-07-28T01:50:52Z"}}},
+                    {"name": "c2", "image": "busybox", "imageID": "y", "ready": False, "restartCount": 1,
+                     "lastState": {"terminated": {"exitCode": 1, "startedAt": "2025-07-28T01:00:00Z",
+                                                  "finishedAt": "2025-07-28T01:49:52.123456Z"}},
+                     "state": {"waiting": {"reason": "CrashLoopBackOff"}}}]}},
+    {"metadata": {"name": "pending", "namespace": "test", "creationTimestamp": "2025-07-28T01:00:00Z"},
+     "spec": {"containers": [{"name": "c1"}]},
+     "status": {"phase": "Pending"}},
+    {"metadata": {"name": "no-timestamp", "namespace": "test"},
+     "spec": {"containers": [{"name": "c1"}], "nodeName": ""},
+     "status": {"podIP": ""}},
+]
+
+RAW_DEPLOYMENTS = [
+    {"metadata": {"name": "web", "namespace": "default", "creationTimestamp": "2025-07-27T10:00:00Z"},
+     "spec": {"replicas": 3, "selector": {"matchLabels": {"app": "web"}},
+              "template": {"spec": {"containers": [{"name": "web"}]}}},
+     "status": {"readyReplicas": 2, "updatedReplicas": 3, "availableReplicas": 2}},
+    {"metadata": {"name": "scaled-down", "namespace": "test", "creationTimestamp": "2025-07-27T10:00:00Z"},
+     "spec": {"replicas": 0, "selector": {"matchLabels": {"app": "x"}},
+              "template": {"spec": {"containers": [{"name": "x"}]}}},
+     "status": {}},
+]
+
+RAW_SERVICES = [
+    {"metadata": {"name": "web", "namespace": "default", "creationTimestamp": "2025-07-27T10:00:00Z"},
+     "spec": {"type": "ClusterIP", "clusterIP": "10.96.1.100",
+              "ports": [{"port": 80, "protocol": "TCP"}, {"port": 53, "protocol": "UDP"}]},
+     "status": {"loadBalancer": {}}},
+    {"metadata": {"name": "lb", "namespace": "default", "creationTimestamp": "2025-07-27T10:00:00Z"},
+     "spec": {"type": "LoadBalancer", "clusterIP": "10.96.1.200", "ports": [{"port": 443}]},
+     "status": {"loadBalancer": {"ingress": [{"hostname": "lb.example.com"}]}}},
+    {"metadata": {"name": "external", "namespace": "test", "creationTimestamp": "2025-07-27T10:00:00Z"},
+     "spec": {"type": "ExternalName", "clusterIP": "None"}},
+    {"metadata": {"name": "headless", "namespace": "test"}, "spec": {}},
+]
+
+
+def _deserialize(obj, klass):
+    """Convert a raw API object to a client model, the same way the kubernetes client does"""
+    return k8s_tools.client.ApiClient().deserialize(SimpleNamespace(data=json.dumps(obj)), klass)
+
+
+SUMMARY_CONVERTERS = [
+    (RAW_NAMESPACES, 'V1Namespace', k8s_tools.NamespaceSummary, k8s_tools._namespace_to_summary,
+     k8s_tools._namespace_json_to_summary),
+    (RAW_NODES, 'V1Node', k8s_tools.NodeSummary, k8s_tools._node_to_summary, k8s_tools._node_json_to_summary),
+    (RAW_PODS, 'V1Pod', k8s_tools.PodSummary, k8s_tools._pod_to_summary, k8s_tools._pod_json_to_summary),
+    (RAW_DEPLOYMENTS, 'V1Deployment', k8s_tools.DeploymentSummary, k8s_tools._deployment_to_summary,
+     k8s_tools._deployment_json_to_summary),
+    (RAW_SERVICES, 'V1Service', k8s_tools.ServiceSummary, k8s_tools._service_to_summary,
+     k8s_tools._service_json_to_summary),
+]
+
+
+@pytest.mark.parametrize("raw_objects,klass,model,to_summary,json_to_summary", SUMMARY_CONVERTERS)
+def test_json_summaries_match_model_summaries(raw_objects, klass, model, to_summary, json_to_summary):
+    """Summaries built from the raw JSON must be identical to those built from the client models"""
+    now = datetime.datetime.now(datetime.timezone.utc)
+    for raw_object in raw_objects:
+        expected = model(**to_summary(_deserialize(raw_object, klass), now))
+        actual = model(**json_to_summary(raw_object, now))
+        assert actual == expected
+        assert actual.model_dump_json() == expected.model_dump_json()
+
+
+def _container_status_one_at_a_time(fields):
+    """Build a ContainerStatus the way the tools did before the fields were validated in bulk"""
+    state_models = {'Running': k8s_tools.ContainerStateRunning, 'Waiting': k8s_tools.ContainerStateWaiting,
+                    'Terminated': k8s_tools.ContainerStateTerminated}
+    def state(state_fields):
+        return state_models[state_fields['state_name']](**state_fields) if state_fields else None
+    return k8s_tools.ContainerStatus(**dict(fields, state=state(fields['state']),
+                                            last_state=state(fields['last_state']),
+                                            volume_mounts=[k8s_tools.VolumeMountStatus(**v)
+                                                           for v in fields['volume_mounts']]))
+
+
+@pytest.mark.parametrize("raw_objects,klass,model,to_summary,json_to_summary", SUMMARY_CONVERTERS)
+def test_bulk_summaries_match_individual_models(raw_objects, klass, model, to_summary, json_to_summary):
+    """Validating a list of summaries in one call must give the same models, serialized to
+    the same bytes, as creating them one at a time"""
+    now = datetime.datetime.now(datetime.timezone.utc)
+    for (converter, objects) in ((to_summary, [_deserialize(o, klass) for o in raw_objects]),
+                                 (json_to_summary, raw_objects)):
+        rows = [converter(obj, now) for obj in objects]
+        expected = [model(**row) for row in rows]
+        actual = k8s_tools._to_summaries(model, iter(rows))
+        assert actual == expected
+        assert all(type(summary) is model for summary in actual)
+        assert pydantic_core.to_json(actual) == pydantic_core.to_json(expected)
+
+
+def test_bulk_container_statuses_match_individual_models():
+    pods = [_deserialize(raw_pod, 'V1Pod') for raw_pod in RAW_PODS]
+    rows = [row for pod in pods for row in k8s_tools._pod_to_container_statuses(pod, pod.metadata.name,
+                                                                                   pod.metadata.namespace)]
+    expected = [_container_status_one_at_a_time(row) for row in rows]
+    actual = k8s_tools._to_summaries(k8s_tools.ContainerStatus, rows)
+    assert isinstance(actual[0].state, k8s_tools.ContainerStateRunning)
+    assert isinstance(actual[0].last_state, k8s_tools.ContainerStateTerminated)
+    assert actual == expected
+    assert pydantic_core.to_json(actual) == pydantic_core.to_json(expected)
+
+
+
+def test_json_container_statuses_match_model_container_statuses():
+    pods = [_deserialize(raw_pod, 'V1Pod') for raw_pod in RAW_PODS]
+    expected = k8s_tools._to_summaries(k8s_tools.ContainerStatus,
+                                       [row for pod in pods
+                                        for row in k8s_tools._pod_to_container_statuses(pod, pod.metadata.name,
+                                                                                        pod.metadata.namespace)])
+    actual = k8s_tools._to_summaries(k8s_tools.ContainerStatus,
+                                     [row for raw_pod in RAW_PODS
+                                      for row in k8s_tools._pod_json_to_container_statuses(raw_pod)])
+    assert actual == expected
+    # the filters are applied to the fields, before any models are created
+    rows = [row for raw_pod in RAW_PODS for row in k8s_tools._pod_json_to_container_statuses(raw_pod)]
+    assert k8s_tools._filter_container_statuses(rows, False, 10**6) == []
+    assert k8s_tools._filter_container_statuses(rows, False, 0) == rows
+
+def test_list_result_budget():
+    """Models should only be created for the items within the budget"""
+    now = datetime.datetime.now(datetime.timezone.utc)
+    fields = [k8s_tools._pod_json_to_summary(raw, now) for raw in RAW_PODS]
+    invalid = dict(fields[0], name=None)
+    result = k8s_tools._list_result(k8s_tools.PodSummary, fields[:2] + [invalid], 'objects', max_items=2)
+    assert [pod.name for pod in result.items] == [fields[0]['name'], fields[1]['name']]
+    assert result.omitted.count == 1
+    assert result.omitted.by_namespace == {invalid['namespace']: 1}
+    size = len(pydantic_core.to_json(k8s_tools.PodSummary(**fields[0])))
+    with patch.object(k8s_tools, "BUDGET_CHUNK_SIZE", 1):
+        result = k8s_tools._list_result(k8s_tools.PodSummary, fields[:2] + [invalid], 'objects',
+                                        max_bytes=size + 3)
+    assert len(result.items) == 1
+    assert result.omitted.count == 2
+    assert k8s_tools._list_result(k8s_tools.PodSummary, fields, 'objects', max_items=len(fields)) == \
+           k8s_tools._to_summaries(k8s_tools.PodSummary, fields)
+
+
+def test_json_response_mode():
+    """In json mode, the list calls should be made without preloading content, in pages"""
+    calls = []
+    def list_fn(**kwargs):
+        calls.append(kwargs)
+        assert kwargs['_preload_content'] is False
+        page = _page(RAW_PODS, kwargs.get('limit'), kwargs.get('_continue'))
+        body = {"kind": "PodList", "metadata": {"continue": page.metadata._continue} if page.metadata._continue else {},
+                "items": page.items}
+        return SimpleNamespace(data=json.dumps(body).encode('utf-8'), release_conn=lambda: None)
+    with patch.object(k8s_tools, "LIST_RESPONSE_MODE", "json"), patch.object(k8s_tools, "LIST_PAGE_SIZE", 2):
+        fields = k8s_tools._get_summary_fields('pods', list_fn, {'namespace': 'test'},
+                                               k8s_tools._pod_to_summary, k8s_tools._pod_json_to_summary,
+                                               k8s_tools._pod_table_row_to_summary)
+        pods = k8s_tools._to_summaries(k8s_tools.PodSummary, fields)
+    assert [pod.name for pod in pods] == ["pod-1", "pending", "no-timestamp"]
+    assert len(calls) == 2
+    assert calls[0]['namespace'] == 'test'
+
+
+def _table(columns, cells_by_row, raw_objects):
+    """Build a Table response, including the metadata of each object like the API server
+    does for includeObject=Metadata"""
+    return {"kind": "Table", "apiVersion": "meta.k8s.io/v1", "metadata": {},
+            "columnDefinitions": [{"name": column, "type": "string"} for column in columns],
+            "rows": [{"cells": cells, "object": {"kind": "PartialObjectMetadata", "apiVersion": "meta.k8s.io/v1",
+                                                 "metadata": raw_object["metadata"]}}
+                     for (cells, raw_object) in zip(cells_by_row, raw_objects)]}
+
+
+# Tables for the RAW_ objects, as printed by the API server
+TABLE_NAMESPACES = _table(["Name", "Status", "Age"],
+                          [["default", "Active", "27d"], ["old", "Terminating", "57d"]], RAW_NAMESPACES)
+TABLE_NODES = _table(["Name", "Status", "Roles", "Age", "Version", "Internal-IP", "External-IP", "OS-Image",
+                      "Kernel-Version", "Container-Runtime"],
+                     [["control-plane-1", "Ready", "control-plane,master", "27d", "v1.28.2", "192.168.1.10",
+                       "203.0.113.10", "Ubuntu 22.04.3 LTS", "5.15.0-78-generic", "containerd://1.7.2"],
+                      ["worker-1", "NotReady", "worker", "26d", "", "<none>", "<none>", "<unknown>",
+                       "<unknown>", "<unknown>"],
+                      ["worker-2", "Unknown", "<none>", "<unknown>", "", "<none>", "<none>", "<unknown>",
+                       "<unknown>", "<unknown>"]], RAW_NODES)
+TABLE_PODS = _table(["Name", "Ready", "Status", "Restarts", "Age", "IP", "Node", "Nominated Node", "Readiness Gates"],
+                    [["pod-1", "1/2", "CrashLoopBackOff", "4 (2d3h ago)", "3d", "10.244.0.6", "node-1",
+                      "<none>", "<none>"],
+                     ["pending", "0/1", "Pending", 0, "3d", "<none>", "<none>", "<none>", "<none>"],
+                     ["no-timestamp", "0/1", "", "0", "<unknown>", "<none>", "<none>", "<none>", "<none>"]],
+                    RAW_PODS)
+TABLE_DEPLOYMENTS = _table(["Name", "Ready", "Up-to-date", "Available", "Age", "Containers", "Images", "Selector"],
+                           [["web", "2/3", 3, 2, "3d", "web", "", "app=web"],
+                            ["scaled-down", "0/0", 0, 0, "3d", "x", "", "app=x"]], RAW_DEPLOYMENTS)
+TABLE_SERVICES = _table(["Name", "Type", "Cluster-IP", "External-IP", "Port(s)", "Age", "Selector"],
+                        [["web", "ClusterIP", "10.96.1.100", "<none>", "80/TCP,53/UDP", "3d", "<none>"],
+                         ["lb", "LoadBalancer", "10.96.1.200", "lb.example.com", "443:31234/TCP", "3d", "<none>"],
+                         ["external", "ExternalName", "None", "<none>", "<none>", "3d", "<none>"],
+                         ["headless", "", "<none>", "<none>", "<none>", "<unknown>", "<none>"]], RAW_SERVICES)
+
+
+@pytest.mark.parametrize("table,raw_objects,model,json_to_summary,table_row_to_summary", [
+    (TABLE_NAMESPACES, RAW_NAMESPACES, k8s_tools.NamespaceSummary, k8s_tools._namespace_json_to_summary,
+     k8s_tools._namespace_table_row_to_summary),
+    (TABLE_NODES, RAW_NODES, k8s_tools.NodeSummary, k8s_tools._node_json_to_summary,
+     k8s_tools._node_table_row_to_summary),
+    (TABLE_PODS, RAW_PODS, k8s_tools.PodSummary, k8s_tools._pod_json_to_summary, k8s_tools._pod_table_row_to_summary),
+    (TABLE_DEPLOYMENTS, RAW_DEPLOYMENTS, k8s_tools.DeploymentSummary, k8s_tools._deployment_json_to_summary,
+     k8s_tools._deployment_table_row_to_summary),
+    (TABLE_SERVICES, RAW_SERVICES, k8s_tools.ServiceSummary, k8s_tools._service_json_to_summary,
+     k8s_tools._service_table_row_to_summary),
+])
+def test_table_summaries_match_json_summaries(table, raw_objects, model, json_to_summary, table_row_to_summary):
+    """Summaries built from Table rows should match those built from the full objects, except
+    for the time of the last pod restart, which the table only has to kubectl's precision."""
+    now = datetime.datetime.now(datetime.timezone.utc)
+    rows = list(k8s_tools._table_rows(table))
+    assert len(rows) == len(raw_objects)
+    for (row, raw_object) in zip(rows, raw_objects):
+        expected = model(**json_to_summary(raw_object, now))
+        actual = model(**table_row_to_summary(row, now))
+        if hasattr(expected, 'last_restart'):
+            assert (actual.last_restart is None) == (expected.last_restart is None)
+            actual.last_restart = expected.last_restart = None
+        assert actual == expected
+
+
+def test_parse_human_duration():
+    assert k8s_tools._parse_human_duration("45s") == datetime.timedelta(seconds=45)
+    assert k8s_tools._parse_human_duration("5m10s") == datetime.timedelta(minutes=5, seconds=10)
+    assert k8s_tools._parse_human_duration("2d3h") == datetime.timedelta(days=2, hours=3)
+    assert k8s_tools._parse_human_duration("1y20d") == datetime.timedelta(days=385)
+    assert k8s_tools._parse_human_duration("<unknown>") is None
+    assert k8s_tools._parse_human_duration(None) is None
+
+
+class MockTableApi:
+    """Stands in for a CoreV1Api whose ApiClient returns the queued responses from call_api()"""
+    def __init__(self, responses):
+        self.api_client = self
+        self.responses = list(responses)
+        self.calls = []
+
+    def call_api(self, resource_path, method, path_params, query_params, header_params, **kwargs):
+        self.calls.append((resource_path, path_params, dict(query_params), header_params, kwargs))
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return SimpleNamespace(data=json.dumps(response).encode('utf-8'), release_conn=lambda: None)
+
+    def list_namespaced_pod(self, **kwargs):
+        return SimpleNamespace(data=json.dumps({"kind": "PodList", "metadata": {}, "items": RAW_PODS}).encode('utf-8'),
+                               release_conn=lambda: None)
+
+
+def test_table_response_mode():
+    """In table mode, a Table is requested with the object metadata, in pages"""
+    first_page = dict(TABLE_PODS, rows=TABLE_PODS["rows"][:2], metadata={"continue": "abc"})
+    second_page = dict(TABLE_PODS, rows=TABLE_PODS["rows"][2:])
+    api = MockTableApi([first_page, second_page])
+    with patch.object(k8s_tools, "LIST_RESPONSE_MODE", "table"), patch.object(k8s_tools, "LIST_PAGE_SIZE", 2):
+        fields = k8s_tools._get_summary_fields('pods', api.list_namespaced_pod,
+                                               {'namespace': 'test', 'label_selector': 'app=web'},
+                                               k8s_tools._pod_to_summary, k8s_tools._pod_json_to_summary,
+                                               k8s_tools._pod_table_row_to_summary)
+        pods = k8s_tools._to_summaries(k8s_tools.PodSummary, fields)
+    assert [pod.name for pod in pods] == ["pod-1", "pending", "no-timestamp"]
+    assert pods[0].restarts == 4
+    assert pods[0].last_restart == datetime.timedelta(days=2, hours=3)
+    assert len(api.calls) == 2
+    (path, path_params, query, headers, kwargs) = api.calls[0]
+    assert path == '/api/v1/namespaces/{namespace}/pods'
+    assert path_params == {'namespace': 'test'}
+    assert query == {'includeObject': 'Metadata', 'labelSelector': 'app=web', 'limit': 2}
+    assert headers['Accept'].startswith('application/json;as=Table')
+    assert kwargs['_preload_content'] is False
+    assert api.calls[1][2]['continue'] == 'abc'
+
+
+def test_table_response_mode_fallback():
+    """If the server returns a regular list, or rejects the Table request, the summaries
+    are built from the full objects"""
+    now = datetime.datetime.now(datetime.timezone.utc)
+    expected = [k8s_tools._pod_json_to_summary(raw, now)['name'] for raw in RAW_PODS]
+    for response in ({"kind": "PodList", "metadata": {}, "items": RAW_PODS},
+                     k8s_tools.ApiException(status=406, reason="Not Acceptable")):
+        api = MockTableApi([response])
+        with patch.object(k8s_tools, "LIST_RESPONSE_MODE", "table"):
+            fields = k8s_tools._get_summary_fields('pods', api.list_namespaced_pod,
+                                                   {'namespace': 'test'},
+                                                   k8s_tools._pod_to_summary, k8s_tools._pod_json_to_summary,
+                                                   k8s_tools._pod_table_row_to_summary)
+            pods = k8s_tools._to_summaries(k8s_tools.PodSummary, fields)
+        assert [pod.name for pod in pods] == expected
+
+
+def test_shared_api_client():
+    """The API groups should share one ApiClient, configured with the pool size and a default timeout"""
+    def load_kube_config(client_configuration):
+        client_configuration.host = "https://k8s.example.com:6443"
+    original_api_client = k8s_tools.API_CLIENT
+    k8s_tools.API_CLIENT = None
+    try:
+        with patch.object(k8s_tools.config, "load_kube_config", load_kube_config), \
+             patch.object(k8s_tools, "CONNECTION_POOL_MAXSIZE", 17), \
+             patch.object(k8s_tools, "REQUEST_TIMEOUT", 12.5):
+            core_v1 = k8s_tools._get_api_client()
+            apps_v1 = k8s_tools._get_apps_v1_api_client()
+            assert core_v1.api_client is apps_v1.api_client
+            api_client = core_v1.api_client
+            assert api_client.configuration.host == "https://k8s.example.com:6443"
+            pool_kw = api_client.rest_client.pool_manager.connection_pool_kw
+            assert pool_kw['maxsize'] == 17
+            assert (k8s_tools.socket.SOL_SOCKET, k8s_tools.socket.SO_KEEPALIVE, 1) in pool_kw['socket_options']
+            with patch.object(api_client.rest_client, "GET") as get:
+                api_client.request("GET", "https://k8s.example.com:6443/api/v1/pods")
+                assert get.call_args.kwargs['_request_timeout'] == (12.5, 12.5)
+                api_client.request("GET", "https://k8s.example.com:6443/api/v1/pods", _request_timeout=300)
+                assert get.call_args.kwargs['_request_timeout'] == 300
+    finally:
+        k8s_tools.API_CLIENT = original_api_client
+
+
+SEARCH_LOG_LINES = [
+    "2025-07-28T01:00:00.000000001Z starting",
+    "2025-07-28T01:00:01.000000000Z ERROR failed to connect",
+    "2025-07-28T01:00:02.000000000Z retrying",
+    "2025-07-28T01:00:03.000000000Z error: timeout",
+    "2025-07-28T01:00:04.000000000Z still retrying",
+    "2025-07-28T01:00:05.000000000Z ERROR giving up",
+    "2025-07-28T01:00:06.000000000Z shutting down",
+]
+
+
+def _search(pattern, lines=SEARCH_LOG_LINES, **kwargs):
+    response = MockLogResponse([("\n".join(lines) + "\n").encode('utf-8')])
+    with patch.object(k8s_tools.K8S, "read_namespaced_pod_log", return_value=response):
+        matches = k8s_tools.search_pod_logs("pod-1", pattern, **kwargs)
+    assert response.closed
+    return matches
+
+
+def test_search_pod_logs():
+    matches = _search("^ERROR")
+    assert [(m.line_number, m.line) for m in matches] == [(2, "ERROR failed to connect"), (6, "ERROR giving up")]
+    assert matches[0].timestamp == datetime.datetime(2025, 7, 28, 1, 0, 1, tzinfo=datetime.timezone.utc)
+    assert matches[0].before == [] and matches[0].after == []
+    matches = _search("error", ignore_case=True, before=1, after=2, max_matches=2)
+    assert [m.line_number for m in matches] == [2, 4]
+    # the context lines have their timestamps stripped, like the matching lines
+    assert matches[0].before == ["starting"]
+    assert matches[0].after == ["retrying", "error: timeout"]
+    assert matches[1].before == ["retrying"]
+    assert matches[1].after == ["still retrying", "ERROR giving up"]
+    # context at the end of the log
+    matches = _search("shutting", before=2, after=3)
+    assert matches[0].before == ["still retrying", "ERROR giving up"]
+    assert matches[0].after == []
+    assert _search("not there") == []
+    # lines without timestamps are matched as a whole
+    matches = _search("plain", lines=["plain line"])
+    assert matches[0].timestamp is None and matches[0].line == "plain line"
+    with pytest.raises(ValueError):
+        k8s_tools.search_pod_logs("pod-1", "([unclosed")
+
+
+def test_search_pod_logs_stops_reading():
+    """Once enough matches have been found, the rest of the log should not be read"""
+    chunks_read = []
+    def chunks():
+        for i in range(1000):
+            chunks_read.append(i)
+            yield f"2025-07-28T01:00:00Z line {i}\n".encode('utf-8')
+    response = MockLogResponse(chunks())
+    with patch.object(k8s_tools.K8S, "read_namespaced_pod_log", return_value=response):
+        matches = k8s_tools.search_pod_logs("pod-1", "line", max_matches=3, after=1)
+    assert [m.line for m in matches] == ["line 0", "line 1", "line 2"]
+    assert len(chunks_read) == 4
+    assert response.closed
+
+
+def test_get_logs_for_workload():
+    logs = k8s_tools.get_logs_for_workload("default", deployment_name="nginx-deployment", container_name="container-1")
+    assert MockK8S.last_list_kwargs == {"label_selector": "app=nginx,tier in (web,edge)"}
+    assert [(l.pod_name, l.error) for l in logs] == [("pod-1", None)]
+    assert "container-1 log line 1" in logs[0].logs
+    with pytest.raises(k8s_tools.K8sApiError):
+        k8s_tools.get_logs_for_workload("default", deployment_name="missing")
+    with pytest.raises(ValueError):
+        k8s_tools.get_logs_for_workload("default")
+
+
+def test_get_logs_for_workload_is_parallel():
+    """The logs should be fetched concurrently, with errors reported per pod"""
+    pods = [SimpleNamespace(metadata=SimpleNamespace(name=f"pod-{i:02d}")) for i in range(8)]
+    def read_log(name, namespace, **kwargs):
+        time.sleep(0.2)
+        if name == "pod-03":
+            raise k8s_tools.ApiException(status=400, reason="container is waiting to start")
+        return f"logs of {name}"
+    with patch.object(k8s_tools.K8S, "list_namespaced_pod", return_value=_page(list(reversed(pods)))), \
+         patch.object(k8s_tools.K8S, "read_namespaced_pod_log", side_effect=read_log), \
+         patch.object(k8s_tools, "LOG_FANOUT_CONCURRENCY", 8):
+        start = time.monotonic()
+        logs = k8s_tools.get_logs_for_workload("default", label_selector="app=web", max_pods=6)
+        elapsed = time.monotonic() - start
+    assert elapsed < 0.6
+    assert [l.pod_name for l in logs] == [f"pod-{i:02d}" for i in range(6)]
+    assert logs[0].logs == "logs of pod-00"
+    assert logs[3].logs is None and "waiting to start" in logs[3].error
+
+
+def test_kubernetes_client_is_imported_lazily():
+    """Importing the tools and the server should not import the kubernetes client or yaml,
+    as they take most of the startup time. They are imported on first use."""
+    code = ("import sys\n"
+            "from k8stools import k8s_tools\n"
+            "for module in ('kubernetes', 'kubernetes.client', 'yaml'):\n"
+            "    assert module not in sys.modules, f'{module} imported with k8s_tools'\n"
+            "from k8stools import mock_tools, async_tools, mcp_server\n"
+            "for module in ('kubernetes', 'kubernetes.client', 'yaml'):\n"
+            "    assert module not in sys.modules, f'{module} imported at startup'\n"
+            "k8s_tools.yaml.safe_dump({})\n"
+            "assert 'yaml' in sys.modules and 'kubernetes' not in sys.modules\n"
+            "k8s_tools.client.Configuration\n"
+            "assert 'kubernetes.client' in sys.modules\n"
+            "assert k8s_tools.ApiException is k8s_tools.client.ApiException\n")
+    completed = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert completed.returncode == 0, completed.stderr
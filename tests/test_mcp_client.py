@@ -156,3 +156,56 @@ def test_k8s_mcp_server_stdio_mock():
     # Run the async test
     result = asyncio.run(run_test())
     assert result, "Mock stdio test failed"
+
+
+def test_tools_run_in_worker_threads():
+    """Blocking tools should run in worker threads, with the number of concurrent
+    calls bounded per tool, without blocking the event loop."""
+    import anyio
+    from k8stools.mcp_server import get_tool_for_function
+
+    lock = threading.Lock()
+    running = []
+    max_running = []
+    def slow_tool(name: str) -> str:
+        """A tool that blocks for a while"""
+        with lock:
+            running.append(name)
+            max_running.append(len(running))
+        time.sleep(0.2)
+        with lock:
+            running.remove(name)
+        return name
+
+    async def run_test():
+        tool = get_tool_for_function(slow_tool, anyio.CapacityLimiter(10), anyio.CapacityLimiter(2))
+        assert tool.name == "slow_tool"
+        assert tool.is_async
+        assert list(tool.parameters['properties']) == ['name']
+        ticks = 0
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+        ticker_task = asyncio.create_task(ticker())
+        results = await asyncio.gather(*[tool.run({'name': f"call-{i}"}) for i in range(4)])
+        ticker_task.cancel()
+        return results, ticks
+
+    start = time.time()
+    results, ticks = asyncio.run(run_test())
+    assert [r for r in results] == [f"call-{i}" for i in range(4)]
+    assert max(max_running) == 2
+    # two rounds of two calls
+    assert time.time() - start >= 0.4
+    # the event loop kept running while the tools were blocked
+    assert ticks > 10
+
+
+def test_mock_rejects_async_tools():
+    """There are no async mock tools, so --mock --async-tools is an error rather than silently using the sync ones"""
+    proc = subprocess.run([sys.executable, '-m', 'k8stools.mcp_server', '--mock', '--async-tools'],
+                          capture_output=True, text=True, timeout=30, env={**os.environ, 'PYTHONPATH': 'src'})
+    assert proc.returncode == 2
+    assert "--async-tools cannot be used with --mock" in proc.stderr
@@ -2,6 +2,7 @@
 
 import datetime
 import pytest
+import pydantic_core
 from k8stools import mock_tools, k8s_tools
 
 
@@ -96,6 +97,21 @@ class TestMockPods:
         for pod in kube_system_pods:
             assert pod.namespace == "kube-system"
             
+    def test_get_pod_summaries_selectors(self):
+        """Test that get_pod_summaries filters by label and field selectors."""
+        pods = mock_tools.get_pod_summaries(label_selector="app=ad")
+        assert [pod.name for pod in pods] == ["ad-647b4947cc-s5mpm"]
+        pods = mock_tools.get_pod_summaries(label_selector="app in (ad,test)")
+        assert {pod.name for pod in pods} == {"ad-647b4947cc-s5mpm", "test-pod-123"}
+        pods = mock_tools.get_pod_summaries(label_selector="!app")
+        assert [pod.name for pod in pods] == ["kube-system-pod"]
+        pods = mock_tools.get_pod_summaries(field_selector="metadata.namespace!=default")
+        assert [pod.name for pod in pods] == ["kube-system-pod"]
+        pods = mock_tools.get_pod_summaries("default", field_selector="spec.nodeName=other-node")
+        assert pods == []
+        with pytest.raises(k8s_tools.K8sApiError):
+            mock_tools.get_pod_summaries(field_selector="spec.unknown=x")
+
     def test_get_pod_summaries_has_ad_pod(self):
         """Test that get_pod_summaries includes the ad pod."""
         pods = mock_tools.get_pod_summaries()
@@ -345,3 +361,149 @@ class TestMockToolsConsistency:
             
             # The mock functions should have the same docstring as the real functions
             assert mock_tool.__doc__ == real_tool.__doc__, f"Docstring mismatch for {mock_tool.__name__}"
+
+
+def test_get_logs_limits():
+    logs = mock_tools.get_logs_for_pod_and_container("test-pod", "default", tail_lines=2)
+    assert logs.splitlines() == ["2025-07-28T01:30:02.000000000Z Processing requests...",
+                                 "2025-07-28T01:30:03.000000000Z Ready to serve traffic"]
+    logs = mock_tools.get_logs_for_pod_and_container("test-pod", "default", tail_lines=None, limit_bytes=10)
+    assert logs == "2025-07-28"
+
+
+def test_search_pod_logs():
+    matches = mock_tools.search_pod_logs("test-pod", "ready to serve", ignore_case=True, before=1)
+    assert len(matches) == 1
+    assert matches[0].line == "Ready to serve traffic"
+    assert matches[0].line_number == 4
+    assert matches[0].before == ["Processing requests..."]
+
+
+def test_get_logs_for_workload():
+    logs = mock_tools.get_logs_for_workload("default", deployment_name="ad")
+    assert [l.pod_name for l in logs] == ["ad-647b4947cc-s5mpm"]
+    assert "JAVA_TOOL_OPTIONS" in logs[0].logs
+    logs = mock_tools.get_logs_for_workload("default", label_selector="app in (ad,test)")
+    assert [l.pod_name for l in logs] == ["ad-647b4947cc-s5mpm", "test-pod-123"]
+
+
+def test_get_namespace_container_statuses():
+    statuses = mock_tools.get_namespace_container_statuses()
+    assert [(s.pod_name, s.container_name) for s in statuses] == \
+           [("ad-647b4947cc-s5mpm", "ad"), ("test-pod-123", "container-1"), ("test-pod-123", "container-2"),
+            ("kube-system-pod", "kube")]
+    statuses = mock_tools.get_namespace_container_statuses("default", only_not_ready=True)
+    assert [(s.pod_name, s.restart_count) for s in statuses] == [("ad-647b4947cc-s5mpm", 93)]
+    assert mock_tools.get_namespace_container_statuses("kube-system", min_restarts=1) == []
+
+
+@pytest.fixture
+def synthetic_cluster():
+    mock_tools.use_synthetic_cluster(num_pods=500, num_nodes=10, num_namespaces=5, seed=42, failure_rate=0.2)
+    yield
+    mock_tools.use_static_data()
+
+
+def test_generate_cluster_data_is_seeded():
+    data1 = mock_tools.generate_cluster_data(num_pods=50, num_nodes=5, num_namespaces=3, seed=7)
+    data2 = mock_tools.generate_cluster_data(num_pods=50, num_nodes=5, num_namespaces=3, seed=7)
+    data3 = mock_tools.generate_cluster_data(num_pods=50, num_nodes=5, num_namespaces=3, seed=8)
+    assert [(p.namespace, p.name, p.restarts, p.node) for p in data1['pods']] == \
+           [(p.namespace, p.name, p.restarts, p.node) for p in data2['pods']]
+    assert [p.name for p in data1['pods']] != [p.name for p in data3['pods']]
+
+
+def test_synthetic_cluster(synthetic_cluster):
+    pods = mock_tools.get_pod_summaries()
+    assert len(pods) == 500
+    assert len(mock_tools.get_node_summaries()) == 10
+    assert [ns.name for ns in mock_tools.get_namespaces()][:2] == ["default", "kube-system"]
+    assert len(mock_tools.get_namespaces()) == 5
+    nodes = {node.name: node for node in mock_tools.get_node_summaries()}
+    assert all(pod.node in nodes for pod in pods if pod.node)
+    # the workers have no role label, which k8s_tools reports as "<none>"
+    assert sorted({tuple(node.roles) for node in nodes.values()}) == [("<none>",), ("control-plane",)]
+    assert all(nodes[pod.node].roles == ["<none>"] for pod in pods if pod.node and pod.namespace == "default")
+    # each deployment's replicas are its pods
+    deployments = mock_tools.get_deployment_summaries()
+    assert sum(d.total_replicas for d in deployments) == 500
+    d = deployments[0]
+    workload = mock_tools.get_logs_for_workload(d.namespace, deployment_name=d.name, max_pods=100)
+    assert len(workload) == d.total_replicas
+    assert len(mock_tools.get_pod_summaries(d.namespace, label_selector=f"app={d.name}")) == d.total_replicas
+    assert {s.name for s in mock_tools.get_service_summaries()} <= {d.name for d in deployments}
+
+    # the container statuses agree with the pod summaries
+    not_ready = mock_tools.get_namespace_container_statuses(only_not_ready=True)
+    assert not_ready
+    assert len(not_ready) == sum(p.total_containers - p.ready_containers for p in pods)
+    crashing = [p for p in pods if p.restarts >= 3 and p.ready_containers < p.total_containers]
+    assert crashing
+    pod = crashing[0]
+    statuses = mock_tools.get_pod_container_statuses(pod.name, pod.namespace)
+    assert statuses[0].state.reason == "CrashLoopBackOff"
+    assert sum(s.restart_count for s in statuses) == pod.restarts
+    assert [e.reason for e in mock_tools.get_pod_events(pod.name, pod.namespace)][-1] == "BackOff"
+    assert mock_tools.search_pod_logs(pod.name, "ERROR", pod.namespace)
+    assert mock_tools.get_pod_spec(pod.name, pod.namespace)['node_name'] == pod.node
+
+
+def test_columnar_format(synthetic_cluster):
+    pods = mock_tools.get_pod_summaries()
+    table = mock_tools.get_pod_summaries(format='columnar')
+    assert isinstance(table, k8s_tools.ColumnarTable)
+    assert table.columns == list(k8s_tools.PodSummary.model_fields)
+    assert len(table.rows) == len(pods)
+    age = table.columns.index('age')
+    assert table.rows[0][age] == int(pods[0].age.total_seconds())
+    assert dict(zip(table.columns, table.rows[0]))['name'] == pods[0].name
+    # the field names are not repeated for each pod
+    assert len(table.model_dump_json()) < len(pydantic_core.to_json(pods))/2
+    services = mock_tools.get_service_summaries(format='columnar')
+    ports = services.columns.index('ports')
+    assert all(isinstance(port, dict) for row in services.rows for port in row[ports])
+    statuses = mock_tools.get_namespace_container_statuses(min_restarts=1, format='columnar')
+    assert len(statuses.rows) == len(mock_tools.get_namespace_container_statuses(min_restarts=1))
+    with pytest.raises(ValueError, match="Invalid format"):
+        mock_tools.get_namespaces(format='table')
+
+
+def test_result_budget(synthetic_cluster):
+    pods = mock_tools.get_pod_summaries()
+    result = mock_tools.get_pod_summaries(max_items=10)
+    assert isinstance(result, k8s_tools.TruncatedList)
+    assert result.items == pods[:10]
+    assert result.omitted.count == 490
+    assert sum(result.omitted.by_namespace.values()) == 490
+    assert sum(result.omitted.by_status.values()) == 490
+    assert set(result.omitted.by_status) == {"Ready", "NotReady"}
+    result = mock_tools.get_pod_summaries(max_bytes=5000)
+    assert 0 < len(result.items) < 500
+    assert len(pydantic_core.to_json(result.items)) <= 5000
+    assert len(result.items) + result.omitted.count == 500
+    table = mock_tools.get_pod_summaries(max_bytes=5000, format='columnar')
+    assert len(table.rows) > len(result.items)
+    assert len(table.rows) + table.omitted.count == 500
+    # a result within the budget is returned as usual
+    assert mock_tools.get_pod_summaries(max_items=500) == pods
+    assert mock_tools.get_namespaces(max_items=1).omitted.by_namespace == {}
+    with pytest.raises(ValueError):
+        mock_tools.get_service_summaries(max_bytes=-1)
+
+
+def test_cursor_paging(synthetic_cluster):
+    pods = mock_tools.get_pod_summaries("default")
+    paged = []
+    cursor = None
+    while True:
+        page = mock_tools.get_pod_summaries("default", page_size=30, cursor=cursor)
+        assert len(page.items) <= 30
+        paged.extend(page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+    assert paged == pods
+    table = mock_tools.get_deployment_summaries(page_size=5, format='columnar')
+    assert len(table.rows) == 5 and table.next_cursor is not None
+    with pytest.raises(ValueError, match="different query"):
+        mock_tools.get_deployment_summaries("default", cursor=table.next_cursor)
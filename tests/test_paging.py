@@ -0,0 +1,46 @@
+"""Tests for the cursors and snapshots used to page through the results of the list tools.
+"""
+
+import base64
+from unittest.mock import patch
+
+import pytest
+
+from k8stools import paging
+from k8stools.paging import SnapshotCache, decode_cursor, encode_cursor, query_fingerprint
+
+
+def test_cursors():
+    query = query_fingerprint('pods', namespace="default", label_selector=None)
+    assert query == query_fingerprint('pods', label_selector=None, namespace="default")
+    assert query != query_fingerprint('pods', namespace="test", label_selector=None)
+    assert decode_cursor(encode_cursor(query, continue_token="abc"), query)['c'] == "abc"
+    position = decode_cursor(encode_cursor(query, snapshot_id="1234", offset=100), query)
+    assert (position['s'], position['o']) == ("1234", 100)
+    with pytest.raises(ValueError, match="different query"):
+        decode_cursor(encode_cursor(query, continue_token="abc"), query_fingerprint('services'))
+    for cursor in ("not a cursor", base64.urlsafe_b64encode(b'{"q": "x"}').decode(), "é"):
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            decode_cursor(cursor, query)
+
+
+def test_snapshot_cache():
+    cache = SnapshotCache(max_snapshots=2, ttl_seconds=10)
+    first = cache.add([1, 2])
+    second = cache.add([3])
+    assert cache.get(first) == [1, 2]
+    # the least recently used snapshot is evicted
+    cache.add([4])
+    assert len(cache) == 2
+    with pytest.raises(ValueError, match="expired"):
+        cache.get(second)
+    assert cache.get(first) == [1, 2]
+    with patch.object(paging.time, "monotonic", return_value=paging.time.monotonic() + 11):
+        with pytest.raises(ValueError, match="expired"):
+            cache.get(first)
+
+
+def test_list_query():
+    assert paging.list_query('pods') == paging.list_query('pods', "", None, "")
+    assert paging.list_query('pods', "default") != paging.list_query('pods')
+    assert paging.list_query('pods', label_selector="app=web") != paging.list_query('pods', field_selector="app=web")
@@ -0,0 +1,87 @@
+"""Tests for the coalescing of concurrent identical calls.
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+import time
+from typing import Optional
+
+import anyio
+import pytest
+
+from k8stools.singleflight import SingleFlight, coalesced
+from k8stools.mcp_server import get_tool_for_function
+
+
+def test_threads_share_one_call():
+    calls = []
+    def get_pod_summaries(namespace: Optional[str] = None) -> list[str]:
+        calls.append(namespace)
+        time.sleep(0.2)
+        return [f"{namespace}/pod-1"]
+    single_flight = SingleFlight()
+    tool = coalesced(get_pod_summaries, single_flight)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
+        futures = [executor.submit(tool, None) for _ in range(4)] + [executor.submit(tool, "default")]
+        results = [f.result() for f in futures]
+    assert results == [["None/pod-1"]]*4 + [["default/pod-1"]]
+    assert sorted(calls, key=str) == [None, "default"]
+    assert single_flight.coalesced_calls == 3
+    # once the call completes, the next one is made again
+    tool(None)
+    assert len(calls) == 3
+
+
+def test_threads_share_exceptions():
+    started = threading.Event()
+    def get_pod_spec(pod_name: str) -> dict:
+        started.set()
+        time.sleep(0.2)
+        raise ValueError(pod_name)
+    tool = coalesced(get_pod_spec, SingleFlight())
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        first = executor.submit(tool, "pod-1")
+        started.wait()
+        second = executor.submit(tool, "pod-1")
+        for future in (first, second):
+            with pytest.raises(ValueError, match="pod-1"):
+                future.result()
+
+
+def test_async_calls_share_one_call():
+    calls = []
+    async def get_namespaces() -> list[str]:
+        calls.append(1)
+        await asyncio.sleep(0.1)
+        return ["default"]
+    single_flight = SingleFlight()
+    tool = coalesced(get_namespaces, single_flight)
+
+    async def run_test():
+        leader = asyncio.create_task(tool())
+        await asyncio.sleep(0)
+        followers = [asyncio.create_task(tool()) for _ in range(3)]
+        # cancelling the caller that started the call does not cancel it for the others
+        leader.cancel()
+        return await asyncio.gather(*followers)
+    assert asyncio.run(run_test()) == [["default"]]*3
+    assert len(calls) == 1
+    assert single_flight.coalesced_calls == 3
+
+
+def test_server_coalesces_tool_calls():
+    calls = []
+    def get_pod_summaries(namespace: Optional[str] = None) -> list[str]:
+        """Returns the pods"""
+        calls.append(namespace)
+        time.sleep(0.2)
+        return ["pod-1"]
+
+    async def run_test():
+        tool = get_tool_for_function(get_pod_summaries, anyio.CapacityLimiter(10), anyio.CapacityLimiter(10),
+                                     single_flight=SingleFlight())
+        assert list(tool.parameters['properties']) == ['namespace']
+        return await asyncio.gather(*[tool.run({}) for _ in range(4)])
+    assert asyncio.run(run_test()) == [["pod-1"]]*4
+    assert calls == [None]
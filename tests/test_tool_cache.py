@@ -0,0 +1,120 @@
+"""Tests for the tool response cache.
+"""
+
+import asyncio
+from typing import Optional
+from unittest.mock import patch
+
+import pytest
+
+from pydantic import BaseModel
+from k8stools import k8s_tools, tool_cache
+from k8stools.tool_cache import ResponseCache, cached, call_key
+
+
+def make_tool(calls:list):
+    def get_pod_summaries(namespace: Optional[str] = None, label_selector: Optional[str] = None) -> list[str]:
+        """Returns the arguments"""
+        calls.append((namespace, label_selector))
+        return [f"{namespace}/{label_selector}"]
+    return get_pod_summaries
+
+
+def test_call_key_normalizes_arguments():
+    tool = make_tool([])
+    assert call_key(tool, ("default",), {}) == call_key(tool, (), {'namespace': "default", 'label_selector': None})
+    assert call_key(tool, ("default",), {}) != call_key(tool, ("test",), {})
+
+
+def test_cached_calls():
+    calls = []
+    cache = ResponseCache()
+    tool = cached(make_tool(calls), cache)
+    assert tool.__name__ == "get_pod_summaries"
+    assert tool("default") == ["default/None"]
+    assert tool(namespace="default") == ["default/None"]
+    assert tool("test") == ["test/None"]
+    assert calls == [("default", None), ("test", None)]
+    assert [(s.tool, s.hits, s.misses) for s in cache.stats()] == [("get_pod_summaries", 1, 2)]
+    # after the TTL, the tool is called again
+    with patch.object(tool_cache.time, "monotonic", return_value=tool_cache.time.monotonic() + 10):
+        tool("default")
+    assert len(calls) == 3
+
+
+def test_async_tool():
+    calls = []
+    async def get_namespaces() -> list[str]:
+        calls.append(1)
+        return ["default"]
+    tool = cached(get_namespaces, ResponseCache())
+    assert asyncio.run(tool()) == ["default"]
+    assert asyncio.run(tool()) == ["default"]
+    assert len(calls) == 1
+
+
+def test_exceptions_not_cached():
+    calls = []
+    def get_pod_spec(pod_name: str) -> dict:
+        calls.append(pod_name)
+        raise ValueError("failed")
+    tool = cached(get_pod_spec, ResponseCache())
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            tool("pod-1")
+    assert len(calls) == 2
+
+
+def test_ttls():
+    cache = ResponseCache({'get_namespaces': 60, 'get_logs_for_pod_and_container': 300, 'get_pod_spec': 0,
+                           'get_catalog_summaries': 300}, default_ttl=3)
+    assert cache.ttl('get_namespaces') == 60
+    assert cache.ttl('get_node_summaries') == tool_cache.DEFAULT_TOOL_TTLS['get_node_summaries']
+    assert cache.ttl('get_pod_summaries') == 3
+    assert cache.ttl('get_logs_for_pod_and_container') == tool_cache.MAX_LOG_TTL
+    # only the log tools are capped, not every tool with "log" in its name
+    assert cache.ttl('get_catalog_summaries') == 300
+    def get_pod_spec(pod_name: str) -> dict:
+        return {}
+    assert cached(get_pod_spec, cache) is get_pod_spec
+
+
+def test_log_tools():
+    tool_names = {tool.__name__ for tool in k8s_tools.TOOLS}
+    assert tool_cache.LOG_TOOLS == {name for name in tool_names if 'logs' in name}
+
+
+def test_lru_eviction():
+    cache = ResponseCache(max_entries=2)
+    for key in ("a", "b"):
+        cache.put("tool", key, key)
+    cache.get("tool", "a")
+    cache.put("tool", "c", "c")
+    assert cache.get("tool", "b") == (False, None)
+    assert cache.get("tool", "a") == (True, "a")
+    assert cache.get("tool", "c") == (True, "c")
+    assert cache.stats()[0].evictions == 1
+
+    cache = ResponseCache(max_bytes=100)
+    cache.put("tool", "a", "x"*60)
+    cache.put("tool", "b", "x"*60)
+    assert len(cache) == 1 and cache.size_bytes == 60
+    assert cache.get("tool", "b") == (True, "x"*60)
+    # results larger than the cache are not stored
+    cache.put("tool", "c", "x"*200)
+    assert cache.get("tool", "c") == (False, None)
+
+
+
+def test_approximate_size():
+    class Pod(BaseModel):
+        name: str
+        labels: dict[str, str]
+        restarts: int
+    pods = [Pod(name=f"pod-{i:04d}", labels={"app": "frontend"}, restarts=i) for i in range(1000)]
+    size = tool_cache._approximate_size(pods)
+    # measures a sample of the items rather than serializing all of them
+    with patch.object(BaseModel, 'model_dump_json', side_effect=AssertionError):
+        assert tool_cache._approximate_size(pods) == size
+    assert size == 1000*tool_cache._approximate_size(pods[0]) + 8*1000
+    assert tool_cache._approximate_size(pods[:2]) < tool_cache._approximate_size(pods[:20]) < size
@@ -0,0 +1,133 @@
+"""Tests for the per-tool metrics.
+"""
+
+import asyncio
+import concurrent.futures
+import contextvars
+from typing import Optional
+
+import anyio
+import pytest
+
+from k8stools import async_tools, k8s_tools
+from k8stools.fake_apiserver import FakeApiServer
+from k8stools.mcp_server import get_tool_for_function
+from k8stools.singleflight import SingleFlight
+from k8stools.tool_cache import ResponseCache
+from k8stools.tool_metrics import ToolMetrics, instrumented, record_api_request
+
+
+def get_pod_summaries(namespace: Optional[str] = None) -> list[str]:
+    """Makes two API requests, one of them from another thread"""
+    record_api_request()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        executor.submit(contextvars.copy_context().run, record_api_request).result()
+    return ["pod-1", "pod-2"]
+
+
+def get_pod_spec(pod_name: str) -> dict:
+    record_api_request()
+    raise k8s_tools.K8sApiError(pod_name)
+
+
+def test_instrumented_calls():
+    metrics = ToolMetrics(measure_response_bytes=True)
+    tool = instrumented(get_pod_summaries, metrics)
+    assert tool.__name__ == "get_pod_summaries"
+    assert tool() == ["pod-1", "pod-2"]
+    tool("default")
+    failing_tool = instrumented(get_pod_spec, metrics)
+    with pytest.raises(k8s_tools.K8sApiError):
+        failing_tool("pod-1")
+    stats = {s.tool: s for s in metrics.stats()}
+    assert (stats['get_pod_summaries'].calls, stats['get_pod_summaries'].api_requests) == (2, 4)
+    assert stats['get_pod_summaries'].response_bytes == 2*len('["pod-1","pod-2"]')
+    assert stats['get_pod_summaries'].errors == 0
+    assert (stats['get_pod_spec'].calls, stats['get_pod_spec'].errors, stats['get_pod_spec'].api_requests) == (1, 1, 1)
+    # requests outside of a tool call are not counted
+    record_api_request()
+    assert sum(s.api_requests for s in metrics.stats()) == 5
+
+
+def test_async_instrumented():
+    async def get_namespaces() -> list[str]:
+        await asyncio.gather(*[asyncio.sleep(0, record_api_request()) for _ in range(3)])
+        return ["default"]
+    metrics = ToolMetrics(measure_response_bytes=True)
+    tool = instrumented(get_namespaces, metrics)
+    assert asyncio.run(tool()) == ["default"]
+    [stats] = metrics.stats()
+    assert (stats.calls, stats.api_requests, stats.response_bytes) == (1, 3, len('["default"]'))
+
+
+def test_response_bytes_are_opt_in():
+    metrics = ToolMetrics()
+    assert instrumented(get_pod_summaries, metrics)() == ["pod-1", "pod-2"]
+    [stats] = metrics.stats()
+    assert (stats.calls, stats.response_bytes) == (1, 0)
+
+
+def test_render():
+    metrics = ToolMetrics(buckets=(0.1, 1.0))
+    metrics.observe("get_pod_summaries", 0.05, api_requests=2, response_bytes=100)
+    metrics.observe("get_pod_summaries", 0.5, api_requests=2, response_bytes=100)
+    metrics.observe("get_pod_spec", 2.0, error="K8sApiError")
+    cache = ResponseCache()
+    cache.get("get_pod_summaries", "key")
+    single_flight = SingleFlight()
+    single_flight.coalesced_calls = 3
+    lines = metrics.render(cache, single_flight).splitlines()
+    assert '# TYPE k8stools_tool_duration_seconds histogram' in lines
+    assert 'k8stools_tool_calls_total{tool="get_pod_summaries"} 2' in lines
+    assert 'k8stools_tool_errors_total{tool="get_pod_spec",error="K8sApiError"} 1' in lines
+    assert 'k8stools_tool_duration_seconds_bucket{tool="get_pod_summaries",le="0.1"} 1' in lines
+    assert 'k8stools_tool_duration_seconds_bucket{tool="get_pod_summaries",le="1"} 2' in lines
+    assert 'k8stools_tool_duration_seconds_bucket{tool="get_pod_spec",le="1"} 0' in lines
+    assert 'k8stools_tool_duration_seconds_bucket{tool="get_pod_spec",le="+Inf"} 1' in lines
+    assert 'k8stools_tool_duration_seconds_count{tool="get_pod_summaries"} 2' in lines
+    assert 'k8stools_tool_api_requests_total{tool="get_pod_summaries"} 4' in lines
+    assert 'k8stools_tool_response_bytes_total{tool="get_pod_summaries"} 200' in lines
+    assert 'k8stools_cache_misses_total{tool="get_pod_summaries"} 1' in lines
+    assert 'k8stools_coalesced_calls_total 3' in lines
+
+
+def test_write(tmp_path):
+    metrics = ToolMetrics()
+    metrics.observe("get_namespaces", 0.01)
+    path = tmp_path/"metrics.prom"
+    metrics.write(str(path))
+    assert 'k8stools_tool_calls_total{tool="get_namespaces"} 1' in path.read_text()
+    assert [p.name for p in tmp_path.iterdir()] == ["metrics.prom"]
+
+
+def test_server_counts_requests_in_worker_threads():
+    metrics = ToolMetrics()
+    async def run_test():
+        tool = get_tool_for_function(get_pod_summaries, anyio.CapacityLimiter(10), anyio.CapacityLimiter(10),
+                                     single_flight=SingleFlight(), metrics=metrics)
+        return await tool.run({})
+    assert asyncio.run(run_test()) == ["pod-1", "pod-2"]
+    [stats] = metrics.stats()
+    assert (stats.calls, stats.api_requests) == (1, 2)
+
+
+def test_kubernetes_requests_are_counted(tmp_path, monkeypatch):
+    monkeypatch.setenv('KUBECONFIG', str(tmp_path/'kubeconfig'))
+    monkeypatch.setattr(k8s_tools, 'LIST_PAGE_SIZE', 40)
+    metrics = ToolMetrics()
+    try:
+        with FakeApiServer(num_pods=100, num_nodes=3, num_namespaces=2) as server:
+            server.configure_k8s_tools(str(tmp_path/'kubeconfig'))
+            assert len(instrumented(k8s_tools.get_pod_summaries, metrics)()) == 100
+            deployment = server.data['deployments'][0]
+            logs = instrumented(k8s_tools.get_logs_for_workload, metrics)(deployment.namespace, deployment.name)
+            stats = {s.tool: s for s in metrics.stats()}
+            assert stats['get_pod_summaries'].api_requests == 3
+            # read the deployment, list its pods, then one request per pod (made from worker threads)
+            assert stats['get_logs_for_workload'].api_requests == 2 + len(logs)
+            assert server.request_count == 5 + len(logs)
+    finally:
+        k8s_tools.API_CLIENT = None
+        k8s_tools.K8S = None
+        k8s_tools.APPS_V1_API = None
+        async_tools.HTTP_CLIENT = None
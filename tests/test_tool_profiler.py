@@ -0,0 +1,136 @@
+"""Tests for the profiling of tool calls.
+"""
+
+import asyncio
+import json
+import pstats
+import time
+from typing import Optional
+
+import anyio
+import pytest
+
+from k8stools import tool_profiler
+from k8stools.mcp_server import get_tool_for_function
+from k8stools.tool_profiler import ToolProfiler, profiled
+
+
+def wait_for_api_server(seconds:float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        sum(range(1000))
+
+
+def get_pod_summaries(namespace: Optional[str] = None, label_selector: Optional[str] = None) -> list[str]:
+    """Returns the pods"""
+    wait_for_api_server(0.2)
+    return ["pod-1"]
+
+
+def read_profiles(directory) -> list[dict]:
+    profiles = []
+    for path in sorted(directory.glob("*.json")):
+        with open(path) as f:
+            profiles.append(json.load(f))
+    return profiles
+
+
+def test_sample_mode(tmp_path):
+    profiler = ToolProfiler(str(tmp_path), threshold_seconds=0.1, interval_seconds=0.001)
+    tool = profiled(get_pod_summaries, profiler)
+    assert tool.__name__ == "get_pod_summaries"
+    assert tool("default") == ["pod-1"]
+    [profile] = read_profiles(tmp_path)
+    assert profile['tool'] == "get_pod_summaries"
+    assert profile['arguments'] == {'namespace': "default", 'label_selector': None}
+    assert profile['duration_seconds'] >= 0.2
+    assert profile['error'] is None
+    stacks = (tmp_path/profile['profile']).read_text().splitlines()
+    assert stacks and all(line.rsplit(' ', 1)[1].isdigit() for line in stacks)
+    assert any("get_pod_summaries" in line and "wait_for_api_server" in line for line in stacks)
+
+
+def test_cprofile_mode(tmp_path):
+    profiler = ToolProfiler(str(tmp_path), threshold_seconds=0.1, mode='cprofile')
+    profiled(get_pod_summaries, profiler)()
+    [profile] = read_profiles(tmp_path)
+    assert profile['profile'].endswith(".prof")
+    stats = pstats.Stats(str(tmp_path/profile['profile']))
+    assert any(name == "wait_for_api_server" for (_, _, name) in stats.stats)
+
+
+def test_fast_and_unsampled_calls_are_not_written(tmp_path):
+    profiled(get_pod_summaries, ToolProfiler(str(tmp_path), threshold_seconds=10))()
+    profiled(get_pod_summaries, ToolProfiler(str(tmp_path), threshold_seconds=0, sample_rate=0))()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_errors_and_max_profiles(tmp_path):
+    def get_pod_spec(pod_name: str) -> dict:
+        raise ValueError(pod_name)
+    profiler = ToolProfiler(str(tmp_path), threshold_seconds=0, max_profiles=2)
+    tool = profiled(get_pod_spec, profiler)
+    for _ in range(3):
+        with pytest.raises(ValueError):
+            tool("pod-1")
+    profiles = read_profiles(tmp_path)
+    assert len(profiles) == 2
+    assert profiles[0]['error'] == "ValueError('pod-1')"
+
+
+def test_async_tool(tmp_path):
+    async def get_namespaces() -> list[str]:
+        await asyncio.sleep(0.05)
+        wait_for_api_server(0.1)
+        return ["default"]
+    tool = profiled(get_namespaces, ToolProfiler(str(tmp_path), threshold_seconds=0.1))
+    assert asyncio.run(tool()) == ["default"]
+    [profile] = read_profiles(tmp_path)
+    assert profile['tool'] == "get_namespaces"
+
+
+def test_profile_tools_from_environment(tmp_path, monkeypatch):
+    assert tool_profiler.profile_tools([get_pod_summaries]) == [get_pod_summaries]
+    monkeypatch.setenv('K8STOOLS_PROFILE_DIR', str(tmp_path))
+    monkeypatch.setenv('K8STOOLS_PROFILE_THRESHOLD', '0.1')
+    monkeypatch.setenv('K8STOOLS_PROFILE_MODE', 'cprofile')
+    monkeypatch.setattr(tool_profiler, 'PROFILER', tool_profiler.profiler_from_environment())
+    module_globals = {'get_pod_summaries': get_pod_summaries}
+    [tool] = tool_profiler.profile_tools([get_pod_summaries], module_globals)
+    assert tool_profiler.PROFILER.mode == 'cprofile'
+    # the module attribute is replaced too, so that direct calls are profiled
+    assert module_globals['get_pod_summaries'] is tool
+    # the tools are not profiled twice
+    assert profiled(tool, tool_profiler.PROFILER) is tool
+    tool()
+    assert len(read_profiles(tmp_path)) == 1
+    # a profiler given explicitly (e.g. with the server's --profile) replaces the one from the environment
+    server_dir = tmp_path/"server"
+    server_tool = profiled(tool, ToolProfiler(str(server_dir), threshold_seconds=0.1))
+    assert server_tool.__wrapped__ is get_pod_summaries
+    server_tool()
+    assert len(read_profiles(tmp_path)) == 1
+    assert len(read_profiles(server_dir)) == 1
+
+
+def test_nested_calls_are_not_profiled_separately(tmp_path):
+    profiler = ToolProfiler(str(tmp_path), threshold_seconds=0.1)
+    inner = profiled(get_pod_summaries, profiler)
+    def get_logs_for_workload(namespace: str, deployment_name: str) -> list[str]:
+        return inner(namespace)
+    assert profiled(get_logs_for_workload, profiler)("default", "frontend") == ["pod-1"]
+    assert [profile['tool'] for profile in read_profiles(tmp_path)] == ["get_logs_for_workload"]
+    inner()
+    assert len(read_profiles(tmp_path)) == 2
+
+
+def test_server_profiles_in_worker_thread(tmp_path):
+    async def run_test():
+        tool = get_tool_for_function(get_pod_summaries, anyio.CapacityLimiter(10), anyio.CapacityLimiter(10),
+                                     profiler=ToolProfiler(str(tmp_path), threshold_seconds=0.1))
+        assert list(tool.parameters['properties']) == ['namespace', 'label_selector']
+        return await tool.run({})
+    assert asyncio.run(run_test()) == ["pod-1"]
+    [profile] = read_profiles(tmp_path)
+    stacks = (tmp_path/profile['profile']).read_text()
+    assert "wait_for_api_server" in stacks